@@ -0,0 +1 @@
+"""Benchmarks für den Product-Microservice, z.B. `uv run python -m benchmarks.search`."""
@@ -0,0 +1,74 @@
+"""Reproduzierbar generierter Produktkatalog für Benchmarks und Lasttests."""
+
+import random
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, Final
+from uuid import UUID
+
+from bson import Binary, Decimal128
+
+from benchmarks.vocabulary import ADJECTIVES, BRANDS, NOUNS, TAGS, VARIANTS
+from product.model.entity.product import normalize_name
+from product.model.enum.product_category import ProductCategory
+
+__all__ = ["BRANDS", "NOUNS", "TAGS", "generate_catalogue", "generate_document"]
+
+_EPOCH: Final = datetime(2024, 1, 1)
+
+
+def generate_document(
+    rng: random.Random, index: int, max_variants: int = 3, max_tags: int = 5
+) -> dict[str, Any]:
+    """Ein Produkt-Dokument so erzeugen, wie es in MongoDB gespeichert ist.
+
+    :param rng: Zufallsgenerator mit festem Seed
+    :param index: Laufende Nummer; macht Name und ID eindeutig
+    :param max_variants: Maximale Anzahl Varianten
+    :param max_tags: Maximale Anzahl Tags
+    :return: BSON-kompatibles Dictionary mit Decimal128-Preisen und UUID als Binary
+    """
+    brand: Final = rng.choice(BRANDS)
+    noun: Final = rng.choice(NOUNS)
+    name: Final = f"{rng.choice(ADJECTIVES)} {noun} {brand} {index:07d}"
+    created: Final = _EPOCH + timedelta(minutes=rng.randrange(0, 60 * 24 * 365))
+    variant_count: Final = rng.randint(0, min(max_variants, len(VARIANTS)))
+    return {
+        "_id": Binary.from_uuid(UUID(int=index + 1)),
+        "revision_id": None,
+        "name": name,
+        "brand": brand,
+        "price": Decimal128(Decimal(rng.randrange(99, 250_000)) / 100),
+        "description": f"{noun} von {brand} mit {rng.choice(TAGS)}-Ausstattung",
+        "category": rng.choice(list(ProductCategory)).value,
+        "tags": rng.sample(TAGS, k=rng.randint(0, min(max_tags, len(TAGS)))),
+        "image_paths": [f"/img/{index}-{i}.png" for i in range(rng.randint(0, 3))],
+        "variants": [
+            {
+                "name": variant,
+                "value": rng.choice(values),
+                "additional_price": Decimal128(Decimal(rng.randrange(0, 5000)) / 100),
+            }
+            for variant, values in rng.sample(VARIANTS, k=variant_count)
+        ],
+        "name_normalized": normalize_name(name),
+        "created": created,
+        "updated": created,
+    }
+
+
+def generate_catalogue(
+    size: int, seed: int = 42, max_variants: int = 3, max_tags: int = 5
+) -> Iterator[dict[str, Any]]:
+    """Einen Katalog mit `size` Produkt-Dokumenten erzeugen; gleicher Seed, gleiche Daten.
+
+    :param size: Anzahl Produkte
+    :param seed: Seed für den Zufallsgenerator
+    :param max_variants: Maximale Anzahl Varianten je Produkt
+    :param max_tags: Maximale Anzahl Tags je Produkt
+    :return: Iterator über die Dokumente
+    """
+    rng: Final = random.Random(seed)  # noqa: S311
+    for index in range(size):
+        yield generate_document(rng, index, max_variants, max_tags)
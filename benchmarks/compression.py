@@ -0,0 +1,140 @@
+"""Bytes auf der Leitung gegen CPU-Zeit je Content-Encoding und Level.
+
+    uv run python -m benchmarks.compression
+    uv run python -m benchmarks.compression --page-size 20 --page-size 200 --repeat 50
+
+Die Payload ist eine Seite von `products` als GraphQL-Response mit Varianten
+und Bildpfaden aus dem generierten Katalog. Gemessen wird mit den Encodern der
+`CompressionMiddleware`, einmal am Stück und einmal gestreamt mit Flush nach
+jedem Produkt wie bei NDJSON. Brotli und zstd erscheinen nur, wenn `brotli`
+bzw. `zstandard` installiert ist. Die letzte Spalte rechnet die eingesparten
+Bytes auf eine Million Responses hoch, z.B. für Traffic zwischen Zonen.
+"""
+
+import argparse
+import statistics
+import sys
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Final
+
+import orjson
+
+from benchmarks.catalogue import generate_catalogue
+from product.compression import available_encodings, create_encoder
+
+__all__ = ["LEVELS", "measure", "products_page"]
+
+LEVELS: Final[dict[str, tuple[int, ...]]] = {
+    "gzip": (1, 6, 9),
+    "br": (1, 4, 6, 11),
+    "zstd": (1, 3, 9, 19),
+}
+"""Level je Verfahren; die Defaults der Konfiguration sind gzip 6, br 4, zstd 3."""
+
+
+def products_page(size: int, seed: int = 42) -> list[dict[str, Any]]:
+    """Produkte wie im Feld `content` von `products` mit allen Feldern."""
+    return [
+        {
+            "id": str(document["_id"].as_uuid()),
+            "name": document["name"],
+            "brand": document["brand"],
+            "price": float(document["price"].to_decimal()),
+            "description": document["description"],
+            "category": document["category"],
+            "imagePaths": document["image_paths"],
+            "variants": [
+                {
+                    "name": variant["name"],
+                    "value": variant["value"],
+                    "additionalPrice": float(variant["additional_price"].to_decimal()),
+                }
+                for variant in document["variants"]
+            ],
+            "tags": document["tags"],
+            "created": document["created"].isoformat(),
+            "updated": document["updated"].isoformat(),
+        }
+        for document in generate_catalogue(size, seed)
+    ]
+
+
+def _compress(encoding: str, level: int, chunks: list[bytes]) -> int:
+    encoder: Final = create_encoder(encoding, level)
+    last: Final = len(chunks) - 1
+    size = 0
+    for index, chunk in enumerate(chunks):
+        size += len(encoder.compress(chunk, flush=index < last))
+    return size + len(encoder.finish())
+
+
+def measure(encoding: str, level: int, chunks: list[bytes], repeat: int) -> dict[str, float]:
+    """Komprimierte Größe und Median der CPU-Zeit.
+
+    :param encoding: gzip, br oder zstd
+    :param level: Level bzw. Qualität
+    :param chunks: Body in Teilen; bei mehr als einem Teil Flush nach jedem
+    :param repeat: Wiederholungen für den Median
+    :return: Bytes, Verhältnis, Mikrosekunden und Durchsatz in MB/s
+    """
+    raw: Final = sum(len(chunk) for chunk in chunks)
+    compressed: Final = _compress(encoding, level, chunks)
+    durations: Final[list[float]] = []
+    for _ in range(repeat):
+        start = perf_counter()
+        _compress(encoding, level, chunks)
+        durations.append(perf_counter() - start)
+    median: Final = statistics.median(durations)
+    return {
+        "raw_bytes": raw,
+        "compressed_bytes": compressed,
+        "ratio": raw / compressed,
+        "cpu_us": median * 1e6,
+        "mb_per_s": raw / median / 1e6,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser: Final = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--page-size", type=int, action="append", help="default: 10, 50, 200")
+    parser.add_argument("--repeat", type=int, default=30)
+    parser.add_argument("--json", type=Path, help="Ergebnisse zusätzlich als JSON")
+    args: Final = parser.parse_args(argv)
+
+    encodings: Final = available_encodings(tuple(LEVELS))
+    results: Final[list[dict[str, Any]]] = []
+    print(
+        f"{'Seite':>5} {'Modus':<8} {'Verfahren':<10} {'Bytes':>9} {'Faktor':>7} "
+        f"{'CPU µs':>9} {'MB/s':>7} {'GB gespart/1 Mio.':>18}"
+    )
+    for size in args.page_size or (10, 50, 200):
+        page = products_page(size)
+        modes = {
+            "ganz": [orjson.dumps({"data": {"products": {"content": page}}})],
+            "stream": [orjson.dumps(product) + b"\n" for product in page],
+        }
+        for mode, chunks in modes.items():
+            for encoding in encodings:
+                for level in LEVELS[encoding]:
+                    result = measure(encoding, level, chunks, args.repeat)
+                    saved_gb = (result["raw_bytes"] - result["compressed_bytes"]) / 1e3
+                    results.append(
+                        {"page_size": size, "mode": mode, "encoding": encoding, "level": level}
+                        | result
+                    )
+                    print(
+                        f"{size:>5} {mode:<8} {f'{encoding}-{level}':<10} "
+                        f"{result['compressed_bytes']:>9.0f} {result['ratio']:>7.2f} "
+                        f"{result['cpu_us']:>9.1f} {result['mb_per_s']:>7.1f} {saved_gb:>18.2f}"
+                    )
+            print(f"{size:>5} {mode:<8} {'identity':<10} {sum(map(len, chunks)):>9}")
+
+    if args.json is not None:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
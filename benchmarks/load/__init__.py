@@ -0,0 +1 @@
+"""Lasttests mit Locust: Keycloak-JWKS- und Kafka-Ersatz, Szenarien und SLO-Prüfung."""
@@ -0,0 +1,114 @@
+"""Lokaler Ersatz für Keycloak: JWKS-Endpunkt und Ausgabe signierter Tokens.
+
+Der Server beantwortet dieselbe URL, die `KeycloakService` aus
+`KC_SERVICE_HOST`, `KC_SERVICE_PORT` und `KC_SERVICE_REALM` bildet, sowie
+`/token?roles=Admin,User` für die Locust-User und `/health/ready` für den
+Health-Check.
+"""
+
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import time
+from typing import Any, Final
+from urllib.parse import parse_qs, urlparse
+
+import orjson
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk, jwt
+
+__all__ = ["JwksStub"]
+
+_KID: Final = "load-test"
+_TOKEN_LIFETIME_SECONDS: Final = 3600
+
+
+class JwksStub:
+    """RSA-Schlüsselpaar mit JWKS-Darstellung und HTTP-Server im Hintergrund."""
+
+    def __init__(self, realm: str) -> None:
+        self.realm: Final = realm
+        private_key: Final = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        self._private_pem: Final = private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+        public_pem: Final = private_key.public_key().public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        self._jwks: Final = {
+            "keys": [
+                jwk.construct(public_pem, "RS256").to_dict()
+                | {"kid": _KID, "use": "sig", "alg": "RS256"}
+            ]
+        }
+        self._server: ThreadingHTTPServer | None = None
+
+    @property
+    def certs_path(self) -> str:
+        """Pfad des JWKS-Endpunkts wie bei Keycloak."""
+        return f"/auth/realms/{self.realm}/protocol/openid-connect/certs"
+
+    def jwks(self) -> dict[str, Any]:
+        """Öffentliche Schlüssel im JWKS-Format."""
+        return self._jwks
+
+    def issue_token(self, roles: list[str], subject: str = "load-test") -> str:
+        """Signiertes Access-Token mit Realm-Rollen wie von Keycloak.
+
+        :param roles: Rollen in `realm_access.roles`
+        :param subject: Benutzername
+        :return: JWT im Compact-Format
+        """
+        now: Final = int(time())
+        claims: Final = {
+            "sub": subject,
+            "preferred_username": subject,
+            "iat": now,
+            "exp": now + _TOKEN_LIFETIME_SECONDS,
+            "realm_access": {"roles": roles},
+        }
+        return jwt.encode(
+            claims, self._private_pem.decode(), algorithm="RS256", headers={"kid": _KID}
+        )
+
+    def serve(self, host: str, port: int) -> None:
+        """HTTP-Server in einem Daemon-Thread starten."""
+        stub: Final = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802
+                url = urlparse(self.path)
+                if url.path == stub.certs_path:
+                    self._send(stub.jwks())
+                elif url.path == "/token":
+                    roles = parse_qs(url.query).get("roles", ["Admin,User"])[0]
+                    token = stub.issue_token(roles.split(","))
+                    self._send({"access_token": token, "token_type": "Bearer"})
+                elif url.path in {"/health/ready", "/-/healthy", "/metrics"}:
+                    self._send({"status": "UP"})
+                else:
+                    self.send_error(HTTPStatus.NOT_FOUND)
+
+            def _send(self, body: dict[str, Any]) -> None:
+                content = orjson.dumps(body)
+                self.send_response(HTTPStatus.OK)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, *_args: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def shutdown(self) -> None:
+        """HTTP-Server beenden."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server = None
@@ -0,0 +1,105 @@
+"""In-Process-Ersatz für Kafka: Producer und Consumer ohne Broker.
+
+Veröffentlichte Nachrichten werden wie beim echten Producer serialisiert, in
+einem begrenzten Puffer abgelegt und synchron an die registrierten Consumer
+des Topics zugestellt. Damit laufen Serialisierung und Event-Handler (z.B.
+für den Suggestion-Index) auch im Lasttest.
+"""
+
+from collections import deque
+from typing import Any, Final, Optional, Union
+
+import orjson
+from loguru import logger
+
+from product.messaging import kafka_singleton
+from product.messaging.consumer import KafkaConsumerService
+from product.messaging.dto.kafka_serializer_mixin import KafkaSerializerMixin
+from product.messaging.producer import KafkaProducerService
+from product.tracing.trace_context import TraceContext
+
+__all__ = ["InMemoryKafkaConsumer", "InMemoryKafkaProducer", "install"]
+
+_MAX_MESSAGES: Final = 10_000
+
+
+class InMemoryKafkaConsumer(KafkaConsumerService):
+    """Consumer, dem Nachrichten direkt vom `InMemoryKafkaProducer` zugestellt werden."""
+
+    async def start(self) -> None:
+        self._log.info("In-Memory-Kafka-Consumer für Topics: {}", self._topics)
+
+    async def stop(self) -> None:
+        pass
+
+    async def deliver(self, topic: str, payload: dict[str, Any]) -> None:
+        """Nachricht an den Handler des Topics übergeben."""
+        handler: Final = self._handlers.get(topic)
+        if handler is not None:
+            await handler(payload)
+
+
+class InMemoryKafkaProducer(KafkaProducerService):
+    """Producer, der Nachrichten serialisiert und lokal zustellt statt sie zu senden."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.messages: Final[deque[tuple[str, bytes]]] = deque(maxlen=_MAX_MESSAGES)
+        self._consumers: Final[list[InMemoryKafkaConsumer]] = []
+
+    def attach(self, consumer: InMemoryKafkaConsumer) -> None:
+        """Consumer für die lokale Zustellung registrieren."""
+        self._consumers.append(consumer)
+
+    async def start(self) -> None:
+        self.started = True
+        logger.info("In-Memory-Kafka-Producer bereit")
+
+    async def stop(self) -> None:
+        self.started = False
+
+    async def publish(
+        self,
+        topic: str,
+        payload: Union[KafkaSerializerMixin, dict],
+        trace_ctx: Optional[TraceContext] = None,
+        headers: Optional[list[tuple[str, str]]] = None,
+    ) -> None:
+        value: Final = (
+            payload.to_kafka() if hasattr(payload, "to_kafka") else orjson.dumps(payload)
+        )
+        self.messages.append((topic, value))
+        for consumer in self._consumers:
+            if topic in consumer._topics:  # noqa: SLF001
+                await consumer.deliver(topic, orjson.loads(value))
+
+
+def _replace(
+    original: KafkaConsumerService, producer: InMemoryKafkaProducer
+) -> InMemoryKafkaConsumer:
+    """In-Memory-Consumer mit Topics, Gruppe und Handlern des Originals."""
+    consumer: Final = InMemoryKafkaConsumer(
+        topics=list(original._topics),  # noqa: SLF001
+        group_id=original._group_id,  # noqa: SLF001
+        handlers=dict(original._handlers),  # noqa: SLF001
+    )
+    producer.attach(consumer)
+    return consumer
+
+
+def install() -> InMemoryKafkaProducer:
+    """Die Kafka-Singletons durch die In-Memory-Varianten ersetzen.
+
+    Muss vor dem ersten Zugriff auf die Services aufgerufen werden.
+
+    :return: Der installierte Producer, z.B. um gesendete Nachrichten zu zählen
+    """
+    producer: Final = InMemoryKafkaProducer()
+    consumer: Final = _replace(kafka_singleton.get_kafka_consumer(), producer)
+    event_consumer: Final = _replace(
+        kafka_singleton.get_product_event_consumer(), producer
+    )
+    kafka_singleton._kafka_producer_instance = producer  # noqa: SLF001
+    kafka_singleton._kafka_consumer_instance = consumer  # noqa: SLF001
+    kafka_singleton._product_event_consumer_instance = event_consumer  # noqa: SLF001
+    return producer
@@ -0,0 +1,189 @@
+"""Locust-User für den Produkt-Service.
+
+Erwartet einen mit `benchmarks.load.server` gestarteten Service. Die Größe des
+Katalogs und der Seed müssen zum Server passen, damit die IDs existieren:
+
+    LOAD_CATALOGUE_SIZE=10000 uv run locust -f benchmarks/load/locustfile.py \\
+        --host http://127.0.0.1:8000 CatalogueReader
+
+Jeder User erhält einen eigenen, aus `LOAD_SEED` abgeleiteten Zufallsgenerator,
+sodass die Abfolge der Requests je User reproduzierbar ist.
+"""
+
+import itertools
+import os
+import random
+from typing import Any, Final
+from uuid import UUID
+
+import requests
+from locust import HttpUser, between, tag, task
+
+from benchmarks.vocabulary import BRANDS, NOUNS, TAGS
+
+CATALOGUE_SIZE: Final = int(os.environ.get("LOAD_CATALOGUE_SIZE", "10000"))
+SEED: Final = int(os.environ.get("LOAD_SEED", "42"))
+JWKS_URL: Final = os.environ.get("LOAD_JWKS_URL", "http://127.0.0.1:8089")
+
+# Auswahl aus ProductCategory; `product` wird hier bewusst nicht importiert
+CATEGORIES: Final = ("ELEKTRONIK", "SPORT", "BUECHER", "HAUSHALT", "SPIELWAREN")
+
+PRODUCT_QUERY: Final = """
+query Product($id: ID!) {
+  product(id: $id) { id name brand price category tags variants { name value } }
+}"""
+
+PRODUCTS_QUERY: Final = """
+query Products($pagination: PaginationInput, $criteria: ProductSearchCriteriaInput) {
+  products(pagination: $pagination, searchCriteria: $criteria) {
+    total
+    content { id name brand price }
+  }
+}"""
+
+CREATE_MUTATION: Final = """
+mutation Create($input: ProductInput!) { createProduct(input: $input) { id } }"""
+
+UPDATE_MUTATION: Final = """
+mutation Update($id: ID!, $input: ProductInput!) {
+  updateProduct(productId: $id, input: $input) { id }
+}"""
+
+DELETE_MUTATION: Final = """
+mutation Delete($id: ID!) { deleteProduct(productId: $id) }"""
+
+_user_ids: Final = itertools.count()
+
+
+class _GraphQLUser(HttpUser):
+    abstract = True
+    roles: str = "User"
+
+    def on_start(self) -> None:
+        self.rng = random.Random(SEED + next(_user_ids))  # noqa: S311
+        response: Final = requests.get(
+            f"{JWKS_URL}/token", params={"roles": self.roles}, timeout=5
+        )
+        response.raise_for_status()
+        self.client.headers["Authorization"] = (
+            f"Bearer {response.json()['access_token']}"
+        )
+
+    def graphql(self, name: str, query: str, variables: dict[str, Any]) -> Any:
+        """GraphQL-Request; Antworten mit `errors` zählen als Fehler."""
+        with self.client.post(
+            "/graphql",
+            json={"query": query, "variables": variables},
+            name=name,
+            catch_response=True,
+        ) as response:
+            if response.status_code != 200:  # noqa: PLR2004
+                response.failure(f"HTTP {response.status_code}")
+                return None
+            body = response.json()
+            if body.get("errors"):
+                response.failure(body["errors"][0].get("message", "GraphQL-Fehler"))
+                return None
+            return body.get("data")
+
+    def product_id(self) -> str:
+        return str(UUID(int=self.rng.randrange(CATALOGUE_SIZE) + 1))
+
+    def products(self, name: str, criteria: dict[str, Any] | None = None) -> None:
+        self.graphql(
+            name,
+            PRODUCTS_QUERY,
+            {
+                "pagination": {"skip": self.rng.randrange(0, 100), "limit": 20},
+                "criteria": criteria,
+            },
+        )
+
+
+class CatalogueReader(_GraphQLUser):
+    """Lesender Traffic: Einzelabruf, Seiten, jedes Suchkriterium und Health-Check."""
+
+    wait_time = between(0.05, 0.25)
+
+    @task(10)
+    def product_by_id(self) -> None:
+        self.graphql("product", PRODUCT_QUERY, {"id": self.product_id()})
+
+    @task(5)
+    def products_page(self) -> None:
+        self.products("products:page")
+
+    @task(2)
+    def products_by_name(self) -> None:
+        prefix: Final = self.rng.choice(NOUNS)[: self.rng.randint(3, 6)]
+        self.products("products:name", {"name": prefix})
+
+    @task(2)
+    def products_by_brand(self) -> None:
+        self.products("products:brand", {"brand": self.rng.choice(BRANDS)})
+
+    @task(2)
+    def products_by_price(self) -> None:
+        low: Final = self.rng.randrange(0, 1000)
+        self.products(
+            "products:price", {"minPrice": low, "maxPrice": low + self.rng.randrange(50, 500)}
+        )
+
+    @task(2)
+    def products_by_category(self) -> None:
+        self.products(
+            "products:category", {"productCategory": self.rng.choice(CATEGORIES)}
+        )
+
+    @task(1)
+    def products_by_created(self) -> None:
+        month: Final = self.rng.randint(1, 11)
+        self.products(
+            "products:created",
+            {
+                "createdAfter": f"2024-{month:02d}-01T00:00:00",
+                "createdBefore": f"2024-{month + 1:02d}-01T00:00:00",
+            },
+        )
+
+    @task(2)
+    def products_by_tags(self) -> None:
+        self.products("products:tags", {"tags": [self.rng.choice(TAGS)]})
+
+    @task(1)
+    def health(self) -> None:
+        self.client.get("/health", name="GET /health")
+
+
+class CatalogueEditor(_GraphQLUser):
+    """Schreibender Traffic: anlegen, ändern und wieder löschen."""
+
+    roles = "Admin,User"
+    wait_time = between(0.5, 1.5)
+
+    def _input(self) -> dict[str, Any]:
+        noun: Final = self.rng.choice(NOUNS)
+        brand: Final = self.rng.choice(BRANDS)
+        return {
+            "name": f"Last {noun} {brand} {self.rng.getrandbits(48):012x}",
+            "brand": brand,
+            "price": f"{self.rng.randrange(99, 100_000) / 100:.2f}",
+            "category": self.rng.choice(CATEGORIES),
+            "tags": self.rng.sample(TAGS, k=2),
+        }
+
+    @tag("mutations")
+    @task
+    def create_update_delete(self) -> None:
+        created: Final = self.graphql(
+            "mutation:createProduct", CREATE_MUTATION, {"input": self._input()}
+        )
+        if not created:
+            return
+        product_id: Final = created["createProduct"]["id"]
+        self.graphql(
+            "mutation:updateProduct",
+            UPDATE_MUTATION,
+            {"id": product_id, "input": self._input()},
+        )
+        self.graphql("mutation:deleteProduct", DELETE_MUTATION, {"id": product_id})
@@ -0,0 +1,145 @@
+"""Locust-Ergebnisse (CSV) gegen die SLO-Ziele in `baselines.json` prüfen.
+
+    uv run python -m benchmarks.load.report results/baseline_stats.csv --scenario baseline
+
+`baselines.json` enthält je Szenario und Request-Name Zielwerte für p95 und
+p99 (ms, optional p50) und den Durchsatz (RPS). Die Ziele sind Vorgaben, keine
+Messwerte; mit `--update` werden sie durch die Werte eines Laufs in der
+Referenzumgebung ersetzt. Latenzen dürfen höchstens um die Toleranz steigen,
+der Durchsatz höchstens um die Toleranz sinken; zusätzlich wird der Anteil
+fehlgeschlagener Requests geprüft. Exit-Code 1 bei einer Verletzung oder falls
+für das Szenario keine Ziele existieren.
+"""
+
+import argparse
+import csv
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Final
+
+import orjson
+
+__all__ = ["BASELINES_PATH", "Measurement", "check", "read_stats"]
+
+BASELINES_PATH: Final = Path(__file__).with_name("baselines.json")
+_DEFAULT_TOLERANCE: Final = 0.15
+_DEFAULT_MAX_FAILURE_RATIO: Final = 0.01
+
+
+@dataclass(frozen=True, slots=True)
+class Measurement:
+    """Kennzahlen eines Request-Namens aus `<prefix>_stats.csv`."""
+
+    requests: int
+    failures: int
+    p50: float
+    p95: float
+    p99: float
+    rps: float
+
+    @property
+    def failure_ratio(self) -> float:
+        return self.failures / self.requests if self.requests else 0.0
+
+
+def read_stats(path: Path) -> dict[str, Measurement]:
+    """Statistik-CSV von Locust einlesen; die Zeile `Aggregated` heißt `total`."""
+    with path.open(newline="", encoding="utf-8") as file:
+        return {
+            ("total" if row["Name"] == "Aggregated" else row["Name"]): Measurement(
+                requests=int(row["Request Count"]),
+                failures=int(row["Failure Count"]),
+                p50=float(row["50%"]),
+                p95=float(row["95%"]),
+                p99=float(row["99%"]),
+                rps=float(row["Requests/s"]),
+            )
+            for row in csv.DictReader(file)
+        }
+
+
+def check(stats: dict[str, Measurement], baseline: dict[str, Any]) -> list[str]:
+    """Messwerte mit der Baseline eines Szenarios vergleichen.
+
+    :param stats: Ergebnis von `read_stats`
+    :param baseline: Eintrag aus `baselines.json` mit `tolerance` und `requests`
+        (Zielwerte je Request-Name)
+    :return: Beschreibung aller Verletzungen; leer, falls alle SLOs erfüllt sind
+    """
+    tolerance: Final = baseline.get("tolerance", _DEFAULT_TOLERANCE)
+    max_failure_ratio: Final = baseline.get("max_failure_ratio", _DEFAULT_MAX_FAILURE_RATIO)
+    violations: Final[list[str]] = []
+    for name, expected in baseline["requests"].items():
+        measured = stats.get(name)
+        if measured is None or measured.requests == 0:
+            violations.append(f"{name}: keine Requests gemessen")
+            continue
+        for quantile in ("p50", "p95", "p99"):
+            if quantile not in expected:
+                continue
+            limit = expected[quantile] * (1 + tolerance)
+            value = getattr(measured, quantile)
+            if value > limit:
+                violations.append(
+                    f"{name}: {quantile} {value:.0f} ms > {limit:.0f} ms "
+                    f"(Ziel {expected[quantile]} ms)"
+                )
+        if "rps" in expected and measured.rps < expected["rps"] * (1 - tolerance):
+            violations.append(
+                f"{name}: {measured.rps:.1f} RPS < {expected['rps'] * (1 - tolerance):.1f} "
+                f"(Ziel {expected['rps']} RPS)"
+            )
+        if measured.failure_ratio > max_failure_ratio:
+            violations.append(
+                f"{name}: Fehlerquote {measured.failure_ratio:.2%} > {max_failure_ratio:.2%}"
+            )
+    return violations
+
+
+def _update(stats: dict[str, Measurement], baselines: dict[str, Any], scenario: str) -> None:
+    entry: Final = baselines.setdefault(scenario, {"tolerance": _DEFAULT_TOLERANCE})
+    entry["requests"] = {
+        name: {"p50": m.p50, "p95": m.p95, "p99": m.p99, "rps": round(m.rps, 1)}
+        for name, m in sorted(stats.items())
+        if m.requests
+    }
+    BASELINES_PATH.write_bytes(
+        orjson.dumps(baselines, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser: Final = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("stats", type=Path, help="<prefix>_stats.csv von Locust")
+    parser.add_argument("--scenario", default="baseline")
+    parser.add_argument("--update", action="store_true", help="Baselines überschreiben")
+    args: Final = parser.parse_args(argv)
+
+    stats: Final = read_stats(args.stats)
+    baselines: Final = orjson.loads(BASELINES_PATH.read_bytes())
+    if args.update:
+        _update(stats, baselines, args.scenario)
+        print(f"Baselines für '{args.scenario}' aktualisiert: {BASELINES_PATH}")
+        return 0
+
+    print(f"{'Request':<22} {'Anzahl':>8} {'p50':>7} {'p95':>7} {'p99':>7} {'RPS':>7}")
+    for name, m in sorted(stats.items()):
+        print(f"{name:<22} {m.requests:>8} {m.p50:>7.0f} {m.p95:>7.0f} {m.p99:>7.0f} {m.rps:>7.1f}")
+
+    if args.scenario not in baselines:
+        print(
+            f"Keine SLO-Ziele für '{args.scenario}' in baselines.json: Ziele eintragen "
+            "oder das Szenario mit --update-baseline messen"
+        )
+        return 1
+
+    violations: Final = check(stats, baselines[args.scenario])
+    for violation in violations:
+        print(f"SLO verletzt: {violation}")
+    print("SLOs erfüllt" if not violations else f"{len(violations)} SLO-Verletzung(en)")
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
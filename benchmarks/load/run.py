@@ -0,0 +1,64 @@
+"""Ein Lastszenario headless ausführen und gegen die Baselines prüfen.
+
+Der Service muss vorher mit derselben Katalog-Größe gestartet werden:
+
+    uv run python -m benchmarks.load.server --size 10000
+    uv run python -m benchmarks.load.run --scenario baseline
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Final
+
+from benchmarks.load import report
+from benchmarks.load.scenarios import SCENARIOS
+
+_LOCUSTFILE: Final = Path(__file__).with_name("locustfile.py")
+
+
+def main() -> int:
+    parser: Final = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="smoke")
+    parser.add_argument("--host", default="http://127.0.0.1:8000")
+    parser.add_argument("--jwks-url", default="http://127.0.0.1:8089")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--results", type=Path, default=Path("results/load"))
+    parser.add_argument("--update-baseline", action="store_true")
+    args: Final = parser.parse_args()
+
+    scenario: Final = SCENARIOS[args.scenario]
+    args.results.mkdir(parents=True, exist_ok=True)
+    prefix: Final = args.results / args.scenario
+    env: Final = os.environ | {
+        "LOAD_CATALOGUE_SIZE": str(scenario.catalogue_size),
+        "LOAD_SEED": str(args.seed),
+        "LOAD_JWKS_URL": args.jwks_url,
+    }
+    command: Final = [
+        sys.executable, "-m", "locust",
+        "--locustfile", str(_LOCUSTFILE),
+        "--host", args.host,
+        "--headless",
+        "--users", str(scenario.users),
+        "--spawn-rate", str(scenario.spawn_rate),
+        "--run-time", scenario.run_time,
+        "--csv", str(prefix),
+        "--html", f"{prefix}.html",
+        "--only-summary",
+        *scenario.user_classes,
+    ]  # fmt: skip
+    print(" ".join(command))
+    # Exit-Code von Locust ist bei Fehlern != 0; maßgeblich ist die SLO-Prüfung
+    subprocess.run(command, env=env, check=False)  # noqa: S603
+
+    report_args: Final = [f"{prefix}_stats.csv", "--scenario", args.scenario]
+    if args.update_baseline:
+        report_args.append("--update")
+    return report.main(report_args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
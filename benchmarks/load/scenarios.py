@@ -0,0 +1,34 @@
+"""Reproduzierbare Lastszenarien: Anzahl User, Spawn-Rate, Dauer und User-Klassen."""
+
+from dataclasses import dataclass
+from typing import Final
+
+__all__ = ["SCENARIOS", "Scenario"]
+
+
+@dataclass(frozen=True, slots=True)
+class Scenario:
+    """Parameter für einen Locust-Lauf im Headless-Modus."""
+
+    users: int
+    spawn_rate: float
+    run_time: str
+    user_classes: tuple[str, ...] = ("CatalogueReader",)
+    catalogue_size: int = 10_000
+
+
+SCENARIOS: Final[dict[str, Scenario]] = {
+    # Schneller Durchlauf, z.B. in der CI
+    "smoke": Scenario(users=10, spawn_rate=5, run_time="1m", catalogue_size=1_000),
+    # Referenz für die SLO-Ziele in baselines.json
+    "baseline": Scenario(users=50, spawn_rate=10, run_time="5m"),
+    # Über der erwarteten Spitzenlast
+    "stress": Scenario(users=200, spawn_rate=20, run_time="10m", catalogue_size=100_000),
+    # Lesen und Schreiben gemischt: Mutationen über das GraphQL-Schema
+    "mixed": Scenario(
+        users=50,
+        spawn_rate=10,
+        run_time="5m",
+        user_classes=("CatalogueReader", "CatalogueEditor"),
+    ),
+}
@@ -0,0 +1,97 @@
+"""Produkt-Service für Lasttests starten: ohne Keycloak und Kafka, mit Testdaten.
+
+Startet den JWKS-Ersatz, ersetzt Kafka durch die In-Process-Variante, befüllt
+die Datenbank `<MONGO_DB_DATABASE>_load` mit einem generierten Katalog und
+startet die Applikation mit uvicorn ohne TLS, z.B.:
+
+    uv run python -m benchmarks.load.server --size 10000 --seed 42
+"""
+
+import argparse
+import asyncio
+import os
+from itertools import islice
+from typing import Final
+
+import uvicorn
+
+from benchmarks.load.jwks_stub import JwksStub
+
+_BATCH_SIZE: Final = 1000
+_REALM: Final = "load-test"
+
+
+def _configure_environment(database: str, jwks_host: str, jwks_port: int) -> None:
+    """Umgebungsvariablen setzen, bevor `product` importiert wird.
+
+    Alle Module aus `product` und `benchmarks.catalogue` werden deshalb erst
+    danach importiert.
+    """
+    jwks_url: Final = f"http://{jwks_host}:{jwks_port}"
+    os.environ |= {
+        "MONGO_DB_DATABASE": database,
+        "KC_SERVICE_HOST": jwks_host,
+        "KC_SERVICE_PORT": str(jwks_port),
+        "KC_SERVICE_REALM": _REALM,
+        "KEYCLOAK_HEALTH_URL": f"{jwks_url}/health/ready",
+        "PROMETHEUS_HEALTH_URL": f"{jwks_url}/-/healthy",
+        "TEMPO_HEALTH_URL": f"{jwks_url}/metrics",
+        "EXCEL_EXPORT_ENABLED": "false",
+    }
+    # Ohne Tempo: Spans lokal als JSON Lines, mit TRACING_EXPORTER=none ganz ohne Tracing
+    os.environ.setdefault("TRACING_EXPORTER", "file")
+
+
+async def _seed(size: int, seed: int) -> None:
+    """Katalog laden, sofern nicht bereits in gleicher Größe vorhanden."""
+    from benchmarks.catalogue import generate_catalogue  # noqa: PLC0415
+    from product.config.mongo import mongo_database  # noqa: PLC0415
+    from product.repository.session import create_client  # noqa: PLC0415
+
+    client: Final = create_client()
+    db: Final = client[mongo_database]
+    if await db.products.estimated_document_count() != size:
+        await db.products.delete_many({})
+        # Materialisierte Sicht wird beim Start der Applikation neu aufgebaut
+        await db.category_stats.drop()
+        documents = generate_catalogue(size, seed=seed)
+        while batch := list(islice(documents, _BATCH_SIZE)):
+            await db.products.insert_many(batch, ordered=False)
+        print(f"{size} Produkte in {mongo_database} geladen")
+    client.close()
+
+
+def main() -> None:
+    parser: Final = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=10_000, help="Anzahl Produkte")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--jwks-port", type=int, default=8089)
+    parser.add_argument(
+        "--database",
+        default=f"{os.environ.get('MONGO_DB_DATABASE', 'product')}_load",
+    )
+    args: Final = parser.parse_args()
+
+    jwks: Final = JwksStub(_REALM)
+    jwks.serve(args.host, args.jwks_port)
+    _configure_environment(args.database, args.host, args.jwks_port)
+
+    from benchmarks.load import kafka_stub  # noqa: PLC0415
+
+    kafka_stub.install()
+    asyncio.run(_seed(args.size, args.seed))
+
+    from product.fastapi_app import app  # noqa: PLC0415
+    from product.health import router as health_router  # noqa: PLC0415
+
+    async def check_kafka() -> dict[str, str]:
+        return {"status": "ok", "mode": "in-memory"}
+
+    health_router.check_kafka = check_kafka
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
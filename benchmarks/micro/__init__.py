@@ -0,0 +1 @@
+"""Microbenchmarks mit pytest-benchmark für CPU-lastige Hot Paths."""
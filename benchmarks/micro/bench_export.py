@@ -0,0 +1,56 @@
+"""Export als CSV bzw. Excel mit Diagrammen für eine Seite Produkte."""
+
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Final
+
+import pytest
+
+from benchmarks.micro.conftest import product_document
+from product.config import env
+from product.model.entity.category_stats import CategoryStats
+from product.model.entity.product import Product
+from product.service.product_read_service import ProductReadService
+
+_PAGE_SIZE: Final = 100
+
+
+@pytest.fixture
+def products() -> list[Product]:
+    return [
+        Product.model_validate(product_document("typisch", index))
+        for index in range(_PAGE_SIZE)
+    ]
+
+
+@pytest.fixture
+def category_stats(products: list[Product]) -> list[CategoryStats]:
+    stats: dict[str, CategoryStats] = {}
+    for product in products:
+        entry = stats.setdefault(
+            product.category.value, CategoryStats(id=product.category.value)
+        )
+        entry.product_count += 1
+        entry.price_sum += Decimal(product.price)
+    return list(stats.values())
+
+
+@pytest.mark.parametrize("export_format", ["csv", "xlsx"])
+def bench_create_export_file(
+    benchmark: Any,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    products: list[Product],
+    category_stats: list[CategoryStats],
+    export_format: str,
+) -> None:
+    """`_create_export_file` für eine Seite mit 100 Produkten."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(env, "EXPORT_FORMAT", export_format)
+    benchmark.pedantic(
+        ProductReadService._create_export_file,  # noqa: SLF001
+        args=(products, category_stats),
+        rounds=10 if export_format == "xlsx" else 50,
+        warmup_rounds=1,
+    )
+    assert any((tmp_path / "exports").iterdir())
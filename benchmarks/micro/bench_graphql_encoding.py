@@ -0,0 +1,65 @@
+"""Serialisierung einer GraphQL-Response mit einer Seite von 100 Produkten."""
+
+import json
+from collections.abc import Callable
+from dataclasses import asdict
+from enum import Enum
+from typing import Any, Final
+
+import orjson
+import pytest
+
+from benchmarks.micro.conftest import product_document
+from product.graphql.encoding import encode_response
+from product.model.entity.product import Product, map_product_to_product_type
+
+_PAGE_SIZE: Final = 100
+
+
+def _camel(name: str) -> str:
+    first, *rest = name.split("_")
+    return first + "".join(part.title() for part in rest)
+
+
+def _graphql_value(value: Any) -> Any:
+    """Wert wie nach der Serialisierung der Skalare durch graphql-core."""
+    if isinstance(value, dict):
+        return {_camel(key): _graphql_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_graphql_value(item) for item in value]
+    if isinstance(value, Enum):
+        return value.name
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+@pytest.fixture(scope="module")
+def products_page() -> dict[str, Any]:
+    """Response von `products` mit allen Feldern und typischen Produkten."""
+    content: Final = [
+        _graphql_value(
+            asdict(map_product_to_product_type(Product.model_validate(product_document("typisch", i))))
+        )
+        for i in range(_PAGE_SIZE)
+    ]
+    return {
+        "data": {"products": {"content": content, "total": _PAGE_SIZE, "size": _PAGE_SIZE}},
+        "extensions": {"cost": {"requested": 2702, "maximum": 5000, "depth": 4}},
+    }
+
+
+_ENCODERS: Final[dict[str, Callable[[Any], str | bytes]]] = {
+    # bisher: BaseView.encode_json von Strawberry
+    "json": json.dumps,
+    "orjson": encode_response,
+}
+
+
+@pytest.mark.parametrize("encoder", list(_ENCODERS))
+def bench_encode_products_page(
+    benchmark: Any, products_page: dict[str, Any], encoder: str
+) -> None:
+    """JSON einer Seite mit 100 Produkten wie im Router erzeugen."""
+    encoded = benchmark(_ENCODERS[encoder], products_page)
+    assert orjson.loads(encoded) == products_page
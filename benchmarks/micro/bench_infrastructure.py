@@ -0,0 +1,40 @@
+"""Aufrufkontext von `LoggerPlus` und Erzeugen von `Pageable`."""
+
+from typing import Any, Final
+
+import pytest
+
+from product.logging.logger_plus import LoggerPlus
+from product.repository.pageable import Pageable
+
+
+class _Service:
+    """Nachbildung der Aufrufkette Service → `LoggerPlus.info` → `log` → `_get_context`."""
+
+    def __init__(self, logger_plus: LoggerPlus) -> None:
+        self._log: Final = logger_plus
+
+    def find(self) -> tuple[str, str]:
+        return self._info()
+
+    def _info(self) -> tuple[str, str]:
+        return self._log_call()
+
+    def _log_call(self) -> tuple[str, str]:
+        return self._log._get_context()  # noqa: SLF001
+
+
+def bench_logger_plus_get_context(benchmark: Any) -> None:
+    """Klassen- und Methodenname des Aufrufers über `inspect.stack()`."""
+    service: Final = _Service(LoggerPlus())
+    class_name, method_name = benchmark(service.find)
+    assert (class_name, method_name) == ("_Service", "find")
+
+
+@pytest.mark.parametrize(
+    ("skip", "limit"), [(None, None), (40, 20), (-1, 1000)], ids=["default", "gueltig", "korrigiert"]
+)
+def bench_pageable_create(benchmark: Any, skip: int | None, limit: int | None) -> None:
+    """`Pageable.create` mit Default-, gültigen und zu korrigierenden Werten."""
+    pageable = benchmark(Pageable.create, skip=skip, limit=limit)
+    assert pageable.limit > 0
@@ -0,0 +1,44 @@
+"""Trace-Header von Kafka-Nachrichten und Serialisierung von Kafka-DTOs."""
+
+from datetime import datetime
+from typing import Any, Final
+from uuid import UUID
+
+import pytest
+
+from product.logging.log_event_dto import LogEventDTO, LogLevel
+from product.tracing.trace_context_util import TraceContextUtil
+
+_HEADERS: Final = {
+    "ohne-trace": [(b"x-service", b"product"), (b"x-event-name", b"log")],
+    "b3": [
+        (b"x-b3-traceid", b"4bf92f3577b34da6a3ce929d0e0e4736"),
+        (b"x-b3-spanid", b"00f067aa0ba902b7"),
+        (b"x-b3-parentspanid", b"a3ce929d0e0e4736"),
+        (b"x-service", b"product"),
+        (b"x-event-name", b"product-updated"),
+        (b"x-event-version", b"1.0.0"),
+    ],
+}
+
+
+@pytest.mark.parametrize("headers", list(_HEADERS))
+def bench_trace_context_from_kafka_headers(benchmark: Any, headers: str) -> None:
+    """TraceContext und OTel-Kontext aus Kafka-Headern."""
+    trace_ctx, _ = benchmark(TraceContextUtil.from_kafka_headers, _HEADERS[headers])
+    assert trace_ctx.x_service == "product"
+
+
+def bench_log_event_to_kafka(benchmark: Any) -> None:
+    """`KafkaSerializerMixin.to_kafka` für ein typisches Log-Event."""
+    event: Final = LogEventDTO(
+        id=UUID(int=1),
+        timestamp=datetime(2025, 1, 1, 12, 0),
+        level=LogLevel.INFO,
+        message="Produkt 00000000-0000-0000-0000-000000000001 aktualisiert",
+        service="product",
+        class_name="ProductWriteService",
+        method_name="update",
+    )
+    payload = benchmark(event.to_kafka)
+    assert payload.startswith(b"{")
@@ -0,0 +1,35 @@
+"""Umwandlung von Decimal128 in Decimal und Validierung einer Seite mit 100 Produkten."""
+
+from decimal import Decimal
+from typing import Any
+
+import pytest
+from bson import Decimal128
+
+from benchmarks.micro.conftest import product_document
+from product.model.entity.money import to_decimal
+from product.model.entity.product import Product
+
+PRICES = ("0", "24.99", "999.99", "-12.5", "1E+3", "0.000001")
+
+
+@pytest.mark.parametrize(
+    "convert",
+    [
+        pytest.param(lambda value: Decimal(str(value.to_decimal())), id="bson-str-roundtrip"),
+        pytest.param(lambda value: value.to_decimal(), id="bson"),
+        pytest.param(to_decimal, id="money"),
+    ],
+)
+def bench_decimal128_to_decimal(benchmark: Any, convert: Any) -> None:
+    """Alle Preise aus `PRICES` umwandeln."""
+    values = [Decimal128(price) for price in PRICES]
+    result = benchmark(lambda: [convert(value) for value in values])
+    assert result == [Decimal(price) for price in PRICES]
+
+
+def bench_validate_products_page(benchmark: Any) -> None:
+    """Seite mit 100 typischen Produkten wie aus `find` validieren."""
+    documents = [product_document("typisch", index) for index in range(100)]
+    products = benchmark(lambda: [Product.model_validate(document) for document in documents])
+    assert products[0].price == documents[0]["price"].to_decimal()
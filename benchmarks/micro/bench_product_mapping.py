@@ -0,0 +1,17 @@
+"""Validierung von MongoDB-Dokumenten und Mapping auf den GraphQL-Typ."""
+
+from typing import Any
+
+from product.model.entity.product import Product, map_product_to_product_type
+
+
+def bench_product_validate_decimal128(benchmark: Any, document: dict[str, Any]) -> None:
+    """`Product.model_validate` inkl. Decimal128 → Decimal für Preis und Aufpreise."""
+    product = benchmark(Product.model_validate, document)
+    assert len(product.variants) == len(document["variants"])
+
+
+def bench_map_product_to_product_type(benchmark: Any, product: Product) -> None:
+    """Mapping eines validierten Produkts auf `ProductType`."""
+    product_type = benchmark(map_product_to_product_type, product)
+    assert product_type.name == product.name
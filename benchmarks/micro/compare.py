@@ -0,0 +1,89 @@
+"""Zwei Läufe der Microbenchmarks (JSON von pytest-benchmark) vergleichen.
+
+    uv run python -m benchmarks.micro.compare results/micro/<alt>.json \\
+        results/micro/<neu>.json --threshold 0.10 --stat median
+
+Verglichen wird je Benchmark die gewählte Kennzahl. Ein Anstieg über den
+Schwellwert gilt als Regression und führt zu Exit-Code 1. Benchmarks, die nur
+in einem der beiden Läufe vorkommen, werden aufgeführt, aber nicht bewertet.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Final
+
+import orjson
+
+__all__ = ["compare", "read_results"]
+
+_DEFAULT_THRESHOLD: Final = 0.10
+_STATS: Final = ("min", "median", "mean")
+
+
+def read_results(path: Path, stat: str) -> dict[str, float]:
+    """Kennzahl (Sekunden) je Benchmark aus einer JSON-Datei von pytest-benchmark."""
+    data: Final = orjson.loads(path.read_bytes())
+    return {bench["fullname"]: bench["stats"][stat] for bench in data["benchmarks"]}
+
+
+def compare(
+    old: dict[str, float], new: dict[str, float], threshold: float
+) -> list[tuple[str, float, float, float]]:
+    """Relative Änderung je Benchmark, der in beiden Läufen vorkommt.
+
+    :param old: Ergebnis von `read_results` für den Referenzlauf
+    :param new: Ergebnis von `read_results` für den neuen Lauf
+    :param threshold: Erlaubter relativer Anstieg, z.B. 0.10 für 10 %
+    :return: Regressionen als (Name, alt, neu, Änderung)
+    """
+    regressions: Final[list[tuple[str, float, float, float]]] = []
+    for name in sorted(old.keys() & new.keys()):
+        change = new[name] / old[name] - 1 if old[name] else 0.0
+        if change > threshold:
+            regressions.append((name, old[name], new[name], change))
+    return regressions
+
+
+def _format(seconds: float) -> str:
+    for unit, factor in (("s", 1.0), ("ms", 1e3), ("µs", 1e6)):
+        if seconds * factor >= 1:
+            return f"{seconds * factor:.2f} {unit}"
+    return f"{seconds * 1e9:.0f} ns"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser: Final = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("old", type=Path, help="Referenzlauf")
+    parser.add_argument("new", type=Path, help="Neuer Lauf")
+    parser.add_argument("--threshold", type=float, default=_DEFAULT_THRESHOLD)
+    parser.add_argument("--stat", choices=_STATS, default="median")
+    args: Final = parser.parse_args(argv)
+
+    old: Final = read_results(args.old, args.stat)
+    new: Final = read_results(args.new, args.stat)
+
+    width: Final = max((len(name) for name in old.keys() | new.keys()), default=10)
+    print(f"{'Benchmark':<{width}} {'alt':>11} {'neu':>11} {'Änderung':>9}")
+    for name in sorted(old.keys() | new.keys()):
+        if name not in old or name not in new:
+            print(f"{name:<{width}} {'nur ' + ('neu' if name in new else 'alt'):>33}")
+            continue
+        change = new[name] / old[name] - 1 if old[name] else 0.0
+        marker = "  !" if change > args.threshold else ""
+        print(
+            f"{name:<{width}} {_format(old[name]):>11} {_format(new[name]):>11} "
+            f"{change:>+9.1%}{marker}"
+        )
+
+    regressions: Final = compare(old, new, args.threshold)
+    print(
+        f"Keine Regression über {args.threshold:.0%} ({args.stat})"
+        if not regressions
+        else f"{len(regressions)} Regression(en) über {args.threshold:.0%} ({args.stat})"
+    )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""Fixtures für die Microbenchmarks: Produkt-Dokumente in mehreren Größen.
+
+`product` validiert beim Import die Umgebungsvariablen; fehlende Werte werden
+hier mit Platzhaltern belegt, da keine externen Dienste kontaktiert werden.
+Beanie wird ohne MongoDB initialisiert, indem `buildInfo` lokal beantwortet
+wird.
+"""
+
+import asyncio
+import os
+import random
+from typing import Any, Final
+
+import pytest
+
+_PLACEHOLDER_ENV: Final = {
+    "APP_ENV": "benchmark",
+    "EXCEL_EXPORT_ENABLED": "false",
+    "EXPORT_FORMAT": "csv",
+    "KAFKA_URI": "localhost:9092",
+    "KC_SERVICE_CLIENT_ID": "product",
+    "KC_SERVICE_HOST": "localhost",
+    "KC_SERVICE_PORT": "8080",
+    "KC_SERVICE_REALM": "benchmark",
+    "KEYS_PATH": "keys",
+    "MONGO_DB_DATABASE": "product_benchmark",
+    "MONGO_DB_URI": "mongodb://localhost:27017",
+    "MONGO_DB_USER_NAME": "benchmark",
+    "MONGO_DB_USER_PASSWORT": "benchmark",
+    "TEMPO_URI": "http://localhost:4317",
+    "TRACING_EXPORTER": "none",
+}
+for _key, _value in _PLACEHOLDER_ENV.items():
+    os.environ.setdefault(_key, _value)
+
+from beanie import init_beanie  # noqa: E402
+from bson import Decimal128  # noqa: E402
+from motor.motor_asyncio import AsyncIOMotorClient  # noqa: E402
+
+from benchmarks.catalogue import generate_document  # noqa: E402
+from benchmarks.vocabulary import TAGS, VARIANTS  # noqa: E402
+from product.model.entity.category_stats import CategoryStats  # noqa: E402
+from product.model.entity.product import Product  # noqa: E402
+
+SHAPES: Final = {
+    # Anzahl Varianten, Anzahl Tags
+    "minimal": (0, 0),
+    "typisch": (3, 5),
+    "umfangreich": (24, len(TAGS)),
+}
+
+
+def product_document(shape: str, index: int = 0) -> dict[str, Any]:
+    """Produkt-Dokument wie in MongoDB gespeichert, mit Decimal128-Preisen.
+
+    :param shape: Schlüssel aus `SHAPES`
+    :param index: Laufende Nummer für eindeutige Namen und IDs
+    :return: BSON-kompatibles Dictionary
+    """
+    variant_count, tag_count = SHAPES[shape]
+    rng: Final = random.Random(index)  # noqa: S311
+    document: Final = generate_document(rng, index, max_variants=0, max_tags=0)
+    document["tags"] = list(TAGS[:tag_count])
+    document["variants"] = [
+        {
+            "name": VARIANTS[i % len(VARIANTS)][0],
+            "value": rng.choice(VARIANTS[i % len(VARIANTS)][1]),
+            "additional_price": Decimal128(f"{rng.randrange(0, 5000) / 100:.2f}"),
+        }
+        for i in range(variant_count)
+    ]
+    return document
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _beanie_offline() -> None:
+    """Beanie ohne MongoDB-Server initialisieren, damit `Product` instanziierbar ist."""
+
+    async def init() -> None:
+        database: Final = AsyncIOMotorClient(connect=False)["product_benchmark"]
+
+        async def build_info(*_args: Any, **_kwargs: Any) -> dict[str, str]:
+            return {"version": "7.0.0"}
+
+        database.command = build_info
+        await init_beanie(
+            database=database,
+            document_models=[Product, CategoryStats],
+            skip_indexes=True,
+        )
+
+    asyncio.run(init())
+
+
+@pytest.fixture(params=list(SHAPES))
+def shape(request: pytest.FixtureRequest) -> str:
+    """Größe des Produkt-Dokuments."""
+    return request.param
+
+
+@pytest.fixture
+def document(shape: str) -> dict[str, Any]:
+    """Rohdokument in der jeweiligen Größe."""
+    return product_document(shape)
+
+
+@pytest.fixture
+def product(document: dict[str, Any]) -> Product:
+    """Validiertes `Product` in der jeweiligen Größe."""
+    return Product.model_validate(document)
@@ -0,0 +1,146 @@
+"""Benchmark für Volltextsuche und Autovervollständigung mit generiertem Katalog.
+
+Benötigt einen laufenden MongoDB-Server gemäß `MONGO_DB_URI` und verwendet die
+Datenbank `<MONGO_DB_DATABASE>_bench`, z.B.:
+
+    uv run python -m benchmarks.search --size 100000 --iterations 200
+"""
+
+import argparse
+import asyncio
+import random
+import re
+import statistics
+from collections.abc import Awaitable, Callable, Iterator
+from itertools import islice
+from time import perf_counter
+from typing import Any, Final
+
+from beanie import init_beanie
+from bson import Binary
+
+from benchmarks.catalogue import BRANDS, NOUNS, TAGS, generate_catalogue
+from product.config.mongo import mongo_database
+from product.model.entity.product import Product
+from product.repository.product_repository import ProductRepository
+from product.repository.query_builder import prefix_filter
+from product.repository.session import create_client
+
+_BATCH_SIZE: Final = 1000
+
+
+def _stages(plan: dict[str, Any]) -> Iterator[str]:
+    """Alle Stages eines Query-Plans (rekursiv) ermitteln."""
+    if "stage" in plan:
+        yield plan["stage"]
+    for key in ("inputStage", "queryPlan"):
+        if key in plan:
+            yield from _stages(plan[key])
+    for child in plan.get("inputStages", []):
+        yield from _stages(child)
+
+
+async def _explain(db: Any, command: dict[str, Any]) -> str:
+    result: Final = await db.command({"explain": command, "verbosity": "queryPlanner"})
+    planner: Final = (
+        result.get("queryPlanner") or result["stages"][0]["$cursor"]["queryPlanner"]
+    )
+    return " <- ".join(_stages(planner["winningPlan"]))
+
+
+async def _measure(
+    name: str, iterations: int, call: Callable[[int], Awaitable[Any]]
+) -> None:
+    durations: Final[list[float]] = []
+    for i in range(iterations):
+        start = perf_counter()
+        await call(i)
+        durations.append((perf_counter() - start) * 1000)
+    quantiles: Final = statistics.quantiles(durations, n=100)
+    print(
+        f"{name:<24} p50={quantiles[49]:8.2f} ms  p95={quantiles[94]:8.2f} ms  "
+        f"p99={quantiles[98]:8.2f} ms  mean={statistics.fmean(durations):8.2f} ms"
+    )
+
+
+async def _load(size: int, seed: int, reload: bool) -> None:
+    collection: Final = Product.get_motor_collection()
+    if not reload and await collection.estimated_document_count() == size:
+        print(f"Katalog mit {size} Produkten bereits vorhanden")
+        return
+    await collection.delete_many({})
+    documents: Final = generate_catalogue(size, seed=seed)
+    start: Final = perf_counter()
+    while batch := list(islice(documents, _BATCH_SIZE)):
+        await collection.insert_many(batch, ordered=False)
+    print(f"{size} Produkte in {perf_counter() - start:.1f} s geladen")
+
+
+async def main() -> None:
+    parser: Final = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=50_000, help="Anzahl Produkte")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--reload", action="store_true", help="Katalog neu laden")
+    args: Final = parser.parse_args()
+
+    client: Final = create_client()
+    db: Final = client[f"{mongo_database}_bench"]
+    await init_beanie(database=db, document_models=[Product])
+    await _load(args.size, args.seed, args.reload)
+
+    repo: Final = ProductRepository()
+    rng: Final = random.Random(args.seed)  # noqa: S311
+    terms: Final = [rng.choice(NOUNS + BRANDS + TAGS) for _ in range(args.iterations)]
+    prefixes: Final = [t[: rng.randint(2, 5)] for t in terms]
+
+    async def regex_scan(i: int) -> Any:
+        pattern = {"name": {"$regex": re.escape(terms[i]), "$options": "i"}}
+        return await Product.find(pattern).limit(10).to_list()
+
+    async def text_search(i: int) -> Any:
+        return await repo.search(terms[i], limit=10)
+
+    async def text_search_page2(i: int) -> Any:
+        first_page = await repo.search(terms[i], limit=10)
+        if not first_page:
+            return []
+        product, score = first_page[-1]
+        return await repo.search(
+            terms[i], limit=10, after=(score, Binary.from_uuid(product.id))
+        )
+
+    async def autocomplete(i: int) -> Any:
+        return await repo.autocomplete(prefixes[i], limit=10)
+
+    plans: Final = {
+        "Substring (Regex)": {
+            "find": "products",
+            "filter": {"name": {"$regex": "kopf", "$options": "i"}},
+        },
+        "Volltext": {
+            "aggregate": "products",
+            "pipeline": [{"$match": {"$text": {"$search": "kopfhörer"}}}],
+            "cursor": {},
+        },
+        "Autocomplete": {
+            "find": "products",
+            "filter": prefix_filter("kopf"),
+            "sort": {"name_normalized": 1},
+        },
+    }
+    print(f"\nQuery-Plans (Katalog: {args.size} Produkte)")
+    for name, command in plans.items():
+        print(f"  {name:<18} {await _explain(db, command)}")
+
+    print(f"\nLatenzen ({args.iterations} Iterationen)")
+    await _measure("regex substring (alt)", args.iterations, regex_scan)
+    await _measure("searchProducts", args.iterations, text_search)
+    await _measure("searchProducts Seite 2", args.iterations, text_search_page2)
+    await _measure("autocompleteProducts", args.iterations, autocomplete)
+
+    client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
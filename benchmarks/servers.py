@@ -0,0 +1,244 @@
+"""ASGI-Server-Konfigurationen vergleichen: Worker, Event Loop, HTTP-Parser, HTTP/2.
+
+    uv run python -m benchmarks.servers --duration 10 --connections 64
+    uv run python -m benchmarks.servers --config uvicorn-tuned --config uvicorn-workers
+
+Jede Konfiguration startet `product.asgi_server.serve` in einem eigenen Prozess
+mit einer kleinen FastAPI-App aus diesem Modul. Sie liefert pro Request eine
+Seite mit Produkten als JSON und braucht weder MongoDB noch Kafka noch
+Keycloak. Gemessen wird also der Server samt FastAPI und nicht die Datenbank.
+Die Last erzeugen mehrere Client-Prozesse mit httpx und Keep-Alive. Auf
+demselben Rechner konkurrieren sie mit den Workern um CPUs; mit `--host` lässt
+sich ein auf einem anderen Knoten gestarteter Server messen (`--serve`).
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess  # noqa: S404
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Final
+
+import httpx
+import orjson
+from fastapi import FastAPI
+
+from benchmarks.startup import PLACEHOLDER_ENV
+
+__all__ = ["CONFIGS", "app"]
+
+_ROOT: Final = Path(__file__).resolve().parent.parent
+_PAGE_SIZE: Final = 20
+
+CONFIGS: Final[dict[str, dict[str, Any]]] = {
+    # bisheriger Default: ein Prozess, asyncio und h11
+    "uvicorn-baseline": {"server": "uvicorn", "workers": 1, "loop": "asyncio", "http": "h11"},
+    "uvicorn-tuned": {"server": "uvicorn", "workers": 1, "loop": "auto", "http": "auto"},
+    "uvicorn-workers": {"server": "uvicorn", "workers": 0, "loop": "auto", "http": "auto"},
+    "hypercorn-baseline": {"server": "hypercorn", "workers": 1, "loop": "asyncio"},
+    "hypercorn-workers": {"server": "hypercorn", "workers": 0, "loop": "auto"},
+    "hypercorn-h2c-workers": {
+        "server": "hypercorn", "workers": 0, "loop": "auto", "http2": True,
+    },
+}  # fmt: skip
+"""Konfigurationen; `workers: 0` steht für `--workers` bzw. eine je CPU."""
+
+app: Final = FastAPI()
+
+
+@app.get("/products")
+def products(page: int = 0) -> list[dict[str, Any]]:
+    """Seite mit Produkten wie bei `products` in GraphQL, aber ohne Datenbank."""
+    start: Final = page * _PAGE_SIZE
+    return [
+        {
+            "id": f"{index:024x}",
+            "name": f"Produkt {index}",
+            "brand": "Benchmark",
+            "price": Decimal(index % 1000) + Decimal("0.99"),
+            "category": ("Elektronik", "Haushalt", "Garten")[index % 3],
+            "tags": ["angebot", f"serie-{index % 7}"],
+        }
+        for index in range(start, start + _PAGE_SIZE)
+    ]
+
+
+@app.get("/ping")
+def ping() -> dict[str, str]:
+    return {"status": "ok"}
+
+
+def _serve(config: str, host: str, port: int, workers: int) -> None:
+    """Server mit einer Konfiguration starten; läuft bis zum Beenden des Prozesses."""
+    for key, value in PLACEHOLDER_ENV.items():
+        os.environ.setdefault(key, value)
+    from product.asgi_server import ServerOptions, serve  # noqa: PLC0415
+
+    settings: Final = CONFIGS[config] | {
+        "app": "benchmarks.servers:app",
+        "host": host,
+        "port": port,
+        "tls": False,
+    }
+    if settings["workers"] == 0:
+        settings["workers"] = workers
+    serve(ServerOptions(**settings))
+
+
+def _start(config: str, port: int, workers: int) -> subprocess.Popen[bytes]:
+    env: Final = os.environ | PLACEHOLDER_ENV
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, (str(_ROOT), str(_ROOT / "src"), env.get("PYTHONPATH")))
+    )
+    command: Final = [
+        sys.executable, "-m", "benchmarks.servers",
+        "--serve", config, "--port", str(port), "--workers", str(workers),
+    ]  # fmt: skip
+    return subprocess.Popen(  # noqa: S603
+        command,
+        cwd=_ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def _wait_ready(url: str, timeout_s: float, http2: bool) -> None:
+    deadline: Final = time.monotonic() + timeout_s
+    with httpx.Client(http1=not http2, http2=http2) as client:
+        while time.monotonic() < deadline:
+            try:
+                if client.get(f"{url}/ping").status_code == 200:  # noqa: PLR2004
+                    return
+            except httpx.TransportError:
+                pass
+            time.sleep(0.2)
+    msg: Final = f"Server unter {url} nicht bereit nach {timeout_s} s"
+    raise TimeoutError(msg)
+
+
+async def _load(
+    url: str, connections: int, duration_s: float, http2: bool
+) -> tuple[list[float], int]:
+    latencies: Final[list[float]] = []
+    errors = 0
+    deadline: Final = time.perf_counter() + duration_s
+    limits: Final = httpx.Limits(
+        max_connections=connections, max_keepalive_connections=connections
+    )
+
+    async def worker(client: httpx.AsyncClient, offset: int) -> None:
+        nonlocal errors
+        page = offset
+        while (start := time.perf_counter()) < deadline:
+            try:
+                response = await client.get(url, params={"page": page % 50})
+                if response.status_code == 200:  # noqa: PLR2004
+                    latencies.append(time.perf_counter() - start)
+                else:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            page += 1
+
+    async with httpx.AsyncClient(
+        limits=limits, http1=not http2, http2=http2, timeout=10
+    ) as client:
+        await asyncio.gather(*(worker(client, i) for i in range(connections)))
+    return latencies, errors
+
+
+def _client(
+    url: str, connections: int, duration_s: float, http2: bool
+) -> tuple[list[float], int]:
+    return asyncio.run(_load(url, connections, duration_s, http2))
+
+
+def _percentile(values: list[float], q: float) -> float:
+    return values[min(int(len(values) * q), len(values) - 1)] if values else 0.0
+
+
+def measure(
+    url: str, connections: int, clients: int, duration_s: float, http2: bool
+) -> dict[str, float]:
+    """Last mit mehreren Client-Prozessen erzeugen.
+
+    :return: Requests/s, Latenz-Perzentile in ms und Anzahl Fehler
+    """
+    per_client: Final = max(connections // clients, 1)
+    latencies: Final[list[float]] = []
+    errors = 0
+    with ProcessPoolExecutor(clients) as pool:
+        futures = [
+            pool.submit(_client, url, per_client, duration_s, http2)
+            for _ in range(clients)
+        ]
+        for future in futures:
+            values, failed = future.result()
+            latencies.extend(values)
+            errors += failed
+    latencies.sort()
+    return {
+        "rps": len(latencies) / duration_s,
+        "p50_ms": _percentile(latencies, 0.5) * 1000,
+        "p99_ms": _percentile(latencies, 0.99) * 1000,
+        "mean_ms": statistics.fmean(latencies) * 1000 if latencies else 0.0,
+        "errors": errors,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser: Final = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--config", action="append", choices=sorted(CONFIGS))
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=os.process_cpu_count() or 1)
+    parser.add_argument("--connections", type=int, default=64)
+    parser.add_argument("--clients", type=int, default=max((os.process_cpu_count() or 2) // 2, 1))
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--warmup", type=float, default=2.0)
+    parser.add_argument("--path", default="/products")
+    parser.add_argument("--json", type=Path, help="Ergebnisse zusätzlich als JSON")
+    parser.add_argument("--serve", choices=sorted(CONFIGS), help=argparse.SUPPRESS)
+    args: Final = parser.parse_args(argv)
+
+    if args.serve is not None:
+        _serve(args.serve, args.host, args.port, args.workers)
+        return 0
+
+    results: Final[dict[str, dict[str, float]]] = {}
+    for name in args.config or CONFIGS:
+        http2 = bool(CONFIGS[name].get("http2", False))
+        base_url = f"http://{args.host}:{args.port}"
+        process = _start(name, args.port, args.workers)
+        try:
+            _wait_ready(base_url, 60, http2)
+            measure(base_url + args.path, args.connections, args.clients, args.warmup, http2)
+            results[name] = measure(
+                base_url + args.path, args.connections, args.clients, args.duration, http2
+            )
+        finally:
+            process.terminate()
+            process.wait(30)
+        workers = CONFIGS[name]["workers"] or args.workers
+        result = results[name]
+        print(
+            f"{name:<24} {workers:>3} Worker {result['rps']:>9.0f} req/s "
+            f"p50 {result['p50_ms']:>7.2f} ms  p99 {result['p99_ms']:>7.2f} ms  "
+            f"Fehler {result['errors']:.0f}",
+            flush=True,
+        )
+
+    if args.json is not None:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+"""Startzeit: Import von `product` mit `python -X importtime` messen.
+
+    uv run python -m benchmarks.startup --runs 5 --top 15
+
+Jeder Lauf startet einen neuen Interpreter mit Platzhalter-Umgebung und ohne
+Span-Export; gemessen wird `import product`, also alles bis zur fertigen
+FastAPI-App ohne Verbindungen zu MongoDB oder Kafka. Ausgegeben werden der
+Median der Laufzeit und die Module mit der größten kumulierten Importzeit.
+Exit-Code 1, falls ein Modul, das erst bei Bedarf geladen werden soll, schon
+beim Start importiert wird.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess  # noqa: S404
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final
+
+__all__ = ["PLACEHOLDER_ENV", "ImportTime", "measure", "parse_importtime"]
+
+_ROOT: Final = Path(__file__).resolve().parent.parent
+
+# Nur für Export, Banner, alternative ASGI-Server bzw. Health-Checks
+LAZY_MODULES: Final = ("openpyxl", "PIL", "pyfiglet", "tabulate", "hypercorn", "aiohttp")
+
+PLACEHOLDER_ENV: Final = {
+    "APP_ENV": "test",
+    "EXCEL_EXPORT_ENABLED": "false",
+    "EXPORT_FORMAT": "csv",
+    "KAFKA_URI": "localhost:9092",
+    "KC_SERVICE_CLIENT_ID": "product",
+    "KC_SERVICE_HOST": "localhost",
+    "KC_SERVICE_PORT": "8080",
+    "KC_SERVICE_REALM": "benchmark",
+    "KEYS_PATH": "keys",
+    "MONGO_DB_DATABASE": "benchmark",
+    "MONGO_DB_URI": "mongodb://localhost",
+    "MONGO_DB_USER_NAME": "benchmark",
+    "MONGO_DB_USER_PASSWORT": "benchmark",
+    "TEMPO_URI": "",
+    "TRACING_EXPORTER": "none",
+}
+
+_PROBE: Final = f"""
+import sys, time
+start = time.perf_counter()
+import product
+print(time.perf_counter() - start)
+print(",".join(m for m in {LAZY_MODULES!r} if m in sys.modules))
+"""
+
+
+@dataclass(slots=True, frozen=True)
+class ImportTime:
+    """Zeile aus der Ausgabe von `-X importtime`."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(stderr: str) -> list[ImportTime]:
+    """Ausgabe von `-X importtime` in Einträge zerlegen."""
+    entries: Final[list[ImportTime]] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        if not self_us.strip().isdigit():
+            # Kopfzeile
+            continue
+        entries.append(
+            ImportTime(
+                module=name.strip(),
+                self_us=int(self_us),
+                cumulative_us=int(cumulative_us),
+                depth=(len(name) - len(name.lstrip())) // 2,
+            )
+        )
+    return entries
+
+
+def measure() -> tuple[float, list[str], list[ImportTime]]:
+    """Ein Lauf in einem neuen Interpreter.
+
+    :return: Sekunden für `import product`, vorzeitig geladene Module und Importzeiten
+    """
+    env: Final = os.environ | PLACEHOLDER_ENV
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, (str(_ROOT / "src"), env.get("PYTHONPATH")))
+    )
+    result: Final = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", _PROBE],
+        capture_output=True,
+        check=True,
+        cwd=_ROOT,
+        env=env,
+        text=True,
+    )
+    seconds, loaded = result.stdout.splitlines()[-2:]
+    return float(seconds), [m for m in loaded.split(",") if m], parse_importtime(
+        result.stderr
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser: Final = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args: Final = parser.parse_args(argv)
+
+    durations: Final[list[float]] = []
+    loaded: list[str] = []
+    entries: list[ImportTime] = []
+    for _ in range(args.runs):
+        seconds, loaded, entries = measure()
+        durations.append(seconds)
+
+    print(
+        f"import product: Median {statistics.median(durations) * 1000:.0f} ms, "
+        f"min {min(durations) * 1000:.0f} ms, max {max(durations) * 1000:.0f} ms "
+        f"({args.runs} Läufe)"
+    )
+    print()
+    print(f"{'Modul':<60} {'kumuliert':>10} {'selbst':>8}")
+    # Nur Pakete der obersten Ebene, sonst erscheint dieselbe Zeit mehrfach
+    top_level: Final = sorted(
+        (e for e in entries if "." not in e.module),
+        key=lambda e: e.cumulative_us,
+        reverse=True,
+    )
+    for entry in top_level[: args.top]:
+        print(
+            f"{entry.module:<60} {entry.cumulative_us / 1000:>7.1f} ms "
+            f"{entry.self_us / 1000:>5.1f} ms"
+        )
+
+    if loaded:
+        print()
+        print(f"Beim Start geladen, obwohl erst bei Bedarf benötigt: {', '.join(loaded)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""Benchmark für den Suggestion-Index: Speicherbedarf, Aufbauzeit und Latenz.
+
+Läuft ohne MongoDB direkt auf dem generierten Katalog, z.B.:
+
+    uv run python -m benchmarks.suggest --size 100000 --iterations 2000
+"""
+
+import argparse
+import gc
+import random
+import statistics
+import tracemalloc
+from time import perf_counter
+from typing import Final
+
+from benchmarks.catalogue import BRANDS, NOUNS, TAGS, generate_catalogue
+from product.search.suggestion_index import SuggestionIndex
+
+
+def _percentiles(name: str, durations: list[float]) -> None:
+    quantiles: Final = statistics.quantiles(durations, n=100)
+    print(
+        f"{name:<28} p50={quantiles[49]:8.1f} µs  p95={quantiles[94]:8.1f} µs  "
+        f"p99={quantiles[98]:8.1f} µs  mean={statistics.fmean(durations):8.1f} µs"
+    )
+
+
+def main() -> None:
+    parser: Final = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=100_000, help="Anzahl Produkte")
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    args: Final = parser.parse_args()
+
+    documents: Final = list(generate_catalogue(args.size, seed=args.seed))
+    for doc in documents:
+        doc["id"] = doc.pop("_id").as_uuid()
+
+    start: Final = perf_counter()
+    SuggestionIndex().build_from(documents)
+    build_seconds: Final = perf_counter() - start
+
+    # Speicher separat messen: tracemalloc verlangsamt den Aufbau erheblich
+    gc.collect()
+    tracemalloc.start()
+    before: Final = tracemalloc.take_snapshot()
+    index: Final = SuggestionIndex()
+    index.build_from(documents)
+    gc.collect()
+    after: Final = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated: Final = sum(s.size_diff for s in after.compare_to(before, "filename"))
+
+    print(f"Katalog:   {len(index)} Produkte, {index.term_count} Begriffe")
+    print(f"Aufbau:    {build_seconds:.2f} s")
+    print(
+        f"Speicher:  {allocated / 2**20:.1f} MiB "
+        f"({allocated / max(len(index), 1):.0f} Byte je Produkt)"
+    )
+
+    rng: Final = random.Random(args.seed)  # noqa: S311
+    vocabulary: Final = NOUNS + BRANDS + TAGS
+    workloads: Final = {
+        "1 Wort, 2 Zeichen": [rng.choice(vocabulary)[:2] for _ in range(args.iterations)],
+        "1 Wort, 4 Zeichen": [rng.choice(vocabulary)[:4] for _ in range(args.iterations)],
+        "2 Wörter (Nomen + Marke)": [
+            f"{rng.choice(NOUNS)} {rng.choice(BRANDS)[:3]}" for _ in range(args.iterations)
+        ],
+        "Update + Suche": [rng.choice(NOUNS)[:3] for _ in range(args.iterations)],
+    }
+
+    print(f"\nLatenzen ({args.iterations} Iterationen, limit={args.limit})")
+    for name, prefixes in workloads.items():
+        durations: list[float] = []
+        for prefix in prefixes:
+            if name == "Update + Suche":
+                index.upsert(rng.choice(documents))
+            start_query = perf_counter()
+            index.suggest(prefix, args.limit)
+            durations.append((perf_counter() - start_query) * 1_000_000)
+        _percentiles(name, durations)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""Wortlisten für generierte Kataloge; ohne Abhängigkeit zu `product` importierbar."""
+
+from typing import Final
+
+__all__ = ["ADJECTIVES", "BRANDS", "NOUNS", "TAGS", "VARIANTS"]
+
+BRANDS: Final = (
+    "Apple", "Samsung", "SoundMax", "ProGamer", "FastCharge", "StreamCam",
+    "Bosch", "Siemens", "Adidas", "Nike", "Lego", "Ravensburger", "Tefal",
+    "Philips", "Braun", "Miele", "Puma", "Hama", "Logitech", "Sony",
+)  # fmt: skip
+
+ADJECTIVES: Final = (
+    "Kabelloser", "Ergonomische", "Smarte", "Kompakter", "Leichte", "Robuster",
+    "Faltbarer", "Digitaler", "Klassische", "Premium", "Wasserdichte", "Mobiler",
+)  # fmt: skip
+
+NOUNS: Final = (
+    "Kopfhörer", "Maus", "Tastatur", "Laptop", "Smartphone", "Tablet", "Webcam",
+    "Ladegerät", "Lautsprecher", "Monitor", "Laufschuh", "Rucksack", "Pfanne",
+    "Kaffeemaschine", "Staubsauger", "Puzzle", "Bausatz", "Jacke", "Uhr", "Lampe",
+)  # fmt: skip
+
+TAGS: Final = (
+    "neu", "sale", "bestseller", "bio", "kabellos", "usb-c", "bluetooth",
+    "outdoor", "gaming", "büro", "kinder", "premium", "nachhaltig", "smart",
+)  # fmt: skip
+
+VARIANTS: Final = (
+    ("Farbe", ("Schwarz", "Weiß", "Rot", "Blau", "Grün")),
+    ("Größe", ("S", "M", "L", "XL")),
+    ("Speicher", ("64 GB", "128 GB", "256 GB", "512 GB")),
+)
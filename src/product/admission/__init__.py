@@ -0,0 +1,6 @@
+"""Admission Control: gleichzeitige GraphQL-Operationen adaptiv begrenzen."""
+
+from product.admission.limiter import AdaptiveLimiter
+from product.admission.middleware import AdmissionControlMiddleware, classify_operation
+
+__all__ = ["AdaptiveLimiter", "AdmissionControlMiddleware", "classify_operation"]
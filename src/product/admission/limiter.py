@@ -0,0 +1,154 @@
+"""Adaptives Limit gleichzeitiger Operationen mit begrenzter Warteschlange.
+
+Das Limit folgt AIMD wie die Congestion Control von TCP. Jede Operation unter
+der Ziel-Latenz erhöht es um 1/Limit, also um etwa 1 je "Runde" von Limit
+Operationen. Jede langsamere Operation senkt es um den Faktor `backoff`,
+höchstens einmal je Runde, damit ein einzelner Ausreißer nicht mehrfach zählt.
+Operationen über dem Limit warten in einer FIFO-Queue. Ist sie voll oder
+dauert das Warten zu lange, wird sofort abgelehnt, statt die Latenz aller
+anderen Operationen zu erhöhen.
+"""
+
+import asyncio
+from collections import deque
+from time import perf_counter
+from typing import Final
+
+from opentelemetry.metrics import CallbackOptions, Observation
+
+from product.config.admission import AdmissionLimit
+from product.error.exceptions import OverloadedError
+from product.metrics.metric_registry import (
+    admission_queue_duration_histogram,
+    admission_rejections_counter,
+    meter,
+)
+
+__all__ = ["AdaptiveLimiter", "register_gauges"]
+
+
+class AdaptiveLimiter:
+    """Begrenzt gleichzeitige Operationen eines Typs in einem Event Loop."""
+
+    def __init__(self, operation: str, limit: AdmissionLimit) -> None:
+        self._operation: Final = operation
+        self._config: Final = limit
+        self._limit: float = limit.initial_limit
+        self._in_flight = 0
+        self._waiters: Final[deque[asyncio.Future[None]]] = deque()
+        # Abgeschlossene Operationen bis zur nächsten möglichen Verringerung
+        self._cooldown = 0
+        self._attributes: Final = {"operation": operation}
+
+    @property
+    def limit(self) -> int:
+        """Aktuelles Limit gleichzeitiger Operationen."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Laufende Operationen."""
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        """Wartende Operationen."""
+        return len(self._waiters)
+
+    async def acquire(self) -> float:
+        """Auf einen freien Platz warten.
+
+        :return: Wartezeit in Sekunden
+        :raises OverloadedError: Falls die Queue voll ist oder die Wartezeit abläuft
+        """
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            admission_queue_duration_histogram.record(0.0, self._attributes)
+            return 0.0
+        if len(self._waiters) >= self._config.max_queue:
+            self._reject("queue_full")
+
+        start: Final = perf_counter()
+        waiter: Final = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            async with asyncio.timeout(self._config.queue_timeout_ms / 1000):
+                await waiter
+        except TimeoutError:
+            if not waiter.done() or waiter.cancelled():
+                self._remove(waiter)
+                self._reject("queue_timeout")
+            # Platz wurde im selben Durchlauf des Event Loops noch zugeteilt
+        except asyncio.CancelledError:
+            # Client hat die Verbindung geschlossen; ein schon zugeteilter Platz wird frei
+            if waiter.done() and not waiter.cancelled():
+                self._in_flight -= 1
+                self._wake()
+            else:
+                self._remove(waiter)
+            raise
+        waited: Final = perf_counter() - start
+        admission_queue_duration_histogram.record(waited, self._attributes)
+        return waited
+
+    def release(self, duration_s: float, *, failed: bool = False) -> None:
+        """Platz freigeben und das Limit anhand der Dauer anpassen.
+
+        :param duration_s: Dauer der Operation ohne Wartezeit
+        :param failed: True, falls die Operation mit einer Exception endete
+        """
+        self._in_flight -= 1
+        self._adjust(slow=failed or duration_s * 1000 > self._config.latency_target_ms)
+        self._wake()
+
+    def _adjust(self, *, slow: bool) -> None:
+        if self._cooldown > 0:
+            self._cooldown -= 1
+        if slow:
+            if self._cooldown == 0:
+                self._limit = max(
+                    self._limit * self._config.backoff, self._config.min_limit
+                )
+                self._cooldown = self.limit
+        elif self._in_flight + 1 >= self.limit // 2:
+            # Nur wachsen, wenn das Limit tatsächlich ausgeschöpft wird
+            self._limit = min(self._limit + 1 / self._limit, self._config.max_limit)
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+    def _remove(self, waiter: asyncio.Future[None]) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def _reject(self, reason: str) -> None:
+        admission_rejections_counter.add(1, self._attributes | {"reason": reason})
+        raise OverloadedError(self._operation, reason)
+
+    def observe(self) -> list[Observation]:
+        """Messwerte für die Gauges aus `register_gauges`."""
+        return [
+            Observation(self.limit, self._attributes | {"state": "limit"}),
+            Observation(self._in_flight, self._attributes | {"state": "in_flight"}),
+            Observation(len(self._waiters), self._attributes | {"state": "queued"}),
+        ]
+
+
+def register_gauges(limiters: list[AdaptiveLimiter]) -> None:
+    """Gauge `admission_concurrency` mit Limit, laufenden und wartenden Operationen."""
+
+    def callback(_options: CallbackOptions) -> list[Observation]:
+        return [obs for limiter in limiters for obs in limiter.observe()]
+
+    meter.create_observable_gauge(
+        name="admission_concurrency",
+        callbacks=[callback],
+        description="Limit, laufende und wartende GraphQL-Operationen je Typ",
+        unit="1",
+    )
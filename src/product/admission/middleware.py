@@ -0,0 +1,198 @@
+"""ASGI-Middleware: GraphQL-Operationen erst nach Zulassung ausführen.
+
+Die Middleware liegt außen vor Keycloak, Tracing und Metriken. Eine
+abgelehnte Operation kostet dadurch weder eine Anfrage an Keycloak noch das
+Parsen durch Strawberry. Der Operationstyp wird ohne vollständiges Parsen
+bestimmt: String-Literale und Kommentare werden entfernt, dann werden die
+Schlüsselwörter am Anfang der Definitionen gesucht. Bei Persisted Queries mit
+nur einem Hash wird der bekannte Query-Text verwendet.
+"""
+
+import re
+from collections.abc import Mapping
+from time import perf_counter
+from typing import Any, Final
+from urllib.parse import parse_qs
+
+import orjson
+from loguru import logger
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from product.admission.limiter import AdaptiveLimiter, register_gauges
+from product.config.admission import (
+    AdmissionLimit,
+    admission_limits,
+    admission_retry_after_s,
+)
+from product.error.exceptions import OverloadedError
+from product.graphql.persisted_queries import get_persisted_queries, persisted_query_hash
+
+__all__ = ["AdmissionControlMiddleware", "classify_operation"]
+
+_DEFAULT_OPERATION: Final = "query"
+
+# Block-Strings, Strings und Kommentare können Schlüsselwörter enthalten
+_LITERALS: Final = re.compile(r'"""(?:[^"\\]|\\.|"(?!""))*"""|"(?:[^"\\\n]|\\.)*"|#[^\n]*')
+# Operationen beginnen am Anfang des Dokuments oder nach dem Ende einer Definition
+_OPERATION: Final = re.compile(
+    r"(?:\A|\})\s*(query|mutation|subscription)\b\s*([_A-Za-z][_0-9A-Za-z]*)?"
+)
+
+
+def classify_operation(document: str, operation_name: str | None = None) -> str:
+    """Typ der auszuführenden Operation eines GraphQL-Dokuments.
+
+    :param document: GraphQL-Dokument
+    :param operation_name: `operationName` aus dem Request bei mehreren Operationen
+    :return: query, mutation oder subscription; query für die Kurzform `{ ... }`
+    """
+    operations: Final = _OPERATION.findall(_LITERALS.sub('""', document))
+    for kind, name in operations:
+        if operation_name is None or name == operation_name:
+            return kind
+    return _DEFAULT_OPERATION
+
+
+def _operation_from_payload(payload: Any) -> str:
+    if isinstance(payload, list):
+        # Batch: der teuerste Typ bestimmt das Limit
+        kinds = {_operation_from_payload(item) for item in payload}
+        return "mutation" if "mutation" in kinds else _DEFAULT_OPERATION
+    if not isinstance(payload, Mapping):
+        return _DEFAULT_OPERATION
+    query: Final = _query(payload.get("query"), payload.get("extensions"))
+    if query is None:
+        return _DEFAULT_OPERATION
+    name: Final = payload.get("operationName")
+    return classify_operation(query, name if isinstance(name, str) else None)
+
+
+def _query(query: Any, extensions: Any) -> str | None:
+    if isinstance(query, str):
+        return query
+    # Persisted Query nur mit Hash; ein unbekannter Hash wird als query gezählt
+    sha256_hash: Final = persisted_query_hash(extensions)
+    return get_persisted_queries().lookup(sha256_hash) if sha256_hash else None
+
+
+class AdmissionControlMiddleware:
+    """Begrenzt gleichzeitige GraphQL-Operationen je Typ mit `AdaptiveLimiter`."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        path: str = "/graphql",
+        limits: Mapping[str, AdmissionLimit] = admission_limits,
+        retry_after_s: int = admission_retry_after_s,
+    ) -> None:
+        self._app: Final = app
+        self._path: Final = path
+        self._limiters: Final = {
+            operation: AdaptiveLimiter(operation, limit)
+            for operation, limit in limits.items()
+        }
+        self._retry_after: Final = str(retry_after_s)
+        register_gauges(list(self._limiters.values()))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(self._path):
+            await self._app(scope, receive, send)
+            return
+
+        operation: str | None = None
+        match scope["method"]:
+            case "POST":
+                body, receive = await self._buffer(receive)
+                operation = self._classify_body(body)
+            case "GET":
+                params = parse_qs(scope["query_string"].decode("latin-1"))
+                if "query" in params or "extensions" in params:
+                    operation = self._classify_params(params)
+        if operation is None:
+            # z.B. die GraphQL-IDE
+            await self._app(scope, receive, send)
+            return
+
+        limiter: Final = self._limiters.get(operation) or self._limiters[_DEFAULT_OPERATION]
+        try:
+            await limiter.acquire()
+        except OverloadedError as err:
+            logger.debug("Operation abgelehnt: {}", err)
+            await self._reject(err)(scope, receive, send)
+            return
+
+        start: Final = perf_counter()
+        failed = True
+        try:
+            await self._app(scope, receive, send)
+            failed = False
+        finally:
+            limiter.release(perf_counter() - start, failed=failed)
+
+    @staticmethod
+    async def _buffer(receive: Receive) -> tuple[bytes, Receive]:
+        """Body vollständig lesen und für die Applikation erneut bereitstellen."""
+        chunks: Final[list[bytes]] = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] != "http.request":
+                # Verbindung getrennt: Nachricht unverändert weitergeben
+                return b"", _replay(message, receive)
+            chunks.append(message.get("body", b""))
+            more_body = message.get("more_body", False)
+        body: Final = b"".join(chunks)
+        return body, _replay({"type": "http.request", "body": body}, receive)
+
+    @staticmethod
+    def _classify_body(body: bytes) -> str:
+        try:
+            return _operation_from_payload(orjson.loads(body))
+        except orjson.JSONDecodeError:
+            # z.B. multipart/form-data; Strawberry liefert ggf. den Fehler
+            return _DEFAULT_OPERATION
+
+    @staticmethod
+    def _classify_params(params: Mapping[str, list[str]]) -> str:
+        try:
+            extensions = orjson.loads(params["extensions"][0]) if "extensions" in params else None
+        except orjson.JSONDecodeError:
+            extensions = None
+        query: Final = _query(params.get("query", [None])[0], extensions)
+        if query is None:
+            return _DEFAULT_OPERATION
+        return classify_operation(query, params.get("operationName", [None])[0])
+
+    def _reject(self, err: OverloadedError) -> Response:
+        content: Final = {
+            "errors": [
+                {
+                    "message": "Service überlastet, bitte später erneut versuchen",
+                    "extensions": {
+                        "code": "SERVICE_UNAVAILABLE",
+                        "operation": err.operation,
+                        "reason": err.reason,
+                    },
+                }
+            ]
+        }
+        return Response(
+            content=orjson.dumps(content),
+            status_code=503,
+            headers={"Retry-After": self._retry_after},
+            media_type="application/json",
+        )
+
+
+def _replay(first: Message, receive: Receive) -> Receive:
+    replayed = False
+
+    async def wrapped() -> Message:
+        nonlocal replayed
+        if not replayed:
+            replayed = True
+            return first
+        return await receive()
+
+    return wrapped
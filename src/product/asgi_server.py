@@ -1,72 +1,180 @@
-
 """Funktion `run`, um die FastAPI-Applikation mit einem ASGI-Server zu starten.
 
-Dazu stehen _uvicorn_ (default) und _hypercorn_ zur Verfügung.
+Dazu stehen _uvicorn_ (default) und _hypercorn_ zur Verfügung. Mit mehreren
+Workern startet der Server je Worker einen Prozess, der die Applikation über
+ihren Importpfad lädt; der Elternprozess überwacht die Worker und startet sie
+neu, z.B. nach `max-requests` Requests.
 """
 
-import asyncio
+import sys
+from dataclasses import dataclass
+from importlib.util import find_spec
+from inspect import signature
 from ssl import PROTOCOL_TLS_SERVER
-from typing import Final
+from typing import Final, Literal
 
 import uvicorn
-from hypercorn.asyncio import serve
-from hypercorn.config import Config
-# 🔁 Direkt uvicorn mit reload starten
-import subprocess
+from loguru import logger
 
 from .config import (
     asgi,
+    dev,
     host_binding,
     port,
     tls_certfile,
     tls_keyfile,
 )
-from .fastapi_app import app
+from .config.server import (
+    server_backlog,
+    server_graceful_timeout_s,
+    server_http,
+    server_http2,
+    server_keep_alive_s,
+    server_limit_concurrency,
+    server_loop,
+    server_max_requests,
+    server_max_requests_jitter,
+    server_tls,
+    server_workers,
+)
+
+__all__ = ["ServerOptions", "run", "serve"]
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ServerOptions:
+    """Einstellungen für einen Start; Defaultwerte aus `[product.server]`."""
 
-__all__ = ["run"]
+    server: Literal["hypercorn", "uvicorn"] = asgi
+    app: str = "product:app"
+    host: str = host_binding
+    port: int = port
+    workers: int = server_workers
+    loop: Literal["auto", "asyncio", "uvloop"] = server_loop
+    http: Literal["auto", "h11", "httptools"] = server_http
+    http2: bool = server_http2
+    tls: bool | None = server_tls
+    keep_alive_s: float = server_keep_alive_s
+    backlog: int = server_backlog
+    limit_concurrency: int | None = server_limit_concurrency
+    max_requests: int | None = server_max_requests
+    max_requests_jitter: int = server_max_requests_jitter
+    graceful_timeout_s: float = server_graceful_timeout_s
 
+    @property
+    def recycling(self) -> bool:
+        """Ob Worker nach `max_requests` neu gestartet werden.
 
-def _run_uvicorn() -> None:
+        Ohne überwachenden Elternprozess würde der Server stattdessen enden.
+        """
+        return self.max_requests is not None and self.workers > 1
+
+
+def _uvicorn_jitter(options: ServerOptions) -> dict[str, int]:
+    """`limit_max_requests_jitter`, sofern die installierte uvicorn-Version ihn kennt."""
+    if not options.recycling or not options.max_requests_jitter:
+        return {}
+    if "limit_max_requests_jitter" not in signature(uvicorn.run).parameters:
+        logger.warning(
+            "max-requests-jitter wird von uvicorn {} nicht unterstützt",
+            uvicorn.__version__,
+        )
+        return {}
+    return {"limit_max_requests_jitter": options.max_requests_jitter}
+
+
+def _run_uvicorn(options: ServerOptions) -> None:
     """Start der Anwendung mit uvicorn."""
-    # https://www.uvicorn.org/settings mit folgenden Defaultwerten
-    # host="127.0.0.1"
-    # port=8000
-    # loop="auto" (default), "asyncio" , "uvloop" (nur fuer Linux und MacOS)
-    # http="auto" (def), "h11", "httptools" Python Binding fuer den HTTP Parser von Node
-    # interface="auto" (default), "asgi2", "asgi3", "wsgi"
-    # loop: Final[Literal["uvloop", "asyncio"]] = (
-    #     "uvloop" if platform.system() != "Windows" else "asyncio"
-    # )
+    # https://www.uvicorn.org/settings
+    # loop="auto" und http="auto" verwenden uvloop bzw. httptools, falls installiert
+    tls: Final = options.tls is not False
     uvicorn.run(
-        "product:app",
-        loop="asyncio",
-        http="h11",
+        options.app,
+        loop=options.loop,
+        http=options.http,
         interface="asgi3",
-        host=host_binding,
-        port=port,
-        ssl_keyfile=tls_keyfile,
-        ssl_certfile=tls_certfile,
+        host=options.host,
+        port=options.port,
+        workers=options.workers,
+        backlog=options.backlog,
+        timeout_keep_alive=round(options.keep_alive_s),
+        timeout_graceful_shutdown=round(options.graceful_timeout_s),
+        limit_concurrency=options.limit_concurrency,
+        limit_max_requests=options.max_requests if options.recycling else None,
+        **_uvicorn_jitter(options),
+        ssl_keyfile=tls_keyfile if tls else None,
+        ssl_certfile=tls_certfile if tls else None,
         ssl_version=PROTOCOL_TLS_SERVER,  # DevSkim: ignore DS440070
     )
 
 
-def _run_hypercorn() -> None:
+def _run_hypercorn(options: ServerOptions) -> None:
     """Start der Anwendung mit hypercorn."""
+    from hypercorn.config import Config  # noqa: PLC0415
+    from hypercorn.run import run as hypercorn_run  # noqa: PLC0415
+
     config: Final = Config()
-    config.bind = [f"{host_binding}:{port}"]
-    # config.keyfile = tls_keyfile
-    # config.certfile = tls_certfile
-    asyncio.run(serve(app=app, config=config, mode="asgi"))  # pyright: ignore[reportArgumentType]
+    config.application_path = options.app
+    config.bind = [f"{options.host}:{options.port}"]
+    # Mit 0 Workern läuft hypercorn ohne Elternprozess im aktuellen Prozess
+    config.workers = options.workers if options.workers > 1 else 0
+    config.worker_class = (
+        "uvloop"
+        if options.loop == "uvloop"
+        or (options.loop == "auto" and find_spec("uvloop") is not None)
+        else "asyncio"
+    )
+    config.alpn_protocols = ["h2", "http/1.1"] if options.http2 else ["http/1.1"]
+    config.keep_alive_timeout = options.keep_alive_s
+    config.backlog = options.backlog
+    config.graceful_timeout = options.graceful_timeout_s
+    if options.recycling:
+        config.max_requests = options.max_requests
+        config.max_requests_jitter = options.max_requests_jitter
+    if options.tls:
+        config.keyfile = tls_keyfile
+        config.certfile = tls_certfile
+    if options.limit_concurrency is not None:
+        logger.warning("limit-concurrency wird von hypercorn nicht unterstützt")
+    sys.exit(hypercorn_run(config))
+
+
+def serve(options: ServerOptions) -> None:
+    """Server mit den gegebenen Einstellungen starten; blockiert bis zum Ende.
+
+    :param options: Server, Anzahl Worker, Event Loop, Limits usw.
+    """
+    if options.max_requests is not None and not options.recycling:
+        logger.warning("max-requests erfordert mehrere Worker und wird ignoriert")
+    logger.info(
+        "{} mit {} Worker(n), loop={}, http={}, http2={}",
+        options.server,
+        options.workers,
+        options.loop,
+        options.http,
+        options.http2,
+    )
+    match options.server:
+        case "uvicorn":
+            _run_uvicorn(options)
+        case "hypercorn":
+            _run_hypercorn(options)
 
 
 def run() -> None:
     """CLI für den asynchronen Appserver."""
     match asgi:
-        case "uvicorn":
-            _run_uvicorn()
-        case "hypercorn":
-            _run_hypercorn()
+        case "uvicorn" | "hypercorn":
+            options = ServerOptions()
+            if dev and options.workers > 1:
+                # Jeder Worker würde beim Start die DB neu laden
+                logger.warning("Entwicklungsmodus: nur 1 Worker statt {}", options.workers)
+                options = ServerOptions(workers=1)
+            serve(options)
         case "hot":
+            # 🔁 Direkt uvicorn mit reload starten
+            import subprocess  # noqa: PLC0415, S404
+
             subprocess.run(
                 [
                     sys.executable,
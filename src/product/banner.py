@@ -1,4 +1,8 @@
-"""Banner beim Start des Servers."""
+"""Banner beim Start des Servers.
+
+pyfiglet und tabulate werden erst beim Aufruf importiert; `banner` läuft nach dem
+Start in einem Thread, damit die DNS-Abfrage die Bereitschaft nicht verzögert.
+"""
 
 import sys
 from collections import namedtuple
@@ -10,9 +14,7 @@ from sysconfig import get_platform
 from typing import Final
 
 from loguru import logger
-from pyfiglet import Figlet
 from starlette.routing import BaseRoute, Route
-from tabulate import tabulate
 
 from product.config import env
 
@@ -31,6 +33,8 @@ def _route_to_table_entry(route: Route) -> TableEntry:
 
 
 def _routes_to_str(routes: list[BaseRoute]) -> str:
+    from tabulate import tabulate  # noqa: PLC0415
+
     routes_str: Final = [
         _route_to_table_entry(route) for route in routes if isinstance(route, Route)
     ]
@@ -49,6 +53,8 @@ def _version(pkg: str) -> str:
 
 def banner(routes: list[BaseRoute]) -> None:
     """Banner für den Start des Servers."""
+    from pyfiglet import Figlet  # noqa: PLC0415
+
     figlet: Final = Figlet()
     print()
     print(figlet.renderText("Product"))
@@ -0,0 +1,17 @@
+"""Kompression von HTTP-Responses mit gzip, Brotli oder zstd."""
+
+from product.compression.encoders import (
+    Encoder,
+    available_encodings,
+    create_encoder,
+    select_encoding,
+)
+from product.compression.middleware import CompressionMiddleware
+
+__all__ = [
+    "CompressionMiddleware",
+    "Encoder",
+    "available_encodings",
+    "create_encoder",
+    "select_encoding",
+]
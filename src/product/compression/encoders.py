@@ -0,0 +1,158 @@
+"""Streaming-Encoder für gzip, Brotli und zstd sowie Auswahl nach Accept-Encoding.
+
+gzip ist immer verfügbar. Brotli und zstd werden nur angeboten, wenn das Paket
+`brotli` bzw. `zstandard` installiert ist; es wird erst beim ersten Encoder
+importiert.
+"""
+
+import zlib
+from collections.abc import Sequence
+from importlib import import_module
+from importlib.util import find_spec
+from typing import Any, Final, Protocol
+
+from loguru import logger
+
+from product.config.compression import (
+    compression_brotli_quality,
+    compression_gzip_level,
+    compression_zstd_level,
+)
+
+__all__ = ["Encoder", "available_encodings", "create_encoder", "select_encoding"]
+
+# Python-Module, die das jeweilige Content-Encoding benötigt
+_ENCODING_MODULES: Final[dict[str, str | None]] = {
+    "gzip": None,
+    "br": "brotli",
+    "zstd": "zstandard",
+}
+
+
+class Encoder(Protocol):
+    """Komprimiert einen Body in mehreren Teilen."""
+
+    def compress(self, data: bytes, *, flush: bool = False) -> bytes:
+        """Teil komprimieren; mit `flush` ist alles Bisherige dekodierbar."""
+        ...
+
+    def finish(self) -> bytes:
+        """Rest und Abschluss des Streams."""
+        ...
+
+
+class _Gzip:
+    def __init__(self, level: int) -> None:
+        # wbits 16 + 15: gzip-Header und -Trailer statt zlib
+        self._compressor: Final = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes, *, flush: bool = False) -> bytes:
+        compressed: Final = self._compressor.compress(data)
+        return compressed + self._compressor.flush(zlib.Z_SYNC_FLUSH) if flush else compressed
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class _Brotli:
+    def __init__(self, quality: int) -> None:
+        brotli: Final[Any] = import_module("brotli")
+        self._compressor: Final = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes, *, flush: bool = False) -> bytes:
+        compressed: Final = self._compressor.process(data)
+        return compressed + self._compressor.flush() if flush else compressed
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class _Zstd:
+    def __init__(self, level: int) -> None:
+        zstandard: Final[Any] = import_module("zstandard")
+        self._zstandard: Final = zstandard
+        self._compressor: Final = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes, *, flush: bool = False) -> bytes:
+        compressed: Final = self._compressor.compress(data)
+        if not flush:
+            return compressed
+        return compressed + self._compressor.flush(self._zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+def available_encodings(encodings: Sequence[str]) -> tuple[str, ...]:
+    """Konfigurierte Verfahren, deren Bibliothek installiert ist.
+
+    :param encodings: Verfahren in bevorzugter Reihenfolge, z.B. ("zstd", "br", "gzip")
+    :return: Verfügbare Verfahren in derselben Reihenfolge
+    """
+    available: Final[list[str]] = []
+    for encoding in encodings:
+        if encoding not in _ENCODING_MODULES:
+            logger.warning("Unbekanntes Content-Encoding: {}", encoding)
+            continue
+        module = _ENCODING_MODULES[encoding]
+        if module is not None and find_spec(module) is None:
+            logger.debug("Content-Encoding {} nicht verfügbar: Modul {} fehlt", encoding, module)
+            continue
+        available.append(encoding)
+    return tuple(available)
+
+
+def create_encoder(encoding: str, level: int | None = None) -> Encoder:
+    """Encoder für ein Content-Encoding.
+
+    :param encoding: gzip, br oder zstd
+    :param level: Level bzw. Qualität; ohne Angabe aus der Konfiguration
+    :return: Neuer Encoder für einen Body
+    """
+    match encoding:
+        case "gzip":
+            return _Gzip(compression_gzip_level if level is None else level)
+        case "br":
+            return _Brotli(compression_brotli_quality if level is None else level)
+        case "zstd":
+            return _Zstd(compression_zstd_level if level is None else level)
+    msg: Final = f"Unbekanntes Content-Encoding: {encoding}"
+    raise ValueError(msg)
+
+
+def _parse_accept_encoding(header: str) -> dict[str, float]:
+    weights: Final[dict[str, float]] = {}
+    for item in header.split(","):
+        coding, _, params = item.strip().partition(";")
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        weights[coding.strip().lower()] = quality
+    return weights
+
+
+def select_encoding(accept_encoding: str, available: Sequence[str]) -> str | None:
+    """Verfahren mit dem höchsten q-Wert, bei Gleichstand in der Reihenfolge von `available`.
+
+    :param accept_encoding: Header Accept-Encoding, z.B. "gzip, br;q=0.9"
+    :param available: Verfügbare Verfahren in bevorzugter Reihenfolge
+    :return: Verfahren oder None, falls keines akzeptiert wird
+    """
+    if not accept_encoding:
+        return None
+    weights: Final = _parse_accept_encoding(accept_encoding)
+    wildcard: Final = weights.get("*", 0.0)
+    best: str | None = None
+    best_quality = 0.0
+    for encoding in available:
+        quality = weights.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
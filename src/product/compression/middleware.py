@@ -0,0 +1,145 @@
+"""ASGI-Middleware: Responses je nach Accept-Encoding komprimieren.
+
+Der Body wird beim Senden Teil für Teil komprimiert und nicht zusätzlich
+gepuffert. Nur der erste Teil wird zurückgehalten, bis feststeht, ob die
+Response die Mindestgröße erreicht. Folgen weitere Teile, z.B. bei einer
+StreamingResponse, wird nach jedem Teil ein Flush ausgeführt. Der Client kann
+so jeden Teil sofort dekodieren.
+"""
+
+from collections.abc import Sequence
+from typing import Final
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from product.compression.encoders import (
+    Encoder,
+    available_encodings,
+    create_encoder,
+    select_encoding,
+)
+from product.config.compression import (
+    compression_content_types,
+    compression_encodings,
+    compression_minimum_size,
+)
+from product.metrics.metric_registry import compression_bytes_counter
+
+__all__ = ["CompressionMiddleware"]
+
+# Ohne Body bzw. vom Client bereits gecacht
+_NO_BODY_STATUS: Final = frozenset({204, 304})
+
+
+class CompressionMiddleware:
+    """Komprimiert Responses ab einer Mindestgröße mit gzip, Brotli oder zstd."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = compression_minimum_size,
+        encodings: Sequence[str] = compression_encodings,
+        content_types: Sequence[str] = compression_content_types,
+    ) -> None:
+        self._app: Final = app
+        self._minimum_size: Final = minimum_size
+        self._encodings: Final = available_encodings(encodings)
+        self._content_types: Final = tuple(content_types)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._encodings:
+            await self._app(scope, receive, send)
+            return
+        encoding: Final = select_encoding(
+            Headers(scope=scope).get("accept-encoding", ""), self._encodings
+        )
+        responder: Final = _CompressingSend(
+            send, encoding, self._minimum_size, self._content_types
+        )
+        await self._app(scope, receive, responder)
+
+
+class _CompressingSend:
+    """Ersetzt `send` für genau eine Response."""
+
+    def __init__(
+        self,
+        send: Send,
+        encoding: str | None,
+        minimum_size: int,
+        content_types: tuple[str, ...],
+    ) -> None:
+        self._send: Final = send
+        self._encoding: Final = encoding
+        self._minimum_size: Final = minimum_size
+        self._content_types: Final = content_types
+        self._start: Message | None = None
+        self._encoder: Encoder | None = None
+        self._attributes: Final = {"encoding": encoding or "identity"}
+
+    async def __call__(self, message: Message) -> None:
+        match message["type"]:
+            case "http.response.start":
+                await self._on_start(message)
+            case "http.response.body" if self._start is not None:
+                await self._on_first_body(self._start, message)
+            case "http.response.body" if self._encoder is not None:
+                await self._send_compressed(message)
+            case _:
+                await self._send(message)
+
+    async def _on_start(self, message: Message) -> None:
+        headers: Final = MutableHeaders(scope=message)
+        if "content-encoding" in headers or not self._compressible(headers):
+            await self._send(message)
+            return
+        headers.add_vary_header("Accept-Encoding")
+        content_length: Final = headers.get("content-length")
+        if (
+            self._encoding is None
+            or message["status"] in _NO_BODY_STATUS
+            or (content_length is not None and int(content_length) < self._minimum_size)
+        ):
+            await self._send(message)
+            return
+        # Start erst mit dem ersten Teil des Bodys senden
+        self._start = message
+
+    def _compressible(self, headers: MutableHeaders) -> bool:
+        content_type: Final = headers.get("content-type", "").lower()
+        return content_type.startswith(self._content_types)
+
+    async def _on_first_body(self, start: Message, message: Message) -> None:
+        self._start = None
+        body: Final[bytes] = message.get("body", b"")
+        more_body: Final[bool] = message.get("more_body", False)
+        if not more_body and len(body) < self._minimum_size:
+            await self._send(start)
+            await self._send(message)
+            return
+
+        assert self._encoding is not None  # noqa: S101
+        self._encoder = create_encoder(self._encoding)
+        headers: Final = MutableHeaders(scope=start)
+        del headers["content-length"]
+        headers["content-encoding"] = self._encoding
+        etag: Final = headers.get("etag")
+        if etag is not None and not etag.startswith("W/"):
+            # Der komprimierte Body ist nicht byte-identisch
+            headers["etag"] = f"W/{etag}"
+        await self._send(start)
+        await self._send_compressed(message)
+
+    async def _send_compressed(self, message: Message) -> None:
+        assert self._encoder is not None  # noqa: S101
+        body: Final[bytes] = message.get("body", b"")
+        more_body: Final[bool] = message.get("more_body", False)
+        compressed = self._encoder.compress(body, flush=more_body)
+        if not more_body:
+            compressed += self._encoder.finish()
+        compression_bytes_counter.add(len(body), self._attributes | {"kind": "uncompressed"})
+        compression_bytes_counter.add(len(compressed), self._attributes | {"kind": "compressed"})
+        await self._send(
+            {"type": "http.response.body", "body": compressed, "more_body": more_body}
+        )
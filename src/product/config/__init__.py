@@ -1,6 +1,5 @@
 """Modul zur Konfiguration."""
 
-from product.config.mongo import init_mongo
 from product.config.dev_modus import dev
 from product.config.excel import excel_enabled
 from product.config.graphql import graphql_ide
@@ -0,0 +1,90 @@
+"""Konfiguration für die Admission Control von GraphQL-Operationen."""
+
+from dataclasses import dataclass
+from typing import Any, Final
+
+from product.config.config import product_config
+
+__all__ = [
+    "AdmissionLimit",
+    "admission_enabled",
+    "admission_limits",
+    "admission_retry_after_s",
+]
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AdmissionLimit:
+    """Limit für einen Operationstyp je Worker-Prozess."""
+
+    initial_limit: int
+    """Gleichzeitige Operationen beim Start."""
+
+    min_limit: int
+    """Untergrenze, auf die das Limit bei hoher Latenz höchstens sinkt."""
+
+    max_limit: int
+    """Obergrenze, bis zu der das Limit bei niedriger Latenz wächst."""
+
+    max_queue: int
+    """Wartende Operationen; weitere werden sofort abgelehnt."""
+
+    queue_timeout_ms: float
+    """Maximale Wartezeit in der Queue, danach Ablehnung."""
+
+    latency_target_ms: float
+    """Ab dieser Dauer einer Operation sinkt das Limit."""
+
+    backoff: float
+    """Faktor, mit dem das Limit nach einer zu langsamen Operation sinkt."""
+
+
+_DEFAULTS: Final[dict[str, dict[str, Any]]] = {
+    "query": {
+        "initial-limit": 32,
+        "min-limit": 4,
+        "max-limit": 256,
+        "max-queue": 128,
+        "queue-timeout-ms": 500,
+        "latency-target-ms": 500,
+        "backoff": 0.9,
+    },
+    "mutation": {
+        "initial-limit": 8,
+        "min-limit": 2,
+        "max-limit": 64,
+        "max-queue": 32,
+        "queue-timeout-ms": 1000,
+        "latency-target-ms": 1000,
+        "backoff": 0.9,
+    },
+}
+
+
+def _limit(toml: dict[str, Any]) -> AdmissionLimit:
+    min_limit: Final = max(int(toml["min-limit"]), 1)
+    max_limit: Final = max(int(toml["max-limit"]), min_limit)
+    return AdmissionLimit(
+        initial_limit=min(max(int(toml["initial-limit"]), min_limit), max_limit),
+        min_limit=min_limit,
+        max_limit=max_limit,
+        max_queue=max(int(toml["max-queue"]), 0),
+        queue_timeout_ms=float(toml["queue-timeout-ms"]),
+        latency_target_ms=float(toml["latency-target-ms"]),
+        backoff=min(max(float(toml["backoff"]), 0.1), 1.0),
+    )
+
+
+_admission_toml: Final = product_config.get("admission", {})
+
+admission_enabled: Final[bool] = bool(_admission_toml.get("enabled", True))
+"""Flag, ob gleichzeitige GraphQL-Operationen begrenzt werden (default: True)."""
+
+admission_retry_after_s: Final[int] = int(_admission_toml.get("retry-after-s", 1))
+"""Wert des Headers Retry-After bei einer Ablehnung in Sekunden (default: 1)."""
+
+admission_limits: Final[dict[str, AdmissionLimit]] = {
+    operation: _limit(defaults | _admission_toml.get(operation, {}))
+    for operation, defaults in _DEFAULTS.items()
+}
+"""Limits je Operationstyp; Subscriptions und Unbekanntes zählen als query."""
@@ -0,0 +1,53 @@
+"""Konfiguration für die Kompression von HTTP-Responses."""
+
+from typing import Final
+
+from product.config.config import product_config
+
+__all__ = [
+    "compression_brotli_quality",
+    "compression_content_types",
+    "compression_enabled",
+    "compression_encodings",
+    "compression_gzip_level",
+    "compression_minimum_size",
+    "compression_zstd_level",
+]
+
+
+_compression_toml: Final = product_config.get("compression", {})
+
+compression_enabled: Final[bool] = bool(_compression_toml.get("enabled", True))
+"""Flag, ob Responses komprimiert werden (default: True)."""
+
+compression_minimum_size: Final[int] = int(_compression_toml.get("minimum-size", 1024))
+"""Kleinere Responses werden unkomprimiert gesendet (default: 1024 Bytes)."""
+
+compression_encodings: Final[tuple[str, ...]] = tuple(
+    _compression_toml.get("encodings", ["zstd", "br", "gzip"])
+)
+"""Bevorzugte Verfahren bei gleichem q-Wert in Accept-Encoding."""
+
+compression_content_types: Final[tuple[str, ...]] = tuple(
+    _compression_toml.get(
+        "content-types",
+        [
+            "application/json",
+            "application/graphql-response+json",
+            "application/x-ndjson",
+            "application/javascript",
+            "image/svg+xml",
+            "text/",
+        ],
+    )
+)
+"""Präfixe komprimierbarer Content-Types; z.B. Bilder sind bereits komprimiert."""
+
+compression_gzip_level: Final[int] = int(_compression_toml.get("gzip-level", 6))
+"""Level für gzip von 1 bis 9 (default: 6)."""
+
+compression_brotli_quality: Final[int] = int(_compression_toml.get("brotli-quality", 4))
+"""Qualität für Brotli von 0 bis 11; ab 5 deutlich langsamer (default: 4)."""
+
+compression_zstd_level: Final[int] = int(_compression_toml.get("zstd-level", 3))
+"""Level für zstd von 1 bis 22 (default: 3)."""
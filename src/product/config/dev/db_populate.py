@@ -5,29 +5,10 @@ from product.config.dev_modus import dev
 from product.model.entity.product import Product
 from product.model.entity.product_variant import ProductVariant
 from product.model.enum.product_category import ProductCategory
+from product.repository.category_stats_repository import CategoryStatsRepository
 from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
-from bson.decimal128 import Decimal128
-from pydantic import field_validator
-
-
-def to_decimal(value: str) -> Decimal:
-    return Decimal(str(Decimal128(value).to_decimal()))
-
-
-# Optional: Central validator for ProductVariant (ensure compatibility)
-ProductVariant.model_rebuild()
-
-
-@field_validator("additional_price", mode="before")
-def validate_additional_price(cls, v):
-    if isinstance(v, Decimal128):
-        return Decimal(str(v.to_decimal()))
-    return v
-
-
-setattr(ProductVariant, "validate_additional_price", validate_additional_price)
 
 
 async def mongo_populate() -> None:
@@ -44,7 +25,7 @@ async def mongo_populate() -> None:
             id=UUID("12000000-0000-0000-0000-000000000001"),
             name="Laptop",
             brand="ExampleBrand",
-            price=to_decimal("999.99"),
+            price=Decimal("999.99"),
             description="High-performance laptop",
             category=ProductCategory.ELEKTRONIK,
             created_at=datetime.utcnow(),
@@ -54,7 +35,7 @@ async def mongo_populate() -> None:
             id=UUID("12000000-0000-0000-0000-000000000002"),
             name="Smartphone",
             brand="AnotherBrand",
-            price=to_decimal("499.99"),
+            price=Decimal("499.99"),
             description="Latest smartphone response",
             category=ProductCategory.ELEKTRONIK,
             created_at=datetime.utcnow(),
@@ -64,7 +45,7 @@ async def mongo_populate() -> None:
             id=UUID("12000000-0000-0000-0000-000000000003"),
             name="Television",
             brand="AwesomeBrand",
-            price=to_decimal("799.99"),
+            price=Decimal("799.99"),
             description="4K Ultra HD Smart TV",
             category=ProductCategory.ELEKTRONIK,
             created_at=datetime.utcnow(),
@@ -74,7 +55,7 @@ async def mongo_populate() -> None:
             id=UUID("12000000-0000-0000-0000-000000000004"),
             name="Tablet",
             brand="YetAnotherBrand",
-            price=to_decimal("299.99"),
+            price=Decimal("299.99"),
             description="Portable tablet device",
             category=ProductCategory.ELEKTRONIK,
             created_at=datetime.utcnow(),
@@ -84,7 +65,7 @@ async def mongo_populate() -> None:
             id=UUID("12000000-0000-0000-0000-000000000005"),
             name="Smartwatch",
             brand="CoolBrand",
-            price=to_decimal("199.99"),
+            price=Decimal("199.99"),
             description="Fitness tracker smartwatch",
             category=ProductCategory.ELEKTRONIK,
             created_at=datetime.utcnow(),
@@ -94,7 +75,7 @@ async def mongo_populate() -> None:
             id=UUID("12000000-0000-0000-0000-000000000006"),
             name="Bluetooth Kopfhörer",
             brand="SoundMax",
-            price=to_decimal("89.99"),
+            price=Decimal("89.99"),
             description="Kabellose Bluetooth-Kopfhörer mit aktiver Geräuschunterdrückung",
             category=ProductCategory.ELEKTRONIK,
             created_at=datetime.utcnow(),
@@ -104,7 +85,7 @@ async def mongo_populate() -> None:
             id=UUID("12000000-0000-0000-0000-000000000007"),
             name="Gaming-Maus",
             brand="ProGamer",
-            price=to_decimal("59.99"),
+            price=Decimal("59.99"),
             description="Ergonomische Gaming-Maus mit RGB-Beleuchtung",
             category=ProductCategory.ELEKTRONIK,
             created_at=datetime.utcnow(),
@@ -114,7 +95,7 @@ async def mongo_populate() -> None:
             id=UUID("12000000-0000-0000-0000-000000000008"),
             name="USB-C Ladegerät",
             brand="FastCharge",
-            price=to_decimal("24.99"),
+            price=Decimal("24.99"),
             description="Schnellladegerät mit USB-C Anschluss",
             category=ProductCategory.ELEKTRONIK,
             created_at=datetime.utcnow(),
@@ -124,7 +105,7 @@ async def mongo_populate() -> None:
             id=UUID("12000000-0000-0000-0000-000000000009"),
             name="Webcam Full HD",
             brand="StreamCam",
-            price=to_decimal("79.99"),
+            price=Decimal("79.99"),
             description="1080p Webcam mit Mikrofon für Videokonferenzen",
             category=ProductCategory.ELEKTRONIK,
             created_at=datetime.utcnow(),
@@ -140,17 +121,17 @@ async def mongo_populate() -> None:
         id=UUID("02000000-0000-0000-0000-000000000003"),
         name="iPhone 15",
         brand="Apple",
-        price=to_decimal("1199.99"),
+        price=Decimal("1199.99"),
         description="Neueste Generation des iPhone",
         category=ProductCategory.ELEKTRONIK,
         tags=["smartphone", "apple"],
         image_paths=["/img/iphone-front.png", "/img/iphone-back.png"],
         variants=[
             ProductVariant(
-                name="Farbe", value="Schwarz", additional_price=to_decimal("0")
+                name="Farbe", value="Schwarz", additional_price=Decimal("0")
             ),
             ProductVariant(
-                name="Speicher", value="256 GB", additional_price=to_decimal("100")
+                name="Speicher", value="256 GB", additional_price=Decimal("100")
             ),
         ],
         created_at=datetime.utcnow(),
@@ -158,5 +139,6 @@ async def mongo_populate() -> None:
     )
 
     await product.insert()
+    await CategoryStatsRepository().rebuild()
 
     logger.success("Beispieldaten wurden eingefügt.")
@@ -1,11 +1,8 @@
-import os
-
 from dotenv import load_dotenv
 from pydantic_settings import BaseSettings
 
 # Laden Sie die .env-Datei
 load_dotenv(dotenv_path=".env")
-print("PRODUCT_SERVICE_PORT from .env:", os.getenv("PRODUCT_SERVICE_PORT"))
 
 
 class Env(BaseSettings):
@@ -24,6 +21,8 @@ class Env(BaseSettings):
     KEYS_PATH: str
     KAFKA_URI: str
     TEMPO_URI: str
+    TRACING_EXPORTER: str | None = None
+    WEB_CONCURRENCY: int | None = None
 
     class Config:
         env_file = ".env"  # Stellen Sie sicher, dass dies auf Ihre .env-Datei verweist
@@ -0,0 +1,16 @@
+"""Konfiguration für den Export aller Produkte als NDJSON."""
+
+from typing import Final
+
+from product.config.config import product_config
+
+__all__ = ["export_batch_size", "export_chunk_size"]
+
+
+_export_toml: Final = product_config.get("export", {})
+
+export_batch_size: Final[int] = int(_export_toml.get("batch-size", 1000))
+"""Anzahl Dokumente je Roundtrip des MongoDB-Cursors (default: 1000)."""
+
+export_chunk_size: Final[int] = int(_export_toml.get("chunk-size", 65536))
+"""Bytes, ab denen gesammelte Zeilen an den Client gehen (default: 64 KiB)."""
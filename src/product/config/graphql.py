@@ -1,12 +1,28 @@
 """Konfiguration für GraphQL."""
 
+from pathlib import Path
 from typing import Final
 
 from strawberry.http.ides import GraphQL_IDE
 
 from product.config.config import product_config
 
-__all__ = ["graphql_ide"]
+__all__ = [
+    "graphql_cache_control",
+    "graphql_default_list_size",
+    "graphql_document_cache_size",
+    "graphql_etag_enabled",
+    "graphql_ide",
+    "graphql_max_cost",
+    "graphql_max_depth",
+    "graphql_persisted_queries_enabled",
+    "graphql_persisted_queries_manifest",
+    "graphql_persisted_queries_size",
+    "graphql_query_field_cost",
+    "graphql_registered_operations_only",
+    "graphql_response_cache_size",
+    "graphql_response_cache_ttl_seconds",
+]
 
 
 _graphql_toml: Final = product_config.get("graphql", {})
@@ -14,3 +30,51 @@ _graphiql_enabled: Final = bool(_graphql_toml.get("graphiql-enabled", False))
 
 graphql_ide: Final[GraphQL_IDE | None] = "graphiql" if _graphiql_enabled else None
 """String 'graphiql', falls GraphiQL aktiviert ist, sonst None."""
+
+graphql_max_cost: Final[int] = int(_graphql_toml.get("max-cost", 5000))
+"""Maximale statische Kosten einer Operation; 0 schaltet die Prüfung ab."""
+
+graphql_max_depth: Final[int] = int(_graphql_toml.get("max-depth", 10))
+"""Maximale Verschachtelungstiefe der Felder einer Operation (default: 10)."""
+
+graphql_query_field_cost: Final[int] = int(_graphql_toml.get("query-field-cost", 100))
+"""Zusätzliche Kosten je Feld von Query, also je Abfrage an MongoDB (default: 100)."""
+
+graphql_default_list_size: Final[int] = int(_graphql_toml.get("default-list-size", 5))
+"""Angenommene Länge von Listen ohne Seitengröße, z.B. `variants` (default: 5)."""
+
+graphql_document_cache_size: Final[int] = int(_graphql_toml.get("document-cache-size", 500))
+"""Geparste und validierte Dokumente je Worker; 0 schaltet den Cache ab (default: 500)."""
+
+graphql_persisted_queries_enabled: Final[bool] = bool(
+    _graphql_toml.get("persisted-queries-enabled", True)
+)
+"""Flag, ob Clients Query-Texte per SHA-256 registrieren können (default: True)."""
+
+graphql_persisted_queries_size: Final[int] = int(
+    _graphql_toml.get("persisted-queries-size", 1000)
+)
+"""Per APQ registrierte Query-Texte je Worker (default: 1000)."""
+
+_manifest: Final[str] = _graphql_toml.get("persisted-queries-manifest", "")
+graphql_persisted_queries_manifest: Final[Path | None] = Path(_manifest) if _manifest else None
+"""JSON-Datei mit registrierten Operationen, z.B. ein Manifest von Apollo."""
+
+graphql_registered_operations_only: Final[bool] = bool(
+    _graphql_toml.get("registered-operations-only", False)
+)
+"""Flag, ob nur Operationen aus dem Manifest ausgeführt werden (default: False)."""
+
+graphql_etag_enabled: Final[bool] = bool(_graphql_toml.get("etag-enabled", True))
+"""Flag, ob GET-Requests mit Persisted Query ETag und 304 unterstützen (default: True)."""
+
+graphql_cache_control: Final[str] = _graphql_toml.get("cache-control", "private, no-cache")
+"""Header Cache-Control für GET-Requests mit Persisted Query (default: private, no-cache)."""
+
+graphql_response_cache_size: Final[int] = int(_graphql_toml.get("response-cache-size", 1000))
+"""Gecachte Responses je Worker; 0 schaltet den Cache ab (default: 1000)."""
+
+graphql_response_cache_ttl_seconds: Final[float] = float(
+    _graphql_toml.get("response-cache-ttl-seconds", 60)
+)
+"""Lebensdauer einer gecachten Response, falls ein Event verloren geht (default: 60)."""
@@ -6,6 +6,7 @@ from product.config import env
 class KafkaSettings(BaseSettings):
     bootstrap_servers: str = env.KAFKA_URI
     topic_product_created: str = "product.created"
+    topic_product_events: str = "product.events"
     topic_log: str = "activity.product.log"
     client_id: str = env.PROJECT_NAME
 
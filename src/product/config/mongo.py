@@ -1,41 +1,116 @@
-"""
-MongoDB-Verbindung initialisieren für Beanie + Motor.
-"""
+"""Konfiguration für MongoDB: Connection Pool, Timeouts, Kompression, Read Preference."""
 
 from typing import Final
 
-from beanie import init_beanie
-from loguru import logger
-from motor.motor_asyncio import AsyncIOMotorClient
-
+from product.config.config import product_config
 from product.config.env import env
-from product.model.entity.product import Product
 
-__all__ = ["init_mongo"]
+__all__ = [
+    "mongo_compressors",
+    "mongo_connect_timeout_ms",
+    "mongo_database",
+    "mongo_index_drop_unused",
+    "mongo_index_rebuild_changed",
+    "mongo_index_unused_min_age_hours",
+    "mongo_max_idle_time_ms",
+    "mongo_max_pool_size",
+    "mongo_max_staleness_seconds",
+    "mongo_min_pool_size",
+    "mongo_query_read_preference",
+    "mongo_read_preference",
+    "mongo_retry_reads",
+    "mongo_retry_writes",
+    "mongo_server_selection_timeout_ms",
+    "mongo_slow_query_buffer_size",
+    "mongo_slow_query_explain_rate",
+    "mongo_slow_query_threshold_ms",
+    "mongo_socket_timeout_ms",
+    "mongo_uri",
+    "mongo_wait_queue_timeout_ms",
+]
+
+
+_mongo_toml: Final = product_config.get("mongodb", {})
+
+mongo_uri: Final[str] = env.MONGO_DB_URI
+"""URI für den MongoDB-Server bzw. das Replica Set aus der .env-Datei."""
+
+mongo_database: Final[str] = env.MONGO_DB_DATABASE
+"""Name der Datenbank aus der .env-Datei."""
+
+mongo_max_pool_size: Final[int] = int(_mongo_toml.get("max-pool-size", 100))
+"""Maximale Anzahl an Verbindungen pro Server im Pool (default: 100)."""
+
+mongo_min_pool_size: Final[int] = int(_mongo_toml.get("min-pool-size", 0))
+"""Anzahl an Verbindungen, die pro Server offen gehalten werden (default: 0)."""
+
+mongo_max_idle_time_ms: Final[int | None] = _mongo_toml.get("max-idle-time-ms")
+"""Millisekunden, nach denen eine unbenutzte Verbindung geschlossen wird."""
+
+mongo_wait_queue_timeout_ms: Final[int | None] = _mongo_toml.get(
+    "wait-queue-timeout-ms"
+)
+"""Maximale Wartezeit in Millisekunden auf eine freie Verbindung im Pool."""
+
+mongo_connect_timeout_ms: Final[int] = int(_mongo_toml.get("connect-timeout-ms", 5000))
+"""Timeout in Millisekunden für den Verbindungsaufbau (default: 5000)."""
+
+mongo_server_selection_timeout_ms: Final[int] = int(
+    _mongo_toml.get("server-selection-timeout-ms", 5000)
+)
+"""Timeout in Millisekunden für die Server-Auswahl (default: 5000)."""
+
+mongo_socket_timeout_ms: Final[int | None] = _mongo_toml.get("socket-timeout-ms")
+"""Timeout in Millisekunden für Lese- und Schreiboperationen auf dem Socket."""
+
+mongo_compressors: Final[tuple[str, ...]] = tuple(
+    _mongo_toml.get("compressors", ["zstd", "snappy"])
+)
+"""Gewünschte Wire-Kompression in absteigender Priorität, z.B. zstd, snappy, zlib."""
+
+mongo_retry_reads: Final[bool] = bool(_mongo_toml.get("retry-reads", True))
+"""Flag, ob Leseoperationen bei Netzwerkfehlern wiederholt werden (default: True)."""
+
+mongo_retry_writes: Final[bool] = bool(_mongo_toml.get("retry-writes", True))
+"""Flag, ob Schreiboperationen bei Netzwerkfehlern wiederholt werden (default: True)."""
+
+mongo_read_preference: Final[str] = _mongo_toml.get("read-preference", "primary")
+"""Default Read Preference des Clients, z.B. primary oder secondaryPreferred."""
+
+mongo_max_staleness_seconds: Final[int | None] = _mongo_toml.get(
+    "max-staleness-seconds"
+)
+"""Maximal tolerierte Replikationsverzögerung von Secondaries in Sekunden."""
+
+mongo_query_read_preference: Final[str] = _mongo_toml.get(
+    "query-read-preference", "secondaryPreferred"
+)
+"""Read Preference für GraphQL-Queries: secondaryPreferred (default) oder primary."""
 
-# Konfiguration aus der .env via pydantic-settings
-MONGO_DB_URI: Final[str] = env.MONGO_DB_URI
-MONGO_DB_DATABASE: Final[str] = env.MONGO_DB_DATABASE
+mongo_slow_query_threshold_ms: Final[float] = float(
+    _mongo_toml.get("slow-query-threshold-ms", 200)
+)
+"""Ab dieser Dauer in Millisekunden gilt eine Abfrage als langsam (default: 200)."""
 
-# Der globale Client kann bei Bedarf wiederverwendet werden
-client: Final = AsyncIOMotorClient(MONGO_DB_URI)
+mongo_slow_query_explain_rate: Final[float] = float(
+    _mongo_toml.get("slow-query-explain-rate", 0.1)
+)
+"""Anteil langsamer Abfragen, für die `explain()` ausgeführt wird (default: 0.1)."""
 
+mongo_slow_query_buffer_size: Final[int] = int(
+    _mongo_toml.get("slow-query-buffer-size", 100)
+)
+"""Anzahl der zuletzt langsamen Abfragen im Ringpuffer (default: 100)."""
 
-async def init_mongo() -> None:
-    """
-    Initialisiert die Verbindung zur MongoDB und registriert Beanie-Modelle.
-    Wird beim Startup ausgeführt.
-    """
-    logger.info("🔌 Initialisiere MongoDB-Client mit URI {}", MONGO_DB_URI)
+mongo_index_rebuild_changed: Final[bool] = bool(
+    _mongo_toml.get("index-rebuild-changed", False)
+)
+"""Geänderte Indexe beim Abgleich löschen und neu anlegen (default: false)."""
 
-    await init_beanie(
-        database=client[MONGO_DB_DATABASE],
-        document_models=[
-            Product,
-            # Weitere Beanie-Modelle hier hinzufügen
-        ],
-    )
+mongo_index_drop_unused: Final[bool] = bool(_mongo_toml.get("index-drop-unused", False))
+"""Nicht deklarierte Indexe ohne Zugriffe laut `$indexStats` löschen (default: false)."""
 
-    logger.success(
-        "✅ MongoDB-Initialisierung abgeschlossen (DB: {})", MONGO_DB_DATABASE
-    )
+mongo_index_unused_min_age_hours: Final[float] = float(
+    _mongo_toml.get("index-unused-min-age-hours", 168)
+)
+"""Mindestdauer der Zugriffsstatistik, bevor ein Index als unbenutzt gilt (default: 168)."""
@@ -0,0 +1,70 @@
+"""Konfiguration für die Volltextsuche und die Autovervollständigung."""
+
+from typing import Final
+
+from product.config.config import product_config
+
+__all__ = [
+    "facet_cache_size",
+    "facet_cache_ttl_seconds",
+    "facet_max_values",
+    "facet_price_boundaries",
+    "price_cents_enabled",
+    "search_autocomplete_max_limit",
+    "search_language",
+    "search_max_page_size",
+    "search_weights",
+    "suggest_batch_size",
+    "suggest_index_enabled",
+    "suggest_max_candidates",
+]
+
+
+_search_toml: Final = product_config.get("search", {})
+
+search_language: Final[str] = _search_toml.get("language", "german")
+"""Sprache für Stemming und Stoppwörter im Textindex (default: german)."""
+
+search_weights: Final[dict[str, int]] = {
+    "name": 10,
+    "brand": 5,
+    "tags": 3,
+    "description": 1,
+} | _search_toml.get("weights", {})
+"""Gewichtung der Felder im Textindex für das Ranking nach textScore."""
+
+search_max_page_size: Final[int] = int(_search_toml.get("max-page-size", 50))
+"""Maximale Anzahl an Treffern pro Seite bei der Volltextsuche (default: 50)."""
+
+search_autocomplete_max_limit: Final[int] = int(
+    _search_toml.get("autocomplete-max-limit", 20)
+)
+"""Maximale Anzahl an Vorschlägen bei der Autovervollständigung (default: 20)."""
+
+suggest_index_enabled: Final[bool] = bool(_search_toml.get("suggest-index-enabled", True))
+"""In-Memory-Index für `suggestProducts` beim Start aufbauen (default: true)."""
+
+suggest_batch_size: Final[int] = int(_search_toml.get("suggest-batch-size", 1000))
+"""Batch-Größe des Cursors beim Aufbau des Suggestion-Index (default: 1000)."""
+
+suggest_max_candidates: Final[int] = int(_search_toml.get("suggest-max-candidates", 2000))
+"""Maximale Anzahl Postings je Suche, z.B. bei Präfixen aus 1-2 Zeichen (default: 2000)."""
+
+facet_max_values: Final[int] = int(_search_toml.get("facet-max-values", 20))
+"""Maximale Anzahl Marken bzw. Tags je Facette (default: 20)."""
+
+facet_price_boundaries: Final[list[int]] = sorted(
+    _search_toml.get("facet-price-boundaries", [0, 10, 25, 50, 100, 250, 500, 1000])
+)
+"""Untere Grenzen der Preis-Buckets in Euro; der letzte Bucket ist nach oben offen."""
+
+facet_cache_size: Final[int] = int(_search_toml.get("facet-cache-size", 256))
+"""Maximale Anzahl gecachter Facetten-Ergebnisse (default: 256)."""
+
+facet_cache_ttl_seconds: Final[float] = float(
+    _search_toml.get("facet-cache-ttl-seconds", 60)
+)
+"""Lebensdauer eines Facetten-Ergebnisses, falls ein Event verloren geht (default: 60)."""
+
+price_cents_enabled: Final[bool] = bool(_search_toml.get("price-cents-enabled", True))
+"""Preise über `price_cents` statt Decimal128 filtern und gruppieren (default: true)."""
@@ -1,10 +1,30 @@
 """Konfiguration für ASGI."""
 
+import math
+import os
+from pathlib import Path
 from typing import Final, Literal
 
 from product.config.config import product_config
+from product.config.env import env
 
-__all__ = ["asgi", "host_binding", "port"]
+__all__ = [
+    "asgi",
+    "available_cpus",
+    "host_binding",
+    "port",
+    "server_backlog",
+    "server_graceful_timeout_s",
+    "server_http",
+    "server_http2",
+    "server_keep_alive_s",
+    "server_limit_concurrency",
+    "server_loop",
+    "server_max_requests",
+    "server_max_requests_jitter",
+    "server_tls",
+    "server_workers",
+]
 
 
 _asgi_toml: Final = product_config.get("server", {})
@@ -20,3 +40,67 @@ port: Final[int] = _asgi_toml.get("port", 8000)
 """Port für den Server (default: 8000)."""
 
 reload: Final[bool] = bool(_asgi_toml.get("reload", False))
+
+
+def available_cpus() -> int:
+    """Für den Prozess nutzbare CPUs unter Berücksichtigung einer cgroup-Quota.
+
+    In einem Pod liefert `os.process_cpu_count()` die CPUs des Knotens; das
+    CPU-Limit steht nur in `/sys/fs/cgroup/cpu.max`, z.B. "200000 100000".
+    """
+    cpus: Final = os.process_cpu_count() or 1
+    try:
+        quota, period = Path("/sys/fs/cgroup/cpu.max").read_text().split()[:2]
+    except (OSError, ValueError):
+        return cpus
+    if quota == "max":
+        return cpus
+    return max(min(cpus, math.ceil(int(quota) / int(period))), 1)
+
+
+_workers: Final[int] = int(
+    env.WEB_CONCURRENCY
+    if env.WEB_CONCURRENCY is not None
+    else _asgi_toml.get("workers", 1)
+)
+
+server_workers: Final[int] = _workers if _workers > 0 else available_cpus()
+"""Anzahl Worker-Prozesse; 0 bedeutet eine je CPU (default: 1, per WEB_CONCURRENCY)."""
+
+server_loop: Final[Literal["auto", "asyncio", "uvloop"]] = _asgi_toml.get(
+    "loop", "auto"
+)
+"""Event Loop: auto verwendet uvloop, falls installiert (default: auto)."""
+
+server_http: Final[Literal["auto", "h11", "httptools"]] = _asgi_toml.get(
+    "http", "auto"
+)
+"""HTTP/1.1-Parser für uvicorn: auto verwendet httptools, falls installiert."""
+
+server_http2: Final[bool] = bool(_asgi_toml.get("http2", False))
+"""HTTP/2 mit hypercorn: per ALPN bei TLS, sonst als h2c (default: False)."""
+
+server_tls: Final[bool | None] = _asgi_toml.get("tls")
+"""TLS mit den Schlüsseln aus `[product.tls]`; ohne Angabe nur bei uvicorn."""
+
+server_keep_alive_s: Final[float] = float(_asgi_toml.get("keep-alive-s", 5))
+"""Sekunden, die eine Keep-Alive-Verbindung ohne Request offen bleibt (default: 5)."""
+
+server_backlog: Final[int] = int(_asgi_toml.get("backlog", 2048))
+"""Maximale Anzahl noch nicht angenommener Verbindungen je Socket (default: 2048)."""
+
+server_limit_concurrency: Final[int | None] = (
+    int(_asgi_toml.get("limit-concurrency", 0)) or None
+)
+"""Nur uvicorn: gleichzeitige Verbindungen je Worker, darüber 503; 0 = unbegrenzt."""
+
+server_max_requests: Final[int | None] = int(_asgi_toml.get("max-requests", 0)) or None
+"""Worker nach so vielen Requests neu starten, z.B. gegen wachsenden Speicher; 0 = nie."""
+
+server_max_requests_jitter: Final[int] = int(_asgi_toml.get("max-requests-jitter", 0))
+"""Zufälliger Zuschlag zu `server_max_requests`, damit Worker nicht gleichzeitig neu starten."""
+
+server_graceful_timeout_s: Final[float] = float(
+    _asgi_toml.get("graceful-timeout-s", 30)
+)
+"""Sekunden für laufende Requests beim Beenden eines Workers (default: 30)."""
@@ -0,0 +1,75 @@
+"""Konfiguration für Tracing: Sampling, Exporter und ausgenommene Endpunkte."""
+
+from typing import Final, Literal
+
+from product.config.config import product_config
+from product.config.env import env
+
+__all__ = [
+    "TracingExporter",
+    "tracing_excluded_urls",
+    "tracing_export_timeout_ms",
+    "tracing_exporter",
+    "tracing_file_path",
+    "tracing_instrument_pymongo",
+    "tracing_max_export_batch_size",
+    "tracing_max_queue_size",
+    "tracing_sample_ratio",
+    "tracing_schedule_delay_ms",
+    "tracing_slow_request_ms",
+    "tracing_tail_sampling",
+]
+
+TracingExporter = Literal["otlp", "file", "console", "none"]
+
+
+_tracing_toml: Final = product_config.get("tracing", {})
+
+tracing_sample_ratio: Final[float] = min(
+    max(float(_tracing_toml.get("sample-ratio", 0.1)), 0.0), 1.0
+)
+"""Anteil der neu begonnenen Traces, die exportiert werden (default: 0.1)."""
+
+tracing_tail_sampling: Final[bool] = bool(_tracing_toml.get("tail-sampling", True))
+"""Nicht gesampelte Requests trotzdem exportieren, falls fehlerhaft oder langsam."""
+
+tracing_slow_request_ms: Final[float] = float(
+    _tracing_toml.get("slow-request-ms", 1000)
+)
+"""Ab dieser Dauer in Millisekunden wird ein Request per Tail Sampling exportiert."""
+
+tracing_excluded_urls: Final[str] = ",".join(
+    _tracing_toml.get(
+        "excluded-urls", ["/metrics", "/health", "/liveness", "/readiness"]
+    )
+)
+"""Kommaseparierte Regex der URLs ohne Tracing, z.B. Health-Checks und Scrapes."""
+
+tracing_instrument_pymongo: Final[bool] = bool(
+    _tracing_toml.get("instrument-pymongo", True)
+)
+"""Flag, ob jedes MongoDB-Kommando einen eigenen Span erhält (default: True)."""
+
+tracing_exporter: Final[TracingExporter] = (
+    env.TRACING_EXPORTER or _tracing_toml.get("exporter", "otlp")
+).lower()
+"""otlp (Tempo), file (JSON Lines), console oder none; per TRACING_EXPORTER übersteuerbar."""
+
+tracing_file_path: Final[str] = _tracing_toml.get("file-path", "traces/spans.jsonl")
+"""Datei für den Exporter `file` und als Fallback, falls OTLP nicht verfügbar ist."""
+
+tracing_max_queue_size: Final[int] = int(_tracing_toml.get("max-queue-size", 2048))
+"""Maximale Anzahl wartender Spans; weitere Spans werden verworfen (default: 2048)."""
+
+tracing_max_export_batch_size: Final[int] = min(
+    int(_tracing_toml.get("max-export-batch-size", 512)), tracing_max_queue_size
+)
+"""Maximale Anzahl Spans je Export (default: 512)."""
+
+tracing_schedule_delay_ms: Final[int] = int(_tracing_toml.get("schedule-delay-ms", 5000))
+"""Maximaler Abstand zwischen zwei Exporten in Millisekunden (default: 5000)."""
+
+tracing_export_timeout_ms: Final[int] = int(
+    _tracing_toml.get("export-timeout-ms", 10000)
+)
+"""Timeout eines Exports in Millisekunden einschließlich Wiederholungen (default: 10000)."""
@@ -3,8 +3,12 @@
 from functools import lru_cache
 from product.messaging.consumer import KafkaConsumerService
 from product.messaging.producer import KafkaProducerService
+from product.repository.category_stats_repository import CategoryStatsRepository
 from product.repository.product_repository import ProductRepository
 from product.resolver.product_mutation_resolver import ProductMutationResolver
+from product.search.facet_cache import get_facet_cache
+from product.search.response_cache import get_response_cache
+from product.search.suggestion_index import get_suggestion_index
 from product.resolver.product_query_resolver import ProductQueryResolver
 from product.service.product_read_service import ProductReadService
 from product.service.product_write_service import ProductWriteService
@@ -16,17 +20,30 @@ def get_product_repository() -> ProductRepository:
     return ProductRepository()
 
 
+@lru_cache()
+def get_category_stats_repository() -> CategoryStatsRepository:
+    return CategoryStatsRepository()
+
+
 @lru_cache()
 def get_product_write_service() -> ProductWriteService:
     return ProductWriteService(
-        repository=get_product_repository(), kafka_producer=get_kafka_producer()
+        repository=get_product_repository(),
+        kafka_producer=get_kafka_producer(),
+        suggestion_index=get_suggestion_index(),
+        facet_cache=get_facet_cache(),
+        category_stats_repository=get_category_stats_repository(),
+        response_cache=get_response_cache(),
     )
 
 
 @lru_cache()
 def get_product_read_service() -> ProductReadService:
     return ProductReadService(
-        repository=get_product_repository()
+        repository=get_product_repository(),
+        suggestion_index=get_suggestion_index(),
+        facet_cache=get_facet_cache(),
+        category_stats_repository=get_category_stats_repository(),
     )
 
 @lru_cache()
@@ -6,8 +6,11 @@ from graphql import GraphQLError
 
 __all__ = [
     "EmailExistsError",
+    "InvalidCursorError",
     "NotAllowedError",
     "NotFoundError",
+    "OverloadedError",
+    "PersistedQueryError",
     "UsernameExistsError",
     "VersionOutdatedError",
 ]
@@ -42,6 +45,18 @@ class UsernameExistsError(Exception):
         self.username = username
 
 
+class InvalidCursorError(Exception):
+    """Exception, falls ein Cursor für die Paginierung ungültig ist."""
+
+    def __init__(self, cursor: str) -> None:
+        """Initialisierung von InvalidCursorError mit dem ungültigen Cursor.
+
+        :param cursor: Ungültiger Cursor aus dem Request
+        """
+        super().__init__(f"Ungültiger Cursor: {cursor}")
+        self.cursor = cursor
+
+
 class NotAllowedError(Exception):
     """Exception, falls es der Zugriff nicht erlaubt ist."""
 
@@ -64,6 +79,34 @@ class NotFoundError(Exception):
         self.suchkriterien = suchkriterien
 
 
+class OverloadedError(Exception):
+    """Exception, falls eine Operation wegen Überlast nicht angenommen wird."""
+
+    def __init__(self, operation: str, reason: str) -> None:
+        """Initialisierung von OverloadedError mit Operationstyp und Grund.
+
+        :param operation: Operationstyp, z.B. query oder mutation
+        :param reason: queue_full oder queue_timeout
+        """
+        super().__init__(f"Überlast bei {operation}: {reason}")
+        self.operation = operation
+        self.reason = reason
+
+
+class PersistedQueryError(GraphQLError):
+    """GraphQL-Fehler bei Persisted Queries mit dem Code aus dem APQ-Protokoll."""
+
+    def __init__(self, code: str, message: str) -> None:
+        """Initialisierung von PersistedQueryError mit Code und Meldung.
+
+        :param code: z.B. PERSISTED_QUERY_NOT_FOUND; Clients wie Apollo
+            senden daraufhin den vollständigen Query-Text
+        :param message: Meldung, z.B. PersistedQueryNotFound
+        """
+        super().__init__(message, extensions={"code": code})
+        self.code = code
+
+
 class VersionOutdatedError(Exception):
     """Exception, falls die Versionsnummer beim Aktualisieren veraltet ist."""
 
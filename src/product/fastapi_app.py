@@ -1,6 +1,7 @@
 # src/product/fastapi_app.py
 """MainApp."""
 
+import asyncio
 from collections.abc import AsyncGenerator, Awaitable, Callable
 from contextlib import asynccontextmanager
 from pathlib import Path
@@ -10,23 +11,42 @@ from fastapi import FastAPI, HTTPException, Request, Response, status
 from fastapi.responses import FileResponse
 from loguru import logger
 
+from product.admission import AdmissionControlMiddleware
+from product.compression import CompressionMiddleware
 from product.config import dev, env
-from product.config.dev.db_populate_router import router as db_populate_router
-from product.config.dev.db_populate import mongo_populate
-from product.config.mongo import init_mongo
+from product.config.admission import admission_enabled
+from product.config.compression import compression_enabled
+from product.config.search import suggest_batch_size, suggest_index_enabled
 from product.error.exceptions import NotAllowedError, NotFoundError, VersionOutdatedError
+from product.dependency_provider import (
+    get_category_stats_repository,
+    get_product_repository,
+)
 from product.graphql.schema import graphql_router
-from product.messaging.kafka_singleton import get_kafka_consumer, get_kafka_producer
+from product.messaging.kafka_singleton import (
+    get_kafka_consumer,
+    get_kafka_producer,
+    get_product_event_consumer,
+)
 from product.otel_setup import setup_otel
-from product.repository.session import dispose_connection_pool
-from product.router import health_router, shutdown_router
+from product.repository.index_manager import get_index_manager
+from product.repository.session import dispose_connection_pool, init_beanie_connection
+from product.repository.session_token_middleware import SessionTokenMiddleware
+from product.router import (
+    category_stats_router,
+    health_router,
+    index_router,
+    product_export_router,
+    shutdown_router,
+    slow_query_router,
+)
+from product.search.suggestion_index import get_suggestion_index
 
 from opentelemetry import trace
 from opentelemetry.sdk.resources import SERVICE_NAME, Resource
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
-from opentelemetry.instrumentation.asgi import OpenTelemetryMiddleware
 from opentelemetry.instrumentation.pymongo import PymongoInstrumentor
 from prometheus_fastapi_instrumentator import Instrumentator
 
@@ -52,13 +72,29 @@ TEXT_PLAIN: Final = "text/plain"
 # --------------------------------------------------------------------------------------
 # S t a r t u p   u n d   S h u t d o w n
 # --------------------------------------------------------------------------------------
+def _log_banner_failure(future: asyncio.Future[None]) -> None:
+    """Fehler des Banners im Executor protokollieren; der Start läuft weiter."""
+    if future.cancelled():
+        return
+    err: Final = future.exception()
+    if err is not None:
+        logger.opt(exception=err).error("Banner konnte nicht ausgegeben werden")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None]:  # noqa: RUF029
     """Startup/Shutdown-Logik: MongoDB, Kafka, Banner."""
     logger.info("→ Starting up services…")
-    await init_mongo()
+    await init_beanie_connection()
+    # Eindeutige Indexe wie name_1 vor Backfills, Testdaten und Requests anlegen;
+    # schlägt das fehl, startet der Server nicht. Die übrigen im Hintergrund
+    index_task = await get_index_manager().start_sync()
+    await get_product_repository().backfill_name_normalized()
+    await get_product_repository().backfill_price_cents()
+    await get_category_stats_repository().ensure_built()
     kafka_consumer = get_kafka_consumer()
     kafka_producer = get_kafka_producer()
+    product_event_consumer = get_product_event_consumer()
 
     # Kein logger_plus im Producer während Start verwenden!
 
@@ -66,13 +102,32 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:  # noqa: RUF029
     logger.info("Starte Kafka Producer…")
     await kafka_producer.start()
     await kafka_consumer.start()
+    await product_event_consumer.start()
     if dev:
+        from product.config.dev.db_populate import mongo_populate  # noqa: PLC0415
+
         await mongo_populate()
-    banner(app.routes)
+    # Index im Hintergrund aufbauen; bis dahin beantwortet MongoDB suggestProducts
+    suggestion_task = (
+        asyncio.create_task(
+            get_suggestion_index().build(
+                get_product_repository().stream_suggestion_fields(suggest_batch_size)
+            )
+        )
+        if suggest_index_enabled
+        else None
+    )
+    # Banner nicht abwarten: gethostbyname kann bei langsamem DNS blockieren
+    banner_future = asyncio.get_running_loop().run_in_executor(None, banner, app.routes)
+    banner_future.add_done_callback(_log_banner_failure)
     yield
     logger.info("← Shutting down services…")
+    index_task.cancel()
+    if suggestion_task is not None:
+        suggestion_task.cancel()
     await kafka_producer.stop()
     await kafka_consumer.stop()
+    await product_event_consumer.stop()
     logger.info("Der Server wird heruntergefahren")
     await dispose_connection_pool()
 
@@ -84,6 +139,7 @@ else:
 # Setup Observability
 setup_otel(app)  # Tracing mit Tempo
 Instrumentator().instrument(app).expose(app)  # Prometheus-Metriken
+app.add_middleware(SessionTokenMiddleware)  # Kausale Konsistenz nach Writes
 
 # --------------------------------------------------------------------------------------
 # R E S T
@@ -91,7 +147,15 @@ Instrumentator().instrument(app).expose(app)  # Prometheus-Metriken
 app.include_router(health_router)
 # app.include_router(health_router, prefix="/health")
 app.include_router(shutdown_router, prefix="/admin")
+app.include_router(slow_query_router, prefix="/admin")
+app.include_router(index_router, prefix="/admin")
+app.include_router(category_stats_router, prefix="/admin")
+app.include_router(product_export_router)
 if dev:
+    from product.config.dev.db_populate_router import (  # noqa: PLC0415
+        router as db_populate_router,
+    )
+
     app.include_router(db_populate_router, prefix="/dev")
 
 
@@ -143,6 +207,16 @@ async def inject_keycloak(request: Request, call_next):
     return await call_next(request)
 
 
+# Außerhalb von Keycloak, Tracing und Metriken: komprimiert alle Responses
+if compression_enabled:
+    app.add_middleware(CompressionMiddleware)
+
+# Zuletzt registriert und damit ganz außen: abgelehnte Operationen kosten weder
+# eine Anfrage an Keycloak noch Tracing
+if admission_enabled:
+    app.add_middleware(AdmissionControlMiddleware)
+
+
 # --------------------------------------------------------------------------------------
 # E x c e p t i o n   H a n d l e r
 # --------------------------------------------------------------------------------------
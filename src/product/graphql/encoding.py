@@ -0,0 +1,29 @@
+"""Serialisierung von GraphQL-Responses mit orjson statt `json.dumps`.
+
+orjson erzeugt direkt Bytes ohne Leerzeichen und serialisiert datetime, UUID
+und Dataclasses selbst. Decimal kennt orjson nicht; es erscheint nur in
+`extensions` eigener Erweiterungen und wird wie beim Typ Float in GraphQL als
+Zahl ausgegeben.
+"""
+
+from decimal import Decimal
+from typing import Any
+
+import orjson
+
+__all__ = ["encode_response"]
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError
+
+
+def encode_response(data: Any) -> bytes:
+    """GraphQL-Response als JSON.
+
+    :param data: Response mit `data`, `errors` und `extensions`
+    :return: JSON als UTF-8
+    """
+    return orjson.dumps(data, default=_default)
@@ -0,0 +1,411 @@
+"""Automatic Persisted Queries und Cache für geparste, validierte Dokumente.
+
+Ein Client sendet statt des Query-Texts nur dessen SHA-256 unter
+`extensions.persistedQuery.sha256Hash`. Ist der Hash unbekannt, antwortet der
+Server mit PERSISTED_QUERY_NOT_FOUND und der Client wiederholt den Request
+einmalig mit Text und Hash. Die Texte liegen in einem LRU je Worker; nach
+einem Neustart oder bei einem anderen Worker registriert der Client erneut.
+Mit `registered-operations-only` sind nur Operationen aus dem Manifest
+erlaubt; freie Queries einschließlich Introspection werden abgelehnt.
+
+GET-Requests mit Persisted Query sind cachebar: Sie erhalten ETag,
+Last-Modified und Cache-Control und werden ggf. aus `ResponseCache` beantwortet.
+
+Unabhängig davon hält `DocumentCache` geparste und validierte Dokumente je
+Hash des Query-Texts. Parsen und Validieren entfallen dann für wiederholte
+Operationen. Die Kostenprüfung läuft weiterhin, da sie von den Variablen
+abhängt.
+"""
+
+import hashlib
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping
+from dataclasses import replace
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Final
+
+import orjson
+from fastapi import Request, Response, status
+from graphql import DocumentNode, validate
+from loguru import logger
+from strawberry.extensions import SchemaExtension
+from strawberry.fastapi import GraphQLRouter
+from strawberry.http import GraphQLRequestData
+from strawberry.types import ExecutionResult
+from strawberry.types.unset import UNSET
+
+from product.config.graphql import (
+    graphql_cache_control,
+    graphql_document_cache_size,
+    graphql_etag_enabled,
+    graphql_persisted_queries_enabled,
+    graphql_persisted_queries_manifest,
+    graphql_persisted_queries_size,
+    graphql_registered_operations_only,
+)
+from product.error.exceptions import PersistedQueryError
+from product.graphql.encoding import encode_response
+from product.metrics.instrumentation import record_cache_access
+from product.search.response_cache import (
+    CachedResponse,
+    etag_matches,
+    get_response_cache,
+    not_modified_since,
+    response_cache_key,
+)
+
+__all__ = [
+    "DocumentCache",
+    "DocumentCacheExtension",
+    "PersistedQueryRouter",
+    "PersistedQueryStore",
+    "get_document_cache",
+    "get_persisted_queries",
+    "load_manifest",
+    "persisted_query_hash",
+    "query_hash",
+]
+
+
+def query_hash(query: str) -> str:
+    """SHA-256 eines Query-Texts wie bei Automatic Persisted Queries.
+
+    :param query: Query-Text
+    :return: Hash als Hex-String in Kleinbuchstaben
+    """
+    return hashlib.sha256(query.encode()).hexdigest()
+
+
+def persisted_query_hash(extensions: Any) -> str | None:
+    """Hash aus `extensions.persistedQuery.sha256Hash` eines Requests.
+
+    :param extensions: Feld `extensions` des Requests
+    :return: Hash in Kleinbuchstaben oder None
+    """
+    if not isinstance(extensions, Mapping):
+        return None
+    persisted: Final = extensions.get("persistedQuery")
+    if not isinstance(persisted, Mapping):
+        return None
+    sha256_hash: Final = persisted.get("sha256Hash")
+    return sha256_hash.lower() if isinstance(sha256_hash, str) else None
+
+
+def load_manifest(path: Path) -> dict[str, str]:
+    """Registrierte Operationen aus einer JSON-Datei laden.
+
+    Erlaubt sind ein Objekt `{"<sha256>": "<query>"}` oder ein Manifest von
+    Apollo mit `operations[].body`. Der Schlüssel ist immer der SHA-256 des
+    Query-Texts, damit ein falscher Hash in der Datei nichts freischaltet.
+
+    :param path: Pfad zur JSON-Datei
+    :return: Query-Texte je Hash
+    """
+    data: Final = orjson.loads(path.read_bytes())
+    bodies: Final[list[str]] = (
+        [operation["body"] for operation in data["operations"]]
+        if isinstance(data, Mapping) and "operations" in data
+        else list(data.values())
+    )
+    return {query_hash(body): body for body in bodies}
+
+
+class PersistedQueryStore:
+    """Registrierte Operationen und per APQ registrierte Query-Texte als LRU."""
+
+    def __init__(
+        self,
+        max_size: int,
+        *,
+        enabled: bool = True,
+        registered: Mapping[str, str] | None = None,
+        registered_only: bool = False,
+    ) -> None:
+        self._max_size: Final = max_size
+        self._enabled: Final = enabled and not registered_only
+        self._registered: Final = dict(registered or {})
+        self._registered_only: Final = registered_only
+        self._entries: OrderedDict[str, str] = OrderedDict()
+
+    def lookup(self, sha256_hash: str) -> str | None:
+        """Query-Text zum Hash ohne Änderung der LRU-Reihenfolge, z.B. für Admission."""
+        return self._registered.get(sha256_hash) or self._entries.get(sha256_hash)
+
+    def resolve(self, query: str | None, sha256_hash: str | None) -> str | None:
+        """Auszuführenden Query-Text bestimmen und ggf. registrieren.
+
+        :param query: Query-Text aus dem Request
+        :param sha256_hash: Hash aus `extensions.persistedQuery`
+        :return: Query-Text
+        :raises PersistedQueryError: Falls der Hash unbekannt ist, nicht zum
+            Text passt oder die Operation nicht registriert ist
+        """
+        if sha256_hash is None:
+            if (
+                query is None
+                or not self._registered_only
+                or query_hash(query) in self._registered
+            ):
+                return query
+            raise _not_in_list()
+
+        if query is None:
+            return self._get(sha256_hash)
+
+        if query_hash(query) != sha256_hash:
+            raise PersistedQueryError(
+                "PERSISTED_QUERY_HASH_MISMATCH", "provided sha does not match query"
+            )
+        if sha256_hash in self._registered:
+            return query
+        if self._registered_only:
+            raise _not_in_list()
+        if self._enabled:
+            self._entries[sha256_hash] = query
+            self._entries.move_to_end(sha256_hash)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+        return query
+
+    def _get(self, sha256_hash: str) -> str:
+        registered: Final = self._registered.get(sha256_hash)
+        if registered is not None:
+            return registered
+        if self._registered_only:
+            raise _not_in_list()
+        if not self._enabled:
+            raise PersistedQueryError(
+                "PERSISTED_QUERY_NOT_SUPPORTED", "PersistedQueryNotSupported"
+            )
+        query: Final = self._entries.get(sha256_hash)
+        record_cache_access("persisted_queries", hit=query is not None)
+        if query is None:
+            raise PersistedQueryError("PERSISTED_QUERY_NOT_FOUND", "PersistedQueryNotFound")
+        self._entries.move_to_end(sha256_hash)
+        return query
+
+
+def _not_in_list() -> PersistedQueryError:
+    return PersistedQueryError("PERSISTED_QUERY_NOT_IN_LIST", "PersistedQueryNotInList")
+
+
+class DocumentCache:
+    """LRU-Cache für geparste und validierte Dokumente je Hash des Query-Texts."""
+
+    def __init__(self, max_size: int) -> None:
+        self._max_size: Final = max_size
+        self._entries: OrderedDict[str, DocumentNode] = OrderedDict()
+
+    def get(self, key: str) -> DocumentNode | None:
+        """Validiertes Dokument zum Hash oder None."""
+        document: Final = self._entries.get(key)
+        record_cache_access("graphql_documents", hit=document is not None)
+        if document is not None:
+            self._entries.move_to_end(key)
+        return document
+
+    def put(self, key: str, document: DocumentNode) -> None:
+        """Validiertes Dokument speichern; verdrängt das am längsten ungenutzte."""
+        self._entries[key] = document
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+
+@lru_cache(maxsize=1)
+def get_persisted_queries() -> PersistedQueryStore:
+    """Prozessweite Persisted Queries gemäß Konfiguration."""
+    registered: Final = (
+        load_manifest(graphql_persisted_queries_manifest)
+        if graphql_persisted_queries_manifest is not None
+        else {}
+    )
+    if registered:
+        logger.info("Registrierte GraphQL-Operationen: {}", len(registered))
+    if graphql_registered_operations_only and not registered:
+        logger.warning("registered-operations-only ohne Manifest: alle Operationen abgelehnt")
+    return PersistedQueryStore(
+        graphql_persisted_queries_size,
+        enabled=graphql_persisted_queries_enabled,
+        registered=registered,
+        registered_only=graphql_registered_operations_only,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_document_cache() -> DocumentCache | None:
+    """Prozessweiter Cache für Dokumente oder None, falls abgeschaltet."""
+    if graphql_document_cache_size <= 0:
+        return None
+    return DocumentCache(graphql_document_cache_size)
+
+
+class DocumentCacheExtension(SchemaExtension):
+    """Übernimmt geparste und validierte Dokumente aus `DocumentCache`.
+
+    Muss vor `QueryCostExtension` stehen: Ein Dokument aus dem Cache gilt als
+    validiert, ein neues wird hier validiert und bei Erfolg gespeichert. Die
+    Kostenprüfung danach betrifft den Cache nicht.
+    """
+
+    _key: str | None = None
+    _cached: bool = False
+
+    def on_parse(self) -> Iterator[None]:
+        context: Final = self.execution_context
+        cache: Final = get_document_cache()
+        if cache is not None and context.query and context.graphql_document is None:
+            self._key = query_hash(context.query)
+            document = cache.get(self._key)
+            if document is not None:
+                context.graphql_document = document
+                self._cached = True
+        yield
+
+    def on_validate(self) -> Iterator[None]:
+        context: Final = self.execution_context
+        if context.errors is None and self._key is not None:
+            if self._cached:
+                context.errors = []
+            elif context.graphql_document is not None:
+                context.errors = validate(
+                    context.schema._schema,  # noqa: SLF001
+                    context.graphql_document,
+                    context.validation_rules,
+                )
+                cache = get_document_cache()
+                if not context.errors and cache is not None:
+                    cache.put(self._key, context.graphql_document)
+        yield
+
+
+class PersistedQueryRouter(GraphQLRouter):
+    """GraphQLRouter mit Automatic Persisted Queries über POST und GET.
+
+    Responses werden mit orjson statt `json.dumps` serialisiert.
+    """
+
+    def should_render_graphql_ide(self, request: Any) -> bool:
+        """GET mit `extensions`, aber ohne `query` ist eine Persisted Query."""
+        return "extensions" not in request.query_params and super().should_render_graphql_ide(
+            request
+        )
+
+    async def parse_http_body(self, request: Any) -> GraphQLRequestData:
+        data: Final = await super().parse_http_body(request)
+        sha256_hash: Final = persisted_query_hash(await self._extensions(request))
+        query: Final = get_persisted_queries().resolve(data.query, sha256_hash)
+        return data if query is data.query else replace(data, query=query)
+
+    async def _extensions(self, request: Any) -> Any:
+        if request.method == "GET":
+            extensions = request.query_params.get("extensions")
+            return self.parse_json(extensions) if extensions else None
+        if "application/json" not in (request.content_type or ""):
+            return None
+        # Der Body ist bereits gelesen; erneut parsen nur bei Persisted Queries
+        body: Final = await request.get_body()
+        if b"persistedQuery" not in body:
+            return None
+        data: Final = orjson.loads(body)
+        return data.get("extensions") if isinstance(data, Mapping) else None
+
+    async def execute_operation(
+        self, request: Any, context: Any, root_value: Any
+    ) -> Any:
+        try:
+            return await super().execute_operation(request, context, root_value)
+        except PersistedQueryError as err:
+            return ExecutionResult(data=None, errors=[err])
+
+    def create_response(self, response_data: Any, sub_response: Response) -> Response:
+        """Response mit orjson; die Content-Length ergibt sich aus den Bytes."""
+        response: Final = Response(
+            encode_response(response_data),
+            media_type="application/json",
+            status_code=sub_response.status_code or status.HTTP_200_OK,
+        )
+        response.headers.raw.extend(sub_response.headers.raw)
+        return response
+
+    async def run(
+        self, request: Any, context: Any = UNSET, root_value: Any = UNSET
+    ) -> Any:
+        """GET mit Persisted Query: Response-Cache, ETag und 304."""
+        key: Final = _response_key(request, context)
+        if key is None:
+            return await super().run(request, context, root_value)
+
+        cache: Final = get_response_cache()
+        cached: Final = cache.get(key) if cache.enabled else None
+        if cached is not None:
+            return _conditional(request, cached)
+
+        generation: Final = cache.generation
+        response: Final = await super().run(request, context, root_value)
+        if response.status_code != status.HTTP_200_OK or not response.headers.get(
+            "content-type", ""
+        ).startswith("application/json"):
+            return response
+        try:
+            if "errors" in orjson.loads(response.body):
+                return response
+        except orjson.JSONDecodeError:
+            # Nicht cachebar, z.B. eine Response ohne gepufferten Body
+            return response
+        entry: Final = CachedResponse.create(response.body)
+        cache.put(key, entry, generation)
+        return _conditional(request, entry, response)
+
+
+def _response_key(request: Any, context: Any) -> str | None:
+    """Schlüssel für den Response-Cache oder None, falls nicht cachebar."""
+    if (
+        not graphql_etag_enabled
+        or not isinstance(request, Request)
+        or request.method != "GET"
+        or "extensions" not in request.query_params
+    ):
+        return None
+    params: Final = request.query_params
+    try:
+        sha256_hash = persisted_query_hash(orjson.loads(params["extensions"]))
+        if sha256_hash is None:
+            return None
+        keycloak = context.get("keycloak") if isinstance(context, Mapping) else None
+        roles = (
+            keycloak.payload.get("realm_access", {}).get("roles", [])
+            if keycloak is not None
+            else []
+        )
+        return response_cache_key(
+            sha256_hash, params.get("variables"), params.get("operationName"), roles
+        )
+    except orjson.JSONDecodeError:
+        # Strawberry antwortet mit 400
+        return None
+
+
+def _conditional(
+    request: Request, entry: CachedResponse, response: Response | None = None
+) -> Response:
+    """304 bei passendem If-None-Match bzw. If-Modified-Since, sonst die Response."""
+    headers: Final = {
+        "ETag": entry.etag,
+        "Last-Modified": entry.last_modified,
+        "Cache-Control": graphql_cache_control,
+        "Vary": "Authorization",
+    }
+    if_none_match: Final = request.headers.get("if-none-match")
+    if_modified_since: Final = request.headers.get("if-modified-since")
+    if (if_none_match is not None and etag_matches(if_none_match, entry.etag)) or (
+        if_none_match is None
+        and if_modified_since is not None
+        and not_modified_since(if_modified_since, entry.last_modified)
+    ):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    if response is None:
+        return Response(entry.body, media_type="application/json", headers=headers)
+    response.headers.update(headers)
+    return response
@@ -0,0 +1,281 @@
+"""Statische Kosten und Tiefe einer GraphQL-Operation vor der Ausführung.
+
+Jedes ausgewählte Feld kostet 1, ein Feld von Query zusätzlich
+`graphql_query_field_cost` für die Abfrage an MongoDB. Die Kosten der Kinder
+einer Liste werden mit der erwarteten Anzahl Elemente multipliziert. Bei
+paginierten Feldern wie `products` ist das die Seitengröße, die auch der
+Service verwenden wird; bei Listen ohne Seitengröße wie `variants` ist es
+`graphql_default_list_size`. Aliase zählen wie eigene Felder. Dadurch fallen
+Operationen auf, die dasselbe Feld unter vielen Aliasen abfragen.
+"""
+
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass
+from typing import Any, Final
+
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLList,
+    GraphQLNamedType,
+    GraphQLObjectType,
+    GraphQLSchema,
+    InlineFragmentNode,
+    OperationDefinitionNode,
+    OperationType,
+    SelectionSetNode,
+    get_named_type,
+    get_nullable_type,
+    validate,
+)
+from graphql.execution.values import get_argument_values
+from strawberry.extensions import SchemaExtension
+
+from product.config.graphql import (
+    graphql_default_list_size,
+    graphql_max_cost,
+    graphql_max_depth,
+    graphql_query_field_cost,
+)
+from product.config.search import search_autocomplete_max_limit, search_max_page_size
+from product.repository.pageable import Pageable
+
+__all__ = ["QueryCost", "QueryCostExtension", "estimate_cost"]
+
+
+def _bounded(value: Any, maximum: int, default: int = 10) -> int:
+    return min(max(value if isinstance(value, int) else default, 1), maximum)
+
+
+def _pagination_limit(args: Mapping[str, Any]) -> int:
+    pagination: Final = args.get("pagination")
+    limit: Final = (
+        pagination.get("limit")
+        if isinstance(pagination, Mapping)
+        else getattr(pagination, "limit", None)
+    )
+    return Pageable.create(limit=limit).limit
+
+
+# Seitengröße wie in ProductReadService bzw. Pageable je Feld von Query
+_PAGE_SIZES: Final[dict[str, Callable[[Mapping[str, Any]], int]]] = {
+    "products": _pagination_limit,
+    "searchProducts": lambda args: _bounded(args.get("first"), search_max_page_size),
+    "autocompleteProducts": lambda args: _bounded(
+        args.get("limit"), search_autocomplete_max_limit
+    ),
+    "suggestProducts": lambda args: _bounded(
+        args.get("limit"), search_autocomplete_max_limit
+    ),
+}
+
+
+@dataclass(slots=True, frozen=True)
+class QueryCost:
+    """Ergebnis von `estimate_cost`."""
+
+    cost: int
+    depth: int
+
+
+class _Estimator:
+    def __init__(
+        self,
+        schema: GraphQLSchema,
+        fragments: Mapping[str, FragmentDefinitionNode],
+        variables: Mapping[str, Any] | None,
+        default_list_size: int,
+        query_field_cost: int,
+    ) -> None:
+        self._schema: Final = schema
+        self._query_field_cost: Final = query_field_cost
+        self._fragments: Final = fragments
+        self._variables: Final = variables or {}
+        self._default_list_size: Final = default_list_size
+        self.depth = 0
+
+    def _fields(
+        self, parent: GraphQLNamedType, selection_set: SelectionSetNode, visited: set[str]
+    ) -> Iterator[tuple[GraphQLNamedType, FieldNode]]:
+        """Felder einschließlich der aus Fragmenten mit ihrem Parent-Typ."""
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                yield parent, selection
+            elif isinstance(selection, InlineFragmentNode):
+                condition = (
+                    self._schema.get_type(selection.type_condition.name.value)
+                    if selection.type_condition is not None
+                    else parent
+                )
+                yield from self._fields(condition or parent, selection.selection_set, visited)
+            elif isinstance(selection, FragmentSpreadNode):
+                name = selection.name.value
+                fragment = self._fragments.get(name)
+                if fragment is None or name in visited:
+                    continue
+                condition = self._schema.get_type(fragment.type_condition.name.value)
+                yield from self._fields(
+                    condition or parent, fragment.selection_set, visited | {name}
+                )
+
+    def cost(
+        self,
+        parent: GraphQLNamedType,
+        selection_set: SelectionSetNode,
+        depth: int,
+        page_size: int | None = None,
+    ) -> int:
+        self.depth = max(self.depth, depth)
+        total = 0
+        for parent_type, node in self._fields(parent, selection_set, set()):
+            name = node.name.value
+            if name.startswith("__"):
+                # __typename bzw. Introspection
+                continue
+            total += 1
+            if parent_type is self._schema.query_type:
+                total += self._query_field_cost
+            field = (
+                parent_type.fields.get(name)
+                if isinstance(parent_type, GraphQLObjectType)
+                else None
+            )
+            if field is None or node.selection_set is None:
+                continue
+
+            size = page_size
+            if parent_type is self._schema.query_type and name in _PAGE_SIZES:
+                try:
+                    args = get_argument_values(field, node, self._variables)
+                except GraphQLError:
+                    args = {}
+                size = _PAGE_SIZES[name](args)
+
+            multiplier = 1
+            child_page_size = size
+            if isinstance(get_nullable_type(field.type), GraphQLList):
+                # Die Seitengröße gilt für die erste Liste darunter, z.B. `content`
+                multiplier = size if size is not None else self._default_list_size
+                child_page_size = None
+            total += multiplier * self.cost(
+                get_named_type(field.type), node.selection_set, depth + 1, child_page_size
+            )
+        return total
+
+
+def estimate_cost(
+    schema: GraphQLSchema,
+    document: DocumentNode,
+    operation_name: str | None = None,
+    variables: Mapping[str, Any] | None = None,
+    default_list_size: int = graphql_default_list_size,
+    query_field_cost: int = graphql_query_field_cost,
+) -> QueryCost | None:
+    """Statische Kosten der auszuführenden Operation eines validierten Dokuments.
+
+    :param schema: Schema von graphql-core
+    :param document: Validiertes Dokument
+    :param operation_name: `operationName` bei mehreren Operationen
+    :param variables: Variablen aus dem Request
+    :param default_list_size: Angenommene Länge von Listen ohne Seitengröße
+    :param query_field_cost: Zusätzliche Kosten je Feld von Query
+    :return: Kosten und Tiefe oder None, falls die Operation nicht existiert
+    """
+    operations: Final = [
+        definition
+        for definition in document.definitions
+        if isinstance(definition, OperationDefinitionNode)
+        and (
+            operation_name is None
+            or (definition.name is not None and definition.name.value == operation_name)
+        )
+    ]
+    if not operations:
+        return None
+    operation: Final = operations[0]
+    root: Final = (
+        schema.mutation_type
+        if operation.operation is OperationType.MUTATION
+        else schema.subscription_type
+        if operation.operation is OperationType.SUBSCRIPTION
+        else schema.query_type
+    )
+    if root is None:
+        return None
+    fragments: Final = {
+        definition.name.value: definition
+        for definition in document.definitions
+        if isinstance(definition, FragmentDefinitionNode)
+    }
+    estimator: Final = _Estimator(
+        schema, fragments, variables, default_list_size, query_field_cost
+    )
+    cost: Final = estimator.cost(root, operation.selection_set, 1)
+    return QueryCost(cost=cost, depth=estimator.depth)
+
+
+class QueryCostExtension(SchemaExtension):
+    """Lehnt Operationen über Kosten- oder Tiefenlimit vor der Ausführung ab.
+
+    Die Standardvalidierung läuft hier vorab, falls sie nicht schon
+    `DocumentCacheExtension` erledigt hat, damit nur gültige Dokumente
+    bewertet werden; Strawberry überspringt sie dann. Die Kosten stehen im
+    Response unter `extensions.cost`.
+    """
+
+    _cost: QueryCost | None = None
+
+    def on_validate(self) -> Iterator[None]:
+        context: Final = self.execution_context
+        if context.graphql_document is None:
+            yield
+            return
+        if context.errors is None:
+            context.errors = validate(
+                context.schema._schema,  # noqa: SLF001
+                context.graphql_document,
+                context.validation_rules,
+            )
+        if not context.errors:
+            # auch für Dokumente, die DocumentCacheExtension schon validiert hat
+            context.errors = self._check(context)
+        yield
+
+    def _check(self, context: Any) -> list[GraphQLError]:
+        self._cost = estimate_cost(
+            context.schema._schema,  # noqa: SLF001
+            context.graphql_document,
+            context.operation_name,
+            context.variables,
+        )
+        if self._cost is None:
+            return []
+        if graphql_max_depth > 0 and self._cost.depth > graphql_max_depth:
+            return [
+                GraphQLError(
+                    f"Tiefe {self._cost.depth} überschreitet das Maximum {graphql_max_depth}",
+                    extensions={"code": "QUERY_TOO_DEEP"},
+                )
+            ]
+        if graphql_max_cost > 0 and self._cost.cost > graphql_max_cost:
+            return [
+                GraphQLError(
+                    f"Kosten {self._cost.cost} überschreiten das Maximum {graphql_max_cost}",
+                    extensions={"code": "QUERY_TOO_EXPENSIVE"},
+                )
+            ]
+        return []
+
+    def get_results(self) -> dict[str, Any]:
+        if self._cost is None:
+            return {}
+        return {
+            "cost": {
+                "requested": self._cost.cost,
+                "maximum": graphql_max_cost,
+                "depth": self._cost.depth,
+            }
+        }
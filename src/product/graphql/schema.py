@@ -2,7 +2,6 @@ from typing import Final, List
 
 import strawberry
 from fastapi import Request
-from strawberry.fastapi import GraphQLRouter
 from strawberry.federation import Schema
 
 from product.config.graphql import graphql_ide
@@ -11,6 +10,13 @@ from product.dependency_provider import (
     get_product_query_resolver,
 )
 from product.error.exceptions import AuthenticationError
+from product.graphql.persisted_queries import (
+    DocumentCacheExtension,
+    PersistedQueryRouter,
+)
+from product.graphql.query_cost import QueryCostExtension
+from product.metrics.instrumentation import MetricsExtension
+from product.model.entity.category_stats import CategoryStatisticsType
 from product.model.entity.product import ProductInput, ProductType
 from product.model.entity.product_variant import ProductVariantInput
 from product.model.input.pagination import PaginationInput
@@ -18,8 +24,12 @@ from product.model.input.searchcriteria import (
     ProductSearchCriteria,
     ProductSearchCriteriaInput,
 )
-from product.model.payload.create_payload import CreatePayload
+from product.model.input.sort import ProductSort, ProductSortInput
+from product.model.payload.create_payload import CreatePayloadType
+from product.model.types.product_facets import ProductFacetsType
+from product.model.types.product_search_slice import ProductSearchSlice
 from product.model.types.product_slice import ProductSlice
+from product.model.types.product_suggestion import ProductSuggestionType
 from product.repository.pageable import Pageable
 from product.security.keycloak_service import KeycloakService
 
@@ -57,6 +67,7 @@ class Query:
         self,
         pagination: PaginationInput | None = None,
         search_criteria: ProductSearchCriteriaInput | None = None,
+        sort: ProductSortInput | None = None,
         info: strawberry.types.Info = None,
     ) -> ProductSlice:
         """Patienten anhand von Suchkriterien suchen.
@@ -87,6 +98,7 @@ class Query:
             info=info,
             pageable=pageable,
             search_criteria=criteria,
+            sort=ProductSort(**sort.__dict__) if sort is not None else None,
         )
 
         return ProductSlice(
@@ -96,6 +108,113 @@ class Query:
             size=pageable.limit,
         )
 
+    @strawberry.field
+    async def search_products(
+        self,
+        query: str,
+        search_criteria: ProductSearchCriteriaInput | None = None,
+        first: int = 10,
+        after: str | None = None,
+        info: strawberry.types.Info = None,
+    ) -> ProductSearchSlice:
+        """Volltextsuche über Name, Marke, Beschreibung und Tags.
+
+        :param query: Suchbegriffe, z.B. "kabellos kopfhörer"
+        :param search_criteria: Zusätzliche Filter wie bei `products`
+        :param first: Anzahl Treffer pro Seite
+        :param after: `nextCursor` der vorherigen Seite
+        :return: Nach Relevanz sortierte Treffer
+        """
+        keycloak: KeycloakService | None = info.context.get("keycloak")
+        if keycloak is None:
+            raise AuthenticationError()
+        keycloak.assert_roles(["Admin", "User"])
+
+        criteria = (
+            ProductSearchCriteria(**search_criteria.__dict__)
+            if search_criteria is not None
+            else None
+        )
+        return await get_product_query_resolver().resolve_search_products(
+            info=info,
+            text=query,
+            search_criteria=criteria,
+            first=first,
+            after=after,
+        )
+
+    @strawberry.field
+    async def product_facets(
+        self,
+        search_criteria: ProductSearchCriteriaInput | None = None,
+        info: strawberry.types.Info = None,
+    ) -> ProductFacetsType:
+        """Anzahl Produkte je Kategorie, Marke, Preisbereich und Tag.
+
+        :param search_criteria: Filter wie bei `products`
+        :return: Facetten für die gefilterten Produkte
+        """
+        keycloak: KeycloakService | None = info.context.get("keycloak")
+        if keycloak is None:
+            raise AuthenticationError()
+        keycloak.assert_roles(["Admin", "User"])
+
+        criteria = (
+            ProductSearchCriteria(**search_criteria.__dict__)
+            if search_criteria is not None
+            else None
+        )
+        return await get_product_query_resolver().resolve_product_facets(
+            info=info, search_criteria=criteria
+        )
+
+    @strawberry.field
+    async def category_statistics(
+        self,
+        info: strawberry.types.Info = None,
+    ) -> List[CategoryStatisticsType]:
+        """Anzahl, Preissumme und Durchschnittspreis je Kategorie für Dashboards."""
+        keycloak: KeycloakService | None = info.context.get("keycloak")
+        if keycloak is None:
+            raise AuthenticationError()
+        keycloak.assert_roles(["Admin"])
+
+        return await get_product_query_resolver().resolve_category_statistics(info)
+
+    @strawberry.field
+    async def autocomplete_products(
+        self,
+        prefix: str,
+        limit: int = 10,
+        info: strawberry.types.Info = None,
+    ) -> List[ProductSuggestionType]:
+        """Produktnamen, die mit dem eingegebenen Präfix beginnen."""
+        keycloak: KeycloakService | None = info.context.get("keycloak")
+        if keycloak is None:
+            raise AuthenticationError()
+        keycloak.assert_roles(["Admin", "User"])
+
+        return await get_product_query_resolver().resolve_autocomplete_products(
+            info, prefix=prefix, limit=limit
+        )
+
+    @strawberry.field
+    async def suggest_products(
+        self,
+        prefix: str,
+        limit: int = 10,
+        info: strawberry.types.Info = None,
+    ) -> List[ProductSuggestionType]:
+        """Type-ahead über Name, Marke und Tags aus dem In-Memory-Index."""
+        keycloak: KeycloakService | None = info.context.get("keycloak")
+        if keycloak is None:
+            raise AuthenticationError()
+        keycloak.assert_roles(["Admin", "User"])
+
+        return await get_product_query_resolver().resolve_suggest_products(
+            info, prefix=prefix, limit=limit
+        )
+
 
 # ---------------------------
 # GraphQL Mutation Definition
@@ -108,7 +227,11 @@ class Mutation:
         self,
         input: ProductInput,
         info: strawberry.types.Info,
-    ) -> CreatePayload:
+    ) -> CreatePayloadType:
+        keycloak: KeycloakService | None = info.context.get("keycloak")
+        if keycloak is None:
+            raise AuthenticationError()
+
         return await get_product_mutation_resolver().create_product(input, info)
 
     @strawberry.mutation
@@ -117,7 +240,7 @@ class Mutation:
         product_id: strawberry.ID,
         input: List[ProductVariantInput],
         info: strawberry.types.Info,
-    ) -> CreatePayload:
+    ) -> CreatePayloadType:
         keycloak: KeycloakService | None = info.context.get("keycloak")
         if keycloak is None:
             raise AuthenticationError()
@@ -133,7 +256,7 @@ class Mutation:
         product_id: strawberry.ID,
         paths: List[str],
         info: strawberry.types.Info,
-    ) -> CreatePayload:
+    ) -> CreatePayloadType:
         keycloak: KeycloakService | None = info.context.get("keycloak")
         if keycloak is None:
             raise AuthenticationError()
@@ -149,7 +272,7 @@ class Mutation:
         product_id: strawberry.ID,
         input: ProductInput,
         info: strawberry.types.Info,
-    ) -> CreatePayload:
+    ) -> CreatePayloadType:
         keycloak: KeycloakService | None = info.context.get("keycloak")
         if keycloak is None:
             raise AuthenticationError()
@@ -178,10 +301,12 @@ class Mutation:
 # ---------------------------
 schema = Schema(
     query=Query,
+    mutation=Mutation,
     enable_federation_2=True,
+    extensions=[DocumentCacheExtension, QueryCostExtension, MetricsExtension],
 )
 
-graphql_router: Final = GraphQLRouter(
+graphql_router: Final = PersistedQueryRouter(
     schema,
     context_getter=get_context,
     graphql_ide=graphql_ide,
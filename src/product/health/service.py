@@ -1,6 +1,5 @@
 import os
 
-import aiohttp
 from aiokafka import AIOKafkaProducer
 from motor.motor_asyncio import AsyncIOMotorClient
 
@@ -31,6 +30,9 @@ def check_cert(filename: str):
 
 
 async def check_http(name: str, url: str):
+    # aiohttp erst bei der ersten Prüfung laden; der Import kostet beim Start ~0,2 s
+    import aiohttp  # noqa: PLC0415
+
     try:
         async with aiohttp.ClientSession() as session:
             async with session.get(url, timeout=2) as resp:
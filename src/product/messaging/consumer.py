@@ -9,6 +9,7 @@ from opentelemetry import trace
 
 from product.config.kafka import get_kafka_settings
 from product.tracing.trace_context_util import TraceContextUtil
+from product.tracing.sampling import sampled_span
 
 
 class KafkaConsumerService:
@@ -75,8 +76,8 @@ class KafkaConsumerService:
             tracer = trace.get_tracer("product.kafka")
 
             # ⬇️ Span für diese Verarbeitung starten
-            with tracer.start_as_current_span(
-                f"kafka.consume.{msg.topic}", context=otel_ctx
+            with sampled_span(
+                tracer, f"kafka.consume.{msg.topic}", context=otel_ctx
             ) as span:
                 span.set_attribute("messaging.system", "kafka")
                 span.set_attribute("messaging.destination", msg.topic)
@@ -108,8 +109,8 @@ class KafkaConsumerService:
                 handler = self._handlers.get(msg.topic)
                 if handler:
                     # ⬇️ Optional: Sub-Span für Handler
-                    with tracer.start_as_current_span(
-                        f"handler.{msg.topic}", context=otel_ctx
+                    with sampled_span(
+                        tracer, f"handler.{msg.topic}", context=otel_ctx
                     ):
                         await handler(payload)
                 else:
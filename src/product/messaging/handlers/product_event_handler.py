@@ -0,0 +1,26 @@
+from loguru import logger
+
+from product.search.facet_cache import get_facet_cache
+from product.search.response_cache import get_response_cache
+from product.search.suggestion_index import get_suggestion_index
+
+PRODUCT_DELETED = "product-deleted"
+
+
+async def handle_product_event(payload: dict) -> None:
+    """
+    Handler für das Topic `product.events`.
+    Hält Suggestion-Index, Facetten- und Response-Cache bei Änderungen anderer
+    Instanzen aktuell.
+    """
+    get_facet_cache().invalidate()
+    get_response_cache().invalidate()
+    index = get_suggestion_index()
+    product_id = payload.get("id")
+    if product_id is None:
+        logger.warning("Produkt-Event ohne ID: {}", payload)
+        return
+    if payload.get("event") == PRODUCT_DELETED:
+        index.remove(product_id)
+    elif payload.get("name"):
+        index.upsert(payload)
@@ -1,16 +1,19 @@
 # src/product/kafka/kafka_singleton.py
 
 from functools import cache
+from product.config.kafka import get_kafka_settings
 from product.messaging.producer import KafkaProducerService
 from product.messaging.consumer import KafkaConsumerService
 from product.messaging.handlers.handlers import (
     handle_customer_created,
     handle_order_cancelled,
 )
+from product.messaging.handlers.product_event_handler import handle_product_event
 
 # Kein lru_cache, damit Start gesteuert werden kann
 _kafka_producer_instance: KafkaProducerService | None = None
 _kafka_consumer_instance: KafkaConsumerService | None = None
+_product_event_consumer_instance: KafkaConsumerService | None = None
 
 
 def get_kafka_producer() -> KafkaProducerService:
@@ -32,3 +35,16 @@ def get_kafka_consumer() -> KafkaConsumerService:
             },
         )
     return _kafka_consumer_instance
+
+
+def get_product_event_consumer() -> KafkaConsumerService:
+    """Consumer ohne Gruppe: jede Instanz erhält alle Produkt-Events."""
+    global _product_event_consumer_instance
+    if _product_event_consumer_instance is None:
+        topic = get_kafka_settings().topic_product_events
+        _product_event_consumer_instance = KafkaConsumerService(
+            topics=[topic],
+            group_id=None,
+            handlers={topic: handle_product_event},
+        )
+    return _product_event_consumer_instance
@@ -1,6 +1,7 @@
 # src/product/kafka/producer.py
 
 import json
+from time import perf_counter
 from typing import Final, Optional, Union
 
 from aiokafka import AIOKafkaProducer
@@ -14,9 +15,11 @@ from product.config.kafka import get_kafka_settings
 from product.logging.log_event_dto import LogEventDTO
 from product.messaging.dto.kafka_message_dto import KafkaMessageDTO
 from product.messaging.dto.kafka_serializer_mixin import KafkaSerializerMixin
+from product.metrics.metric_registry import kafka_publish_duration_histogram
 from product.model.entity.product import Product
 from product.tracing.trace_context import TraceContext
 from product.tracing.trace_context_util import TraceContextUtil
+from product.tracing.sampling import sampled_span
 
 
 class KafkaProducerService:
@@ -30,6 +33,7 @@ class KafkaProducerService:
         self._bootstrap = settings.bootstrap_servers
         self._client_id = settings.client_id
         self._topic_created: Final[str] = settings.topic_product_created
+        self._topic_events: Final[str] = settings.topic_product_events
 
     async def start(self) -> None:
         if not self._producer:
@@ -85,14 +89,15 @@ class KafkaProducerService:
         tracer = trace.get_tracer("product.kafka")
 
         # ⬇️ Neuer Span
-        with tracer.start_as_current_span(f"kafka.publish.{topic}") as span:
+        with sampled_span(tracer, f"kafka.publish.{topic}") as span:
             span.set_attribute("messaging.system", "kafka")
             span.set_attribute("messaging.destination", topic)
             span.set_attribute("messaging.operation", "send")
             span.set_attribute("messaging.messaging.client_id", self._client_id)
-            span.set_attribute(
-                "messaging.messaging.message_payload_size_bytes", len(str(payload))
-            )
+            if span.is_recording():
+                span.set_attribute(
+                    "messaging.messaging.message_payload_size_bytes", len(str(payload))
+                )
 
             logger.debug("📤 Sende Kafka-Event an '{}': {}", topic, payload)
 
@@ -102,9 +107,17 @@ class KafkaProducerService:
                 value = orjson.dumps(payload)
 
 
-            await self._producer.send_and_wait(
-                topic, value=value, headers=kafka_headers
-            )
+            start = perf_counter()
+            outcome = "error"
+            try:
+                await self._producer.send_and_wait(
+                    topic, value=value, headers=kafka_headers
+                )
+                outcome = "ok"
+            finally:
+                kafka_publish_duration_histogram.record(
+                    perf_counter() - start, {"topic": topic, "outcome": outcome}
+                )
 
             logger.info(
                 "✅ Event an '{}' gesendet (Trace-ID: {})",
@@ -126,6 +139,26 @@ class KafkaProducerService:
         }
         await self.publish(self._topic_created, payload, trace_ctx)
 
+    async def send_event(
+        self, event: str, payload: dict, trace_ctx: Optional[TraceContext] = None
+    ) -> None:
+        """Änderung an einem Produkt auf dem Topic für Produkt-Events veröffentlichen.
+
+        :param event: Event-Name, z.B. "product-updated"
+        :param payload: JSON-kompatible Daten des Produkts
+        :param trace_ctx: Optionaler TraceContext
+        """
+        await self.publish(
+            topic=self._topic_events,
+            payload={"event": event, **payload},
+            trace_ctx=trace_ctx,
+            headers=[
+                ("x-service", self._client_id),
+                ("x-event-name", event),
+                ("x-event-version", "1.0.0"),
+            ],
+        )
+
     async def send_log_event(self, log_event: LogEventDTO, trace_ctx: TraceContext) -> None:
         await self.publish(
             topic="activity.product.logs",
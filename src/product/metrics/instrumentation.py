@@ -0,0 +1,131 @@
+"""Messpunkte für Resolver, Repository-Aufrufe und Caches.
+
+Die Werte landen in den Instrumenten aus `metric_registry` und werden über den
+`MeterProvider` aus `otel_setup.setup_metrics` unter `/metrics` exportiert.
+"""
+
+from collections.abc import Awaitable, Callable, Mapping, Sized
+from functools import wraps
+from inspect import isawaitable
+from time import perf_counter
+from typing import Any, Final, ParamSpec, TypeVar
+
+from graphql import GraphQLResolveInfo
+from pydantic import BaseModel
+from strawberry.extensions import SchemaExtension
+from strawberry.extensions.tracing.utils import should_skip_tracing
+
+from product.metrics.metric_registry import (
+    cache_requests_counter,
+    db_documents_returned_histogram,
+    db_query_duration_histogram,
+    graphql_resolver_duration_histogram,
+)
+
+__all__ = ["MetricsExtension", "measured_query", "record_cache_access"]
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+def record_cache_access(cache: str, hit: bool) -> None:
+    """Zugriff auf einen prozessinternen Cache zählen.
+
+    :param cache: Name des Caches, z.B. "facets"
+    :param hit: True bei einem Treffer
+    """
+    cache_requests_counter.add(1, {"cache": cache, "result": "hit" if hit else "miss"})
+
+
+def _document_count(result: Any) -> int | None:
+    if result is None:
+        return 0
+    if isinstance(result, (BaseModel, Mapping)):
+        # Einzelne Entität bzw. Ergebnis einer Aggregation wie `facets`
+        return 1
+    if isinstance(result, Sized) and not isinstance(result, (str, bytes)):
+        return len(result)
+    return None
+
+
+def measured_query(
+    collection: str, count_documents: bool = True
+) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """Dekorator für asynchrone Repository-Methoden: Dauer und Anzahl Dokumente.
+
+    :param collection: Name der Collection als Attribut der Messwerte
+    :param count_documents: False für Writes, deren Ergebnis keine Dokumente sind
+    :return: Dekorator
+    """
+
+    def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        attributes: Final = {"collection": collection, "method": func.__name__}
+
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            start: Final = perf_counter()
+            outcome = "error"
+            try:
+                result = await func(*args, **kwargs)
+                outcome = "ok"
+            finally:
+                db_query_duration_histogram.record(
+                    perf_counter() - start, attributes | {"outcome": outcome}
+                )
+            count: Final = _document_count(result) if count_documents else None
+            if count is not None:
+                db_documents_returned_histogram.record(count, attributes)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+class MetricsExtension(SchemaExtension):
+    """Strawberry-Extension: Dauer jedes Resolvers je Typ und Feld.
+
+    Felder mit Default-Resolver und Introspection werden wie bei der
+    OpenTelemetry-Extension von Strawberry übersprungen; sie würden nur
+    Attributzugriffe messen und die Kardinalität erhöhen.
+    """
+
+    def resolve(
+        self,
+        _next: Callable[..., Any],
+        root: Any,
+        info: GraphQLResolveInfo,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        if should_skip_tracing(_next, info):
+            return _next(root, info, *args, **kwargs)
+
+        attributes: Final = {"type": info.parent_type.name, "field": info.field_name}
+        start: Final = perf_counter()
+        try:
+            result = _next(root, info, *args, **kwargs)
+        except Exception:
+            self._record(start, attributes, "error")
+            raise
+        if isawaitable(result):
+            return self._await(result, start, attributes)
+        self._record(start, attributes, "ok")
+        return result
+
+    async def _await(
+        self, result: Awaitable[Any], start: float, attributes: dict[str, str]
+    ) -> Any:
+        outcome = "error"
+        try:
+            value = await result
+            outcome = "ok"
+            return value
+        finally:
+            self._record(start, attributes, outcome)
+
+    @staticmethod
+    def _record(start: float, attributes: dict[str, str], outcome: str) -> None:
+        graphql_resolver_duration_histogram.record(
+            perf_counter() - start, attributes | {"outcome": outcome}
+        )
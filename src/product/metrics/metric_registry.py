@@ -1,8 +1,6 @@
 # src/product/metrics/metric_registry.py
 
 from opentelemetry.metrics import get_meter
-from opentelemetry.sdk.metrics import CallbackOptions
-from opentelemetry.sdk.metrics.export import AggregationTemporality
 from opentelemetry.sdk.metrics.view import View, ExplicitBucketHistogramAggregation
 
 # 🔍 Meter (logisch gruppiert)
@@ -15,17 +13,134 @@ export_requests_counter = meter.create_counter(
     unit="1",
 )
 
-# 📊 Histogramm für Dauer von DB-Abfragen
+# ⏱ Histogramm für die Dauer eines Exports (Datei erstellen inkl. Statistiken)
+export_duration_histogram = meter.create_histogram(
+    name="export_duration_seconds",
+    description="Dauer eines Produkt-Exports in Sekunden",
+    unit="s",
+)
+
+# 📊 Histogramm für Dauer von DB-Abfragen je Repository-Methode
 db_query_duration_histogram = meter.create_histogram(
     name="db_query_duration_seconds",
-    description="Dauer von Produktabfragen in Sekunden",
+    description="Dauer von Repository-Aufrufen in Sekunden",
+    unit="s",
+)
+
+# 📄 Histogramm für die Anzahl gelieferter Dokumente je Repository-Methode
+db_documents_returned_histogram = meter.create_histogram(
+    name="db_documents_returned",
+    description="Anzahl der von einem Repository-Aufruf gelieferten Dokumente",
+    unit="1",
+)
+
+# 🧩 Histogramm für die Dauer von GraphQL-Resolvern je Feld
+graphql_resolver_duration_histogram = meter.create_histogram(
+    name="graphql_resolver_duration_seconds",
+    description="Dauer eines GraphQL-Resolvers je Feld in Sekunden",
+    unit="s",
+)
+
+# 📤 Histogramm für die Dauer bis zur Bestätigung durch Kafka
+kafka_publish_duration_histogram = meter.create_histogram(
+    name="kafka_publish_duration_seconds",
+    description="Dauer von send_and_wait je Topic in Sekunden",
+    unit="s",
+)
+
+# 🐢 Counter für Abfragen über dem Schwellwert des Slow-Query-Logs
+db_slow_queries_counter = meter.create_counter(
+    name="db_slow_queries_total",
+    description="Anzahl langsamer MongoDB-Abfragen je Repository-Methode",
+    unit="1",
+)
+
+# 🛰 Counter für exportierte bzw. verworfene Spans (Queue voll, Export fehlgeschlagen)
+tracing_spans_exported_counter = meter.create_counter(
+    name="tracing_spans_exported_total",
+    description="Anzahl erfolgreich exportierter Spans",
+    unit="1",
+)
+tracing_spans_dropped_counter = meter.create_counter(
+    name="tracing_spans_dropped_total",
+    description="Anzahl verworfener Spans nach Grund",
+    unit="1",
+)
+
+# 🎯 Counter für Cache-Zugriffe; Trefferquote = hit / (hit + miss)
+cache_requests_counter = meter.create_counter(
+    name="cache_requests_total",
+    description="Zugriffe auf prozessinterne Caches nach Ergebnis (hit/miss)",
+    unit="1",
+)
+
+# 🚦 Admission Control: Wartezeit in der Queue und abgelehnte GraphQL-Operationen
+admission_queue_duration_histogram = meter.create_histogram(
+    name="admission_queue_duration_seconds",
+    description="Wartezeit einer GraphQL-Operation auf Zulassung in Sekunden",
     unit="s",
 )
+admission_rejections_counter = meter.create_counter(
+    name="admission_rejections_total",
+    description="Wegen Überlast abgelehnte GraphQL-Operationen nach Grund",
+    unit="1",
+)
+
+# 🗜 Bytes komprimierter Responses vor und nach der Kompression je Verfahren
+compression_bytes_counter = meter.create_counter(
+    name="http_compression_bytes_total",
+    description="Bytes komprimierter Responses vor und nach der Kompression",
+    unit="By",
+)
 
-# Optional: weitere Histogram Bucket Konfiguration
-custom_histogram_view = View(
-    instrument_name="db_query_duration_seconds",
-    aggregation=ExplicitBucketHistogramAggregation(
-        boundaries=[0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.0]
+_LATENCY_BOUNDARIES = [0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5]
+
+# Bucket-Grenzen der Histogramme; werden in `otel_setup.setup_metrics` registriert
+views = [
+    View(
+        instrument_name="db_query_duration_seconds",
+        aggregation=ExplicitBucketHistogramAggregation(boundaries=_LATENCY_BOUNDARIES),
+    ),
+    View(
+        instrument_name="graphql_resolver_duration_seconds",
+        aggregation=ExplicitBucketHistogramAggregation(boundaries=_LATENCY_BOUNDARIES),
     ),
+    View(
+        instrument_name="kafka_publish_duration_seconds",
+        aggregation=ExplicitBucketHistogramAggregation(boundaries=_LATENCY_BOUNDARIES),
+    ),
+    View(
+        instrument_name="admission_queue_duration_seconds",
+        aggregation=ExplicitBucketHistogramAggregation(boundaries=_LATENCY_BOUNDARIES),
+    ),
+    View(
+        instrument_name="db_pool_checkout_duration_seconds",
+        aggregation=ExplicitBucketHistogramAggregation(boundaries=_LATENCY_BOUNDARIES),
+    ),
+    View(
+        instrument_name="export_duration_seconds",
+        aggregation=ExplicitBucketHistogramAggregation(
+            boundaries=[0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0]
+        ),
+    ),
+    View(
+        instrument_name="db_documents_returned",
+        aggregation=ExplicitBucketHistogramAggregation(
+            boundaries=[0, 1, 5, 10, 20, 50, 100, 500, 1000, 10000]
+        ),
+    ),
+]
+
+# ⏱ Histogramm für die Wartezeit auf eine Verbindung aus dem MongoDB-Pool
+db_pool_checkout_duration_histogram = meter.create_histogram(
+    name="db_pool_checkout_duration_seconds",
+    description="Wartezeit auf eine Verbindung aus dem MongoDB-Pool in Sekunden",
+    unit="s",
+)
+
+# ❌ Counter für fehlgeschlagene Checkouts (z.B. Timeout bei vollem Pool)
+db_pool_checkout_failures_counter = meter.create_counter(
+    name="db_pool_checkout_failures_total",
+    description="Anzahl fehlgeschlagener Checkouts aus dem MongoDB-Pool",
+    unit="1",
 )
@@ -1,13 +1,20 @@
 """Modul für persistente Produktdaten."""
 
+from product.model.entity.category_stats import CategoryStats, CategoryStatisticsType
+from product.model.entity.money import Money, to_cents, to_decimal
 from product.model.entity.product import Product, ProductType, ProductInput
 from product.model.entity.product_variant import ProductVariant, ProductVariantType, ProductVariantInput
 
 __all__ = [
+    "CategoryStats",
+    "CategoryStatisticsType",
+    "Money",
     "Product",
     "ProductType",
     "ProductInput",
     "ProductVariant",
     "ProductVariantType",
     "ProductVariantInput",
+    "to_cents",
+    "to_decimal",
 ]
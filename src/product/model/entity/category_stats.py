@@ -0,0 +1,49 @@
+# src/product/model/entity/category_stats.py
+
+from datetime import datetime
+from decimal import Decimal
+
+import strawberry
+from beanie import Document
+from pydantic import Field
+
+from product.model.entity.money import Money
+from product.model.enum.product_category import ProductCategory
+
+
+class CategoryStats(Document):
+    """Materialisierte Kennzahlen je Kategorie, per `$inc` bei jedem Write gepflegt."""
+
+    id: str = Field(..., description="Kategorie, z.B. 'ELEKTRONIK'")
+    product_count: int = Field(0, description="Anzahl Produkte")
+    price_sum: Money = Field(Decimal(0), description="Summe der Grundpreise in Euro")
+    updated: datetime = Field(default_factory=datetime.utcnow)
+
+    class Settings:
+        name = "category_stats"
+
+
+@strawberry.type
+class CategoryStatisticsType:
+    """GraphQL-Typ für die Kennzahlen einer Kategorie."""
+
+    category: ProductCategory
+    count: int
+    price_sum: float
+    average_price: float
+
+
+def map_category_stats_to_type(stats: CategoryStats) -> CategoryStatisticsType:
+    """Materialisierte Kennzahlen in den GraphQL-Typ umwandeln.
+
+    :param stats: Dokument aus `category_stats`
+    :return: GraphQL-Typ inkl. Durchschnittspreis
+    """
+    return CategoryStatisticsType(
+        category=ProductCategory(stats.id),
+        count=stats.product_count,
+        price_sum=float(stats.price_sum),
+        average_price=(
+            float(stats.price_sum / stats.product_count) if stats.product_count else 0.0
+        ),
+    )
@@ -0,0 +1,85 @@
+# src/product/model/entity/money.py
+
+"""Geldbeträge als Decimal mit direkter Umwandlung aus BSON Decimal128.
+
+`Decimal128.to_decimal()` aus `bson` setzt die Ziffern in Python zusammen und
+ist beim Laden eines Dokuments der teuerste Schritt je Preis. `to_decimal`
+liest Koeffizient und Exponent stattdessen direkt aus den 16 Bytes. Sonderwerte
+wie NaN und Infinity sowie nicht kanonische Werte gehen weiterhin über `bson`.
+
+Gespeichert werden Beträge als Decimal128: Beanie kodiert `Decimal` beim
+Schreiben selbst in Decimal128.
+"""
+
+from decimal import ROUND_HALF_EVEN, Decimal
+from struct import Struct
+from typing import Annotated, Any, Final
+
+from bson import Decimal128
+from pydantic import GetCoreSchemaHandler, TypeAdapter
+from pydantic_core import CoreSchema, core_schema
+
+__all__ = ["Money", "to_cents", "to_decimal"]
+
+_UNPACK: Final = Struct("<QQ").unpack
+_COEFFICIENT_HIGH_MASK: Final = (1 << 49) - 1
+_EXPONENT_BIAS: Final = 6176
+_MAX_COEFFICIENT: Final = 10**34 - 1
+
+# Validierung aller anderen Eingaben, z.B. str, int oder float
+_DECIMAL_ADAPTER: Final = TypeAdapter(Decimal)
+
+
+def to_decimal(value: Decimal128) -> Decimal:
+    """Decimal128 ohne Umweg über Ziffernlisten in Decimal umwandeln.
+
+    :param value: Wert aus MongoDB, z.B. Decimal128("999.99")
+    :return: Gleicher Wert als Decimal inkl. Exponent, z.B. Decimal("999.99")
+    """
+    low, high = _UNPACK(value.bid)
+    # Kombinationsfeld 11: Sonderwerte oder Koeffizient mit implizitem Präfix
+    if (high >> 61) & 3 == 3:
+        return value.to_decimal()
+    coefficient: Final = ((high & _COEFFICIENT_HIGH_MASK) << 64) | low
+    if coefficient > _MAX_COEFFICIENT:
+        return value.to_decimal()
+    exponent: Final = ((high >> 49) & 0x3FFF) - _EXPONENT_BIAS
+    sign: Final = "-" if high >> 63 else ""
+    return Decimal(f"{sign}{coefficient}E{exponent}")
+
+
+def to_cents(value: Decimal) -> int:
+    """Betrag in ganzen Cent, gerundet wie `$round` in MongoDB.
+
+    :param value: Betrag in Euro, z.B. Decimal("999.99")
+    :return: Betrag in Cent, z.B. 99999
+    """
+    return int(value.scaleb(2).to_integral_value(ROUND_HALF_EVEN))
+
+
+def _validate_money(value: Any) -> Decimal:
+    value_type: Final = type(value)
+    if value_type is Decimal128:
+        return to_decimal(value)
+    if value_type is Decimal:
+        return value
+    return _DECIMAL_ADAPTER.validate_python(value)
+
+
+class _MoneySchema:
+    """Core-Schema mit genau einem Validator für Decimal128, Decimal und Zahlen."""
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, _source: Any, _handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        decimal_schema: Final = core_schema.decimal_schema()
+        return core_schema.json_or_python_schema(
+            json_schema=decimal_schema,
+            python_schema=core_schema.no_info_plain_validator_function(_validate_money),
+            serialization=decimal_schema.get("serialization"),
+        )
+
+
+Money = Annotated[Decimal, _MoneySchema]
+"""Betrag in Euro; akzeptiert Decimal128 aus MongoDB, Decimal, int, float und str."""
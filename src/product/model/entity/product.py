@@ -2,45 +2,63 @@
 
 from datetime import datetime
 from decimal import Decimal
-from typing import Annotated, Optional, List
+from typing import Optional, List
+from unicodedata import combining, normalize
 from uuid import UUID, uuid4
 
-from bson import Decimal128
 import strawberry
-from beanie import Document, Indexed
-from pydantic import BaseModel, Field, field_validator
+from beanie import Document, Insert, Replace, Save, SaveChanges, Update, before_event
+from pydantic import BaseModel, Field
 
+from product.model.entity.money import Money, to_cents
+from product.model.entity.product_indexes import PRODUCT_INDEXES
 from product.model.entity.product_variant import ProductVariant, ProductVariantInput, ProductVariantType
 from product.model.enum.product_category import ProductCategory
 
 
+def normalize_name(value: str) -> str:
+    """Normalisiert einen Namen für die Präfixsuche: ohne Akzente, kleingeschrieben.
+
+    :param value: Name, z.B. "Bluetooth Kopfhörer"
+    :return: Normalisierter Name, z.B. "bluetooth kopfhorer"
+    """
+    decomposed = normalize("NFKD", value)
+    return "".join(c for c in decomposed if not combining(c)).casefold().strip()
+
+
 class Product(Document):
     """MongoDB-Dokument zur Repräsentation eines Produkts."""
 
     id: UUID = Field(default_factory=uuid4)
-    name: Annotated[str, Indexed(unique=True)] = Field(..., description="Produktname")
+    name: str = Field(..., description="Produktname")
     brand: Optional[str] = Field(None, description="Hersteller- oder Markenname")
-    price: Decimal = Field(..., description="Grundpreis in Euro")
+    price: Money = Field(..., description="Grundpreis in Euro")
+    price_cents: Optional[int] = Field(
+        None, description="Grundpreis in Cent für Preisfilter und Sortierung"
+    )
     description: Optional[str] = Field(None, description="Produktbeschreibung")
     category: ProductCategory = Field(..., description="Zugeordnete Produktkategorie")
     tags: List[str] = Field(default_factory=list, description="Tags zur Klassifikation")
     image_paths: List[str] = Field(default_factory=list, description="Pfad zu Bildern")
     variants: List[ProductVariant] = Field(default_factory=list)
+    name_normalized: str = Field("", description="Normalisierter Name für die Präfixsuche")
     created: datetime = Field(default_factory=datetime.utcnow)
     updated: datetime = Field(default_factory=datetime.utcnow)
 
-    @field_validator("price", mode="before")
-    @classmethod
-    def convert_price_decimal128(cls, v):
-        if isinstance(v, Decimal128):
-            return v.to_decimal()
-        return v
+    @before_event(Insert, Replace, Save, SaveChanges, Update)
+    def set_name_normalized(self) -> None:
+        """Den normalisierten Namen vor jedem Schreibzugriff aktualisieren."""
+        self.name_normalized = normalize_name(self.name)
 
+    @before_event(Insert, Replace, Save, SaveChanges, Update)
+    def set_price_cents(self) -> None:
+        """Den Preis in Cent vor jedem Schreibzugriff aktualisieren."""
+        self.price_cents = to_cents(self.price)
 
     class Settings:
         name = "products"
         use_revision = True
-        indexes = ["name"]
+        indexes = PRODUCT_INDEXES
 
     class Config:
         json_schema_extra = {
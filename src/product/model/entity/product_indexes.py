@@ -0,0 +1,56 @@
+# src/product/model/entity/product_indexes.py
+
+"""Indexe der Collection `products`, gruppiert nach den Zugriffspfaden.
+
+Die Liste ist die einzige Deklaration: `Product.Settings.indexes` verweist
+darauf, `IndexManager` gleicht sie mit MongoDB ab und `build_sort` leitet
+daraus die erlaubten Sortierungen ab. Die Namen sind Teil des Abgleichs; ein
+umbenannter Index gilt als fehlend und der alte als nicht deklariert.
+"""
+
+from typing import Final
+
+from pymongo import ASCENDING, TEXT, IndexModel
+
+from product.config.search import search_language, search_weights
+
+__all__ = ["PRODUCT_INDEXES"]
+
+PRODUCT_INDEXES: Final[list[IndexModel]] = [
+    # Eindeutiger Produktname; Name wie zuvor bei Indexed(unique=True)
+    IndexModel([("name", ASCENDING)], name="name_1", unique=True),
+    # autocompleteProducts: verankerter Regex als Bereichsabfrage
+    IndexModel([("name_normalized", ASCENDING)], name="product_name_normalized"),
+    # searchProducts: Volltextsuche mit Gewichtung
+    IndexModel(
+        [(field, TEXT) for field in search_weights],
+        weights=search_weights,
+        default_language=search_language,
+        name="product_text_search",
+    ),
+    # products: Sortierung mit ID bei Gleichstand; price_cents auch für Preisfilter
+    IndexModel([("name", ASCENDING), ("_id", ASCENDING)], name="product_sort_name"),
+    IndexModel(
+        [("price_cents", ASCENDING), ("_id", ASCENDING)],
+        name="product_sort_price",
+    ),
+    IndexModel(
+        [("created", ASCENDING), ("_id", ASCENDING)],
+        name="product_sort_created",
+    ),
+    IndexModel(
+        [("updated", ASCENDING), ("_id", ASCENDING)],
+        name="product_sort_updated",
+    ),
+    # products und productFacets: Filter mit Seiten in der Reihenfolge der ID
+    IndexModel(
+        [("category", ASCENDING), ("_id", ASCENDING)],
+        name="product_filter_category",
+    ),
+    IndexModel(
+        [("brand", ASCENDING), ("_id", ASCENDING)],
+        name="product_filter_brand",
+    ),
+    IndexModel([("tags", ASCENDING)], name="product_filter_tags"),
+]
+"""Deklarierte Indexe; `_id_` legt MongoDB selbst an."""
@@ -7,7 +7,9 @@ from typing import Optional
 from uuid import UUID, uuid4
 
 import strawberry
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field
+
+from product.model.entity.money import Money
 
 
 class ProductVariant(BaseModel):
@@ -15,19 +17,10 @@ class ProductVariant(BaseModel):
 
     name: str = Field(..., description="Name der Variante, z.B. 'Farbe'")
     value: str = Field(..., description="Wert der Variante, z.B. 'Rot'")
-    additional_price: Optional[Decimal] = Field(
-        default=0, description="Aufpreis für diese Variante"
+    additional_price: Optional[Money] = Field(
+        default=Decimal(0), description="Aufpreis für diese Variante"
     )
 
-    @field_validator("additional_price", mode="before")
-    @classmethod
-    def convert_decimal128(cls, v):
-        from bson.decimal128 import Decimal128
-
-        if isinstance(v, Decimal128):
-            return Decimal(str(v.to_decimal()))
-        return v
-
 
 @strawberry.type
 class ProductVariantType:
@@ -2,5 +2,18 @@ from product.model.input.searchcriteria import (
     ProductSearchCriteria,
     ProductSearchCriteriaInput,
 )
+from product.model.input.sort import (
+    ProductSort,
+    ProductSortField,
+    ProductSortInput,
+    SortDirection,
+)
 
-__all__ = ["ProductSearchCriteria", "ProductSearchCriteriaInput"]
+__all__ = [
+    "ProductSearchCriteria",
+    "ProductSearchCriteriaInput",
+    "ProductSort",
+    "ProductSortField",
+    "ProductSortInput",
+    "SortDirection",
+]
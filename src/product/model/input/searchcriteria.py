@@ -15,6 +15,7 @@ class ProductSearchCriteria(BaseModel):
     """DTO für Produktsuche per Service, Repository oder API."""
 
     name: Optional[str] = None
+    name_prefix: Optional[str] = None
     brand: Optional[str] = None
     min_price: Optional[float] = None
     max_price: Optional[float] = None
@@ -29,6 +30,7 @@ class ProductSearchCriteriaInput:
     """GraphQL-Eingabeobjekt für Produktsuchanfragen."""
 
     name: Optional[str] = None
+    name_prefix: Optional[str] = None
     brand: Optional[str] = None
     min_price: Optional[float] = None
     max_price: Optional[float] = None
@@ -0,0 +1,39 @@
+# src/product/model/input/sort.py
+
+from enum import Enum
+
+import strawberry
+from pydantic import BaseModel
+
+
+@strawberry.enum
+class ProductSortField(Enum):
+    """Felder, nach denen `products` sortiert werden kann."""
+
+    NAME = "name"
+    PRICE = "price"
+    CREATED = "created"
+    UPDATED = "updated"
+
+
+@strawberry.enum
+class SortDirection(Enum):
+    """Sortierrichtung."""
+
+    ASC = "ASC"
+    DESC = "DESC"
+
+
+class ProductSort(BaseModel):
+    """DTO für die Sortierung per Service oder Repository."""
+
+    field: ProductSortField
+    direction: SortDirection = SortDirection.ASC
+
+
+@strawberry.input
+class ProductSortInput:
+    """GraphQL-Eingabeobjekt für die Sortierung; bei Gleichstand entscheidet die ID."""
+
+    field: ProductSortField
+    direction: SortDirection = SortDirection.ASC
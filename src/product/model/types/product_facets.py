@@ -0,0 +1,31 @@
+from typing import List, Optional
+
+import strawberry
+
+
+@strawberry.type
+class FacetCountType:
+    """Anzahl Produkte zu einem Wert einer Facette."""
+
+    value: str
+    count: int
+
+
+@strawberry.type
+class PriceBucketType:
+    """Anzahl Produkte in einem Preisbereich; `max` fehlt beim obersten Bucket."""
+
+    min: float
+    max: Optional[float]
+    count: int
+
+
+@strawberry.type
+class ProductFacetsType:
+    """Facetten zu den aktuellen Suchkriterien aus einer einzigen Aggregation."""
+
+    total: int
+    categories: List[FacetCountType]
+    brands: List[FacetCountType]
+    price_buckets: List[PriceBucketType]
+    tags: List[FacetCountType]
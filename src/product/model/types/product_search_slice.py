@@ -0,0 +1,13 @@
+from typing import List, Optional
+
+import strawberry
+from product.model.entity.product import ProductType
+
+
+@strawberry.type
+class ProductSearchSlice:
+    """Seite einer Volltextsuche mit Cursor für die nächste Seite."""
+
+    content: List[ProductType]
+    next_cursor: Optional[str]
+    has_next: bool
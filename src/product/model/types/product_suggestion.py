@@ -0,0 +1,12 @@
+from typing import Optional
+
+import strawberry
+
+
+@strawberry.type
+class ProductSuggestionType:
+    """Vorschlag für die Autovervollständigung von Produktnamen."""
+
+    id: strawberry.ID
+    name: str
+    brand: Optional[str]
@@ -1,13 +1,28 @@
 # src/product/otel_setup.py
 
+from functools import lru_cache
+
 from loguru import logger
 from opentelemetry import trace
 from opentelemetry.sdk.resources import SERVICE_NAME, Resource
 from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
 
 from product.config import env
 from product.config.kafka import get_kafka_settings
+from product.config.tracing import (
+    tracing_excluded_urls,
+    tracing_export_timeout_ms,
+    tracing_exporter,
+    tracing_file_path,
+    tracing_instrument_pymongo,
+    tracing_max_export_batch_size,
+    tracing_max_queue_size,
+    tracing_sample_ratio,
+    tracing_schedule_delay_ms,
+    tracing_slow_request_ms,
+    tracing_tail_sampling,
+)
+from product.metrics.metric_registry import views
 
 # 🔧 Prometheus Setup
 from opentelemetry.metrics import set_meter_provider
@@ -19,13 +34,15 @@ from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from opentelemetry.instrumentation.pymongo import PymongoInstrumentor
 from opentelemetry.sdk.resources import SERVICE_NAME, Resource
 from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
-from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
-from opentelemetry.instrumentation.asgi import OpenTelemetryMiddleware
 
 # 🔧 Prometheus ASGI App (z. B. für FastAPI)
 from prometheus_client import make_asgi_app
 
+from product.tracing.sampling import TailSamplingSpanProcessor, create_sampler
+from product.tracing.telemetry_pipeline import (
+    BoundedBatchSpanProcessor,
+    create_span_exporter,
+)
 from product.tracing.trace_context_middleware import TraceContextMiddleware
 
 
@@ -55,26 +72,71 @@ from product.tracing.trace_context_middleware import TraceContextMiddleware
 #     set_meter_provider(meter_provider)
 
 
-def setup_otel(app):
+@lru_cache
+def setup_metrics() -> MeterProvider:
+    """MeterProvider mit Prometheus-Reader und den Views aus `metric_registry`.
+
+    Der Reader registriert sich bei der Default-Registry von `prometheus_client`;
+    die Metriken erscheinen dadurch unter dem vorhandenen Endpunkt `/metrics`.
+    Wegen dieser Registrierung darf der Provider nur einmal erzeugt werden.
+    """
     resource = Resource(attributes={SERVICE_NAME: get_kafka_settings().client_id})
+    meter_provider = MeterProvider(
+        resource=resource,
+        metric_readers=[PrometheusMetricReader()],
+        views=views,
+    )
+    set_meter_provider(meter_provider)
+    return meter_provider
 
-    provider = TracerProvider(resource=resource)
-    trace.set_tracer_provider(provider)
 
-    try:
-        otlp_exporter = OTLPSpanExporter(
-            endpoint=env.TEMPO_URI
+def setup_otel(app):
+    setup_metrics()
+
+    exporter = create_span_exporter(
+        tracing_exporter, env.TEMPO_URI, tracing_file_path, tracing_export_timeout_ms
+    )
+    if exporter is None:
+        # No-Op-Modus, z.B. für Benchmarks: kein TracerProvider, keine Instrumentierung
+        logger.info("Tracing deaktiviert (exporter=none)")
+    else:
+        exporter_name, span_exporter = exporter
+        resource = Resource(attributes={SERVICE_NAME: get_kafka_settings().client_id})
+        provider = TracerProvider(
+            resource=resource,
+            sampler=create_sampler(tracing_sample_ratio, tracing_tail_sampling),
+        )
+        trace.set_tracer_provider(provider)
+
+        span_processor = BoundedBatchSpanProcessor(
+            span_exporter,
+            exporter_name,
+            max_queue_size=tracing_max_queue_size,
+            max_export_batch_size=tracing_max_export_batch_size,
+            schedule_delay_millis=tracing_schedule_delay_ms,
+        )
+        provider.add_span_processor(
+            TailSamplingSpanProcessor(span_processor, tracing_slow_request_ms)
+            if tracing_tail_sampling
+            else span_processor
+        )
+        logger.info(
+            "Tracing: exporter={}, sample-ratio={}, max-queue-size={}",
+            exporter_name,
+            tracing_sample_ratio,
+            tracing_max_queue_size,
         )
-    except Exception as e:
-        logger.warning("Tempo Exporter konnte nicht gestartet werden: {}", str(e))
-
-    span_processor = BatchSpanProcessor(otlp_exporter)
-    provider.add_span_processor(span_processor)
 
-    # Instrumentiere FastAPI und MongoDB
-    FastAPIInstrumentor().instrument_app(app)
-    PymongoInstrumentor().instrument()
+        # Instrumentiere FastAPI und MongoDB; FastAPIInstrumentor umschließt bereits
+        # alle Middlewares, eine zusätzliche OpenTelemetryMiddleware würde jeden
+        # Request doppelt tracen
+        FastAPIInstrumentor().instrument_app(
+            app,
+            excluded_urls=tracing_excluded_urls,
+            exclude_spans=["receive", "send"],
+        )
+        if tracing_instrument_pymongo:
+            PymongoInstrumentor().instrument()
 
     # 🛠 TraceContextMiddleware aktivieren
     app.add_middleware(TraceContextMiddleware)
-    app.add_middleware(OpenTelemetryMiddleware)
@@ -1,8 +1,11 @@
 """Modul für den DB-Zugriff."""
 
 from product.repository.pageable import MAX_PAGE_LIMIT, Pageable
+from product.repository.read_policy import QUERY_READ_POLICY, ReadPolicy
 from product.repository.session import (
+    create_client,
     dispose_connection_pool,
+    get_client,
     init_beanie_connection,
 )
 from product.repository.slice import Slice
@@ -10,7 +13,11 @@ from product.repository.slice import Slice
 __all__ = [
     "MAX_PAGE_LIMIT",
     "Pageable",
+    "QUERY_READ_POLICY",
+    "ReadPolicy",
     "Slice",
+    "create_client",
     "dispose_connection_pool",
+    "get_client",
     "init_beanie_connection",
 ]
@@ -0,0 +1,118 @@
+"""Materialisierte Sicht `category_stats` mit Anzahl und Preissumme je Kategorie.
+
+`ProductWriteService` übernimmt die Differenz eines Writes per `apply` in
+derselben Transaktion wie den Write selbst. Ohne Transaktionen, d.h. bei einem
+Standalone-Server, kann die Sicht nach einem Fehler zwischen beiden Writes
+abweichen. Sie wird deshalb dort bei jedem Start neu aufgebaut; zusätzlich
+baut `POST /admin/category-stats/rebuild` sie im laufenden Betrieb neu auf.
+"""
+
+from collections.abc import Mapping
+from decimal import Decimal
+from typing import Final, List
+
+from bson import Decimal128
+from loguru import logger
+from motor.motor_asyncio import AsyncIOMotorClientSession
+from opentelemetry import trace
+from pymongo import UpdateOne
+
+from product.metrics.instrumentation import measured_query
+from product.model.entity.category_stats import CategoryStats
+from product.model.entity.product import Product
+from product.repository.read_policy import ReadPolicy
+from product.repository.session import supports_transactions
+from product.tracing.sampling import sampled_span
+
+__all__ = ["CategoryStatsDelta", "CategoryStatsRepository"]
+
+tracer = trace.get_tracer(__name__)
+
+CategoryStatsDelta = Mapping[str, tuple[int, Decimal]]
+"""Änderung je Kategorie: Anzahl und Preissumme, jeweils als Differenz."""
+
+
+class CategoryStatsRepository:
+    """Pflegt `category_stats` inkrementell und baut die Sicht bei Bedarf neu auf."""
+
+    @measured_query("category_stats", count_documents=False)
+    async def apply(
+        self,
+        deltas: CategoryStatsDelta,
+        transaction: AsyncIOMotorClientSession | None = None,
+    ) -> None:
+        """Differenzen per `$inc` in einem Bulk-Write übernehmen.
+
+        :param deltas: Anzahl und Preissumme je Kategorie; Nullen werden übersprungen
+        :param transaction: Session der Transaktion mit dem Produkt-Write
+        """
+        operations: Final = [
+            UpdateOne(
+                {"_id": category},
+                {
+                    "$inc": {"product_count": count, "price_sum": Decimal128(price_sum)},
+                    "$currentDate": {"updated": True},
+                },
+                upsert=True,
+            )
+            for category, (count, price_sum) in deltas.items()
+            if count or price_sum
+        ]
+        if not operations:
+            return
+        with sampled_span(tracer, "MongoDB: apply category_stats"):
+            await CategoryStats.get_motor_collection().bulk_write(
+                operations, ordered=False, session=transaction
+            )
+
+    @measured_query("category_stats")
+    async def find_all(
+        self, policy: ReadPolicy = ReadPolicy.PRIMARY
+    ) -> List[CategoryStats]:
+        """Kennzahlen aller Kategorien mit mindestens einem Produkt.
+
+        :param policy: Read Policy
+        :return: Kennzahlen sortiert nach Kategorie
+        """
+        collection: Final = CategoryStats.get_motor_collection().with_options(
+            read_preference=policy.read_preference(),
+            read_concern=policy.read_concern(False),
+        )
+        cursor: Final = collection.find({"product_count": {"$gt": 0}}).sort("_id", 1)
+        return [CategoryStats.model_validate(doc) async for doc in cursor]
+
+    @measured_query("category_stats", count_documents=False)
+    async def rebuild(self) -> int:
+        """Sicht vollständig aus der Produkt-Collection neu berechnen.
+
+        :return: Anzahl Kategorien
+        """
+        pipeline: Final = [
+            {
+                "$group": {
+                    "_id": "$category",
+                    "product_count": {"$sum": 1},
+                    "price_sum": {"$sum": "$price"},
+                }
+            },
+            {"$set": {"updated": "$$NOW"}},
+            {"$out": CategoryStats.Settings.name},
+        ]
+        with sampled_span(tracer, "MongoDB: rebuild category_stats"):
+            await Product.get_motor_collection().aggregate(pipeline).to_list(None)
+        count: Final = await CategoryStats.get_motor_collection().count_documents({})
+        logger.info("category_stats neu aufgebaut: {} Kategorien", count)
+        return count
+
+    async def ensure_built(self) -> None:
+        """Sicht beim Start aufbauen, falls sie fehlt oder abweichen kann.
+
+        Mit Transaktionen nur, falls sie fehlt, z.B. beim ersten Start mit
+        Bestandsdaten; ohne Transaktionen bei jedem Start.
+        """
+        if (
+            supports_transactions()
+            and await CategoryStats.get_motor_collection().estimated_document_count()
+        ):
+            return
+        await self.rebuild()
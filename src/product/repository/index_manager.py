@@ -0,0 +1,348 @@
+"""Abgleich der deklarierten Indexe von `products` mit MongoDB.
+
+Die Deklaration in `PRODUCT_INDEXES` wird mit `listIndexes` verglichen:
+Fehlende Indexe werden angelegt, geänderte nur auf Wunsch gelöscht und neu
+angelegt. Nicht deklarierte Indexe werden gelöscht, falls gewünscht und falls
+`$indexStats` seit einer Mindestdauer keinen Zugriff zeigt.
+
+Beim Start wartet der Server nur auf eindeutige Indexe wie `name_1`, damit sie
+vor dem ersten Schreiben existieren; schlägt das fehl, bricht der Start ab.
+Alle übrigen Indexe werden im Hintergrund angelegt, während der Server bereits
+Requests beantwortet. `report` zeigt sie bis dahin als `building`; Fehler
+werden protokolliert.
+
+    uv run python -m product.repository.index_manager report
+    uv run python -m product.repository.index_manager sync --drop-unused
+"""
+
+import argparse
+import asyncio
+import sys
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from time import perf_counter
+from typing import Any, Final
+
+from loguru import logger
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import IndexModel
+
+from product.config.mongo import (
+    mongo_index_drop_unused,
+    mongo_index_rebuild_changed,
+    mongo_index_unused_min_age_hours,
+)
+from product.model.entity.product import Product
+from product.model.entity.product_indexes import PRODUCT_INDEXES
+
+__all__ = ["IndexDiff", "IndexManager", "diff_indexes", "get_index_manager"]
+
+# Index auf _id legt MongoDB an; er kann nicht gelöscht werden
+_ID_INDEX: Final = "_id_"
+
+# Optionen, deren Abweichung einen Index zu einem anderen macht
+_OPTIONS: Final = ("unique", "sparse", "partialFilterExpression", "expireAfterSeconds")
+
+
+def _required(index: IndexModel) -> bool:
+    """Eindeutige Indexe sichern Invarianten und müssen vor dem ersten Schreiben existieren."""
+    return bool(index.document.get("unique"))
+
+
+def _log_sync_failure(task: asyncio.Task[Any]) -> None:
+    """Fehler des Abgleichs im Hintergrund protokollieren; der Server läuft weiter."""
+    if task.cancelled():
+        return
+    err: Final = task.exception()
+    if err is not None:
+        logger.opt(exception=err).error("Indexe konnten nicht angelegt werden")
+
+
+def _spec(document: Mapping[str, Any]) -> tuple[Any, ...]:
+    """Vergleichbare Form einer Index-Definition aus `IndexModel` oder `listIndexes`."""
+    key: Final = dict(document["key"])
+    if "_fts" in key or "text" in key.values():
+        # listIndexes liefert Text-Indexe als _fts/_ftsx; die Felder stehen in weights
+        return (
+            "text",
+            dict(document.get("weights", {})),
+            document.get("default_language", "english"),
+        )
+    keys: Final = tuple(
+        (field, int(direction) if isinstance(direction, int | float) else direction)
+        for field, direction in key.items()
+    )
+    options: Final = tuple(
+        (option, document[option]) for option in _OPTIONS if document.get(option)
+    )
+    return keys, options
+
+
+@dataclass(slots=True, frozen=True)
+class IndexDiff:
+    """Unterschied zwischen deklarierten und vorhandenen Indexen."""
+
+    missing: tuple[IndexModel, ...]
+    """Deklariert, aber nicht vorhanden."""
+
+    changed: tuple[IndexModel, ...]
+    """Unter gleichem Namen mit anderer Definition vorhanden."""
+
+    undeclared: tuple[str, ...]
+    """Vorhanden, aber nicht deklariert; ohne `_id_`."""
+
+    @property
+    def in_sync(self) -> bool:
+        """True, falls alle deklarierten Indexe unverändert vorhanden sind."""
+        return not self.missing and not self.changed
+
+
+def diff_indexes(
+    declared: Iterable[IndexModel], existing: Mapping[str, Mapping[str, Any]]
+) -> IndexDiff:
+    """Deklarierte Indexe mit der Ausgabe von `listIndexes` vergleichen.
+
+    :param declared: Indexe wie in `PRODUCT_INDEXES`
+    :param existing: Indexe aus MongoDB je Name
+    :return: Fehlende, geänderte und nicht deklarierte Indexe
+    """
+    missing: Final[list[IndexModel]] = []
+    changed: Final[list[IndexModel]] = []
+    names: Final[set[str]] = set()
+    for index in declared:
+        name = index.document["name"]
+        names.add(name)
+        current = existing.get(name)
+        if current is None:
+            missing.append(index)
+        elif _spec(current) != _spec(index.document):
+            changed.append(index)
+    undeclared: Final = tuple(
+        name for name in existing if name not in names and name != _ID_INDEX
+    )
+    return IndexDiff(missing=tuple(missing), changed=tuple(changed), undeclared=undeclared)
+
+
+class IndexManager:
+    """Legt Indexe einer Collection gemäß Deklaration an und berichtet über sie."""
+
+    def __init__(
+        self,
+        collection: Callable[[], AsyncIOMotorCollection],
+        declared: Sequence[IndexModel],
+    ) -> None:
+        """Initialisierung mit Collection und Deklaration.
+
+        :param collection: Liefert die Collection, erst nach `init_beanie` aufrufbar
+        :param declared: Deklarierte Indexe
+        """
+        self._collection: Final = collection
+        self._declared: Final = declared
+        # Namen der Indexe, deren create_indexes gerade läuft
+        self._building: Final[set[str]] = set()
+
+    async def existing(self) -> dict[str, dict[str, Any]]:
+        """Vorhandene Indexe je Name laut `listIndexes`."""
+        return {index["name"]: index async for index in self._collection().list_indexes()}
+
+    async def diff(self) -> IndexDiff:
+        """Deklaration mit den vorhandenen Indexen vergleichen."""
+        return diff_indexes(self._declared, await self.existing())
+
+    async def sync(
+        self,
+        rebuild_changed: bool = mongo_index_rebuild_changed,
+        drop_unused: bool = mongo_index_drop_unused,
+        required_only: bool = False,
+    ) -> IndexDiff:
+        """Fehlende Indexe anlegen und optional geänderte bzw. unbenutzte bereinigen.
+
+        :param rebuild_changed: Geänderte Indexe löschen und neu anlegen
+        :param drop_unused: Nicht deklarierte Indexe ohne Zugriffe löschen
+        :param required_only: Nur eindeutige Indexe anlegen; nicht deklarierte
+            bleiben unberührt
+        :return: Unterschied vor dem Abgleich
+        :raises PyMongoError: Falls ein Index nicht angelegt werden kann, z.B.
+            wegen doppelter Namen beim eindeutigen Index
+        """
+        collection: Final = self._collection()
+        diff: Final = await self.diff()
+        build: Final = [
+            index for index in diff.missing if not required_only or _required(index)
+        ]
+        for index in diff.changed:
+            if required_only and not _required(index):
+                continue
+            name = index.document["name"]
+            if not rebuild_changed:
+                logger.warning("Index {}.{} weicht von der Deklaration ab", collection.name, name)
+                continue
+            logger.warning("Index {}.{} wird neu angelegt", collection.name, name)
+            await collection.drop_index(name)
+            build.append(index)
+        if build:
+            names = [index.document["name"] for index in build]
+            logger.warning("Fehlende Indexe {}.{} werden angelegt", collection.name, names)
+            start = perf_counter()
+            self._building.update(names)
+            try:
+                await collection.create_indexes(build)
+            finally:
+                self._building.difference_update(names)
+            logger.info(
+                "Indexe {}.{} angelegt in {:.1f} s",
+                collection.name,
+                names,
+                perf_counter() - start,
+            )
+        if required_only:
+            return diff
+        if drop_unused and diff.undeclared:
+            await self.drop_unused(diff.undeclared)
+        elif diff.undeclared:
+            logger.info("Nicht deklarierte Indexe {}.{}", collection.name, list(diff.undeclared))
+        return diff
+
+    async def start_sync(self) -> asyncio.Task[IndexDiff]:
+        """Eindeutige Indexe anlegen und alle übrigen im Hintergrund abgleichen.
+
+        :return: Task des Abgleichs im Hintergrund
+        :raises PyMongoError: Falls ein eindeutiger Index nicht angelegt werden kann
+        """
+        await self.sync(required_only=True)
+        task: Final = asyncio.create_task(self.sync())
+        task.add_done_callback(_log_sync_failure)
+        return task
+
+    async def usage(self) -> dict[str, tuple[int, datetime]]:
+        """Zugriffe je Index seit dem Zeitpunkt laut `$indexStats`.
+
+        Die Zähler gelten je Server und beginnen bei jedem Neustart von vorn.
+        """
+        cursor: Final = self._collection().aggregate([{"$indexStats": {}}])
+        return {
+            stats["name"]: (int(stats["accesses"]["ops"]), stats["accesses"]["since"])
+            async for stats in cursor
+        }
+
+    async def drop_unused(
+        self,
+        names: Iterable[str],
+        min_age: timedelta = timedelta(hours=mongo_index_unused_min_age_hours),
+    ) -> list[str]:
+        """Indexe ohne Zugriffe löschen, deren Statistik mindestens `min_age` alt ist.
+
+        :param names: Kandidaten, z.B. `IndexDiff.undeclared`
+        :param min_age: Mindestdauer der Statistik
+        :return: Gelöschte Indexe
+        """
+        collection: Final = self._collection()
+        usage: Final = await self.usage()
+        cutoff: Final = datetime.now(UTC) - min_age
+        dropped: Final[list[str]] = []
+        for name in names:
+            if name == _ID_INDEX or name not in usage:
+                continue
+            ops, since = usage[name]
+            if ops or since.replace(tzinfo=since.tzinfo or UTC) > cutoff:
+                logger.info(
+                    "Index {}.{} bleibt: {} Zugriffe seit {}", collection.name, name, ops, since
+                )
+                continue
+            await collection.drop_index(name)
+            logger.warning("Unbenutzter Index {}.{} gelöscht", collection.name, name)
+            dropped.append(name)
+        return dropped
+
+    async def sizes(self) -> dict[str, int]:
+        """Größe je Index in Bytes laut `$collStats`."""
+        cursor: Final = self._collection().aggregate(
+            [{"$collStats": {"storageStats": {}}}]
+        )
+        sizes: Final[dict[str, int]] = {}
+        async for stats in cursor:
+            for name, size in stats["storageStats"].get("indexSizes", {}).items():
+                sizes[name] = sizes.get(name, 0) + int(size)
+        return sizes
+
+    async def report(self) -> list[dict[str, Any]]:
+        """Deklarierte und vorhandene Indexe mit Zustand, Größe und Zugriffen.
+
+        :return: Ein Eintrag je Index mit `state` ok, missing, building, changed
+            oder undeclared
+        """
+        existing: Final = await self.existing()
+        diff: Final = diff_indexes(self._declared, existing)
+        sizes: Final = await self.sizes()
+        usage: Final = await self.usage()
+        states: Final = {index.document["name"]: "missing" for index in diff.missing}
+        states.update({index.document["name"]: "changed" for index in diff.changed})
+        states.update(dict.fromkeys(diff.undeclared, "undeclared"))
+        states.update(dict.fromkeys(self._building & states.keys(), "building"))
+        keys: Final = {name: dict(index["key"]) for name, index in existing.items()}
+        keys.update(
+            {
+                index.document["name"]: dict(index.document["key"])
+                for index in diff.missing
+            }
+        )
+        return [
+            {
+                "name": name,
+                "key": key,
+                "state": states.get(name, "ok"),
+                "size_bytes": sizes.get(name),
+                "accesses": usage[name][0] if name in usage else None,
+                "since": usage[name][1] if name in usage else None,
+            }
+            for name, key in keys.items()
+        ]
+
+
+@lru_cache
+def get_index_manager() -> IndexManager:
+    """Index-Verwaltung für `products`."""
+    return IndexManager(Product.get_motor_collection, PRODUCT_INDEXES)
+
+
+async def _run(args: argparse.Namespace) -> int:
+    from product.repository.session import (  # noqa: PLC0415
+        dispose_connection_pool,
+        init_beanie_connection,
+    )
+
+    await init_beanie_connection()
+    manager: Final = get_index_manager()
+    try:
+        if args.command == "sync":
+            diff = await manager.sync(
+                rebuild_changed=args.rebuild_changed, drop_unused=args.drop_unused
+            )
+            print(
+                f"angelegt: {len(diff.missing)}, geändert: {len(diff.changed)}, "
+                f"nicht deklariert: {len(diff.undeclared)}"
+            )
+        for entry in await manager.report():
+            size = entry["size_bytes"]
+            print(
+                f"{entry['name']:<28} {entry['state']:<11} "
+                f"{'-' if size is None else f'{size / 1024:.0f} KiB':>10} "
+                f"{'-' if entry['accesses'] is None else entry['accesses']:>10}  {entry['key']}"
+            )
+    finally:
+        await dispose_connection_pool()
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser: Final = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("command", choices=("report", "sync"))
+    parser.add_argument("--rebuild-changed", action="store_true")
+    parser.add_argument("--drop-unused", action="store_true")
+    return asyncio.run(_run(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+"""Statistiken zum Connection Pool des MongoDB-Clients als Metriken."""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Final
+
+from loguru import logger
+from opentelemetry.metrics import CallbackOptions, Observation
+from pymongo.monitoring import (
+    ConnectionCheckedInEvent,
+    ConnectionCheckedOutEvent,
+    ConnectionCheckOutFailedEvent,
+    ConnectionCheckOutStartedEvent,
+    ConnectionClosedEvent,
+    ConnectionCreatedEvent,
+    ConnectionPoolListener,
+    ConnectionReadyEvent,
+    PoolClearedEvent,
+    PoolClosedEvent,
+    PoolCreatedEvent,
+    PoolReadyEvent,
+)
+
+from product.metrics.metric_registry import (
+    db_pool_checkout_duration_histogram,
+    db_pool_checkout_failures_counter,
+    meter,
+)
+
+__all__ = ["PoolStatistics", "PoolStatisticsListener", "pool_statistics"]
+
+
+@dataclass(eq=False, slots=True, kw_only=True)
+class PoolStatistics:
+    """Datenklasse für den aktuellen Zustand des Pools zu einem Server."""
+
+    open: int = 0
+    """Anzahl offener Verbindungen."""
+
+    in_use: int = 0
+    """Anzahl ausgeliehener Verbindungen."""
+
+    waiting: int = 0
+    """Anzahl Operationen, die auf eine Verbindung warten."""
+
+
+# Einträge entstehen nur in `pool_created`; Ereignisse nach `pool_closed`, z.B.
+# das Zurückgeben einer Verbindung, dürfen einen entfernten Server nicht anlegen
+_statistics: Final[dict[str, PoolStatistics]] = {}
+
+
+def _server(address: tuple[str, int | None]) -> str:
+    host, port = address
+    return f"{host}:{port}" if port is not None else host
+
+
+def pool_statistics() -> dict[str, PoolStatistics]:
+    """Aktuelle Pool-Statistiken je Server (host:port).
+
+    :return: Dictionary mit den Statistiken je Server
+    """
+    return dict(_statistics)
+
+
+class PoolStatisticsListener(ConnectionPoolListener):
+    """Listener für PyMongo, der die Pool-Ereignisse zu Statistiken verdichtet."""
+
+    def pool_created(self, event: PoolCreatedEvent) -> None:
+        _statistics.setdefault(_server(event.address), PoolStatistics())
+        logger.debug("MongoDB-Pool erstellt: {}", event.address)
+
+    def pool_ready(self, event: PoolReadyEvent) -> None:
+        pass
+
+    def pool_cleared(self, event: PoolClearedEvent) -> None:
+        logger.warning("MongoDB-Pool geleert: {}", event.address)
+
+    def pool_closed(self, event: PoolClosedEvent) -> None:
+        _statistics.pop(_server(event.address), None)
+
+    def connection_created(self, event: ConnectionCreatedEvent) -> None:
+        stats = _statistics.get(_server(event.address))
+        if stats is not None:
+            stats.open += 1
+
+    def connection_ready(self, event: ConnectionReadyEvent) -> None:
+        pass
+
+    def connection_closed(self, event: ConnectionClosedEvent) -> None:
+        stats = _statistics.get(_server(event.address))
+        if stats is not None:
+            stats.open = max(stats.open - 1, 0)
+
+    def connection_check_out_started(
+        self, event: ConnectionCheckOutStartedEvent
+    ) -> None:
+        stats = _statistics.get(_server(event.address))
+        if stats is not None:
+            stats.waiting += 1
+
+    def connection_check_out_failed(
+        self, event: ConnectionCheckOutFailedEvent
+    ) -> None:
+        server: Final = _server(event.address)
+        stats = _statistics.get(server)
+        if stats is not None:
+            stats.waiting = max(stats.waiting - 1, 0)
+        db_pool_checkout_failures_counter.add(
+            1, {"server": server, "reason": str(event.reason)}
+        )
+
+    def connection_checked_out(self, event: ConnectionCheckedOutEvent) -> None:
+        server: Final = _server(event.address)
+        stats = _statistics.get(server)
+        if stats is not None:
+            stats.waiting = max(stats.waiting - 1, 0)
+            stats.in_use += 1
+        if event.duration is not None:
+            db_pool_checkout_duration_histogram.record(
+                event.duration, {"server": server}
+            )
+
+    def connection_checked_in(self, event: ConnectionCheckedInEvent) -> None:
+        stats = _statistics.get(_server(event.address))
+        if stats is not None:
+            stats.in_use = max(stats.in_use - 1, 0)
+
+
+def _observe(attribute: str) -> Iterable[Observation]:
+    return [
+        Observation(getattr(stats, attribute), {"server": server})
+        for server, stats in list(_statistics.items())
+    ]
+
+
+def _observe_open(_options: CallbackOptions) -> Iterable[Observation]:
+    return _observe("open")
+
+
+def _observe_in_use(_options: CallbackOptions) -> Iterable[Observation]:
+    return _observe("in_use")
+
+
+def _observe_waiting(_options: CallbackOptions) -> Iterable[Observation]:
+    return _observe("waiting")
+
+
+meter.create_observable_gauge(
+    name="db_pool_connections_open",
+    callbacks=[_observe_open],
+    description="Offene Verbindungen im MongoDB-Pool je Server",
+    unit="1",
+)
+meter.create_observable_gauge(
+    name="db_pool_connections_in_use",
+    callbacks=[_observe_in_use],
+    description="Ausgeliehene Verbindungen im MongoDB-Pool je Server",
+    unit="1",
+)
+meter.create_observable_gauge(
+    name="db_pool_wait_queue_size",
+    callbacks=[_observe_waiting],
+    description="Auf eine Verbindung wartende Operationen je Server",
+    unit="1",
+)
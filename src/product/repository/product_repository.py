@@ -1,54 +1,471 @@
-from typing import Final, Optional, List
-from motor.motor_asyncio import AsyncIOMotorClient
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
+from contextlib import asynccontextmanager
+from time import perf_counter
+from typing import Any, Final, Optional, List, TypeVar
+from uuid import UUID
+
 from beanie import PydanticObjectId
+from bson import Binary
 from loguru import logger
-from product.config import env
-from product.model.entity.product import Product
+from motor.motor_asyncio import AsyncIOMotorClientSession, AsyncIOMotorCollection
+from pymongo import ASCENDING, UpdateOne
+from product.metrics.instrumentation import measured_query
+from product.model.entity.product import Product, normalize_name
 from product.error.exceptions import NotFoundError
+from product.model.input.sort import ProductSort
+from product.repository.query_builder import (
+    build_facet_pipeline,
+    build_product_filter,
+    build_sort,
+    prefix_filter,
+)
+from product.repository.read_policy import ReadPolicy
+from product.repository.session import get_client, supports_transactions
+from product.repository.session_token import SessionTokenUtil
+from product.repository.slow_query_log import get_slow_query_log
+from product.tracing.sampling import sampled_span
 from opentelemetry import trace
 
 tracer = trace.get_tracer(__name__)
 
-MONGO_DB_URI: Final[str] = env.MONGO_DB_URI
+T = TypeVar("T")
+
+
+def _as_uuid(value: Binary | UUID) -> UUID:
+    return value.as_uuid() if isinstance(value, Binary) else value
+
 
 class ProductRepository:
-    """Repository für MongoDB-Zugriffe auf Produktdaten."""
+    """Repository für MongoDB-Zugriffe auf Produktdaten.
+
+    Leseoperationen erhalten eine `ReadPolicy`: Mutations und Read-after-Write
+    lesen vom Primary, GraphQL-Queries dürfen auf Secondaries verteilt werden.
+    Liegt ein Session-Token vor, wird in einer kausal konsistenten Session gelesen
+    bzw. geschrieben und das Token danach aktualisiert.
+    """
 
     def __init__(self) -> None:
-        # Platz für zukünftige Abhängigkeiten (z. B. Konfig, Logger)
-        pass
+        self._slow_queries: Final = get_slow_query_log()
+
+    @asynccontextmanager
+    async def _session(
+        self,
+        write: bool = False,
+        transaction: AsyncIOMotorClientSession | None = None,
+    ) -> AsyncIterator[AsyncIOMotorClientSession | None]:
+        """Kausal konsistente Session für Writes bzw. für Reads mit Session-Token.
+
+        Innerhalb von `in_transaction` wird deren Session verwendet; das Token
+        aktualisiert dann `in_transaction` nach dem Commit.
+        """
+        if transaction is not None:
+            yield transaction
+            return
+        causal_ctx: Final = SessionTokenUtil.get()
+        if causal_ctx is None or not (write or causal_ctx.token):
+            yield None
+            return
+        async with await get_client().start_session(causal_consistency=True) as session:
+            SessionTokenUtil.apply(session, causal_ctx.token)
+            yield session
+            token: Final = SessionTokenUtil.encode(session)
+            if token is not None:
+                causal_ctx.token = token
+            causal_ctx.written = causal_ctx.written or write
+
+    async def in_transaction(
+        self, writes: Callable[[AsyncIOMotorClientSession | None], Awaitable[T]]
+    ) -> T:
+        """Zusammengehörige Writes in einer Transaktion ausführen.
 
-    async def save(self, product: Product) -> Product:
-        return await product.insert()
+        Bei einem Standalone-Server gibt es keine Transaktionen; `writes` läuft
+        dann ohne Session und die Writes sind nicht atomar.
 
-    async def update(self, product: Product) -> Product:
-        return await product.save()
+        :param writes: Erhält die Session und übergibt sie an jeden Write; wird
+            bei transienten Fehlern wiederholt
+        :return: Ergebnis von `writes`
+        """
+        if not supports_transactions():
+            return await writes(None)
+        causal_ctx: Final = SessionTokenUtil.get()
+        async with await get_client().start_session(causal_consistency=True) as session:
+            if causal_ctx is not None:
+                SessionTokenUtil.apply(session, causal_ctx.token)
+            result: Final = await session.with_transaction(writes)
+            if causal_ctx is not None:
+                token = SessionTokenUtil.encode(session)
+                if token is not None:
+                    causal_ctx.token = token
+                causal_ctx.written = True
+        return result
 
-    async def find_by_id(self, product_id: PydanticObjectId) -> Optional[Product]:
-        return await Product.get(product_id)
+    @staticmethod
+    def _collection(policy: ReadPolicy, causal: bool) -> AsyncIOMotorCollection:
+        return Product.get_motor_collection().with_options(
+            read_preference=policy.read_preference(),
+            read_concern=policy.read_concern(causal),
+        )
 
-    async def find_by_id_or_throw(self, product_id: PydanticObjectId) -> Product:
-        with tracer.start_as_current_span("MongoDB: find_by_id_or_throw products"):
-            product = await self.find_by_id(product_id)
+    async def _find(
+        self,
+        filter_query: dict[str, Any],
+        policy: ReadPolicy,
+        skip: int = 0,
+        limit: int = 0,
+        method: str = "find",
+        sort: list[tuple[str, int]] | None = None,
+    ) -> List[Product]:
+        """Dokumente gemäß Read Policy lesen und in `Product`-Objekte umwandeln."""
+        start: Final = perf_counter()
+        async with self._session() as session:
+            collection = self._collection(policy, session is not None)
+            cursor = collection.find(
+                filter_query, skip=skip, limit=limit, sort=sort, session=session
+            )
+            products: Final = [Product.model_validate(doc) async for doc in cursor]
+        self._slow_queries.observe(
+            method=method,
+            collection=collection.name,
+            duration_s=perf_counter() - start,
+            query=filter_query,
+            sort=sort,
+            skip=skip,
+            limit=limit,
+            explain=lambda: collection.find(
+                filter_query, skip=skip, limit=limit, sort=sort
+            ).explain(),
+        )
+        return products
+
+    def _observe_aggregate(
+        self,
+        method: str,
+        collection: AsyncIOMotorCollection,
+        start: float,
+        pipeline: list[dict[str, Any]],
+    ) -> None:
+        """Aggregation im Slow-Query-Log erfassen; explain über das Kommando `aggregate`."""
+        self._slow_queries.observe(
+            method=method,
+            collection=collection.name,
+            duration_s=perf_counter() - start,
+            query=pipeline,
+            explain=lambda: collection.database.command(
+                "aggregate",
+                collection.name,
+                pipeline=pipeline,
+                explain=True,
+                read_preference=collection.read_preference,
+            ),
+        )
+
+    @measured_query("products", count_documents=False)
+    async def save(
+        self, product: Product, transaction: AsyncIOMotorClientSession | None = None
+    ) -> Product:
+        async with self._session(write=True, transaction=transaction) as session:
+            return await product.insert(session=session)
+
+    @measured_query("products", count_documents=False)
+    async def update(
+        self, product: Product, transaction: AsyncIOMotorClientSession | None = None
+    ) -> Product:
+        async with self._session(write=True, transaction=transaction) as session:
+            return await product.save(session=session)
+
+    @measured_query("products")
+    async def find_by_id(
+        self,
+        product_id: PydanticObjectId | UUID | str,
+        policy: ReadPolicy = ReadPolicy.PRIMARY,
+    ) -> Optional[Product]:
+        try:
+            uuid: Final = (
+                product_id if isinstance(product_id, UUID) else UUID(str(product_id))
+            )
+        except ValueError:
+            logger.debug("find_by_id: ungueltige ID {}", product_id)
+            return None
+        query: Final = Product.find(Product.id == uuid).get_filter_query()
+        products: Final = await self._find(query, policy, limit=1, method="find_by_id")
+        return products[0] if products else None
+
+    async def find_by_id_or_throw(
+        self,
+        product_id: PydanticObjectId | UUID | str,
+        policy: ReadPolicy = ReadPolicy.PRIMARY,
+    ) -> Product:
+        with sampled_span(tracer, "MongoDB: find_by_id_or_throw products"):
+            product = await self.find_by_id(product_id, policy)
             if not product:
                 raise NotFoundError(f"Produkt mit ID {product_id} nicht gefunden.")
             return product
 
-    async def delete(self, product_id: PydanticObjectId) -> bool:
-        result = await Product.find_one(Product.id == product_id).delete()
+    @measured_query("products", count_documents=False)
+    async def delete(
+        self,
+        product_id: PydanticObjectId,
+        transaction: AsyncIOMotorClientSession | None = None,
+    ) -> bool:
+        async with self._session(write=True, transaction=transaction) as session:
+            result = await Product.find_one(
+                Product.id == product_id, session=session
+            ).delete(session=session)
         return result is not None
 
-    async def find_all(self) -> List[Product]:
-        return await Product.find_all().to_list()
+    @measured_query("products")
+    async def find_all(self, policy: ReadPolicy = ReadPolicy.PRIMARY) -> List[Product]:
+        return await self._find({}, policy, method="find_all")
 
-    async def find_paginated(self, skip: int = 0, limit: int = 10) -> List[Product]:
-        return await Product.find_all().skip(skip).limit(limit).to_list()
+    @measured_query("products")
+    async def find_paginated(
+        self,
+        skip: int = 0,
+        limit: int = 10,
+        policy: ReadPolicy = ReadPolicy.PRIMARY,
+        sort: ProductSort | None = None,
+    ) -> List[Product]:
+        return await self._find(
+            {},
+            policy,
+            skip=skip,
+            limit=limit,
+            method="find_paginated",
+            sort=build_sort(sort),
+        )
 
+    @measured_query("products")
     async def find_filtered(
-    self,
-    filter_dict: dict,
-    skip: int = 0,
-    limit: int = 10
-) -> List[Product]:
-        query = Product.find(filter_dict)
-        return await query.skip(skip).limit(limit).to_list()
+        self,
+        filter_dict: dict,
+        skip: int = 0,
+        limit: int = 10,
+        policy: ReadPolicy = ReadPolicy.PRIMARY,
+        sort: ProductSort | None = None,
+    ) -> List[Product]:
+        query = build_product_filter(filter_dict)
+        return await self._find(
+            query,
+            policy,
+            skip=skip,
+            limit=limit,
+            method="find_filtered",
+            sort=build_sort(sort),
+        )
+
+    @measured_query("products")
+    async def search(
+        self,
+        text: str,
+        criteria: dict | None = None,
+        limit: int = 10,
+        after: tuple[float, Binary] | None = None,
+        policy: ReadPolicy = ReadPolicy.PRIMARY,
+    ) -> List[tuple[Product, float]]:
+        """Volltextsuche über den Textindex, sortiert nach textScore und `_id`.
+
+        :param text: Suchbegriffe; Phrasen in Anführungszeichen, Ausschluss mit "-"
+        :param criteria: Zusätzliche Suchkriterien wie bei `find_filtered`
+        :param limit: Maximale Anzahl Treffer
+        :param after: textScore und ID des letzten Treffers der vorherigen Seite
+        :param policy: Read Policy
+        :return: Gefundene Produkte jeweils mit textScore
+        """
+        pipeline: Final[list[dict[str, Any]]] = [
+            {"$match": {"$text": {"$search": text}} | build_product_filter(criteria or {})},
+            {"$addFields": {"_score": {"$meta": "textScore"}}},
+        ]
+        if after is not None:
+            score, last_id = after
+            pipeline.append(
+                {
+                    "$match": {
+                        "$or": [
+                            {"_score": {"$lt": score}},
+                            {"_score": score, "_id": {"$gt": last_id}},
+                        ]
+                    }
+                }
+            )
+        pipeline.extend([{"$sort": {"_score": -1, "_id": 1}}, {"$limit": limit}])
+
+        start: Final = perf_counter()
+        with sampled_span(tracer, "MongoDB: search products"):
+            async with self._session() as session:
+                collection = self._collection(policy, session is not None)
+                cursor = collection.aggregate(pipeline, session=session)
+                hits: Final[List[tuple[Product, float]]] = []
+                async for doc in cursor:
+                    score = doc.pop("_score")
+                    hits.append((Product.model_validate(doc), score))
+        self._observe_aggregate("search", collection, start, pipeline)
+        return hits
+
+    @measured_query("products")
+    async def autocomplete(
+        self,
+        prefix: str,
+        limit: int = 10,
+        policy: ReadPolicy = ReadPolicy.PRIMARY,
+    ) -> List[dict[str, Any]]:
+        """Produktnamen zu einem Präfix über den Index `product_name_normalized`.
+
+        :param prefix: Eingegebener Anfang des Produktnamens
+        :param limit: Maximale Anzahl Vorschläge
+        :param policy: Read Policy
+        :return: Dictionaries mit `id`, `name` und `brand`
+        """
+        async with self._session() as session:
+            cursor = (
+                self._collection(policy, session is not None)
+                .find(
+                    prefix_filter(prefix),
+                    projection={"name": 1, "brand": 1},
+                    session=session,
+                )
+                .sort("name_normalized", 1)
+                .limit(limit)
+            )
+            return [
+                {
+                    "id": _as_uuid(doc["_id"]),
+                    "name": doc["name"],
+                    "brand": doc.get("brand"),
+                }
+                async for doc in cursor
+            ]
+
+    @measured_query("products")
+    async def facets(
+        self,
+        criteria: dict,
+        price_boundaries: list[int],
+        max_values: int,
+        policy: ReadPolicy = ReadPolicy.PRIMARY,
+    ) -> dict[str, Any]:
+        """Facetten für die Suchkriterien mit einer `$facet`-Aggregation ermitteln.
+
+        :param criteria: Suchkriterien wie bei `find_filtered`
+        :param price_boundaries: Untere Grenzen der Preis-Buckets
+        :param max_values: Maximale Anzahl Marken bzw. Tags
+        :param policy: Read Policy
+        :return: Dictionary mit `total` sowie Listen von `_id`/`count` je Facette
+        """
+        pipeline: Final = build_facet_pipeline(criteria, price_boundaries, max_values)
+        start: Final = perf_counter()
+        with sampled_span(tracer, "MongoDB: facets products"):
+            async with self._session() as session:
+                collection = self._collection(policy, session is not None)
+                cursor = collection.aggregate(pipeline, session=session)
+                result: Final = await cursor.to_list(length=1)
+        self._observe_aggregate("facets", collection, start, pipeline)
+        facets: Final = result[0] if result else {}
+        total: Final = facets.get("total") or [{"count": 0}]
+        return {
+            "total": total[0]["count"],
+            "categories": facets.get("categories", []),
+            "brands": facets.get("brands", []),
+            "tags": facets.get("tags", []),
+            "prices": facets.get("prices", []),
+        }
+
+    async def stream_suggestion_fields(
+        self, batch_size: int = 1000
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Name, Marke und Tags aller Produkte für den Suggestion-Index streamen.
+
+        :param batch_size: Anzahl Dokumente je Roundtrip
+        :return: Dokumente mit `id`, `name`, `brand` und `tags`
+        """
+        cursor = Product.get_motor_collection().find(
+            {},
+            projection={"name": 1, "brand": 1, "tags": 1},
+            batch_size=batch_size,
+        )
+        async for doc in cursor:
+            doc["id"] = _as_uuid(doc.pop("_id"))
+            yield doc
+
+    async def stream(
+        self,
+        criteria: Mapping[str, Any] | None = None,
+        policy: ReadPolicy = ReadPolicy.PRIMARY,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Produkte als Rohdokumente mit einem Cursor streamen, sortiert nach ID.
+
+        Ohne Session-Token: Ein Export darf beliebig lange dauern und soll keine
+        Session offenhalten.
+
+        :param criteria: Suchkriterien wie bei `build_product_filter`
+        :param policy: Read Policy
+        :param batch_size: Anzahl Dokumente je Roundtrip
+        :return: Dokumente mit `id` statt `_id`, ohne interne Felder
+        """
+        cursor = self._collection(policy, causal=False).find(
+            build_product_filter(criteria or {}),
+            projection={"revision_id": 0, "name_normalized": 0, "price_cents": 0},
+            sort=[("_id", ASCENDING)],
+            batch_size=batch_size,
+        )
+        async for doc in cursor:
+            doc["id"] = _as_uuid(doc.pop("_id"))
+            yield doc
+
+    async def backfill_name_normalized(self, batch_size: int = 1000) -> int:
+        """Fehlende normalisierte Namen bei Bestandsdaten ergänzen.
+
+        `normalize_name` zerlegt Unicode wie NFKD und ist in MongoDB nicht
+        nachbildbar. Die Updates gehen deshalb gebündelt per `bulk_write` an
+        den Server statt als ein Roundtrip je Dokument.
+
+        :param batch_size: Anzahl Updates je `bulk_write`
+        :return: Anzahl aktualisierter Dokumente
+        """
+        collection: Final = Product.get_motor_collection()
+        count = 0
+        batch: list[UpdateOne] = []
+        cursor = collection.find(
+            {"name_normalized": {"$exists": False}},
+            projection={"name": 1},
+            batch_size=batch_size,
+        )
+        async for doc in cursor:
+            batch.append(
+                UpdateOne(
+                    {"_id": doc["_id"]},
+                    {"$set": {"name_normalized": normalize_name(doc["name"])}},
+                )
+            )
+            if len(batch) >= batch_size:
+                count += (await collection.bulk_write(batch, ordered=False)).modified_count
+                batch = []
+        if batch:
+            count += (await collection.bulk_write(batch, ordered=False)).modified_count
+        if count:
+            logger.info("name_normalized für {} Produkte ergänzt", count)
+        return count
+
+    async def backfill_price_cents(self) -> int:
+        """Fehlende Preise in Cent bei Bestandsdaten ergänzen.
+
+        Das Update läuft als Pipeline vollständig in MongoDB; `$round` rundet
+        wie `to_cents` auf die gerade Zahl.
+
+        :return: Anzahl aktualisierter Dokumente
+        """
+        result: Final = await Product.get_motor_collection().update_many(
+            {"price_cents": {"$exists": False}},
+            [
+                {
+                    "$set": {
+                        "price_cents": {
+                            "$toLong": {"$round": [{"$multiply": ["$price", 100]}, 0]}
+                        }
+                    }
+                }
+            ],
+        )
+        if result.modified_count:
+            logger.info("price_cents für {} Produkte ergänzt", result.modified_count)
+        return result.modified_count
@@ -0,0 +1,258 @@
+"""Übersetzung von Suchkriterien in MongoDB-Filter, die über Indexe bedient werden."""
+
+import re
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections.abc import Iterable, Mapping
+from decimal import ROUND_CEILING, ROUND_FLOOR, Decimal
+from typing import Any, Final
+from uuid import UUID
+
+import orjson
+from bson import Binary, Decimal128
+from loguru import logger
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+from product.config.search import price_cents_enabled
+from product.error.exceptions import InvalidCursorError
+from product.model.entity.product import Product, normalize_name
+from product.model.enum.product_category import ProductCategory
+from product.model.input.sort import ProductSort, ProductSortField, SortDirection
+
+__all__ = [
+    "build_facet_pipeline",
+    "build_product_filter",
+    "build_sort",
+    "decode_search_cursor",
+    "encode_search_cursor",
+    "indexed_sort_fields",
+    "prefix_filter",
+]
+
+
+def _decimal128(value: float | Decimal) -> Decimal128:
+    return Decimal128(Decimal(str(value)))
+
+
+def _cents(value: float | Decimal, rounding: str) -> int:
+    # Bei ganzen Cent-Beträgen gilt z.B. price >= 9.991 genau dann, wenn price_cents >= 1000
+    return int(Decimal(str(value)).scaleb(2).to_integral_value(rounding))
+
+
+def _price_filter(criteria: Mapping[str, Any], price_cents: bool) -> dict[str, Any]:
+    min_price: Final = criteria.get("min_price")
+    max_price: Final = criteria.get("max_price")
+    if price_cents:
+        cents: Final[dict[str, int]] = {}
+        if min_price is not None:
+            cents["$gte"] = _cents(min_price, ROUND_CEILING)
+        if max_price is not None:
+            cents["$lte"] = _cents(max_price, ROUND_FLOOR)
+        return {"price_cents": cents} if cents else {}
+    price: Final[dict[str, Decimal128]] = {}
+    if min_price is not None:
+        price["$gte"] = _decimal128(min_price)
+    if max_price is not None:
+        price["$lte"] = _decimal128(max_price)
+    return {"price": price} if price else {}
+
+
+def prefix_filter(prefix: str) -> dict[str, Any]:
+    """Präfixsuche über das normalisierte Namensfeld.
+
+    Ein verankerter regulärer Ausdruck ohne Optionen wird von MongoDB als
+    Bereichsabfrage auf dem Index `product_name_normalized` ausgeführt.
+
+    :param prefix: Eingegebener Anfang des Produktnamens
+    :return: Filter für `name_normalized`
+    """
+    return {"name_normalized": {"$regex": f"^{re.escape(normalize_name(prefix))}"}}
+
+
+def build_product_filter(
+    criteria: Mapping[str, Any], price_cents: bool = price_cents_enabled
+) -> dict[str, Any]:
+    """MongoDB-Filter aus den Suchkriterien erstellen.
+
+    :param criteria: Suchkriterien wie in `ProductSearchCriteria`, leere Werte fehlen
+    :param price_cents: Preisgrenzen über das Integer-Feld `price_cents` statt `price`
+    :return: Filter für `find` bzw. `$match`
+    """
+    query: Final[dict[str, Any]] = {}
+
+    name = criteria.get("name")
+    if name:
+        query["name"] = name
+
+    name_prefix = criteria.get("name_prefix")
+    if name_prefix:
+        query |= prefix_filter(name_prefix)
+
+    brand = criteria.get("brand")
+    if brand:
+        query["brand"] = brand
+
+    query |= _price_filter(criteria, price_cents)
+
+    category = criteria.get("product_category")
+    if category:
+        query["category"] = ProductCategory(category).value
+
+    created: Final[dict[str, Any]] = {}
+    if criteria.get("created_after") is not None:
+        created["$gte"] = criteria["created_after"]
+    if criteria.get("created_before") is not None:
+        created["$lte"] = criteria["created_before"]
+    if created:
+        query["created"] = created
+
+    tags = criteria.get("tags")
+    if tags:
+        query["tags"] = {"$all": list(tags)}
+
+    return query
+
+
+def _price_buckets(price_boundaries: list[int], price_cents: bool) -> list[dict[str, Any]]:
+    scale: Final = 100 if price_cents else 1
+    boundaries: Final = [boundary * scale for boundary in price_boundaries]
+    stages: Final[list[dict[str, Any]]] = [
+        {
+            "$bucket": {
+                "groupBy": "$price_cents" if price_cents else "$price",
+                "boundaries": boundaries,
+                "default": boundaries[-1],
+                "output": {"count": {"$sum": 1}},
+            }
+        }
+    ]
+    if price_cents:
+        # Untere Grenze wieder in Euro wie bei der Gruppierung über `price`
+        stages.append({"$set": {"_id": {"$divide": ["$_id", scale]}}})
+    return stages
+
+
+def build_facet_pipeline(
+    criteria: Mapping[str, Any],
+    price_boundaries: list[int],
+    max_values: int,
+    price_cents: bool = price_cents_enabled,
+) -> list[dict[str, Any]]:
+    """Aggregation für alle Facetten in einem Durchlauf über die gefilterten Produkte.
+
+    :param criteria: Suchkriterien wie bei `build_product_filter`
+    :param price_boundaries: Aufsteigende untere Grenzen der Preis-Buckets
+    :param max_values: Maximale Anzahl Marken bzw. Tags
+    :param price_cents: Filter und Preis-Buckets über `price_cents` statt `price`
+    :return: Pipeline mit `$match` und `$facet`
+    """
+    by_count: Final = {"$sort": {"count": -1, "_id": 1}}
+    return [
+        {"$match": build_product_filter(criteria, price_cents)},
+        {
+            "$facet": {
+                "total": [{"$count": "count"}],
+                "categories": [
+                    {"$group": {"_id": "$category", "count": {"$sum": 1}}},
+                    by_count,
+                ],
+                "brands": [
+                    {"$match": {"brand": {"$nin": [None, ""]}}},
+                    {"$group": {"_id": "$brand", "count": {"$sum": 1}}},
+                    by_count,
+                    {"$limit": max_values},
+                ],
+                "tags": [
+                    {"$unwind": "$tags"},
+                    {"$group": {"_id": "$tags", "count": {"$sum": 1}}},
+                    by_count,
+                    {"$limit": max_values},
+                ],
+                # Preise ab der obersten Grenze landen im Default-Bucket mit dieser Grenze
+                "prices": _price_buckets(price_boundaries, price_cents),
+            }
+        },
+    ]
+
+
+def _sort_field(field: ProductSortField, price_cents: bool) -> str:
+    if field is ProductSortField.PRICE:
+        return "price_cents" if price_cents else "price"
+    return field.value
+
+
+def indexed_sort_fields(indexes: Iterable[Any]) -> frozenset[str]:
+    """Felder, deren Sortierung mit ID bei Gleichstand ein Index bedient.
+
+    Das sind Compound-Indexe, die mit dem Feld und `_id` in gleicher Richtung
+    beginnen. MongoDB liest sie für beide Sortierrichtungen, ohne im Speicher
+    zu sortieren.
+
+    :param indexes: Indexe wie in `Product.Settings.indexes`
+    :return: Feldnamen in MongoDB, z.B. "price_cents"
+    """
+    fields: Final[set[str]] = set()
+    for index in indexes:
+        if not isinstance(index, IndexModel):
+            continue
+        keys = list(index.document["key"].items())
+        if len(keys) < 2:  # noqa: PLR2004
+            continue
+        (field, direction), (tiebreaker, tiebreaker_direction) = keys[:2]
+        if (
+            tiebreaker == "_id"
+            and isinstance(direction, int)
+            and direction == tiebreaker_direction
+        ):
+            fields.add(field)
+    return frozenset(fields)
+
+
+_INDEXED_SORT_FIELDS: Final = indexed_sort_fields(Product.Settings.indexes)
+
+
+def build_sort(
+    sort: ProductSort | None, price_cents: bool = price_cents_enabled
+) -> list[tuple[str, int]]:
+    """Sortierung für `find`, bei Gleichstand immer nach `_id`.
+
+    Ohne Sortierung bzw. für ein Feld ohne passenden Index in
+    `Product.Settings.indexes` wird nur nach `_id` sortiert. Die Reihenfolge ist
+    damit über alle Seiten stabil und wird nie im Speicher sortiert.
+
+    :param sort: Feld und Richtung aus dem Request
+    :param price_cents: Preis über das Integer-Feld `price_cents` sortieren
+    :return: Sortierung, z.B. [("price_cents", -1), ("_id", -1)]
+    """
+    if sort is None:
+        return [("_id", ASCENDING)]
+    direction: Final = DESCENDING if sort.direction is SortDirection.DESC else ASCENDING
+    field: Final = _sort_field(sort.field, price_cents)
+    if field not in _INDEXED_SORT_FIELDS:
+        logger.warning("Sortierung nach {} ohne Index: es wird nach _id sortiert", field)
+        return [("_id", direction)]
+    return [(field, direction), ("_id", direction)]
+
+
+def encode_search_cursor(score: float, product_id: UUID) -> str:
+    """Position in einer nach textScore sortierten Trefferliste kodieren.
+
+    :param score: textScore des letzten Treffers der Seite
+    :param product_id: ID des letzten Treffers der Seite
+    :return: Cursor für die nächste Seite
+    """
+    raw: Final = orjson.dumps({"s": score, "id": str(product_id)})
+    return urlsafe_b64encode(raw).decode()
+
+
+def decode_search_cursor(cursor: str) -> tuple[float, Binary]:
+    """Cursor aus `encode_search_cursor` dekodieren.
+
+    :param cursor: Cursor aus der vorherigen Seite
+    :return: textScore und ID als BSON-Binary für den Vergleich mit `_id`
+    :raises InvalidCursorError: Falls der Cursor nicht dekodiert werden kann
+    """
+    try:
+        decoded: Final = orjson.loads(urlsafe_b64decode(cursor.encode()))
+        return float(decoded["s"]), Binary.from_uuid(UUID(decoded["id"]))
+    except (KeyError, TypeError, ValueError, orjson.JSONDecodeError) as err:
+        raise InvalidCursorError(cursor) from err
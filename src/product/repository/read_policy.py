@@ -0,0 +1,52 @@
+"""Read Policy je Operation: Routing von Leseoperationen im Replica Set."""
+
+from enum import StrEnum
+from typing import Final
+
+from pymongo.read_concern import ReadConcern
+from pymongo.read_preferences import Primary, SecondaryPreferred, _ServerMode
+
+from product.config.mongo import mongo_max_staleness_seconds, mongo_query_read_preference
+
+__all__ = ["QUERY_READ_POLICY", "ReadPolicy"]
+
+
+class ReadPolicy(StrEnum):
+    """Read Policy für eine Leseoperation im Repository."""
+
+    PRIMARY = "primary"
+    """Lesen vom Primary, z.B. für Mutations und Read-after-Write."""
+
+    SECONDARY_PREFERRED = "secondaryPreferred"
+    """Lesen bevorzugt von Secondaries mit begrenzter Replikationsverzögerung."""
+
+    def read_preference(self) -> _ServerMode:
+        """Read Preference von PyMongo zur Policy.
+
+        :return: Read Preference für `Collection.with_options`
+        """
+        if self is ReadPolicy.PRIMARY:
+            return Primary()
+        return SecondaryPreferred(max_staleness=mongo_max_staleness_seconds or -1)
+
+    def read_concern(self, causal: bool = False) -> ReadConcern:
+        """Read Concern zur Policy.
+
+        Bei einer kausal konsistenten Session wird "majority" verwendet, damit
+        ein Secondary erst antwortet, wenn der vorherige Schreibzugriff dort
+        angekommen ist.
+
+        :param causal: Flag, ob innerhalb einer kausal konsistenten Session gelesen wird
+        :return: Read Concern für `Collection.with_options`
+        """
+        if causal:
+            return ReadConcern("majority")
+        return ReadConcern("local") if self is ReadPolicy.SECONDARY_PREFERRED else ReadConcern()
+
+
+QUERY_READ_POLICY: Final[ReadPolicy] = (
+    ReadPolicy.SECONDARY_PREFERRED
+    if mongo_query_read_preference == ReadPolicy.SECONDARY_PREFERRED
+    else ReadPolicy.PRIMARY
+)
+"""Read Policy für GraphQL-Queries gemäß Konfiguration."""
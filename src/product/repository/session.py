@@ -1,42 +1,165 @@
-"""Initialisierung der Beanie-Datenbankverbindung mit MongoDB."""
+"""Initialisierung der Beanie-Datenbankverbindung mit MongoDB.
+
+Der Client wird einmalig im Lifespan der Applikation erzeugt und beim
+Herunterfahren wieder geschlossen.
+"""
+
+from importlib.util import find_spec
+from typing import Any, Final
 
-from typing import Final
-from motor.motor_asyncio import AsyncIOMotorClient
-from loguru import logger
 from beanie import init_beanie
+from loguru import logger
+from motor.motor_asyncio import AsyncIOMotorClient
 
-from product.config import env
+from product.config.mongo import (
+    mongo_compressors,
+    mongo_connect_timeout_ms,
+    mongo_database,
+    mongo_max_idle_time_ms,
+    mongo_max_pool_size,
+    mongo_max_staleness_seconds,
+    mongo_min_pool_size,
+    mongo_read_preference,
+    mongo_retry_reads,
+    mongo_retry_writes,
+    mongo_server_selection_timeout_ms,
+    mongo_socket_timeout_ms,
+    mongo_uri,
+    mongo_wait_queue_timeout_ms,
+)
+from product.model.entity.category_stats import CategoryStats
 from product.model.entity.product import Product
+from product.repository.pool_monitor import PoolStatisticsListener
 
-MONGO_DB_URI: Final[str] = env.MONGO_DB_URI
-MONGO_DB_NAME: Final[str] = env.MONGO_DB_DATABASE
+__all__ = [
+    "create_client",
+    "dispose_connection_pool",
+    "get_client",
+    "init_beanie_connection",
+    "supports_transactions",
+]
 
-
-__all__ = ["init_beanie_connection"]
+# Python-Module, die PyMongo für die jeweilige Wire-Kompression benötigt
+_COMPRESSOR_MODULES: Final[dict[str, str | None]] = {
+    "zstd": "zstandard",
+    "snappy": "snappy",
+    "zlib": None,
+}
 
 client: AsyncIOMotorClient | None = None
 
+# Laut "hello" beim Verbindungsaufbau: Replica Set oder Sharded Cluster
+_transactions: bool = False
+
+
+def _available_compressors() -> list[str]:
+    """Konfigurierte Kompressionsverfahren, deren Bibliothek installiert ist."""
+    available: Final[list[str]] = []
+    for compressor in mongo_compressors:
+        if compressor not in _COMPRESSOR_MODULES:
+            logger.warning("Unbekannte MongoDB-Kompression: {}", compressor)
+            continue
+        module = _COMPRESSOR_MODULES[compressor]
+        if module is not None and find_spec(module) is None:
+            logger.debug(
+                "MongoDB-Kompression {} nicht verfügbar: Modul {} fehlt",
+                compressor,
+                module,
+            )
+            continue
+        available.append(compressor)
+    return available
+
+
+def _client_options() -> dict[str, Any]:
+    """Optionen für den MongoDB-Client aus der Konfiguration."""
+    options: Final[dict[str, Any]] = {
+        "maxPoolSize": mongo_max_pool_size,
+        "minPoolSize": mongo_min_pool_size,
+        "connectTimeoutMS": mongo_connect_timeout_ms,
+        "serverSelectionTimeoutMS": mongo_server_selection_timeout_ms,
+        "retryReads": mongo_retry_reads,
+        "retryWrites": mongo_retry_writes,
+        "readPreference": mongo_read_preference,
+        "event_listeners": [PoolStatisticsListener()],
+    }
+    if mongo_max_idle_time_ms is not None:
+        options["maxIdleTimeMS"] = mongo_max_idle_time_ms
+    if mongo_wait_queue_timeout_ms is not None:
+        options["waitQueueTimeoutMS"] = mongo_wait_queue_timeout_ms
+    if mongo_socket_timeout_ms is not None:
+        options["socketTimeoutMS"] = mongo_socket_timeout_ms
+    if mongo_max_staleness_seconds is not None and mongo_read_preference != "primary":
+        options["maxStalenessSeconds"] = mongo_max_staleness_seconds
+    compressors: Final = _available_compressors()
+    if compressors:
+        options["compressors"] = compressors
+    return options
+
+
+def create_client() -> AsyncIOMotorClient:
+    """Einen neuen MongoDB-Client gemäß der Konfiguration erzeugen.
+
+    :return: Neuer Client mit eigenem Connection Pool
+    """
+    options: Final = _client_options()
+    logger.debug(
+        "MongoDB-Client: maxPoolSize={}, minPoolSize={}, compressors={}, "
+        "readPreference={}",
+        options["maxPoolSize"],
+        options["minPoolSize"],
+        options.get("compressors", []),
+        options["readPreference"],
+    )
+    return AsyncIOMotorClient(mongo_uri, **options)
+
+
+def supports_transactions() -> bool:
+    """True, falls MongoDB Transaktionen unterstützt; nicht bei einem Standalone-Server."""
+    return _transactions
+
+
+def get_client() -> AsyncIOMotorClient:
+    """Den im Lifespan initialisierten MongoDB-Client ermitteln.
+
+    :return: Der gemeinsam genutzte Client
+    :raises RuntimeError: Falls die Verbindung noch nicht initialisiert ist
+    """
+    if client is None:
+        raise RuntimeError("MongoDB-Verbindung ist nicht initialisiert")
+    return client
+
 
 async def init_beanie_connection() -> None:
     """Initialisiert die Verbindung zu MongoDB und Beanie."""
-    global client
-    logger.debug("Verbinde mit MongoDB unter {}", MONGO_DB_URI)
-    client = AsyncIOMotorClient(MONGO_DB_URI)
+    global client, _transactions  # noqa: PLW0603
+    if client is not None:
+        return
+    logger.info("🔌 Verbinde mit MongoDB unter {}", mongo_uri)
+    client = create_client()
 
     await init_beanie(
-        database=client[MONGO_DB_NAME],
+        database=client[mongo_database],
         document_models=[
             Product,
+            CategoryStats,
+            # Weitere Beanie-Modelle hier hinzufügen
         ],
+        # Indexe legt IndexManager aus PRODUCT_INDEXES an; der Lifespan wartet darauf
+        skip_indexes=True,
     )
+    hello: Final = await client.admin.command("hello")
+    _transactions = "setName" in hello or hello.get("msg") == "isdbgrid"
+    logger.info("MongoDB-Transaktionen: {}", "ja" if _transactions else "nein")
 
-    logger.info("MongoDB- und Beanie-Initialisierung abgeschlossen.")
+    logger.success("✅ MongoDB-Initialisierung abgeschlossen (DB: {})", mongo_database)
 
 
 async def dispose_connection_pool() -> None:
     """Schließt die Verbindung zum MongoDB-Client."""
-    global client
+    global client, _transactions  # noqa: PLW0603
     if client is not None:
         logger.info("MongoDB-Verbindung wird geschlossen.")
         client.close()
         client = None
+        _transactions = False
@@ -0,0 +1,84 @@
+"""Session-Token für kausale Konsistenz zwischen Schreib- und Lesezugriffen.
+
+Nach einem Schreibzugriff erhält der Client im Response-Header `x-session-token`
+die Cluster- und Operation-Time der MongoDB-Session. Schickt er das Token bei der
+nächsten Anfrage mit, wird in einer kausal konsistenten Session gelesen, so dass
+auch ein Secondary den eigenen Schreibzugriff sieht.
+"""
+
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Final
+
+from bson import BSON, Timestamp
+from bson.errors import BSONError
+from loguru import logger
+from motor.motor_asyncio import AsyncIOMotorClientSession
+
+__all__ = ["SESSION_TOKEN_HEADER", "CausalContext", "SessionTokenUtil"]
+
+SESSION_TOKEN_HEADER: Final = "x-session-token"
+
+
+@dataclass(eq=False, slots=True, kw_only=True)
+class CausalContext:
+    """Veränderbarer Kontext eines Requests für die kausale Konsistenz."""
+
+    token: str | None = None
+    """Session-Token aus dem Request bzw. nach einem Schreibzugriff."""
+
+    written: bool = False
+    """Flag, ob im Request geschrieben wurde."""
+
+
+_causal_context_var: ContextVar[CausalContext | None] = ContextVar(
+    "causal_context", default=None
+)
+
+
+class SessionTokenUtil:
+    """Hilfsklasse zum Kodieren und Anwenden von Session-Tokens."""
+
+    @staticmethod
+    def set(causal_context: CausalContext | None) -> None:
+        _causal_context_var.set(causal_context)
+
+    @staticmethod
+    def get() -> CausalContext | None:
+        return _causal_context_var.get()
+
+    @staticmethod
+    def encode(session: AsyncIOMotorClientSession) -> str | None:
+        """Cluster- und Operation-Time einer Session als Token kodieren.
+
+        :param session: Session nach einem Zugriff
+        :return: Base64-kodiertes Token oder None, falls die Session keine Zeiten hat
+        """
+        if session.cluster_time is None or session.operation_time is None:
+            return None
+        raw: Final = BSON.encode(
+            {"clusterTime": session.cluster_time, "operationTime": session.operation_time}
+        )
+        return urlsafe_b64encode(raw).decode()
+
+    @staticmethod
+    def apply(session: AsyncIOMotorClientSession, token: str | None) -> None:
+        """Eine Session bis zum Zeitpunkt des Tokens vorrücken.
+
+        Ungültige Tokens werden ignoriert; dann wird ohne Kausalitätsgarantie gelesen.
+
+        :param session: Neue, kausal konsistente Session
+        :param token: Token aus dem Request-Header
+        """
+        if not token:
+            return
+        try:
+            decoded: Final = BSON(urlsafe_b64decode(token.encode())).decode()
+            operation_time: Final = decoded["operationTime"]
+            if not isinstance(operation_time, Timestamp):
+                raise TypeError("operationTime ist kein Timestamp")
+            session.advance_cluster_time(decoded["clusterTime"])
+            session.advance_operation_time(operation_time)
+        except (BSONError, KeyError, TypeError, ValueError) as err:
+            logger.warning("Ungültiges Session-Token ignoriert: {}", err)
@@ -0,0 +1,25 @@
+# src/product/repository/session_token_middleware.py
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.types import ASGIApp
+
+from product.repository.session_token import (
+    SESSION_TOKEN_HEADER,
+    CausalContext,
+    SessionTokenUtil,
+)
+
+
+class SessionTokenMiddleware(BaseHTTPMiddleware):
+    """Übernimmt das Session-Token aus dem Request und gibt es nach Writes zurück."""
+
+    def __init__(self, app: ASGIApp):
+        super().__init__(app)
+
+    async def dispatch(self, request: Request, call_next):
+        causal_ctx = CausalContext(token=request.headers.get(SESSION_TOKEN_HEADER))
+        SessionTokenUtil.set(causal_ctx)
+        response = await call_next(request)
+        if causal_ctx.written and causal_ctx.token:
+            response.headers[SESSION_TOKEN_HEADER] = causal_ctx.token
+        return response
@@ -0,0 +1,248 @@
+"""Protokoll langsamer Abfragen mit Filterstruktur und optionalem Query-Plan.
+
+Filter werden normalisiert: Werte werden durch "?" ersetzt, Feldnamen und
+Operatoren bleiben erhalten. Abfragen mit gleicher Struktur sind dadurch
+vergleichbar, und Suchbegriffe landen nicht im Log. Für einen Anteil der
+langsamen Abfragen wird `explain()` im Hintergrund ausgeführt; ein
+`COLLSCAN` im Plan weist auf einen fehlenden Index hin.
+"""
+
+import asyncio
+import random
+from collections import deque
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from functools import lru_cache
+from typing import Any, Final
+
+from loguru import logger
+
+from product.config.mongo import (
+    mongo_slow_query_buffer_size,
+    mongo_slow_query_explain_rate,
+    mongo_slow_query_threshold_ms,
+)
+from product.metrics.metric_registry import db_slow_queries_counter
+
+__all__ = [
+    "QueryPlan",
+    "SlowQuery",
+    "SlowQueryLog",
+    "get_slow_query_log",
+    "normalize_query",
+]
+
+_PLACEHOLDER: Final = "?"
+
+
+def normalize_query(value: Any) -> Any:
+    """Struktur eines Filters bzw. einer Pipeline ohne konkrete Werte.
+
+    :param value: Filter, Sortierung oder Aggregations-Pipeline
+    :return: Gleiche Struktur, Werte durch "?" ersetzt
+    """
+    if isinstance(value, Mapping):
+        return {key: normalize_query(v) for key, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        normalized = [normalize_query(v) for v in value]
+        # `$in: [a, b, c]` und `$in: [a]` sind dieselbe Abfrageform
+        if all(v == _PLACEHOLDER for v in normalized):
+            return [_PLACEHOLDER] if normalized else []
+        return normalized
+    return _PLACEHOLDER
+
+
+@dataclass(slots=True, kw_only=True)
+class QueryPlan:
+    """Zusammenfassung der Ausgabe von `explain()`."""
+
+    stages: list[str]
+    """Stages des Gewinnerplans von außen nach innen, z.B. FETCH, IXSCAN."""
+
+    collscan: bool
+    """Ob der Plan die gesamte Collection durchsucht."""
+
+    index_names: list[str]
+    """Verwendete Indexe."""
+
+    docs_examined: int | None = None
+    """Gelesene Dokumente laut `executionStats`."""
+
+    keys_examined: int | None = None
+    """Gelesene Indexeinträge laut `executionStats`."""
+
+    n_returned: int | None = None
+    """Gelieferte Dokumente laut `executionStats`."""
+
+
+@dataclass(slots=True, kw_only=True)
+class SlowQuery:
+    """Eintrag im Ringpuffer."""
+
+    timestamp: datetime
+    method: str
+    collection: str
+    filter: Any
+    sort: Any = None
+    skip: int = 0
+    limit: int = 0
+    duration_ms: float
+    plan: QueryPlan | None = field(default=None)
+
+
+def _walk(node: Any, key: str) -> list[Any]:
+    """Alle Werte zu `key` in einer verschachtelten explain-Ausgabe."""
+    found: list[Any] = []
+    if isinstance(node, Mapping):
+        for k, v in node.items():
+            if k == key:
+                found.append(v)
+            found.extend(_walk(v, key))
+    elif isinstance(node, list):
+        for item in node:
+            found.extend(_walk(item, key))
+    return found
+
+
+def _first_int(explain: Mapping[str, Any], key: str) -> int | None:
+    values: Final = [v for v in _walk(explain, key) if isinstance(v, int)]
+    return values[0] if values else None
+
+
+def summarize_explain(explain: Mapping[str, Any]) -> QueryPlan:
+    """Gewinnerplan aus `explain()` für find bzw. aggregate zusammenfassen.
+
+    :param explain: Ausgabe von `explain()` bzw. `aggregate` mit `explain: true`
+    :return: Stages, COLLSCAN-Erkennung, Indexe und Ausführungsstatistik
+    """
+    plans: Final = _walk(explain, "winningPlan")
+    stages: Final = [s for s in _walk(plans, "stage") if isinstance(s, str)]
+    return QueryPlan(
+        stages=stages,
+        collscan="COLLSCAN" in stages,
+        index_names=list(dict.fromkeys(_walk(plans, "indexName"))),
+        docs_examined=_first_int(explain, "totalDocsExamined"),
+        keys_examined=_first_int(explain, "totalKeysExamined"),
+        n_returned=_first_int(explain, "nReturned"),
+    )
+
+
+class SlowQueryLog:
+    """Ringpuffer der zuletzt langsamen Abfragen."""
+
+    def __init__(
+        self, threshold_ms: float, explain_rate: float, buffer_size: int
+    ) -> None:
+        self._threshold_ms: Final = threshold_ms
+        self._explain_rate: Final = explain_rate
+        self._entries: Final[deque[SlowQuery]] = deque(maxlen=max(buffer_size, 1))
+        # Referenzen halten, damit laufende explain-Tasks nicht eingesammelt werden
+        self._tasks: Final[set[asyncio.Task[None]]] = set()
+
+    @property
+    def threshold_ms(self) -> float:
+        """Schwellwert in Millisekunden."""
+        return self._threshold_ms
+
+    def observe(
+        self,
+        *,
+        method: str,
+        collection: str,
+        duration_s: float,
+        query: Any,
+        sort: Any = None,
+        skip: int = 0,
+        limit: int = 0,
+        explain: Callable[[], Awaitable[Mapping[str, Any]]] | None = None,
+    ) -> SlowQuery | None:
+        """Abfrage protokollieren, falls sie den Schwellwert überschreitet.
+
+        :param method: Name der Repository-Methode
+        :param collection: Name der Collection
+        :param duration_s: Dauer in Sekunden
+        :param query: Filter bzw. Aggregations-Pipeline
+        :param sort: Sortierung
+        :param skip: Anzahl übersprungener Dokumente
+        :param limit: Maximale Anzahl Dokumente
+        :param explain: Liefert die Ausgabe von `explain()`; wird nur für eine
+            Stichprobe und erst nach der Abfrage aufgerufen
+        :return: Eintrag im Ringpuffer oder None, falls die Abfrage schnell war
+        """
+        duration_ms: Final = duration_s * 1000
+        if duration_ms < self._threshold_ms:
+            return None
+        entry: Final = SlowQuery(
+            timestamp=datetime.now(UTC),
+            method=method,
+            collection=collection,
+            filter=normalize_query(query),
+            sort=sort,
+            skip=skip,
+            limit=limit,
+            duration_ms=round(duration_ms, 1),
+        )
+        self._entries.append(entry)
+        if explain is not None and random.random() < self._explain_rate:  # noqa: S311
+            task: Final = asyncio.get_running_loop().create_task(
+                self._explain(entry, explain)
+            )
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        else:
+            self._log(entry)
+        return entry
+
+    async def _explain(
+        self,
+        entry: SlowQuery,
+        explain: Callable[[], Awaitable[Mapping[str, Any]]],
+    ) -> None:
+        try:
+            entry.plan = summarize_explain(await explain())
+        except Exception as err:  # noqa: BLE001
+            logger.debug("explain fuer {} fehlgeschlagen: {}", entry.method, err)
+        self._log(entry)
+
+    @staticmethod
+    def _log(entry: SlowQuery) -> None:
+        collscan: Final = entry.plan is not None and entry.plan.collscan
+        db_slow_queries_counter.add(
+            1,
+            {
+                "collection": entry.collection,
+                "method": entry.method,
+                "collscan": str(collscan).lower(),
+            },
+        )
+        logger.warning(
+            "Langsame Abfrage {}.{}: {:.1f} ms, filter={}, sort={}, skip={}, "
+            "limit={}, plan={}",
+            entry.collection,
+            entry.method,
+            entry.duration_ms,
+            entry.filter,
+            entry.sort,
+            entry.skip,
+            entry.limit,
+            "-" if entry.plan is None else " > ".join(entry.plan.stages),
+        )
+
+    def entries(self) -> list[dict[str, Any]]:
+        """Einträge als Dictionaries, neueste zuerst."""
+        return [asdict(entry) for entry in reversed(self._entries)]
+
+    def clear(self) -> None:
+        """Ringpuffer leeren."""
+        self._entries.clear()
+
+
+@lru_cache
+def get_slow_query_log() -> SlowQueryLog:
+    """Prozessweites Protokoll langsamer Abfragen."""
+    return SlowQueryLog(
+        threshold_ms=mongo_slow_query_threshold_ms,
+        explain_rate=mongo_slow_query_explain_rate,
+        buffer_size=mongo_slow_query_buffer_size,
+    )
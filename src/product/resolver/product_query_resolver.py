@@ -5,8 +5,13 @@ from opentelemetry import trace
 from strawberry.types import Info
 
 from product.error.exceptions import NotFoundError
+from product.model.entity.category_stats import CategoryStatisticsType
 from product.model.entity.product import ProductType
 from product.model.input.searchcriteria import ProductSearchCriteria
+from product.model.input.sort import ProductSort
+from product.model.types.product_facets import ProductFacetsType
+from product.model.types.product_search_slice import ProductSearchSlice
+from product.model.types.product_suggestion import ProductSuggestionType
 from product.repository.pageable import Pageable
 from product.repository.slice import Slice
 from product.security.keycloak_service import KeycloakService
@@ -43,6 +48,7 @@ class ProductQueryResolver:
         info: Info,
         pageable: Pageable,
         search_criteria: ProductSearchCriteria | None = None,
+        sort: ProductSort | None = None,
     ) -> Slice:
         logger.debug("resolve_products: search_criteria=%s", search_criteria)
 
@@ -56,12 +62,13 @@ class ProductQueryResolver:
         try:
 
             if not filtered:
-                result_slice = await self.read_service.find_all(pageable)
+                result_slice = await self.read_service.find_all(pageable, sort)
 
             else:
                 result_slice = await self.read_service.find_filtered(
                     filter_dict=filtered,
                     pageable=pageable,
+                    sort=sort,
                 )
 
         except NotFoundError:
@@ -70,3 +77,65 @@ class ProductQueryResolver:
 
         logger.debug("resolve_products: found=%d", len(result_slice.content))
         return result_slice
+
+    @traced("resolve_search_products")
+    async def resolve_search_products(
+        self,
+        info: Info,
+        text: str,
+        search_criteria: ProductSearchCriteria | None = None,
+        first: int = 10,
+        after: str | None = None,
+    ) -> ProductSearchSlice:
+        logger.debug("resolve_search_products: text={}, after={}", text, after)
+
+        keycloak: KeycloakService = info.context["keycloak"]
+        keycloak.assert_roles(["Admin", "User"])
+
+        criteria_dict: Final = dict(vars(search_criteria)) if search_criteria else {}
+        filtered: Final = {key: val for key, val in criteria_dict.items() if val}
+
+        return await self.read_service.search(
+            text, filter_dict=filtered, first=first, after=after
+        )
+
+    @traced("resolve_product_facets")
+    async def resolve_product_facets(
+        self,
+        info: Info,
+        search_criteria: ProductSearchCriteria | None = None,
+    ) -> ProductFacetsType:
+        logger.debug("resolve_product_facets: search_criteria={}", search_criteria)
+
+        keycloak: KeycloakService = info.context["keycloak"]
+        keycloak.assert_roles(["Admin", "User"])
+
+        criteria_dict: Final = dict(vars(search_criteria)) if search_criteria else {}
+        filtered: Final = {key: val for key, val in criteria_dict.items() if val}
+
+        return await self.read_service.facets(filtered)
+
+    @traced("resolve_category_statistics")
+    async def resolve_category_statistics(
+        self, info: Info
+    ) -> List[CategoryStatisticsType]:
+        keycloak: KeycloakService = info.context["keycloak"]
+        keycloak.assert_roles(["Admin"])
+
+        return await self.read_service.category_statistics()
+
+    async def resolve_autocomplete_products(
+        self, info: Info, prefix: str, limit: int = 10
+    ) -> List[ProductSuggestionType]:
+        keycloak: KeycloakService = info.context["keycloak"]
+        keycloak.assert_roles(["Admin", "User"])
+
+        return await self.read_service.autocomplete(prefix, limit=limit)
+
+    async def resolve_suggest_products(
+        self, info: Info, prefix: str, limit: int = 10
+    ) -> List[ProductSuggestionType]:
+        keycloak: KeycloakService = info.context["keycloak"]
+        keycloak.assert_roles(["Admin", "User"])
+
+        return await self.read_service.suggest(prefix, limit=limit)
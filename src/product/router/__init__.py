@@ -2,23 +2,33 @@
 
 from collections.abc import Sequence
 
+from product.router.category_stats_router import router as category_stats_router
 from product.router.health_router import liveness, readiness
 from product.router.health_router import router as health_router
+from product.router.index_router import router as index_router
+from product.router.product_export_router import export_products
+from product.router.product_export_router import router as product_export_router
 from product.router.shutdown_router import router as shutdown_router
 from product.router.shutdown_router import shutdown
+from product.router.slow_query_router import router as slow_query_router
 
 __all__: Sequence[str] = [
+    "category_stats_router",
     "delete_by_id",
+    "export_products",
     "get",
     "get_by_id",
     "get_nachnamen",
     "health_router",
+    "index_router",
     "liveness",
     "patient_get_router",
     "patient_write_router",
     "post",
+    "product_export_router",
     "put",
     "readiness",
     "shutdown",
     "shutdown_router",
+    "slow_query_router",
 ]
@@ -0,0 +1,24 @@
+"""REST-Schnittstelle zum Neuaufbau der materialisierten Sicht `category_stats`."""
+
+from typing import Final
+
+from fastapi import APIRouter, HTTPException, Request, status
+
+from product.dependency_provider import get_category_stats_repository
+from product.security.keycloak_service import KeycloakService
+
+__all__ = ["router"]
+
+
+router: Final = APIRouter(tags=["Admin"])
+
+
+@router.post("/category-stats/rebuild")
+async def rebuild_category_stats(request: Request) -> dict[str, int]:
+    """Sicht aus `products` neu berechnen, z.B. nach Writes ohne Transaktion."""
+    keycloak: Final[KeycloakService | None] = getattr(request.state, "keycloak", None)
+    if keycloak is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+    keycloak.assert_roles(["Admin"])
+
+    return {"categories": await get_category_stats_repository().rebuild()}
@@ -0,0 +1,24 @@
+"""REST-Schnittstelle für den Zustand der Indexe von `products`."""
+
+from typing import Any, Final
+
+from fastapi import APIRouter, HTTPException, Request, status
+
+from product.repository.index_manager import get_index_manager
+from product.security.keycloak_service import KeycloakService
+
+__all__ = ["router"]
+
+
+router: Final = APIRouter(tags=["Admin"])
+
+
+@router.get("/indexes")
+async def indexes(request: Request) -> list[dict[str, Any]]:
+    """Deklarierte und vorhandene Indexe mit Zustand, Größe in Bytes und Zugriffen."""
+    keycloak: Final[KeycloakService | None] = getattr(request.state, "keycloak", None)
+    if keycloak is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+    keycloak.assert_roles(["Admin"])
+
+    return await get_index_manager().report()
@@ -0,0 +1,41 @@
+"""REST-Schnittstelle für den Export aller Produkte als NDJSON."""
+
+from typing import Annotated, Final
+
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+
+from product.dependency_provider import get_product_read_service
+from product.model.input.searchcriteria import ProductSearchCriteria
+from product.security.keycloak_service import KeycloakService
+
+__all__ = ["export_products", "router"]
+
+NDJSON: Final = "application/x-ndjson"
+
+router: Final = APIRouter(tags=["Export"])
+
+
+@router.get("/products/export", response_class=StreamingResponse)
+async def export_products(
+    request: Request, criteria: Annotated[ProductSearchCriteria, Query()]
+) -> StreamingResponse:
+    """Alle Produkte zu den Suchkriterien als NDJSON streamen.
+
+    Im Gegensatz zu `products` in GraphQL gibt es keine Seitengröße: Die
+    Produkte werden sortiert nach ID geliefert, sobald sie aus dem Cursor
+    kommen.
+
+    :param criteria: Suchkriterien als Query-Parameter, z.B. `?brand=Sony&tags=audio`
+    :return: Eine Zeile JSON je Produkt
+    """
+    keycloak: Final[KeycloakService | None] = getattr(request.state, "keycloak", None)
+    if keycloak is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+    keycloak.assert_roles(["Admin", "User"])
+
+    return StreamingResponse(
+        get_product_read_service().export_ndjson(criteria.model_dump(exclude_none=True)),
+        media_type=NDJSON,
+        headers={"Content-Disposition": 'inline; filename="products.ndjson"'},
+    )
@@ -0,0 +1,39 @@
+"""REST-Schnittstelle für das Protokoll langsamer MongoDB-Abfragen."""
+
+from typing import Any, Final
+
+from fastapi import APIRouter, HTTPException, Request, status
+
+from product.repository.slow_query_log import get_slow_query_log
+from product.security.keycloak_service import KeycloakService
+
+__all__ = ["router"]
+
+
+router: Final = APIRouter(tags=["Admin"])
+
+
+def _assert_admin(request: Request) -> None:
+    """Filter und explain-Ausgaben nur für die Rolle Admin."""
+    keycloak: Final[KeycloakService | None] = getattr(request.state, "keycloak", None)
+    if keycloak is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+    keycloak.assert_roles(["Admin"])
+
+
+@router.get("/slow-queries")
+def slow_queries(request: Request) -> dict[str, Any]:
+    """Zuletzt langsame Abfragen, neueste zuerst."""
+    _assert_admin(request)
+    slow_query_log: Final = get_slow_query_log()
+    return {
+        "threshold_ms": slow_query_log.threshold_ms,
+        "entries": slow_query_log.entries(),
+    }
+
+
+@router.delete("/slow-queries", status_code=status.HTTP_204_NO_CONTENT)
+def clear_slow_queries(request: Request) -> None:
+    """Ringpuffer leeren, z.B. nach dem Anlegen eines Index."""
+    _assert_admin(request)
+    get_slow_query_log().clear()
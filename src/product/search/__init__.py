@@ -0,0 +1,22 @@
+"""In-Memory-Indexe für latenzkritische Suchanfragen."""
+
+from product.search.facet_cache import FacetCache, facet_cache_key, get_facet_cache
+from product.search.response_cache import ResponseCache, get_response_cache
+from product.search.suggestion_index import (
+    Suggestion,
+    SuggestionIndex,
+    get_suggestion_index,
+)
+from product.search.ttl_cache import GenerationCache
+
+__all__ = [
+    "FacetCache",
+    "GenerationCache",
+    "ResponseCache",
+    "Suggestion",
+    "SuggestionIndex",
+    "facet_cache_key",
+    "get_facet_cache",
+    "get_response_cache",
+    "get_suggestion_index",
+]
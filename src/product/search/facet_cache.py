@@ -0,0 +1,58 @@
+"""Cache für Facetten-Ergebnisse mit Invalidierung bei Schreibzugriffen.
+
+Generation und TTL wie bei `GenerationCache`: Eine Aggregation, die vor einem
+Write begonnen hat, legt ihre Zahlen nicht mehr ab.
+"""
+
+from collections.abc import Mapping
+from datetime import datetime
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Final
+
+import orjson
+
+from product.config.search import facet_cache_size, facet_cache_ttl_seconds
+from product.model.entity.product import normalize_name
+from product.search.ttl_cache import GenerationCache
+
+__all__ = ["FacetCache", "facet_cache_key", "get_facet_cache"]
+
+
+def _normalize(key: str, value: Any) -> Any:
+    if key == "name_prefix":
+        return normalize_name(value)
+    if key == "tags":
+        return sorted(set(value))
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def facet_cache_key(criteria: Mapping[str, Any]) -> str:
+    """Suchkriterien unabhängig von Reihenfolge und Schreibweise als Schlüssel.
+
+    :param criteria: Suchkriterien wie bei `build_product_filter`
+    :return: Kanonische JSON-Darstellung
+    """
+    normalized: Final = {
+        key: _normalize(key, value)
+        for key, value in criteria.items()
+        if value not in (None, "", [])
+    }
+    return orjson.dumps(normalized, option=orjson.OPT_SORT_KEYS).decode()
+
+
+class FacetCache(GenerationCache[Any]):
+    """Cache für Facetten je Suchkriterien."""
+
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        super().__init__("facets", max_size, ttl_seconds)
+
+
+@lru_cache
+def get_facet_cache() -> FacetCache:
+    """Prozessweiter Facetten-Cache."""
+    return FacetCache(facet_cache_size, facet_cache_ttl_seconds)
@@ -0,0 +1,114 @@
+"""Cache für vollständige GraphQL-Responses mit ETag und Invalidierung bei Writes.
+
+Gecacht werden nur GET-Requests mit Persisted Query, deren Response keine
+Fehler enthält. Der Schlüssel besteht aus Hash, Variablen, `operationName` und
+den Rollen des Tokens. Die Resolver prüfen nur Rollen; die Daten hängen nicht
+vom Benutzer ab. Wie bei `GenerationCache` leert jeder Write den Cache. Eine
+Response wird nur gespeichert, wenn seit Beginn der Ausführung kein Write
+erfolgt ist.
+
+Der ETag ist ein Hash des Bodys. Er gilt damit auch für Aggregationen wie
+`productFacets` ohne Revision und ist in jedem Worker und jeder Instanz gleich.
+"""
+
+import hashlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+from email.utils import formatdate, parsedate_to_datetime
+from functools import lru_cache
+from time import time
+from typing import Final
+
+import orjson
+
+from product.config.graphql import (
+    graphql_response_cache_size,
+    graphql_response_cache_ttl_seconds,
+)
+from product.search.ttl_cache import GenerationCache
+
+__all__ = [
+    "CachedResponse",
+    "ResponseCache",
+    "etag_matches",
+    "get_response_cache",
+    "not_modified_since",
+    "response_cache_key",
+]
+
+
+@dataclass(slots=True, frozen=True)
+class CachedResponse:
+    """Body einer Response mit ETag und Zeitpunkt der Erzeugung."""
+
+    body: bytes
+    etag: str
+    last_modified: str
+
+    @classmethod
+    def create(cls, body: bytes) -> "CachedResponse":
+        """Schwacher ETag, da eine Kompression den Body verändern kann."""
+        digest: Final = hashlib.sha256(body).hexdigest()[:32]
+        return cls(
+            body=body,
+            etag=f'W/"{digest}"',
+            last_modified=formatdate(time(), usegmt=True),
+        )
+
+
+def response_cache_key(
+    sha256_hash: str,
+    variables: str | None,
+    operation_name: str | None,
+    roles: Iterable[str],
+) -> str:
+    """Schlüssel einer GET-Response mit Persisted Query.
+
+    :param sha256_hash: Hash der Persisted Query
+    :param variables: Parameter `variables` als JSON-String
+    :param operation_name: Parameter `operationName`
+    :param roles: Rollen aus dem Token
+    :return: Kanonische JSON-Darstellung
+    """
+    parsed: Final = orjson.loads(variables) if variables else None
+    return orjson.dumps(
+        [sha256_hash, parsed, operation_name, sorted(set(roles))],
+        option=orjson.OPT_SORT_KEYS,
+    ).decode()
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Schwacher Vergleich mit dem Header If-None-Match.
+
+    :param if_none_match: Header, z.B. `W/"abc", "def"` oder `*`
+    :param etag: Aktueller ETag
+    :return: True, falls einer der ETags passt
+    """
+    current: Final = etag.removeprefix("W/")
+    return any(
+        candidate == "*" or candidate.removeprefix("W/") == current
+        for candidate in (value.strip() for value in if_none_match.split(","))
+    )
+
+
+def not_modified_since(if_modified_since: str, last_modified: str) -> bool:
+    """True, falls die Response seit If-Modified-Since unverändert ist."""
+    try:
+        return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(
+            if_modified_since
+        )
+    except (TypeError, ValueError):
+        return False
+
+
+class ResponseCache(GenerationCache[CachedResponse]):
+    """Cache für Responses je Persisted Query, Variablen und Rollen."""
+
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        super().__init__("graphql_responses", max_size, ttl_seconds)
+
+
+@lru_cache
+def get_response_cache() -> ResponseCache:
+    """Prozessweiter Response-Cache."""
+    return ResponseCache(graphql_response_cache_size, graphql_response_cache_ttl_seconds)
@@ -0,0 +1,312 @@
+"""Invertierter Index über Name, Marke und Tags für die Autovervollständigung.
+
+Die Begriffe liegen als sortierte Liste vor; alle Begriffe zu einem Präfix
+bilden darin einen zusammenhängenden Bereich, der per Binärsuche gefunden wird.
+Jeder Begriff verweist auf eine Posting-Liste aus Ordinalzahlen
+(`array("I")`, 4 Byte je Eintrag). Entfernen setzt nur einen Tombstone im
+Eintrag; `_compact_if_sparse` baut den Index neu auf, sobald mehr als die
+Hälfte der Einträge entfernt ist. Namen, Marken und Begriffe werden mit
+`sys.intern` dedupliziert.
+
+Eine Suche liest höchstens `max_candidates` Postings. Kurze Präfixe wie "ka"
+passen auf große Teile des Katalogs; sie liefern dann die besten Treffer aus
+dieser Auswahl statt aus allen Produkten.
+
+Der Index wird nur aus dem Event-Loop heraus verändert, daher sind keine
+Sperren nötig. `build` sammelt die Einträge getrennt vom aktiven Index und
+tauscht sie erst am Ende in einem Schritt ein. Writes während des Aufbaus
+wirken sofort auf den aktiven Index und werden nach dem Tausch wiederholt.
+"""
+
+import heapq
+import re
+import sys
+from array import array
+from bisect import bisect_left, insort
+from collections.abc import AsyncIterable, Iterable, Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from time import perf_counter
+from typing import Any, Final
+
+from loguru import logger
+
+from product.config.search import suggest_max_candidates
+from product.model.entity.product import normalize_name
+
+__all__ = ["Suggestion", "SuggestionIndex", "get_suggestion_index"]
+
+_TOKEN: Final = re.compile(r"\w+")
+_MAX_CHAR: Final = "\U0010ffff"
+# Eine Posting-Liste wird in C gelesen; der Vergleich der Begriffe eines
+# Kandidaten in Python kostet etwa so viel wie 16 Postings
+_POSTINGS_PER_CANDIDATE: Final = 16
+
+
+def _tokenize(text: str | None) -> list[str]:
+    return _TOKEN.findall(normalize_name(text)) if text else []
+
+
+def _intern(value: str | None) -> str | None:
+    return sys.intern(value) if value else value
+
+
+@dataclass(slots=True, frozen=True)
+class Suggestion:
+    """Eintrag im Index und zugleich Ergebnis einer Suche."""
+
+    id: str
+    name: str
+    brand: str | None
+    name_normalized: str
+    terms: tuple[str, ...]
+
+
+_by_name: Final = attrgetter("name_normalized")
+
+
+class SuggestionIndex:
+    """Präfixindex für `suggestProducts` mit Latenzen im Mikrosekundenbereich."""
+
+    def __init__(self, max_candidates: int = suggest_max_candidates) -> None:
+        """Initialisierung mit der Obergrenze für gelesene Postings je Suche.
+
+        :param max_candidates: Maximale Anzahl Ordinalzahlen je Suche
+        """
+        self._max_candidates: Final = max_candidates
+        self._terms: list[str] = []
+        self._postings: dict[str, array] = {}
+        self._entries: list[Suggestion | None] = []
+        self._ordinals: dict[str, int] = {}
+        self._ready = False
+        # Writes während eines Aufbaus: ID und neuer Eintrag bzw. None beim Löschen
+        self._pending: list[tuple[str, Suggestion | None]] | None = None
+
+    @property
+    def ready(self) -> bool:
+        """Ob der initiale Aufbau abgeschlossen ist."""
+        return self._ready
+
+    def __len__(self) -> int:
+        return len(self._ordinals)
+
+    @property
+    def term_count(self) -> int:
+        """Anzahl unterschiedlicher Begriffe."""
+        return len(self._terms)
+
+    async def build(self, documents: AsyncIterable[Mapping[str, Any]]) -> int:
+        """Index aus einem Strom von Produkt-Dokumenten neu aufbauen.
+
+        :param documents: Dokumente mit `_id` bzw. `id`, `name`, `brand` und `tags`
+        :return: Anzahl indizierter Produkte
+        """
+        start: Final = perf_counter()
+        self._pending = []
+        entries: Final[dict[str, Suggestion]] = {}
+        try:
+            async for doc in documents:
+                entry = self._entry(doc)
+                entries[entry.id] = entry
+            self._swap(entries.values())
+        finally:
+            self._pending = None
+        logger.info(
+            "Suggestion-Index: {} Produkte, {} Begriffe in {:.2f} s",
+            len(self),
+            self.term_count,
+            perf_counter() - start,
+        )
+        return len(self)
+
+    def build_from(self, documents: Iterable[Mapping[str, Any]]) -> int:
+        """Index synchron aus bereits geladenen Dokumenten aufbauen.
+
+        :param documents: Dokumente wie bei `build`
+        :return: Anzahl indizierter Produkte
+        """
+        entries: Final = {entry.id: entry for entry in map(self._entry, documents)}
+        self._swap(entries.values())
+        return len(self)
+
+    def clear(self) -> None:
+        """Alle Einträge entfernen."""
+        self._reset()
+        self._ready = False
+
+    def _reset(self) -> None:
+        self._terms.clear()
+        self._postings.clear()
+        self._entries.clear()
+        self._ordinals.clear()
+
+    def _swap(self, entries: Iterable[Suggestion]) -> None:
+        """Aktiven Index ersetzen und die Writes seit Beginn des Aufbaus wiederholen.
+
+        Läuft ohne `await` und ist damit für andere Tasks atomar.
+        """
+        pending: Final = self._pending or []
+        self._pending = None
+        self._reset()
+        for entry in entries:
+            self._add(entry, sort=False)
+        self._terms.sort()
+        for product_id, entry in pending:
+            self._remove(product_id)
+            if entry is not None:
+                self._add(entry, sort=True)
+        self._ready = True
+
+    def upsert(self, doc: Mapping[str, Any]) -> None:
+        """Produkt einfügen oder ersetzen.
+
+        :param doc: Dokument bzw. Event-Payload mit `_id` oder `id`, `name`,
+            `brand` und `tags`
+        """
+        entry: Final = self._entry(doc)
+        if self._pending is not None:
+            self._pending.append((entry.id, entry))
+        self._remove(entry.id)
+        self._add(entry, sort=True)
+
+    @staticmethod
+    def _entry(doc: Mapping[str, Any]) -> Suggestion:
+        name: Final = doc["name"]
+        brand: Final = doc.get("brand")
+        terms = _tokenize(name) + _tokenize(brand)
+        for tag in doc.get("tags") or ():
+            terms += _tokenize(tag)
+        return Suggestion(
+            id=str(doc.get("_id", doc.get("id"))),
+            name=sys.intern(name),
+            brand=_intern(brand),
+            name_normalized=normalize_name(name),
+            terms=tuple(sys.intern(t) for t in dict.fromkeys(terms)),
+        )
+
+    def _add(self, entry: Suggestion, sort: bool) -> None:
+        """Eintrag anhängen; ohne `sort` muss `_terms` danach sortiert werden."""
+        # Neue Ordinalzahlen sind immer die größten: append hält die Listen sortiert
+        ordinal: Final = len(self._entries)
+        self._entries.append(entry)
+        self._ordinals[entry.id] = ordinal
+        for term in entry.terms:
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = array("I")
+                if sort:
+                    insort(self._terms, term)
+                else:
+                    self._terms.append(term)
+            postings.append(ordinal)
+
+    def remove(self, product_id: str) -> bool:
+        """Produkt aus dem Index entfernen.
+
+        :param product_id: ID des Produkts
+        :return: True, falls das Produkt enthalten war
+        """
+        if self._pending is not None:
+            self._pending.append((str(product_id), None))
+        return self._remove(str(product_id))
+
+    def _remove(self, product_id: str) -> bool:
+        """Tombstone setzen; die Postings bleiben bis zur Verdichtung bestehen."""
+        ordinal: Final = self._ordinals.pop(product_id, None)
+        if ordinal is None:
+            return False
+        self._entries[ordinal] = None
+        self._compact_if_sparse()
+        return True
+
+    def suggest(self, prefix: str, limit: int = 10) -> list[Suggestion]:
+        """Produkte, bei denen jedes eingegebene Wort Präfix eines Begriffs ist.
+
+        Produkte, deren Name mit der gesamten Eingabe beginnt, stehen vorne;
+        danach wird nach dem normalisierten Namen sortiert.
+
+        :param prefix: Eingabe, z.B. "sony kopf"
+        :param limit: Maximale Anzahl Vorschläge
+        :return: Vorschläge
+        """
+        tokens: Final = _tokenize(prefix)
+        if not tokens or limit <= 0:
+            return []
+
+        # Das Wort mit den wenigsten Postings liefert die Kandidaten; jedes weitere
+        # Wort filtert sie über die eigenen Postings oder, falls das zu viele
+        # wären, über die Begriffe der Kandidaten
+        term_ranges: Final = [(token, self._term_range(token)) for token in tokens]
+        ranges: Final = sorted(
+            ((self._posting_count(terms), token, terms) for token, terms in term_ranges),
+            key=itemgetter(0),
+        )
+        candidates: Final = self._candidates(ranges[0][2])
+        for count, token, terms in ranges[1:]:
+            if count <= len(candidates) * _POSTINGS_PER_CANDIDATE:
+                matching: set[int] = set()
+                for term in terms:
+                    matching.update(self._postings[term])
+                candidates &= matching
+            else:
+                candidates.intersection_update(
+                    [o for o in candidates if self._matches(self._entries[o], token)]
+                )
+
+        normalized: Final = normalize_name(prefix)
+        leading: Final[list[Suggestion]] = []
+        other: Final[list[Suggestion]] = []
+        for ordinal in candidates:
+            entry = self._entries[ordinal]
+            if entry is None:
+                continue
+            if entry.name_normalized.startswith(normalized):
+                leading.append(entry)
+            else:
+                other.append(entry)
+        result: Final = heapq.nsmallest(limit, leading, key=_by_name)
+        if len(result) < limit:
+            result += heapq.nsmallest(limit - len(result), other, key=_by_name)
+        return result
+
+    def _posting_count(self, terms: Iterable[str]) -> int:
+        return sum(len(self._postings[term]) for term in terms)
+
+    def _candidates(self, terms: Iterable[str]) -> set[int]:
+        """Ordinalzahlen zu den Begriffen, höchstens `max_candidates` gelesene Postings."""
+        candidates: Final[set[int]] = set()
+        remaining = self._max_candidates
+        for term in terms:
+            postings = self._postings[term]
+            if len(postings) >= remaining:
+                candidates.update(postings[:remaining])
+                break
+            candidates.update(postings)
+            remaining -= len(postings)
+        return candidates
+
+    @staticmethod
+    def _matches(entry: Suggestion | None, token: str) -> bool:
+        return entry is not None and any(term.startswith(token) for term in entry.terms)
+
+    def _term_range(self, token: str) -> list[str]:
+        lo: Final = bisect_left(self._terms, token)
+        hi: Final = bisect_left(self._terms, token + _MAX_CHAR, lo)
+        return self._terms[lo:hi]
+
+    def _compact_if_sparse(self) -> None:
+        """Freie Plätze entfernen, sobald mehr als die Hälfte leer ist."""
+        if len(self._entries) < 1024 or len(self._ordinals) * 2 > len(self._entries):
+            return
+        entries: Final = [e for e in self._entries if e is not None]
+        self._reset()
+        for entry in entries:
+            self._add(entry, sort=False)
+        self._terms.sort()
+
+
+@lru_cache
+def get_suggestion_index() -> SuggestionIndex:
+    """Prozessweiter Suggestion-Index."""
+    return SuggestionIndex()
@@ -0,0 +1,71 @@
+"""LRU-Cache mit TTL und Generationszähler für Ergebnisse, die Writes verändern.
+
+Jeder Write erhöht die Generation und leert den Cache. Ein Ergebnis wird nur
+gespeichert, wenn sich die Generation seit Beginn der Berechnung nicht
+geändert hat; so kann eine parallel laufende Abfrage kein veraltetes Ergebnis
+nach einem Write ablegen. Die TTL begrenzt die Veraltung, falls ein
+Produkt-Event einer anderen Instanz verloren geht.
+"""
+
+from collections import OrderedDict
+from time import monotonic
+from typing import Final, Generic, TypeVar
+
+from product.metrics.instrumentation import record_cache_access
+
+__all__ = ["GenerationCache"]
+
+V = TypeVar("V")
+
+
+class GenerationCache(Generic[V]):
+    """LRU-Cache mit TTL und Generationszähler."""
+
+    def __init__(self, name: str, max_size: int, ttl_seconds: float) -> None:
+        """Initialisierung mit Name für die Metriken, Größe und TTL.
+
+        :param name: Name des Caches für `record_cache_access`
+        :param max_size: Maximale Anzahl Einträge; 0 deaktiviert den Cache
+        :param ttl_seconds: Gültigkeit eines Eintrags in Sekunden
+        """
+        self._name: Final = name
+        self._max_size: Final = max_size
+        self._ttl: Final = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, V]] = OrderedDict()
+        self._generation = 0
+
+    @property
+    def enabled(self) -> bool:
+        """False, falls die Größe 0 ist."""
+        return self._max_size > 0
+
+    @property
+    def generation(self) -> int:
+        """Aktuelle Generation; vor der Berechnung lesen und an `put` übergeben."""
+        return self._generation
+
+    def get(self, key: str) -> V | None:
+        """Gültiger Eintrag zum Schlüssel oder None."""
+        item: Final = self._entries.get(key)
+        if item is None or item[0] < monotonic():
+            if item is not None:
+                del self._entries[key]
+            record_cache_access(self._name, hit=False)
+            return None
+        self._entries.move_to_end(key)
+        record_cache_access(self._name, hit=True)
+        return item[1]
+
+    def put(self, key: str, value: V, generation: int) -> None:
+        """Eintrag speichern, sofern seit `generation` kein Write erfolgt ist."""
+        if generation != self._generation or self._max_size <= 0:
+            return
+        self._entries[key] = (monotonic() + self._ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Alle Einträge verwerfen; jeder Write kann jeden Eintrag verändern."""
+        self._generation += 1
+        self._entries.clear()
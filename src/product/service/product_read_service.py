@@ -8,50 +8,102 @@ sowie zur Erstellung eines Excelsheets (falls aktiviert).
 import csv
 import re
 from collections import defaultdict
+from collections.abc import AsyncIterator
 from datetime import datetime
+from decimal import Decimal
 from pathlib import Path
-from typing import Final, List, Optional
+from time import perf_counter
+from typing import Any, Final, List, Optional
 
+import orjson
 from beanie import PydanticObjectId
+from bson import Decimal128
 from loguru import logger
-from openpyxl import Workbook
-from openpyxl.chart import BarChart, PieChart, Reference
-from openpyxl.drawing.image import Image as ExcelImage
-from openpyxl.styles import Border, Font, PatternFill, Side
-from openpyxl.utils import get_column_letter
 from opentelemetry import trace
 
 from product.config import env
+from product.config.export import export_batch_size, export_chunk_size
 from product.config.feature_flags import excel_export_enabled  # z. B. True/False-Flag
 from product.config.kafka import get_kafka_settings
+from product.config.search import (
+    facet_max_values,
+    facet_price_boundaries,
+    search_autocomplete_max_limit,
+    search_max_page_size,
+)
 from product.error.exceptions import NotFoundError
 from product.logging.logger_plus import LoggerPlus
 from product.messaging.kafka_singleton import get_kafka_producer
 from product.messaging.producer import KafkaProducerService
+from product.metrics.instrumentation import record_cache_access
+from product.metrics.metric_registry import (
+    export_duration_histogram,
+    export_requests_counter,
+)
+from product.model.entity.category_stats import (
+    CategoryStats,
+    CategoryStatisticsType,
+    map_category_stats_to_type,
+)
+from product.model.entity.money import to_decimal
 from product.model.entity.product import Product, map_product_to_product_type
+from product.model.input.sort import ProductSort
+from product.repository.category_stats_repository import CategoryStatsRepository
 from product.repository.pageable import Pageable
+from product.model.types.product_facets import (
+    FacetCountType,
+    PriceBucketType,
+    ProductFacetsType,
+)
+from product.model.types.product_search_slice import ProductSearchSlice
+from product.model.types.product_suggestion import ProductSuggestionType
 from product.repository.product_repository import ProductRepository
+from product.repository.query_builder import decode_search_cursor, encode_search_cursor
+from product.repository.read_policy import QUERY_READ_POLICY
 from product.repository.slice import Slice
+from product.search.facet_cache import FacetCache, facet_cache_key
+from product.search.suggestion_index import SuggestionIndex
 from product.tracing.trace_context import TraceContext
 from product.tracing.trace_context_util import TraceContextUtil
+from product.tracing.sampling import sampled_span
 
 tracer = trace.get_tracer(__name__)
 as_csv: Final = env.EXPORT_FORMAT.lower() == "csv"
 
 
+def _json_default(value: Any) -> str:
+    """Preise als String wie bei `model_dump(mode="json")`, ohne Rundung."""
+    if isinstance(value, Decimal128):
+        return str(to_decimal(value))
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError
+
+
 class ProductReadService:
     """Serviceklasse für lesenden Zugriff auf Produktdaten in MongoDB."""
 
-    def __init__(self, repository: ProductRepository):
+    def __init__(
+        self,
+        repository: ProductRepository,
+        suggestion_index: SuggestionIndex,
+        facet_cache: FacetCache,
+        category_stats_repository: CategoryStatsRepository,
+    ):
         self._repository = repository
+        self._suggestions = suggestion_index
+        self._facet_cache = facet_cache
+        self._category_stats = category_stats_repository
         self._log = LoggerPlus()
         self._producer = get_kafka_producer()
         self._service = get_kafka_settings().client_id
 
     async def find_by_id(self, product_id: PydanticObjectId) -> Product:
-        with tracer.start_as_current_span("ProductReadService.find_by_id"):
+        with sampled_span(tracer, "ProductReadService.find_by_id"):
             await self._log.debug("find_by_id: id=%s", product_id)
-            product = await self._repository.find_by_id_or_throw(product_id)
+            product = await self._repository.find_by_id_or_throw(
+                product_id, policy=QUERY_READ_POLICY
+            )
             await self.notify_export_event([product])
             return product
 
@@ -80,16 +132,18 @@ class ProductReadService:
 
         await self._log.info("🛰️ Kafka-Export-Event versendet: %s", payload)
 
-    async def find_all(self, pageable: Pageable) -> Slice:
-        logger.debug("find_all")
+    async def find_all(self, pageable: Pageable, sort: ProductSort | None = None) -> Slice:
+        logger.debug("find_all: sort={}", sort)
 
         products = await self._repository.find_paginated(
             skip=pageable.skip,
             limit=pageable.limit,
+            policy=QUERY_READ_POLICY,
+            sort=sort,
         )
 
         if excel_export_enabled:
-            ProductReadService._create_export_file(products)
+            await self._export(products)
 
         mapped = [map_product_to_product_type(p) for p in products]
         return Slice(
@@ -101,18 +155,24 @@ class ProductReadService:
 
     async def find_paginated(self, skip: int = 0, limit: int = 10) -> List[Product]:
         logger.debug("find_paginated: skip=%s, limit=%s", skip, limit)
-        products = await self._repository.find_paginated(skip=skip, limit=limit)
+        products = await self._repository.find_paginated(
+            skip=skip, limit=limit, policy=QUERY_READ_POLICY
+        )
 
         if excel_export_enabled:
-            ProductReadService._create_export_file(products)
+            await self._export(products)
         return products
 
-    async def find_filtered(self, filter_dict: dict, pageable: Pageable) -> Slice:
+    async def find_filtered(
+        self, filter_dict: dict, pageable: Pageable, sort: ProductSort | None = None
+    ) -> Slice:
         logger.debug("find_filtered: filter_dict=%s", filter_dict)
         result = await self._repository.find_filtered(
             filter_dict,
             skip=pageable.skip,
             limit=pageable.limit,
+            policy=QUERY_READ_POLICY,
+            sort=sort,
         )
 
         if not result:
@@ -120,16 +180,196 @@ class ProductReadService:
             raise NotFoundError("Keine Produkte mit diesen Filterkriterien gefunden.")
 
         if excel_export_enabled:
-            ProductReadService._create_export_file(products=result)
+            await self._export(result)
 
         mapped = [map_product_to_product_type(p) for p in result]
         return Slice(
             content=mapped,
             total=len(mapped),
-            pageable=pageable,
+            size=pageable.limit,
+            page=pageable.skip,
+        )
+
+    async def export_ndjson(
+        self,
+        filter_dict: dict | None = None,
+        batch_size: int = export_batch_size,
+        chunk_size: int = export_chunk_size,
+    ) -> AsyncIterator[bytes]:
+        """Alle passenden Produkte als NDJSON, eine Zeile je Produkt.
+
+        Jedes Dokument wird direkt aus dem Cursor mit orjson serialisiert, ohne
+        Umweg über `Product`. Gesammelt werden höchstens `chunk_size` Bytes;
+        der Speicherbedarf ist unabhängig von der Anzahl Produkte.
+
+        :param filter_dict: Suchkriterien wie bei `find_filtered`
+        :param batch_size: Anzahl Dokumente je Roundtrip des Cursors
+        :param chunk_size: Bytes, ab denen die gesammelten Zeilen geliefert werden
+        :return: Teile des Bodys mit vollständigen Zeilen
+        """
+        logger.debug("export_ndjson: filter_dict={}", filter_dict)
+        buffer: Final = bytearray()
+        async for doc in self._repository.stream(
+            filter_dict, policy=QUERY_READ_POLICY, batch_size=batch_size
+        ):
+            buffer += orjson.dumps(
+                doc, default=_json_default, option=orjson.OPT_APPEND_NEWLINE
+            )
+            if len(buffer) >= chunk_size:
+                yield bytes(buffer)
+                buffer.clear()
+        if buffer:
+            yield bytes(buffer)
+
+    async def search(
+        self,
+        text: str,
+        filter_dict: dict | None = None,
+        first: int = 10,
+        after: Optional[str] = None,
+    ) -> ProductSearchSlice:
+        """Volltextsuche mit Ranking nach Relevanz und Cursor-Paginierung.
+
+        :param text: Suchbegriffe
+        :param filter_dict: Zusätzliche Suchkriterien
+        :param first: Gewünschte Anzahl Treffer, begrenzt durch `search_max_page_size`
+        :param after: Cursor aus der vorherigen Seite
+        :return: Seite mit Treffern und Cursor für die nächste Seite
+        :raises InvalidCursorError: Falls der Cursor ungültig ist
+        """
+        logger.debug("search: text={}, filter_dict={}, after={}", text, filter_dict, after)
+        limit: Final = min(max(first, 1), search_max_page_size)
+
+        hits = await self._repository.search(
+            text,
+            criteria=filter_dict,
+            limit=limit + 1,
+            after=decode_search_cursor(after) if after else None,
+            policy=QUERY_READ_POLICY,
+        )
+        has_next: Final = len(hits) > limit
+        hits = hits[:limit]
+
+        next_cursor: Final = (
+            encode_search_cursor(hits[-1][1], hits[-1][0].id) if has_next else None
+        )
+        return ProductSearchSlice(
+            content=[map_product_to_product_type(p) for p, _ in hits],
+            next_cursor=next_cursor,
+            has_next=has_next,
+        )
+
+    async def autocomplete(
+        self, prefix: str, limit: int = 10
+    ) -> List[ProductSuggestionType]:
+        """Vorschläge für Produktnamen, die mit dem Präfix beginnen.
+
+        :param prefix: Eingegebener Anfang des Produktnamens
+        :param limit: Gewünschte Anzahl, begrenzt durch `search_autocomplete_max_limit`
+        :return: Vorschläge sortiert nach dem normalisierten Namen
+        """
+        if not prefix.strip():
+            return []
+        suggestions: Final = await self._repository.autocomplete(
+            prefix,
+            limit=min(max(limit, 1), search_autocomplete_max_limit),
+            policy=QUERY_READ_POLICY,
+        )
+        return [
+            ProductSuggestionType(id=str(s["id"]), name=s["name"], brand=s["brand"])
+            for s in suggestions
+        ]
+
+    async def suggest(
+        self, prefix: str, limit: int = 10
+    ) -> List[ProductSuggestionType]:
+        """Vorschläge aus dem In-Memory-Index; jedes Wort ist Präfix von Name, Marke oder Tag.
+
+        Solange der Index noch aufgebaut wird, wird wie bei `autocomplete` MongoDB
+        abgefragt.
+
+        :param prefix: Eingabe, z.B. "sony kopf"
+        :param limit: Gewünschte Anzahl, begrenzt durch `search_autocomplete_max_limit`
+        :return: Vorschläge, Treffer am Namensanfang zuerst
+        """
+        # Treffer: Index beantwortet die Anfrage, sonst Fallback auf MongoDB
+        record_cache_access("suggestions", self._suggestions.ready)
+        if not self._suggestions.ready:
+            return await self.autocomplete(prefix, limit)
+        suggestions: Final = self._suggestions.suggest(
+            prefix, limit=min(max(limit, 1), search_autocomplete_max_limit)
+        )
+        return [
+            ProductSuggestionType(id=s.id, name=s.name, brand=s.brand)
+            for s in suggestions
+        ]
+
+    async def facets(self, filter_dict: dict | None = None) -> ProductFacetsType:
+        """Kategorien, Marken, Preis-Buckets und Tags zu den Suchkriterien.
+
+        Ergebnisse werden je normalisierten Kriterien gecacht und bei jedem
+        Write verworfen.
+
+        :param filter_dict: Suchkriterien wie bei `find_filtered`
+        :return: Facetten mit Anzahl Produkten je Wert
+        """
+        criteria: Final = filter_dict or {}
+        key: Final = facet_cache_key(criteria)
+        cached = self._facet_cache.get(key)
+        if cached is not None:
+            return cached
+
+        logger.debug("facets: cache miss, criteria={}", criteria)
+        generation: Final = self._facet_cache.generation
+        raw: Final = await self._repository.facets(
+            criteria,
+            price_boundaries=facet_price_boundaries,
+            max_values=facet_max_values,
+            policy=QUERY_READ_POLICY,
+        )
+
+        def counts(values: list[dict]) -> List[FacetCountType]:
+            return [FacetCountType(value=str(v["_id"]), count=v["count"]) for v in values]
+
+        price_counts: Final = {float(b["_id"]): b["count"] for b in raw["prices"]}
+        upper: Final = [float(b) for b in facet_price_boundaries[1:]] + [None]
+        facets: Final = ProductFacetsType(
+            total=raw["total"],
+            categories=counts(raw["categories"]),
+            brands=counts(raw["brands"]),
+            price_buckets=[
+                PriceBucketType(
+                    min=float(lower), max=upper[i], count=price_counts.get(float(lower), 0)
+                )
+                for i, lower in enumerate(facet_price_boundaries)
+            ],
+            tags=counts(raw["tags"]),
+        )
+        self._facet_cache.put(key, facets, generation)
+        return facets
+
+    async def category_statistics(self) -> List[CategoryStatisticsType]:
+        """Anzahl, Preissumme und Durchschnittspreis je Kategorie aus `category_stats`.
+
+        :return: Kennzahlen aller Kategorien mit Produkten
+        """
+        stats: Final = await self._category_stats.find_all(policy=QUERY_READ_POLICY)
+        return [map_category_stats_to_type(s) for s in stats]
+
+    async def _export(self, products: List[Product]) -> None:
+        """Exportdatei erstellen; Kategorie-Diagramme stammen aus `category_stats`."""
+        attributes: Final = {"format": env.EXPORT_FORMAT.lower()}
+        start: Final = perf_counter()
+        category_stats: Final = await self._category_stats.find_all(
+            policy=QUERY_READ_POLICY
         )
+        ProductReadService._create_export_file(products, category_stats)
+        export_duration_histogram.record(perf_counter() - start, attributes)
+        export_requests_counter.add(1, attributes)
 
-    def _create_export_file(products: List[Product]) -> None:
+    def _create_export_file(
+        products: List[Product], category_stats: List[CategoryStats]
+    ) -> None:
         """Erstellt CSV oder Excel mit Logo und Diagrammen."""
 
         # 🔢 Startposition
@@ -182,7 +422,13 @@ class ProductReadService:
             logger.success("CSV-Export gespeichert unter: %s", export_path)
             return
 
-        # 📊 Excel-Erstellung mit openpyxl
+        # 📊 Excel-Erstellung mit openpyxl; erst hier importiert, weil openpyxl
+        # samt Pillow den Start deutlich verlangsamt
+        from openpyxl import Workbook  # noqa: PLC0415
+        from openpyxl.chart import BarChart, PieChart, Reference  # noqa: PLC0415
+        from openpyxl.drawing.image import Image as ExcelImage  # noqa: PLC0415
+        from openpyxl.styles import Border, Font, PatternFill, Side  # noqa: PLC0415
+
         workbook = Workbook()
         sheet = workbook.active
         sheet.title = "Produkte"
@@ -255,16 +501,14 @@ class ProductReadService:
         except Exception as e:
             logger.warning("⚠️ Fehler beim Logo: {}", str(e))
 
-        # Anzahl Produkte pro Kategorie
-        category_count = defaultdict(int)
-        category_sum = defaultdict(float)
+        # Anzahl und Summe pro Kategorie aus der materialisierten Sicht,
+        # Einzelpreise nur für die exportierten Produkte
+        category_count = {stats.id: stats.product_count for stats in category_stats}
+        category_sum = {stats.id: float(stats.price_sum) for stats in category_stats}
         category_prices = defaultdict(list)
 
         for p in products:
-            key = p.category.value
-            category_count[key] += 1
-            category_sum[key] += float(p.price)
-            category_prices[key].append((p.name, float(p.price)))
+            category_prices[p.category.value].append((p.name, float(p.price)))
 
         # Kreisdiagramm: Anzahl Produkte pro Kategorie
         sheet_count = workbook.create_sheet("Anzahl je Kategorie")
@@ -1,33 +1,106 @@
-from typing import Final, List
+from collections import defaultdict
+from decimal import Decimal
+from typing import Any, Final, List
 
+import strawberry
 from beanie import PydanticObjectId
 from loguru import logger
+from motor.motor_asyncio import AsyncIOMotorClientSession
 
 from product.error.exceptions import NotFoundError
 from product.messaging.producer import KafkaProducerService
 from product.model.entity.product import Product, ProductInput, ProductVariant
 from product.model.entity.product_variant import ProductVariantInput
+from product.repository.category_stats_repository import (
+    CategoryStatsDelta,
+    CategoryStatsRepository,
+)
 from product.repository.product_repository import ProductRepository
+from product.search.facet_cache import FacetCache
+from product.search.response_cache import ResponseCache
+from product.search.suggestion_index import SuggestionIndex
 
 
 class ProductWriteService:
-    """Service für schreibende Operationen auf Produktdaten inkl. Kafka-Publishing."""
+    """Service für schreibende Operationen auf Produktdaten inkl. Kafka-Publishing.
+
+    Produkt und `category_stats` werden per `ProductRepository.in_transaction`
+    gemeinsam geschrieben, sofern MongoDB Transaktionen unterstützt.
+    """
 
     def __init__(
         self,
         repository: ProductRepository,
         kafka_producer: KafkaProducerService,
+        suggestion_index: SuggestionIndex,
+        facet_cache: FacetCache,
+        category_stats_repository: CategoryStatsRepository,
+        response_cache: ResponseCache,
     ) -> None:
         self._repo: Final = repository
         self._kafka: Final = kafka_producer
+        self._suggestions: Final = suggestion_index
+        self._facet_cache: Final = facet_cache
+        self._category_stats: Final = category_stats_repository
+        self._response_cache: Final = response_cache
         self._logger: Final = logger.bind(classname=self.__class__.__name__)
 
+    @staticmethod
+    def _stats_delta(
+        removed: Product | None = None, added: Product | None = None
+    ) -> CategoryStatsDelta:
+        """Änderung von Anzahl und Preissumme je Kategorie durch einen Write."""
+        delta: Final[defaultdict[str, tuple[int, Decimal]]] = defaultdict(
+            lambda: (0, Decimal(0))
+        )
+        for product, sign in ((removed, -1), (added, 1)):
+            if product is not None:
+                count, price_sum = delta[product.category.value]
+                delta[product.category.value] = (
+                    count + sign,
+                    price_sum + sign * product.price,
+                )
+        return delta
+
+    @staticmethod
+    def _input_fields(input: ProductInput) -> dict[str, Any]:
+        """Felder der Eingabe ohne nicht angegebene, d.h. None-Werte."""
+        return {
+            field: value
+            for field, value in strawberry.asdict(input).items()
+            if value is not None
+        }
+
+    @staticmethod
+    def _apply_input(product: Product, input: ProductInput) -> None:
+        """Angegebene Felder validiert in das Produkt übernehmen."""
+        changes: Final = ProductWriteService._input_fields(input)
+        validated: Final = Product.model_validate(product.model_dump() | changes)
+        for field in changes:
+            setattr(product, field, getattr(validated, field))
+
+    async def _publish(self, event: str, product: Product) -> None:
+        """Lokale Indexe und Caches aktualisieren und Produkt-Event versenden."""
+        payload: Final = product.model_dump(mode="json")
+        self._suggestions.upsert(payload)
+        self._facet_cache.invalidate()
+        self._response_cache.invalidate()
+        await self._kafka.send_event(event, payload)
+
     async def create(self, input: ProductInput) -> PydanticObjectId:
         self._logger.debug("create: input=%s", input)
 
-        product = Product(**input.dict())
-        saved = await self._repo.save(product)
-        await self._kafka.send_event("product-created", saved.dict())
+        product = Product(**self._input_fields(input))
+
+        async def write(transaction: AsyncIOMotorClientSession | None) -> Product:
+            saved = await self._repo.save(product, transaction)
+            await self._category_stats.apply(
+                self._stats_delta(added=saved), transaction
+            )
+            return saved
+
+        saved = await self._repo.in_transaction(write)
+        await self._publish("product-created", saved)
 
         return saved.id
 
@@ -39,19 +112,39 @@ class ProductWriteService:
         logger.debug("update: id=%s input=%s", product_id, input)
 
         product = await self._repo.find_by_id_or_throw(product_id)
-        product.update(input.dict(exclude_unset=True))
-        updated = await self._repo.update(product)
-
-        await self._kafka.send_event("product-updated", updated.dict())
+        previous: Final = product.model_copy(deep=True)
+        self._apply_input(product, input)
+
+        async def write(transaction: AsyncIOMotorClientSession | None) -> Product:
+            updated = await self._repo.update(product, transaction)
+            await self._category_stats.apply(
+                self._stats_delta(previous, updated), transaction
+            )
+            return updated
+
+        updated = await self._repo.in_transaction(write)
+        await self._publish("product-updated", updated)
         return updated.id
 
     async def delete(self, product_id: PydanticObjectId) -> bool:
         logger.debug("delete: id=%s", product_id)
 
-        await self._repo.find_by_id_or_throw(product_id)
-        deleted = await self._repo.delete(product_id)
+        product = await self._repo.find_by_id_or_throw(product_id)
+
+        async def write(transaction: AsyncIOMotorClientSession | None) -> bool:
+            deleted = await self._repo.delete(product_id, transaction)
+            if deleted:
+                await self._category_stats.apply(
+                    self._stats_delta(removed=product), transaction
+                )
+            return deleted
+
+        deleted = await self._repo.in_transaction(write)
 
         if deleted:
+            self._suggestions.remove(str(product_id))
+            self._facet_cache.invalidate()
+            self._response_cache.invalidate()
             await self._kafka.send_event("product-deleted", {"id": str(product_id)})
 
         return deleted
@@ -72,7 +165,7 @@ class ProductWriteService:
             product.productVariants = variants
 
         updated = await self._repo.update(product)
-        await self._kafka.send_event("product-variant-added", updated.dict())
+        await self._publish("product-variant-added", updated)
 
         return updated.id
 
@@ -87,6 +180,6 @@ class ProductWriteService:
         product.image_paths = (product.image_paths or []) + paths
 
         updated = await self._repo.update(product)
-        await self._kafka.send_event("product-image-added", updated.dict())
+        await self._publish("product-image-added", updated)
 
         return updated.id
@@ -0,0 +1,163 @@
+"""Sampling für Traces: parent-based Ratio mit Tail Sampling für Ausreißer.
+
+Neue Traces werden mit `TraceIdRatioBased` ausgewählt; Kind-Spans folgen der
+Entscheidung ihres Parents. Mit Tail Sampling wird der lokale Root-Span eines
+nicht ausgewählten Traces trotzdem aufgezeichnet (`RECORD_ONLY`). Nach dem
+Ende exportiert `TailSamplingSpanProcessor` ihn nur, falls er fehlerhaft oder
+langsam war. Seine Kind-Spans werden nie erzeugt; die Kosten bleiben auf einen
+Span je Request begrenzt.
+"""
+
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from typing import Any, Final
+
+from opentelemetry.context import Context
+from opentelemetry.sdk.trace import ReadableSpan, Span, SpanProcessor
+from opentelemetry.sdk.trace.sampling import (
+    Decision,
+    ParentBased,
+    Sampler,
+    SamplingResult,
+    TraceIdRatioBased,
+)
+from opentelemetry.trace import (
+    Link,
+    NonRecordingSpan,
+    SpanContext,
+    SpanKind,
+    StatusCode,
+    TraceFlags,
+    Tracer,
+    get_current_span,
+)
+from opentelemetry.trace import Span as ApiSpan
+from opentelemetry.util.types import Attributes
+
+__all__ = ["TailSamplingSpanProcessor", "create_sampler", "sampled_span"]
+
+
+class _TailCandidateSampler(Sampler):
+    """Ratio-Sampling für Root-Spans; abgelehnte Spans werden nur aufgezeichnet."""
+
+    def __init__(self, ratio: float) -> None:
+        self._ratio: Final = TraceIdRatioBased(ratio)
+
+    def should_sample(
+        self,
+        parent_context: Context | None,
+        trace_id: int,
+        name: str,
+        kind: SpanKind | None = None,
+        attributes: Attributes = None,
+        links: Sequence[Link] | None = None,
+        trace_state: Any = None,
+    ) -> SamplingResult:
+        result: Final = self._ratio.should_sample(
+            parent_context, trace_id, name, kind, attributes, links, trace_state
+        )
+        if result.decision is Decision.DROP:
+            return SamplingResult(Decision.RECORD_ONLY, attributes, result.trace_state)
+        return result
+
+    def get_description(self) -> str:
+        return f"TailCandidate{{{self._ratio.get_description()}}}"
+
+
+def create_sampler(ratio: float, tail_sampling: bool) -> Sampler:
+    """Parent-based Sampler für den `TracerProvider`.
+
+    :param ratio: Anteil neuer Traces zwischen 0 und 1
+    :param tail_sampling: Root-Spans nicht ausgewählter Traces aufzeichnen, damit
+        `TailSamplingSpanProcessor` Fehler und langsame Requests exportieren kann
+    :return: Sampler
+    """
+    root: Final = (
+        _TailCandidateSampler(ratio) if tail_sampling else TraceIdRatioBased(ratio)
+    )
+    return ParentBased(root=root)
+
+
+class TailSamplingSpanProcessor(SpanProcessor):
+    """Leitet gesampelte Spans weiter sowie aufgezeichnete Ausreißer."""
+
+    def __init__(self, delegate: SpanProcessor, slow_threshold_ms: float) -> None:
+        self._delegate: Final = delegate
+        self._slow_threshold_ns: Final = int(slow_threshold_ms * 1_000_000)
+
+    def on_start(self, span: Span, parent_context: Context | None = None) -> None:
+        self._delegate.on_start(span, parent_context)
+
+    def on_end(self, span: ReadableSpan) -> None:
+        if span.context is None:
+            return
+        if span.context.trace_flags.sampled:
+            self._delegate.on_end(span)
+            return
+        reason: Final = self._reason(span)
+        if reason is not None:
+            self._delegate.on_end(self._as_sampled(span, reason))
+
+    def _reason(self, span: ReadableSpan) -> str | None:
+        if span.status.status_code is StatusCode.ERROR:
+            return "error"
+        if (
+            span.start_time is not None
+            and span.end_time is not None
+            and span.end_time - span.start_time >= self._slow_threshold_ns
+        ):
+            return "slow"
+        return None
+
+    @staticmethod
+    def _as_sampled(span: ReadableSpan, reason: str) -> ReadableSpan:
+        """Kopie mit gesetztem Sampled-Flag; Batch-Prozessoren verwerfen sonst."""
+        context: Final = span.context
+        return ReadableSpan(
+            name=span.name,
+            context=SpanContext(
+                trace_id=context.trace_id,
+                span_id=context.span_id,
+                is_remote=context.is_remote,
+                trace_flags=TraceFlags(TraceFlags.SAMPLED),
+                trace_state=context.trace_state,
+            ),
+            parent=span.parent,
+            resource=span.resource,
+            attributes={**(span.attributes or {}), "sampling.tail_reason": reason},
+            events=span.events,
+            links=span.links,
+            kind=span.kind,
+            status=span.status,
+            start_time=span.start_time,
+            end_time=span.end_time,
+            instrumentation_scope=span.instrumentation_scope,
+        )
+
+    def shutdown(self) -> None:
+        self._delegate.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self._delegate.force_flush(timeout_millis)
+
+
+@contextmanager
+def sampled_span(
+    tracer: Tracer, name: str, context: Context | None = None, **kwargs: Any
+) -> Iterator[ApiSpan]:
+    """Wie `start_as_current_span`, aber ohne neuen Span in nicht gesampelten Traces.
+
+    Liefert dann einen nicht aufzeichnenden Span mit dem Kontext des Parents;
+    Attribute darauf werden verworfen.
+
+    :param tracer: Tracer
+    :param name: Name des Spans
+    :param context: Optionaler Parent-Kontext, z.B. aus Kafka-Headern
+    :return: Neuer Span oder Platzhalter ohne Aufzeichnung
+    """
+    parent_context: Final = get_current_span(context).get_span_context()
+    if parent_context.is_valid and not parent_context.trace_flags.sampled:
+        yield NonRecordingSpan(parent_context)
+        return
+    with tracer.start_as_current_span(name, context=context, **kwargs) as span:
+        yield span
@@ -0,0 +1,160 @@
+"""Export von Spans mit begrenzter Queue, Drop-Metriken und lokalem Fallback.
+
+`BoundedBatchSpanProcessor` zählt die Spans zwischen `on_end` und dem Export
+selbst. Ist die Queue voll, wird der neue Span verworfen und gezählt, statt
+Speicher zu belegen oder den Request zu verzögern. Der Export läuft wie beim
+`BatchSpanProcessor` in einem eigenen Thread.
+"""
+
+from collections.abc import Callable, Sequence
+from io import TextIOWrapper
+from pathlib import Path
+from threading import Lock
+from typing import Final
+
+from loguru import logger
+from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+from opentelemetry.metrics import CallbackOptions, Observation
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    ConsoleSpanExporter,
+    SpanExporter,
+    SpanExportResult,
+)
+
+from product.config.tracing import TracingExporter
+from product.metrics.metric_registry import (
+    meter,
+    tracing_spans_dropped_counter,
+    tracing_spans_exported_counter,
+)
+
+__all__ = ["BoundedBatchSpanProcessor", "MeteredSpanExporter", "create_span_exporter"]
+
+
+class MeteredSpanExporter(SpanExporter):
+    """Zählt exportierte und beim Export verlorene Spans."""
+
+    def __init__(
+        self,
+        delegate: SpanExporter,
+        name: str,
+        on_export: Callable[[int], None] | None = None,
+    ) -> None:
+        self._delegate: Final = delegate
+        self._attributes: Final = {"exporter": name}
+        self._on_export: Final = on_export
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        try:
+            result = self._delegate.export(spans)
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).debug(
+                "Export von {} Spans fehlgeschlagen", len(spans)
+            )
+            result = SpanExportResult.FAILURE
+        finally:
+            if self._on_export is not None:
+                self._on_export(len(spans))
+        if result is SpanExportResult.SUCCESS:
+            tracing_spans_exported_counter.add(len(spans), self._attributes)
+        else:
+            tracing_spans_dropped_counter.add(
+                len(spans), self._attributes | {"reason": "export_failed"}
+            )
+        return result
+
+    def shutdown(self) -> None:
+        self._delegate.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self._delegate.force_flush(timeout_millis)
+
+
+class BoundedBatchSpanProcessor(BatchSpanProcessor):
+    """`BatchSpanProcessor`, der bei voller Queue neue Spans verwirft und zählt."""
+
+    def __init__(
+        self,
+        exporter: SpanExporter,
+        name: str,
+        max_queue_size: int,
+        max_export_batch_size: int,
+        schedule_delay_millis: float,
+    ) -> None:
+        self._max_pending: Final = max_queue_size
+        self._pending = 0
+        self._lock: Final = Lock()
+        self._attributes: Final = {"exporter": name, "reason": "queue_full"}
+        super().__init__(
+            MeteredSpanExporter(exporter, name, on_export=self._release),
+            max_queue_size=max_queue_size,
+            schedule_delay_millis=schedule_delay_millis,
+            max_export_batch_size=max_export_batch_size,
+        )
+        meter.create_observable_gauge(
+            name="tracing_span_queue_size",
+            callbacks=[self._observe_pending],
+            description="Anzahl Spans, die auf den Export warten",
+            unit="1",
+        )
+
+    def on_end(self, span: ReadableSpan) -> None:
+        if span.context is None or not span.context.trace_flags.sampled:
+            return
+        with self._lock:
+            full = self._pending >= self._max_pending
+            if not full:
+                self._pending += 1
+        if full:
+            tracing_spans_dropped_counter.add(1, self._attributes)
+            return
+        super().on_end(span)
+
+    def _release(self, count: int) -> None:
+        with self._lock:
+            self._pending = max(self._pending - count, 0)
+
+    def _observe_pending(self, _options: CallbackOptions) -> list[Observation]:
+        return [Observation(self._pending, {"exporter": self._attributes["exporter"]})]
+
+
+def _file_exporter(path: str) -> SpanExporter:
+    target: Final = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    out: Final[TextIOWrapper] = target.open("a", encoding="utf-8")  # noqa: SIM115
+    return ConsoleSpanExporter(
+        out=out, formatter=lambda span: span.to_json(indent=None) + "\n"
+    )
+
+
+def create_span_exporter(
+    kind: TracingExporter, endpoint: str, file_path: str, timeout_ms: int
+) -> tuple[str, SpanExporter] | None:
+    """Exporter gemäß Konfiguration; fällt OTLP aus, wird lokal exportiert.
+
+    :param kind: otlp, file, console oder none
+    :param endpoint: OTLP-Endpunkt, z.B. von Tempo
+    :param file_path: Datei für `file` und den Fallback
+    :param timeout_ms: Timeout eines OTLP-Exports in Millisekunden
+    :return: Name und Exporter oder None für `none`
+    """
+    if kind == "none":
+        return None
+    if kind == "console":
+        return "console", ConsoleSpanExporter()
+    if kind == "otlp":
+        if endpoint:
+            try:
+                exporter = OTLPSpanExporter(endpoint=endpoint, timeout=timeout_ms / 1000)
+                return "otlp", exporter
+            except Exception as err:  # noqa: BLE001
+                logger.warning(
+                    "OTLP-Exporter nicht verfügbar, Spans gehen nach {}: {}", file_path, err
+                )
+        else:
+            logger.warning("TEMPO_URI fehlt, Spans gehen nach {}", file_path)
+    elif kind != "file":
+        logger.warning("Unbekannter Tracing-Exporter {}, verwende file", kind)
+    return "file", _file_exporter(file_path)
@@ -9,3 +9,4 @@ class TraceContext(BaseModel):
     span_id: Optional[str] = None
     parent_id: Optional[str] = None
     x_service: Optional[str] = None
+    sampled: Optional[bool] = None
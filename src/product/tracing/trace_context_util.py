@@ -43,6 +43,7 @@ class TraceContextUtil:
             span_id=format(ctx.span_id, "016x") if ctx.span_id else None,
             parent_id=None,
             x_service=cls._service,
+            sampled=ctx.trace_flags.sampled if ctx.is_valid else None,
         )
 
     @staticmethod
@@ -68,12 +69,15 @@ class TraceContextUtil:
         span_id = decoded.get("x-b3-spanid")
         parent_id = decoded.get("x-b3-parentspanid")
         x_service = decoded.get("x-service")
+        # Ohne Header gilt der Trace wie bisher als gesampelt
+        sampled = decoded.get("x-b3-sampled") != "0"
 
         trace_ctx = TraceContext(
             trace_id=trace_id,
             span_id=span_id,
             parent_id=parent_id,
             x_service=x_service,
+            sampled=sampled,
         )
 
         # Kontext für OpenTelemetry-Span bauen
@@ -83,7 +87,9 @@ class TraceContextUtil:
                     trace_id=int(trace_id, 16),
                     span_id=int(span_id, 16),
                     is_remote=True,
-                    trace_flags=TraceFlags(TraceFlags.SAMPLED),
+                    trace_flags=TraceFlags(
+                        TraceFlags.SAMPLED if sampled else TraceFlags.DEFAULT
+                    ),
                     trace_state=TraceState(),
                 )
                 otel_context = set_span_in_context(NonRecordingSpan(span_context))
@@ -112,12 +118,15 @@ class TraceContextUtil:
         span_id = decoded.get("x-b3-spanid")
         parent_id = decoded.get("x-b3-parentspanid")
         x_service = decoded.get("x-service")
+        # Ohne Header gilt der Trace wie bisher als gesampelt
+        sampled = decoded.get("x-b3-sampled") != "0"
 
         trace_ctx = TraceContext(
             trace_id=trace_id,
             span_id=span_id,
             parent_id=parent_id,
             x_service=x_service,
+            sampled=sampled,
         )
 
         try:
@@ -126,7 +135,9 @@ class TraceContextUtil:
                     trace_id=int(trace_id, 16),
                     span_id=int(span_id, 16),
                     is_remote=True,
-                    trace_flags=TraceFlags(TraceFlags.SAMPLED),
+                    trace_flags=TraceFlags(
+                        TraceFlags.SAMPLED if sampled else TraceFlags.DEFAULT
+                    ),
                     trace_state=TraceState(),
                 )
                 otel_context = set_span_in_context(NonRecordingSpan(span_context))
@@ -154,5 +165,7 @@ class TraceContextUtil:
             headers.append(("x-b3-parentspanid", trace_ctx.parent_id))
         if trace_ctx.x_service:
             headers.append(("x-service", trace_ctx.x_service))
+        if trace_ctx.sampled is not None:
+            headers.append(("x-b3-sampled", "1" if trace_ctx.sampled else "0"))
 
         return headers
@@ -0,0 +1,115 @@
+"""AdaptiveLimiter: AIMD-Anpassung, volle Queue und Wartezeit."""
+
+import asyncio
+
+import pytest
+
+from product.admission.limiter import AdaptiveLimiter
+from product.config.admission import AdmissionLimit
+from product.error.exceptions import OverloadedError
+
+
+def _limiter(
+    initial_limit: int = 4, max_queue: int = 10, queue_timeout_ms: float = 1000
+) -> AdaptiveLimiter:
+    return AdaptiveLimiter(
+        "query",
+        AdmissionLimit(
+            initial_limit=initial_limit,
+            min_limit=1,
+            max_limit=8,
+            max_queue=max_queue,
+            queue_timeout_ms=queue_timeout_ms,
+            latency_target_ms=100,
+            backoff=0.5,
+        ),
+    )
+
+
+def test_limit_grows_additively_while_saturated() -> None:
+    """Schnelle Operationen bei ausgeschöpftem Limit erhöhen es um 1/Limit."""
+
+    async def run() -> AdaptiveLimiter:
+        limiter = _limiter()
+        for _ in range(4):
+            await limiter.acquire()
+        for _ in range(5):
+            limiter.release(0.01)
+            await limiter.acquire()
+        return limiter
+
+    limiter = asyncio.run(run())
+
+    assert limiter.limit == 5
+    assert limiter.in_flight == 4
+
+
+def test_limit_does_not_grow_when_idle() -> None:
+    """Ohne Auslastung bleibt das Limit trotz niedriger Latenz unverändert."""
+
+    async def run() -> AdaptiveLimiter:
+        limiter = _limiter()
+        for _ in range(20):
+            await limiter.acquire()
+            limiter.release(0.01)
+        return limiter
+
+    assert asyncio.run(run()).limit == 4
+
+
+def test_limit_decreases_multiplicatively_once_per_round() -> None:
+    """Langsame oder fehlgeschlagene Operationen halbieren das Limit einmal je Runde."""
+
+    async def run() -> list[int]:
+        limiter = _limiter()
+        for _ in range(4):
+            await limiter.acquire()
+        limits = []
+        limiter.release(0.5)
+        limits.append(limiter.limit)
+        limiter.release(0.01, failed=True)
+        limits.append(limiter.limit)
+        limiter.release(0.5)
+        limits.append(limiter.limit)
+        return limits
+
+    assert asyncio.run(run()) == [2, 2, 1]
+
+
+def test_full_queue_is_rejected() -> None:
+    """Ist die Queue voll, wird sofort mit `queue_full` abgelehnt."""
+
+    async def run() -> None:
+        limiter = _limiter(initial_limit=1, max_queue=1)
+        await limiter.acquire()
+        waiting = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert limiter.queued == 1
+
+        with pytest.raises(OverloadedError) as err:
+            await limiter.acquire()
+        assert err.value.reason == "queue_full"
+
+        # Der wartenden Operation wird der freie Platz zugeteilt
+        limiter.release(0.01)
+        await waiting
+        assert limiter.in_flight == 1
+        assert limiter.queued == 0
+
+    asyncio.run(run())
+
+
+def test_queue_timeout_is_rejected() -> None:
+    """Nach Ablauf der Wartezeit wird mit `queue_timeout` abgelehnt."""
+
+    async def run() -> None:
+        limiter = _limiter(initial_limit=1, queue_timeout_ms=10)
+        await limiter.acquire()
+
+        with pytest.raises(OverloadedError) as err:
+            await limiter.acquire()
+        assert err.value.reason == "queue_timeout"
+        assert limiter.queued == 0
+        assert limiter.in_flight == 1
+
+    asyncio.run(run())
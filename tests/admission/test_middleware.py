@@ -0,0 +1,37 @@
+"""Operationstyp ohne vollständiges Parsen: Strings, Kommentare, `operationName`."""
+
+from product.admission.middleware import classify_operation
+
+
+def test_shorthand_and_keywords() -> None:
+    """Die Kurzform `{ ... }` ist eine Query; Schlüsselwörter bestimmen den Typ."""
+    assert classify_operation("{ products { total } }") == "query"
+    assert classify_operation("query P { products { total } }") == "query"
+    assert classify_operation("mutation { deleteProduct(productId: 1) }") == "mutation"
+
+
+def test_keywords_in_strings_and_comments_are_ignored() -> None:
+    """`mutation` in einem String, Block-String oder Kommentar zählt nicht."""
+    document = '''
+    # mutation { deleteProduct(productId: 1) }
+    query Search {
+      a: products(searchCriteria: {name: "} mutation X {"}) { total }
+      b: products(searchCriteria: {name: """} mutation Y {"""}) { total }
+    }
+    '''
+
+    assert classify_operation(document) == "query"
+
+
+def test_operation_name_selects_operation() -> None:
+    """Bei mehreren Operationen entscheidet `operationName`."""
+    document = """
+    query Read { products { total } }
+    mutation Write { deleteProduct(productId: 1) }
+    """
+
+    assert classify_operation(document, "Write") == "mutation"
+    assert classify_operation(document, "Read") == "query"
+    assert classify_operation(document) == "query"
+    # Unbekannter Name: Strawberry lehnt ab, gezählt wird als query
+    assert classify_operation(document, "Other") == "query"
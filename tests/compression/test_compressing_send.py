@@ -0,0 +1,91 @@
+"""_CompressingSend: Mindestgröße, Content-Type und Streaming."""
+
+import asyncio
+import zlib
+from typing import Any
+
+from product.compression.middleware import _CompressingSend
+
+BODY = b'{"data": "' + b"x" * 2000 + b'"}'
+
+
+def _start(content_type: str = "application/json", **headers: str) -> dict[str, Any]:
+    raw = [(b"content-type", content_type.encode())]
+    raw += [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]
+    return {"type": "http.response.start", "status": 200, "headers": raw}
+
+
+def _body(body: bytes, more_body: bool = False) -> dict[str, Any]:
+    return {"type": "http.response.body", "body": body, "more_body": more_body}
+
+
+def _send(*messages: dict[str, Any], encoding: str | None = "gzip") -> list[dict[str, Any]]:
+    sent: list[dict[str, Any]] = []
+
+    async def send(message: dict[str, Any]) -> None:
+        sent.append(message)
+
+    async def run() -> None:
+        responder = _CompressingSend(send, encoding, 1000, ("application/json",))
+        for message in messages:
+            await responder(message)
+
+    asyncio.run(run())
+    return sent
+
+
+def _headers(message: dict[str, Any]) -> dict[str, str]:
+    return {name.decode(): value.decode() for name, value in message["headers"]}
+
+
+def _gunzip(*parts: dict[str, Any]) -> bytes:
+    return zlib.decompress(b"".join(part["body"] for part in parts), 16 + zlib.MAX_WBITS)
+
+
+def test_large_body_is_compressed() -> None:
+    """Ab der Mindestgröße: gzip, ohne Content-Length, mit schwachem ETag."""
+    start, body = _send(_start(content_length=str(len(BODY)), etag='"abc"'), _body(BODY))
+    headers = _headers(start)
+
+    assert headers["content-encoding"] == "gzip"
+    assert "content-length" not in headers
+    assert headers["etag"] == 'W/"abc"'
+    assert headers["vary"] == "Accept-Encoding"
+    assert _gunzip(body) == BODY
+
+
+def test_small_body_is_not_compressed() -> None:
+    """Unter der Mindestgröße, per Content-Length oder erstem Teil, bleibt der Body roh."""
+    by_length = _send(_start(content_length="10"), _body(b"0123456789"))
+    by_body = _send(_start(), _body(b"0123456789"))
+
+    for start, body in (by_length, by_body):
+        assert "content-encoding" not in _headers(start)
+        assert _headers(start)["vary"] == "Accept-Encoding"
+        assert body["body"] == b"0123456789"
+
+
+def test_other_content_types_and_encodings_are_passed_through() -> None:
+    """Bilder, schon kodierte Bodies und Clients ohne Accept-Encoding bleiben unverändert."""
+    for start in (_start("image/png"), _start(content_encoding="br")):
+        sent = _send(start, _body(BODY))
+        assert sent[1]["body"] == BODY
+        assert "vary" not in _headers(sent[0])
+
+    start, body = _send(_start(), _body(BODY), encoding=None)
+    assert "content-encoding" not in _headers(start)
+    assert body["body"] == BODY
+
+
+def test_streaming_flushes_each_part() -> None:
+    """Auch ein kleiner erster Teil wird bei `more_body` komprimiert und sofort dekodierbar."""
+    start, first, second = _send(
+        _start(), _body(b"erster Teil ", more_body=True), _body(b"zweiter Teil")
+    )
+
+    assert _headers(start)["content-encoding"] == "gzip"
+    assert first["more_body"] is True
+    decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    assert decoder.decompress(first["body"]) == b"erster Teil "
+    assert decoder.decompress(second["body"]) == b"zweiter Teil"
+    assert second["more_body"] is False
@@ -0,0 +1,41 @@
+"""Auswahl des Content-Encodings nach q-Werten."""
+
+import zlib
+
+from product.compression.encoders import create_encoder, select_encoding
+
+AVAILABLE = ("zstd", "br", "gzip")
+
+
+def test_highest_quality_wins() -> None:
+    """Der höchste q-Wert entscheidet, nicht die Reihenfolge im Header."""
+    assert select_encoding("gzip;q=1.0, br;q=0.5", AVAILABLE) == "gzip"
+    assert select_encoding("gzip;q=0.5, zstd;q=0.8", AVAILABLE) == "zstd"
+
+
+def test_tie_uses_server_preference() -> None:
+    """Bei gleichem q-Wert gilt die Reihenfolge von `available`."""
+    assert select_encoding("gzip, br", AVAILABLE) == "br"
+    assert select_encoding("GZIP, BR", ("gzip", "br")) == "gzip"
+
+
+def test_zero_quality_and_wildcard() -> None:
+    """q=0 schließt aus; `*` gilt für alle nicht genannten Verfahren."""
+    assert select_encoding("br;q=0, gzip", AVAILABLE) == "gzip"
+    assert select_encoding("*;q=0.1, zstd;q=0", AVAILABLE) == "br"
+    assert select_encoding("identity", AVAILABLE) is None
+    assert select_encoding("gzip;q=0", AVAILABLE) is None
+    assert select_encoding("gzip;q=abc", AVAILABLE) is None
+    assert select_encoding("", AVAILABLE) is None
+
+
+def test_gzip_flush_makes_parts_decodable() -> None:
+    """Nach einem Flush ist der bisherige Stream dekodierbar."""
+    encoder = create_encoder("gzip", level=6)
+    decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+    first = decoder.decompress(encoder.compress(b"erster Teil ", flush=True))
+    rest = decoder.decompress(encoder.compress(b"zweiter Teil") + encoder.finish())
+
+    assert first == b"erster Teil "
+    assert rest == b"zweiter Teil"
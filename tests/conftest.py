@@ -0,0 +1,57 @@
+"""Gemeinsame Einstellungen für die Tests.
+
+`product` validiert beim Import die Umgebungsvariablen; fehlende Werte werden
+wie bei den Microbenchmarks mit Platzhaltern belegt. Es werden keine externen
+Dienste kontaktiert; Beanie beantwortet `buildInfo` lokal.
+"""
+
+import asyncio
+import os
+from typing import Any, Final
+
+import pytest
+from beanie import init_beanie
+from motor.motor_asyncio import AsyncIOMotorClient
+
+_PLACEHOLDER_ENV: Final = {
+    "APP_ENV": "test",
+    "EXCEL_EXPORT_ENABLED": "false",
+    "EXPORT_FORMAT": "csv",
+    "KAFKA_URI": "localhost:9092",
+    "KC_SERVICE_CLIENT_ID": "product",
+    "KC_SERVICE_HOST": "localhost",
+    "KC_SERVICE_PORT": "8080",
+    "KC_SERVICE_REALM": "test",
+    "KEYCLOAK_HEALTH_URL": "http://localhost:8080/health",
+    "KEYS_PATH": "keys",
+    "MONGO_DB_DATABASE": "product_test",
+    "MONGO_DB_URI": "mongodb://localhost:27017",
+    "MONGO_DB_USER_NAME": "test",
+    "MONGO_DB_USER_PASSWORT": "test",
+    "TEMPO_URI": "http://localhost:4317",
+    "TRACING_EXPORTER": "none",
+}
+for _key, _value in _PLACEHOLDER_ENV.items():
+    os.environ.setdefault(_key, _value)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _beanie_offline() -> None:
+    """Beanie ohne MongoDB-Server initialisieren, damit `Product` instanziierbar ist."""
+    from product.model.entity.category_stats import CategoryStats  # noqa: PLC0415
+    from product.model.entity.product import Product  # noqa: PLC0415
+
+    async def init() -> None:
+        database: Final = AsyncIOMotorClient(connect=False)["product_test"]
+
+        async def build_info(*_args: Any, **_kwargs: Any) -> dict[str, str]:
+            return {"version": "7.0.0"}
+
+        database.command = build_info
+        await init_beanie(
+            database=database,
+            document_models=[Product, CategoryStats],
+            skip_indexes=True,
+        )
+
+    asyncio.run(init())
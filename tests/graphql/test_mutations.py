@@ -0,0 +1,98 @@
+"""Mutationen über das gemountete Schema bis zum ProductWriteService."""
+
+import asyncio
+from decimal import Decimal
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+
+from product.graphql import schema as schema_module
+from product.model.entity.product import ProductInput
+from product.resolver.product_mutation_resolver import ProductMutationResolver
+
+PRODUCT_ID = uuid4()
+
+MUTATIONS = """
+mutation {
+  created: createProduct(input: {name: "Kabel", price: "9.99", category: ELEKTRONIK}) {
+    id
+  }
+  updated: updateProduct(
+    productId: "%s", input: {name: "Kabel", price: "12.50", category: SPORT}
+  ) {
+    id
+  }
+  deleted: deleteProduct(productId: "%s")
+}
+""" % (PRODUCT_ID, PRODUCT_ID)
+
+
+class _WriteService:
+    """Zeichnet die Aufrufe auf, wie sie der Resolver weiterreicht."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, Any]] = []
+
+    async def create(self, input: ProductInput) -> UUID:
+        self.calls.append(("create", input.price))
+        return PRODUCT_ID
+
+    async def update(self, product_id: str, input: ProductInput) -> UUID:
+        self.calls.append(("update", input.category.value))
+        return UUID(product_id)
+
+    async def delete(self, product_id: str) -> bool:
+        self.calls.append(("delete", product_id))
+        return True
+
+
+class _Keycloak:
+    def __init__(self, roles: list[str]) -> None:
+        self.roles = roles
+
+    def assert_roles(self, required: list[str]) -> None:
+        if not set(required) & set(self.roles):
+            raise PermissionError(required)
+
+
+def test_create_update_delete(monkeypatch: pytest.MonkeyPatch) -> None:
+    """createProduct, updateProduct und deleteProduct erreichen den Service."""
+    service = _WriteService()
+    resolver = ProductMutationResolver(service)  # type: ignore[arg-type]
+    monkeypatch.setattr(schema_module, "get_product_mutation_resolver", lambda: resolver)
+
+    result = asyncio.run(
+        schema_module.schema.execute(
+            MUTATIONS, context_value={"keycloak": _Keycloak(["Admin"])}
+        )
+    )
+
+    assert result.errors is None
+    assert result.data == {
+        "created": {"id": str(PRODUCT_ID)},
+        "updated": {"id": str(PRODUCT_ID)},
+        "deleted": True,
+    }
+    assert service.calls == [
+        ("create", Decimal("9.99")),
+        ("update", "SPORT"),
+        ("delete", str(PRODUCT_ID)),
+    ]
+
+
+def test_mutation_without_token_is_rejected(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Ohne Keycloak-Kontext wird der Service nicht aufgerufen."""
+    service = _WriteService()
+    resolver = ProductMutationResolver(service)  # type: ignore[arg-type]
+    monkeypatch.setattr(schema_module, "get_product_mutation_resolver", lambda: resolver)
+
+    result = asyncio.run(
+        schema_module.schema.execute(
+            'mutation { deleteProduct(productId: "%s") }' % PRODUCT_ID,
+            context_value={"keycloak": None},
+        )
+    )
+
+    assert result.errors
+    assert service.calls == []
@@ -0,0 +1,133 @@
+"""Persisted Queries: Auflösung per Hash und GET ohne Query-Text."""
+
+import json
+from typing import Any
+
+import pytest
+import strawberry
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from strawberry.fastapi import GraphQLRouter
+
+from product.error.exceptions import PersistedQueryError
+from product.graphql.persisted_queries import (
+    PersistedQueryRouter,
+    PersistedQueryStore,
+    query_hash,
+)
+
+QUERY = "{ __typename }"
+HASH = query_hash(QUERY)
+
+
+def _code(store: PersistedQueryStore, query: str | None, sha256_hash: str) -> str:
+    with pytest.raises(PersistedQueryError) as err:
+        store.resolve(query, sha256_hash)
+    return err.value.code
+
+
+def test_unknown_hash_is_not_found() -> None:
+    """Ohne vorherige Registrierung fordert der Server den Query-Text an."""
+    assert _code(PersistedQueryStore(10), None, HASH) == "PERSISTED_QUERY_NOT_FOUND"
+
+
+def test_hash_must_match_query() -> None:
+    """Ein falscher Hash registriert nichts."""
+    store = PersistedQueryStore(10)
+    assert _code(store, QUERY, "0" * 64) == "PERSISTED_QUERY_HASH_MISMATCH"
+    assert _code(store, None, "0" * 64) == "PERSISTED_QUERY_NOT_FOUND"
+
+
+def test_registered_only_rejects_other_operations() -> None:
+    """Nur Operationen aus dem Manifest, per Hash oder als Text."""
+    other = "{ a: __typename }"
+    store = PersistedQueryStore(10, registered={HASH: QUERY}, registered_only=True)
+    assert store.resolve(None, HASH) == QUERY
+    assert store.resolve(QUERY, None) == QUERY
+    assert _code(store, other, query_hash(other)) == "PERSISTED_QUERY_NOT_IN_LIST"
+    with pytest.raises(PersistedQueryError):
+        store.resolve(other, None)
+
+
+def test_least_recently_used_is_evicted() -> None:
+    """Bei voller Größe fällt der am längsten nicht genutzte Text heraus."""
+    store = PersistedQueryStore(2)
+    queries = ["{ a: __typename }", "{ b: __typename }", "{ c: __typename }"]
+    store.resolve(queries[0], query_hash(queries[0]))
+    store.resolve(queries[1], query_hash(queries[1]))
+    assert store.resolve(None, query_hash(queries[0])) == queries[0]
+    store.resolve(queries[2], query_hash(queries[2]))
+    assert _code(store, None, query_hash(queries[1])) == "PERSISTED_QUERY_NOT_FOUND"
+    assert store.resolve(None, query_hash(queries[0])) == queries[0]
+
+
+@strawberry.type
+class _Query:
+    @strawberry.field
+    def hello(self) -> str:
+        return "world"
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+    app.include_router(
+        PersistedQueryRouter(strawberry.Schema(query=_Query)), prefix="/graphql"
+    )
+    return TestClient(app)
+
+
+def test_get_with_hash_only_executes_with_default_accept() -> None:
+    """Accept: */* wie bei curl oder fetch liefert das Ergebnis statt GraphiQL."""
+    client = _client()
+    query = "{ hello }"
+    extensions = {"persistedQuery": {"version": 1, "sha256Hash": query_hash(query)}}
+    client.post("/graphql", json={"query": query, "extensions": extensions})
+
+    response = client.get(
+        "/graphql",
+        params={"extensions": json.dumps(extensions)},
+        headers={"Accept": "*/*"},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"data": {"hello": "world"}}
+
+
+def test_get_with_default_accept_returns_etag_and_304() -> None:
+    """Wiederholter GET mit If-None-Match wird aus dem Cache mit 304 beantwortet."""
+    client = _client()
+    query = "{ hello }"
+    extensions = {"persistedQuery": {"version": 1, "sha256Hash": query_hash(query)}}
+    client.post("/graphql", json={"query": query, "extensions": extensions})
+    params = {"extensions": json.dumps(extensions)}
+
+    first = client.get("/graphql", params=params)
+    etag = first.headers["ETag"]
+    second = client.get("/graphql", params=params, headers={"If-None-Match": etag})
+
+    assert first.status_code == 200
+    assert first.json() == {"data": {"hello": "world"}}
+    assert second.status_code == 304
+    assert second.headers["ETag"] == etag
+
+
+class _IdeRouter(PersistedQueryRouter):
+    """Rendert GraphiQL auch bei Persisted Queries wie Strawberry ohne Override."""
+
+    def should_render_graphql_ide(self, request: Any) -> bool:
+        return GraphQLRouter.should_render_graphql_ide(self, request)
+
+
+def test_non_json_response_is_returned_uncached() -> None:
+    """Eine HTML-Response wird weder geparst noch gecacht statt mit 500 zu scheitern."""
+    app = FastAPI()
+    app.include_router(_IdeRouter(strawberry.Schema(query=_Query)), prefix="/graphql")
+    extensions = {"persistedQuery": {"version": 1, "sha256Hash": HASH}}
+
+    response = TestClient(app).get(
+        "/graphql", params={"extensions": json.dumps(extensions)}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+    assert "ETag" not in response.headers
@@ -0,0 +1,92 @@
+"""Statische Kosten: Aliase, Fragmente und Seitengrößen."""
+
+import strawberry
+from graphql import parse
+
+from product.graphql.query_cost import QueryCost, estimate_cost
+from product.model.input.pagination import PaginationInput
+
+
+@strawberry.type(name="Variant")
+class _Variant:
+    name: str
+
+
+@strawberry.type(name="Item")
+class _Item:
+    id: str
+    variants: list[_Variant]
+
+
+@strawberry.type(name="Slice")
+class _Slice:
+    total: int
+    content: list[_Item]
+
+
+@strawberry.type
+class _Query:
+    @strawberry.field
+    def products(self, pagination: PaginationInput | None = None) -> _Slice:
+        return _Slice(total=0, content=[])
+
+
+SCHEMA = strawberry.Schema(query=_Query)._schema  # noqa: SLF001
+
+
+def _cost(document: str, variables: dict | None = None) -> QueryCost | None:
+    return estimate_cost(
+        SCHEMA,
+        parse(document),
+        variables=variables,
+        default_list_size=5,
+        query_field_cost=100,
+    )
+
+
+def test_page_size_multiplies_first_list() -> None:
+    """Die Seitengröße gilt für `content`, Listen darunter zählen mit default_list_size."""
+    cost = _cost(
+        "{ products(pagination: {limit: 20}) { total content { id variants { name } } } }"
+    )
+
+    # products 1 + 100, total 1, content 1 + 20 * (id 1 + variants 1 + 5 * name 1)
+    assert cost == QueryCost(cost=243, depth=4)
+
+
+def test_page_size_from_variables_and_fallback() -> None:
+    """Seitengröße aus Variablen; ungültige Werte wie im Service auf 10 begrenzt."""
+    document = (
+        "query($p: PaginationInput) { products(pagination: $p) { content { id } } }"
+    )
+
+    assert _cost(document, {"p": {"limit": 50}}) == QueryCost(cost=152, depth=3)
+    assert _cost(document, {"p": {"limit": 500}}) == QueryCost(cost=112, depth=3)
+    assert _cost(document) == QueryCost(cost=112, depth=3)
+
+
+def test_aliases_count_as_separate_fields() -> None:
+    """Dasselbe Feld unter zwei Aliasen kostet doppelt."""
+    single = _cost("{ products { total } }")
+    aliased = _cost("{ a: products { total } b: products { total } }")
+
+    assert single is not None
+    assert aliased == QueryCost(cost=2 * single.cost, depth=2)
+
+
+def test_fragments_are_expanded() -> None:
+    """Fragment-Spreads und Inline-Fragmente kosten wie die Felder selbst."""
+    inline = _cost("{ products { content { id } } }")
+    spread = _cost(
+        "{ products { ...Page } } fragment Page on Slice { ... on Slice { content { id } } }"
+    )
+
+    assert inline == QueryCost(cost=112, depth=3)
+    assert spread == inline
+
+
+def test_unknown_operation_name() -> None:
+    """Ohne passende Operation gibt es keine Kosten."""
+    assert (
+        estimate_cost(SCHEMA, parse("query A { products { total } }"), "B") is None
+    )
@@ -0,0 +1,63 @@
+"""Money: Decimal128 direkt in Decimal umwandeln und Beträge in Cent."""
+
+from decimal import Decimal
+from struct import pack
+
+from bson import Decimal128
+from pydantic import TypeAdapter
+
+from product.model.entity.money import Money, to_cents, to_decimal
+
+VALUES = [
+    "0",
+    "-0",
+    "0.00",
+    "999.99",
+    "-12.50",
+    "1E+10",
+    "1.000000000000000000000000000000000",
+    "9999999999999999999999999999999999",
+    "-1.23E-6100",
+]
+
+
+def test_round_trip_keeps_value_and_exponent() -> None:
+    """Wert, Vorzeichen und Exponent bleiben wie bei `Decimal128.to_decimal`."""
+    for value in VALUES:
+        converted = to_decimal(Decimal128(Decimal(value)))
+
+        assert converted.as_tuple() == Decimal(value).as_tuple(), value
+
+
+def test_special_values_use_bson() -> None:
+    """NaN und Infinity werden wie von `bson` umgewandelt."""
+    for value in ("NaN", "-Infinity", "Infinity"):
+        assert str(to_decimal(Decimal128(value))) == str(Decimal(value))
+
+
+def test_bid_is_read_directly() -> None:
+    """Koeffizient und Exponent stammen direkt aus den 16 Bytes."""
+    # 99999 * 10**-2 mit Exponent-Bias 6176, negatives Vorzeichen
+    bid = pack("<QQ", 99999, (1 << 63) | ((6176 - 2) << 49))
+
+    assert to_decimal(Decimal128.from_bid(bid)) == Decimal("-999.99")
+
+
+def test_to_cents_rounds_half_even() -> None:
+    """Cent-Beträge runden wie `$round` in MongoDB."""
+    assert to_cents(Decimal("999.99")) == 99999
+    assert to_cents(Decimal("12")) == 1200
+    assert to_cents(Decimal("0.005")) == 0
+    assert to_cents(Decimal("0.015")) == 2
+    assert to_cents(Decimal("-1.005")) == -100
+
+
+def test_round_trip_through_cents() -> None:
+    """Decimal128 aus MongoDB über Money und zurück in Cent ohne Verlust."""
+    adapter = TypeAdapter(Money)
+    for value in ("999.99", "-12.50", "0.01"):
+        money = adapter.validate_python(Decimal128(value))
+
+        assert money == Decimal(value)
+        assert Decimal(to_cents(money)).scaleb(-2) == money
+    assert adapter.validate_python("1.10") == Decimal("1.10")
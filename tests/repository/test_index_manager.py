@@ -0,0 +1,119 @@
+"""Index-Abgleich: Deklaration gegen `listIndexes` und Anlegen beim Start."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+
+from pymongo import ASCENDING, TEXT, IndexModel
+
+from product.repository.index_manager import IndexManager, diff_indexes
+
+WEIGHTS = {"name": 10, "brand": 5, "tags": 2}
+
+DECLARED = [
+    IndexModel([("name", ASCENDING)], name="name_1", unique=True),
+    IndexModel(
+        [(field, TEXT) for field in WEIGHTS],
+        weights=WEIGHTS,
+        default_language="german",
+        name="product_text_search",
+    ),
+]
+
+
+def _existing(**text: Any) -> dict[str, dict[str, Any]]:
+    """Indexe, wie MongoDB sie liefert: Text-Indexe als `_fts`/`_ftsx`."""
+    return {
+        "_id_": {"v": 2, "key": {"_id": 1}, "name": "_id_"},
+        "name_1": {"v": 2, "key": {"name": 1}, "name": "name_1", "unique": True},
+        "product_text_search": {
+            "v": 2,
+            "key": {"_fts": "text", "_ftsx": 1},
+            "name": "product_text_search",
+            "weights": {"tags": 2, "brand": 5, "name": 10},
+            "default_language": "german",
+            "language_override": "language",
+            "textIndexVersion": 3,
+        }
+        | text,
+    }
+
+
+def test_text_index_matches_by_weights_and_language() -> None:
+    """`_fts`/`_ftsx` gleichen der Deklaration, wenn Gewichte und Sprache stimmen."""
+    diff = diff_indexes(DECLARED, _existing())
+
+    assert diff.in_sync
+    assert diff.undeclared == ()
+
+
+def test_text_index_with_other_weights_or_language_is_changed() -> None:
+    """Andere Gewichte oder eine andere Standardsprache gelten als Änderung."""
+    for text in ({"weights": {"name": 1, "brand": 5, "tags": 2}}, {"default_language": "english"}):
+        diff = diff_indexes(DECLARED, _existing(**text))
+
+        assert [index.document["name"] for index in diff.changed] == ["product_text_search"]
+        assert not diff.missing
+
+
+def test_missing_changed_and_undeclared() -> None:
+    """Fehlender Text-Index, geänderte Option und fremder Index; `_id_` zählt nicht."""
+    existing = _existing()
+    del existing["product_text_search"]
+    existing["name_1"] = {"v": 2, "key": {"name": 1}, "name": "name_1"}
+    existing["old_price"] = {"v": 2, "key": {"price": 1.0}, "name": "old_price"}
+
+    diff = diff_indexes(DECLARED, existing)
+
+    assert [index.document["name"] for index in diff.missing] == ["product_text_search"]
+    assert [index.document["name"] for index in diff.changed] == ["name_1"]
+    assert diff.undeclared == ("old_price",)
+    assert not diff.in_sync
+
+
+class _Collection:
+    """Collection, deren create_indexes für nicht eindeutige Indexe hängt."""
+
+    name = "products"
+
+    def __init__(self) -> None:
+        self.indexes: dict[str, dict[str, Any]] = {
+            "_id_": {"v": 2, "key": {"_id": 1}, "name": "_id_"}
+        }
+        self.release = asyncio.Event()
+
+    async def list_indexes(self) -> AsyncIterator[dict[str, Any]]:
+        for index in list(self.indexes.values()):
+            yield index
+
+    async def create_indexes(self, indexes: list[IndexModel]) -> None:
+        if not all(index.document.get("unique") for index in indexes):
+            await self.release.wait()
+        for index in indexes:
+            self.indexes[index.document["name"]] = index.document
+
+    async def aggregate(self, _pipeline: list[dict[str, Any]]) -> AsyncIterator[Any]:
+        for stats in ():
+            yield stats
+
+
+def test_start_sync_gates_only_unique_indexes() -> None:
+    """Der Start wartet nur auf name_1; der Text-Index entsteht im Hintergrund."""
+    collection = _Collection()
+    manager = IndexManager(lambda: collection, DECLARED)  # type: ignore[arg-type, return-value]
+
+    async def run() -> tuple[dict[str, str], dict[str, str]]:
+        task = await manager.start_sync()
+        assert "name_1" in collection.indexes
+        await asyncio.sleep(0)
+        during = {entry["name"]: entry["state"] for entry in await manager.report()}
+        collection.release.set()
+        await task
+        after = {entry["name"]: entry["state"] for entry in await manager.report()}
+        return during, after
+
+    during, after = asyncio.run(run())
+
+    assert during["name_1"] == "ok"
+    assert during["product_text_search"] == "building"
+    assert after["product_text_search"] == "ok"
@@ -0,0 +1,30 @@
+"""Pool-Statistiken: Einträge nur zwischen `pool_created` und `pool_closed`."""
+
+from pymongo.monitoring import (
+    ConnectionCheckedInEvent,
+    ConnectionCheckedOutEvent,
+    ConnectionCreatedEvent,
+    PoolClosedEvent,
+    PoolCreatedEvent,
+)
+
+from product.repository.pool_monitor import PoolStatisticsListener, pool_statistics
+
+ADDRESS = ("mongo-1", 27017)
+
+
+def test_events_after_pool_closed_do_not_recreate_server() -> None:
+    """Nach `pool_closed` bleibt der Server aus den Gauges entfernt."""
+    listener = PoolStatisticsListener()
+    listener.pool_created(PoolCreatedEvent(ADDRESS, {}))
+    listener.connection_created(ConnectionCreatedEvent(ADDRESS, 1))
+    listener.connection_checked_out(ConnectionCheckedOutEvent(ADDRESS, 1, 0.001))
+
+    stats = pool_statistics()["mongo-1:27017"]
+    assert (stats.open, stats.in_use) == (1, 1)
+
+    listener.pool_closed(PoolClosedEvent(ADDRESS))
+    listener.connection_checked_in(ConnectionCheckedInEvent(ADDRESS, 1))
+    listener.connection_checked_out(ConnectionCheckedOutEvent(ADDRESS, 1, 0.001))
+
+    assert "mongo-1:27017" not in pool_statistics()
@@ -0,0 +1,82 @@
+"""Filter aus Suchkriterien und Sortierung: Name, Preisgrenzen in Cent, Indexe."""
+
+from decimal import Decimal
+
+from bson import Decimal128
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+from product.model.input.sort import ProductSort, ProductSortField, SortDirection
+from product.repository.query_builder import (
+    build_product_filter,
+    build_sort,
+    indexed_sort_fields,
+)
+
+
+def test_name_is_exact_match() -> None:
+    """`name` vergleicht exakt wie vor der Volltextsuche."""
+    assert build_product_filter({"name": "Kopfhörer X"}) == {"name": "Kopfhörer X"}
+
+
+def test_name_prefix_uses_normalized_name() -> None:
+    """`name_prefix` sucht verankert auf dem normalisierten Namen."""
+    assert build_product_filter({"name_prefix": "Kopfh"}) == {
+        "name_normalized": {"$regex": "^kopfh"}
+    }
+
+
+def test_price_bounds_in_cents_round_inwards() -> None:
+    """Untergrenze aufrunden, Obergrenze abrunden: gleiche Treffer wie mit `price`."""
+    criteria = {"min_price": 9.991, "max_price": Decimal("20.009")}
+
+    assert build_product_filter(criteria, price_cents=True) == {
+        "price_cents": {"$gte": 1000, "$lte": 2000}
+    }
+
+
+def test_exact_cent_bounds_are_kept() -> None:
+    """Ganze Cent-Beträge bleiben unverändert, auch bei float-Eingaben wie 0.1."""
+    assert build_product_filter({"min_price": 0.1, "max_price": 19.99}, True) == {
+        "price_cents": {"$gte": 10, "$lte": 1999}
+    }
+    assert build_product_filter({"max_price": 0}, True) == {"price_cents": {"$lte": 0}}
+
+
+def test_price_bounds_without_cents_use_decimal128() -> None:
+    """Ohne `price_cents` wird wie bisher `price` als Decimal128 verglichen."""
+    assert build_product_filter({"min_price": 9.99}, price_cents=False) == {
+        "price": {"$gte": Decimal128("9.99")}
+    }
+    assert build_product_filter({}, price_cents=True) == {}
+
+
+def test_sort_with_index_uses_id_as_tiebreaker() -> None:
+    """Sortierung nach einem indexierten Feld, bei Gleichstand nach `_id`."""
+    sort = ProductSort(field=ProductSortField.PRICE, direction=SortDirection.DESC)
+
+    assert build_sort(sort, price_cents=True) == [
+        ("price_cents", DESCENDING),
+        ("_id", DESCENDING),
+    ]
+    assert build_sort(None) == [("_id", ASCENDING)]
+
+
+def test_sort_without_index_falls_back_to_id() -> None:
+    """Ohne passenden Index wird nur nach `_id` sortiert, in der gewünschten Richtung."""
+    sort = ProductSort(field=ProductSortField.PRICE, direction=SortDirection.DESC)
+
+    assert build_sort(sort, price_cents=False) == [("_id", DESCENDING)]
+
+
+def test_indexed_sort_fields_require_id_in_same_direction() -> None:
+    """Nur Compound-Indexe aus Feld und `_id` in gleicher Richtung zählen."""
+    indexes = [
+        IndexModel([("name", ASCENDING), ("_id", ASCENDING)]),
+        IndexModel([("created", DESCENDING), ("_id", DESCENDING)]),
+        IndexModel([("brand", ASCENDING), ("_id", DESCENDING)]),
+        IndexModel([("price_cents", ASCENDING)]),
+        IndexModel([("tags", ASCENDING), ("category", ASCENDING)]),
+        IndexModel([("name", "text"), ("_id", "text")]),
+    ]
+
+    assert indexed_sort_fields(indexes) == {"name", "created"}
@@ -0,0 +1,97 @@
+"""Suggestion-Index: Writes während des Aufbaus im Hintergrund."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+
+from product.search.suggestion_index import SuggestionIndex
+
+
+def _doc(product_id: str, name: str, brand: str | None = None) -> dict[str, Any]:
+    return {"_id": product_id, "name": name, "brand": brand, "tags": []}
+
+
+async def _stream(
+    documents: list[dict[str, Any]], started: asyncio.Event, proceed: asyncio.Event
+) -> AsyncIterator[dict[str, Any]]:
+    for index, document in enumerate(documents):
+        if index == 1:
+            started.set()
+            await proceed.wait()
+        yield document
+
+
+def _names(index: SuggestionIndex, prefix: str) -> list[str]:
+    return [suggestion.name for suggestion in index.suggest(prefix)]
+
+
+def test_write_during_build() -> None:
+    """Löschen und Ändern während `build` bleibt nach dem Tausch erhalten."""
+
+    async def run() -> SuggestionIndex:
+        index = SuggestionIndex()
+        index.build_from([_doc("1", "Zebra Lampe"), _doc("2", "Apple Watch")])
+        started, proceed = asyncio.Event(), asyncio.Event()
+        documents = [
+            _doc("1", "Zebra Lampe"),
+            _doc("2", "Apple Watch"),
+            _doc("3", "Mango Saft"),
+        ]
+        task = asyncio.create_task(index.build(_stream(documents, started, proceed)))
+        await started.wait()
+        index.remove("2")
+        index.upsert(_doc("3", "Kiwi Saft"))
+        index.upsert(_doc("4", "Banane"))
+        # Der aktive Index bleibt während des Aufbaus konsistent
+        assert _names(index, "zebra") == ["Zebra Lampe"]
+        assert _names(index, "apple") == []
+        proceed.set()
+        await task
+        return index
+
+    index = asyncio.run(run())
+
+    assert index.ready
+    assert _names(index, "zebra") == ["Zebra Lampe"]
+    assert _names(index, "apple") == []
+    assert _names(index, "saft") == ["Kiwi Saft"]
+    assert _names(index, "banane") == ["Banane"]
+    assert len(index) == 3
+
+
+def test_upsert_replaces_entry() -> None:
+    """Ein erneut eingefügtes Produkt hat genau einen Eintrag."""
+    index = SuggestionIndex()
+    index.build_from([_doc("1", "Apple Watch"), _doc("1", "Apple Watch")])
+    index.upsert(_doc("1", "Apple Watch Ultra"))
+
+    assert _names(index, "apple") == ["Apple Watch Ultra"]
+    assert len(index) == 1
+
+
+def test_remove_sets_tombstone_and_compacts() -> None:
+    """Entfernte Produkte erscheinen nicht mehr; ein dünn besetzter Index wird verdichtet."""
+    index = SuggestionIndex()
+    index.build_from([_doc(str(i), f"Lampe {i}") for i in range(2048)])
+
+    for i in range(1023):
+        index.remove(str(i))
+    assert _names(index, "lampe 1023") == ["Lampe 1023"]
+    assert _names(index, "lampe 1022") == []
+    assert len(index._entries) == 2048  # noqa: SLF001
+
+    index.remove("1023")
+    assert len(index) == 1024
+    assert len(index._entries) == 1024  # noqa: SLF001
+    assert _names(index, "lampe 1023") == []
+    assert _names(index, "lampe 2047") == ["Lampe 2047"]
+
+
+def test_short_prefix_reads_at_most_max_candidates() -> None:
+    """Ein breiter Präfix liefert Treffer aus höchstens `max_candidates` Postings."""
+    index = SuggestionIndex(max_candidates=3)
+    index.build_from([_doc(str(i), f"Kabel {i}", "Sony") for i in range(10)])
+
+    assert len(index.suggest("ka", limit=10)) == 3
+    # Weitere Wörter filtern nur die gelesenen Kandidaten des seltensten Worts
+    assert _names(index, "sony kabel 7") == ["Kabel 7"]
@@ -0,0 +1,29 @@
+"""GenerationCache: Generation, TTL und LRU gemeinsam für Facetten und Responses."""
+
+from product.search.ttl_cache import GenerationCache
+
+
+def test_put_after_invalidate_is_discarded() -> None:
+    """Ein Ergebnis, dessen Berechnung vor einem Write begann, wird verworfen."""
+    cache: GenerationCache[int] = GenerationCache("test", max_size=2, ttl_seconds=60)
+    generation = cache.generation
+    cache.invalidate()
+    cache.put("a", 1, generation)
+    assert cache.get("a") is None
+    cache.put("a", 1, cache.generation)
+    assert cache.get("a") == 1
+
+
+def test_expired_and_least_recently_used_are_evicted() -> None:
+    """Abgelaufene Einträge und bei voller Größe der älteste Zugriff fallen heraus."""
+    cache: GenerationCache[int] = GenerationCache("test", max_size=2, ttl_seconds=60)
+    cache.put("a", 1, cache.generation)
+    cache.put("b", 2, cache.generation)
+    assert cache.get("a") == 1
+    cache.put("c", 3, cache.generation)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    expired: GenerationCache[int] = GenerationCache("test", max_size=2, ttl_seconds=-1)
+    expired.put("a", 1, expired.generation)
+    assert expired.get("a") is None
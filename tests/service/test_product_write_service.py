@@ -0,0 +1,96 @@
+"""ProductWriteService: Differenzen für `category_stats` bei Create, Update und Delete."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from decimal import Decimal
+from typing import Any
+from uuid import uuid4
+
+from product.model.entity.product import Product, ProductInput
+from product.model.enum.product_category import ProductCategory
+from product.repository.category_stats_repository import CategoryStatsDelta
+from product.service.product_write_service import ProductWriteService
+
+
+def _product(category: ProductCategory, price: str) -> Product:
+    return Product(name="Kopfhörer", price=Decimal(price), category=category)
+
+
+def test_stats_delta_across_category_and_price_change() -> None:
+    """Die alte Kategorie verliert Produkt und Preis, die neue erhält sie."""
+    delta = ProductWriteService._stats_delta(  # noqa: SLF001
+        _product(ProductCategory.ELEKTRONIK, "100.00"),
+        _product(ProductCategory.SPORT, "80.50"),
+    )
+
+    assert dict(delta) == {
+        "ELEKTRONIK": (-1, Decimal("-100.00")),
+        "SPORT": (1, Decimal("80.50")),
+    }
+
+
+def test_stats_delta_for_price_change_only() -> None:
+    """Gleiche Kategorie: nur die Preisdifferenz, Anzahl unverändert."""
+    delta = ProductWriteService._stats_delta(  # noqa: SLF001
+        _product(ProductCategory.SPORT, "10.00"),
+        _product(ProductCategory.SPORT, "12.50"),
+    )
+
+    assert dict(delta) == {"SPORT": (0, Decimal("2.50"))}
+
+
+class _Repository:
+    def __init__(self, product: Product) -> None:
+        self.product = product
+
+    async def find_by_id_or_throw(self, _product_id: Any) -> Product:
+        return self.product
+
+    async def in_transaction(self, writes: Callable[[None], Awaitable[Any]]) -> Any:
+        return await writes(None)
+
+    async def update(self, product: Product, _transaction: Any = None) -> Product:
+        return product
+
+
+class _CategoryStats:
+    def __init__(self) -> None:
+        self.deltas: list[CategoryStatsDelta] = []
+
+    async def apply(self, deltas: CategoryStatsDelta, _transaction: Any = None) -> None:
+        self.deltas.append(dict(deltas))
+
+
+class _Noop:
+    """Ersatz für Kafka, Suggestion-Index und Caches."""
+
+    def upsert(self, _payload: Any) -> None: ...
+
+    def invalidate(self) -> None: ...
+
+    async def send_event(self, _event: str, _payload: Any) -> None: ...
+
+
+def test_update_applies_input_and_moves_stats() -> None:
+    """Ein Update mit neuer Kategorie und neuem Preis erreicht `category_stats`."""
+    product = _product(ProductCategory.ELEKTRONIK, "100.00")
+    stats = _CategoryStats()
+    service = ProductWriteService(
+        repository=_Repository(product),  # type: ignore[arg-type]
+        kafka_producer=_Noop(),  # type: ignore[arg-type]
+        suggestion_index=_Noop(),  # type: ignore[arg-type]
+        facet_cache=_Noop(),  # type: ignore[arg-type]
+        category_stats_repository=stats,  # type: ignore[arg-type]
+        response_cache=_Noop(),  # type: ignore[arg-type]
+    )
+    update = ProductInput(
+        name="Kopfhörer", price=Decimal("80.50"), category=ProductCategory.SPORT
+    )
+
+    asyncio.run(service.update(uuid4(), update))
+
+    assert product.category is ProductCategory.SPORT
+    assert product.price == Decimal("80.50")
+    assert stats.deltas == [
+        {"ELEKTRONIK": (-1, Decimal("-100.00")), "SPORT": (1, Decimal("80.50"))}
+    ]
@@ -0,0 +1,42 @@
+"""uvicorn-Start mit und ohne Unterstützung für `limit_max_requests_jitter`."""
+
+from typing import Any
+
+import pytest
+import uvicorn
+
+from product import asgi_server
+from product.asgi_server import ServerOptions
+
+_RECYCLING = ServerOptions(
+    server="uvicorn", workers=2, max_requests=1000, max_requests_jitter=50
+)
+
+
+def test_jitter_is_omitted_for_uvicorn_without_parameter(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """uvicorn 0.34 kennt den Parameter nicht; der Start darf nicht scheitern."""
+    calls: list[dict[str, Any]] = []
+
+    def run(app: str, *, limit_max_requests: int | None = None, **kwargs: Any) -> None:
+        calls.append({"limit_max_requests": limit_max_requests} | kwargs)
+
+    monkeypatch.setattr(uvicorn, "run", run)
+    asgi_server._run_uvicorn(_RECYCLING)  # noqa: SLF001
+
+    assert calls[0]["limit_max_requests"] == 1000
+    assert "limit_max_requests_jitter" not in calls[0]
+
+
+def test_jitter_is_passed_when_supported(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Neuere uvicorn-Versionen erhalten den Jitter."""
+    calls: list[dict[str, Any]] = []
+
+    def run(app: str, *, limit_max_requests_jitter: int = 0, **kwargs: Any) -> None:
+        calls.append({"limit_max_requests_jitter": limit_max_requests_jitter})
+
+    monkeypatch.setattr(uvicorn, "run", run)
+    asgi_server._run_uvicorn(_RECYCLING)  # noqa: SLF001
+
+    assert calls[0]["limit_max_requests_jitter"] == 50